@@ -0,0 +1,196 @@
+# benchmark_page_operations.py
+"""
+Benchmark: page-object operations against a running Shopizer admin
+
+Times login, route navigation, search, sort, language detection/change and rich-text
+formatting through the page objects, with warm-up iterations and repeated measurements
+(median, p95, standard deviation and a confidence interval for the median). Results are
+written as JSON and compared with a stored baseline; a real slowdown exits with 1.
+
+Usage:
+    python benchmark_page_operations.py [--only search,sort] [--warmup 2] [--repeats 10]
+                                        [--output reports/benchmarks.json] [--baseline FILE]
+                                        [--save-baseline] [--threshold 0.10] [--headless]
+                                        [--stub [--stub-latency-ms 50]] [--fake]
+
+--stub times the framework against the offline admin stand-in (utils/admin_stub_server.py)
+instead of BASE_URL. --fake times the table reads against the in-memory FakeWebDriver the
+page-object unit tests run on (thousands per second is the bar); nothing needs to be running.
+Both keep their own baseline (benchmark_baseline.stub.json, benchmark_baseline.fake.json), and
+a baseline from another browser or base_url is reported as incomparable.
+"""
+
+import argparse
+import os
+import sys
+from contextlib import nullcontext
+from config.config import Config
+from utils.admin_stub_server import stand_in
+from utils.benchmark import (BenchmarkSuite, write_results, load_results, load_environment, run_environment,
+                             baseline_path, environment_mismatch, compare, comparison_report)
+from utils.driver_factory import DriverFactory
+from utils.fake_webdriver import FakeWebDriver, fixture_html, virtual_time
+from pages.brands_page import BrandsPage
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.rich_text_editor_component import RichTextEditorComponent
+from pages.routes import route_hash, route_url
+
+CLEAR_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+def login(driver):
+    login_page = LoginPage(driver)
+    login_page.navigate_to_login_page()
+    return login_page.perform_login(Config.VALID_USERNAME, Config.VALID_PASSWORD)
+
+
+def build_suite(driver, warmup=None, repeats=None):
+    """The page-object operations, grouped as login, navigation, search, sort, table, language, rich_text"""
+    suite = BenchmarkSuite(warmup, repeats)
+    login_page = LoginPage(driver)
+    home = HomePage(driver)
+    products = ProductsPage(driver)
+    brands = BrandsPage(driver)
+    editor = RichTextEditorComponent(driver)
+
+    # Login: signed out before every iteration, signed in again by the last one
+    def signed_out():
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        login_page.navigate_to_login_page()
+
+    suite.add("login.perform_login",
+              lambda: login_page.perform_login(Config.VALID_USERNAME, Config.VALID_PASSWORD), signed_out)
+
+    # Navigation: a cold document load vs a route switch inside the loaded admin
+    suite.add("navigation.products_full_load",
+              lambda: products.open_route(products.TABLE_ROUTE, products.wait_for_page_load, force_reload=True))
+    suite.add("navigation.products_in_app",
+              lambda: products.open_route(products.TABLE_ROUTE, products.wait_for_page_load),
+              lambda: brands.open_route(brands.TABLE_ROUTE, brands.wait_for_page_load))
+
+    # Search and sort: from a reset table to the settled result
+    def search():
+        products.enter_sku_search("a")
+        products.wait_for_table_update()
+
+    suite.add("search.products_sku", search,
+              lambda: products.open_route(products.TABLE_ROUTE, products.wait_for_page_load))
+    suite.add("sort.brands_by_id",
+              lambda: brands.sort_by_column("id", "asc"),
+              lambda: brands.open_route(brands.TABLE_ROUTE, brands.wait_for_page_load))
+
+    # Table reads: rows and sort state of the loaded brands table (one script each)
+    suite.add("table.brands_read", lambda: (brands.get_table_data(), brands.table.get_sort_state()),
+              lambda: brands.open_route(brands.TABLE_ROUTE, brands.wait_for_page_load))
+
+    # Language: detection every iteration; the change only while the UI is still in French
+    # (once per run, so it is not warmed up)
+    def on_home():
+        if route_hash("home") not in driver.current_url:
+            home.open_route("home", home.wait_for_home_page_load)
+
+    suite.add("language.get_current_language", home.get_current_language, on_home)
+    suite.add("language.is_french_language", home.is_french_language, on_home, check=False)
+    suite.add("language.change_language_to_english", home.change_language_to_english,
+              lambda: on_home() or home.is_french_language(), warmup=0)
+
+    # Rich text: formatting a selection in the create-product description editor
+    def selected_text():
+        if route_hash("create_product") not in driver.current_url:
+            editor.open_route("create_product", editor.wait_for_editor_load)
+        editor.clear_editor_content()
+        editor.enter_text("Benchmark paragraph")
+        editor.select_all_text()
+
+    suite.add("rich_text.bold", editor.click_bold, selected_text)
+    suite.add("rich_text.insert_table", lambda: editor.insert_table(2, 2), selected_text)
+    return suite
+
+
+def run_fake_benchmarks(only=None, warmup=None, repeats=None):
+    """The table reads against the fake WebDriver (the other groups need the real admin)"""
+    with virtual_time():
+        driver = FakeWebDriver(pages={route_url("brands"): fixture_html("brands_list.html")})
+        try:
+            return build_suite(driver, warmup, repeats).run(only or ["table"])
+        finally:
+            driver.quit()
+
+
+def run_benchmarks(only=None, warmup=None, repeats=None, headless=False, browser="chrome"):
+    driver = DriverFactory.get_driver(browser, headless=headless)
+    try:
+        if not login(driver):
+            raise SystemExit("❌ Could not log in - is the admin running at " + Config.BASE_URL + "?")
+        return build_suite(driver, warmup, repeats).run(only)
+    finally:
+        driver.quit()
+
+
+def print_results(results):
+    print("\n📊 PAGE OPERATION BENCHMARK")
+    print("=" * 100)
+    for result in results.values():
+        print(result.summary())
+    print("=" * 100)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark page-object operations")
+    parser.add_argument("--only", default="", help="Comma separated groups or benchmark names")
+    parser.add_argument("--warmup", type=int, default=Config.BENCHMARK_WARMUP, help="Discarded iterations")
+    parser.add_argument("--repeats", type=int, default=Config.BENCHMARK_REPEATS, help="Measured iterations")
+    parser.add_argument("--output", default=Config.BENCHMARK_OUTPUT, help="JSON results file")
+    parser.add_argument("--baseline", default=None,
+                        help=f"Baseline results file (default: {Config.BENCHMARK_BASELINE_FILE}, with .fake or "
+                             f".stub before the extension for those backends)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=Config.BENCHMARK_THRESHOLD,
+                        help="Relative median slowdown that counts as a regression")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headless", action="store_true", help="Run the browser headless")
+    parser.add_argument("--stub", action="store_true", help="Benchmark against the offline admin stand-in")
+    parser.add_argument("--stub-latency-ms", type=int, default=Config.STUB_LATENCY_MS,
+                        help="API latency of the stand-in")
+    parser.add_argument("--fake", action="store_true", help="Benchmark table reads on the fake WebDriver")
+    args = parser.parse_args(argv)
+
+    only = [name for name in args.only.split(",") if name]
+    backend = "fake" if args.fake else "stub" if args.stub else None
+    baseline = args.baseline or baseline_path(Config.BENCHMARK_BASELINE_FILE, backend)
+    if args.fake:
+        results = run_fake_benchmarks(only, args.warmup, args.repeats)
+    else:
+        with stand_in(latency_ms=args.stub_latency_ms) if args.stub else nullcontext():
+            results = run_benchmarks(only, args.warmup, args.repeats, args.headless, args.browser)
+    print_results(results)
+    metadata = {"browser": "fake" if args.fake else args.browser, "headless": args.headless}
+    if backend:
+        # The stand-in's port changes every run and is gone by now: name the backend instead
+        metadata["base_url"] = backend
+    if args.stub:
+        metadata["stub_latency_ms"] = args.stub_latency_ms
+    print(f"💾 Results written to {write_results(results, args.output, metadata)}")
+
+    if args.save_baseline:
+        print(f"📌 Baseline saved to {write_results(results, baseline, metadata)}")
+        return 0
+    if not os.path.exists(baseline):
+        print(f"ℹ️ No baseline at {baseline} - run with --save-baseline to create one")
+        return 0
+
+    environment, baseline_environment = run_environment(metadata), load_environment(baseline)
+    rows = compare(results, load_results(baseline), args.threshold, environment, baseline_environment)
+    print(f"\n📈 Compared with {baseline} (threshold {args.threshold:.0%}):")
+    for key, (before, current) in environment_mismatch(environment, baseline_environment).items():
+        print(f"   ⚠ Baseline {key} is {before}, this run's is {current} - timings are not comparable")
+    for line in comparison_report(rows):
+        print(f"   {line}")
+    return 1 if any(status == "regressed" for _, status, *_ in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
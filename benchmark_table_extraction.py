@@ -0,0 +1,109 @@
+# benchmark_table_extraction.py
+"""
+Benchmark: per-cell vs single-round-trip (bulk) ng2-smart-table extraction
+
+Renders a synthetic products table with 10, 100 and 1000 rows in a real browser
+(no Shopizer backend needed) and reads it with ProductsPage.get_table_data in both
+modes, counting WebDriver round-trips and wall time.
+
+Usage:
+    python benchmark_table_extraction.py [--rows 10,100,1000] [--repeat 3] [--headless]
+"""
+
+import argparse
+import statistics
+import time
+from config.config import Config
+from utils.driver_factory import DriverFactory
+from pages.products_page import ProductsPage
+
+
+def build_products_table(row_count):
+    """HTML for an ng2-smart-table laid out like the products list"""
+    rows = []
+    for i in range(row_count):
+        checked = " checked" if i % 2 == 0 else ""
+        rows.append(
+            f"<tr><td>{i + 1}</td><td>SKU-{i:05d}</td><td>Product {i}</td><td>{i % 50}</td>"
+            f"<td><input type='checkbox'{checked}></td><td>{i * 1.5:.2f}</td><td>2025-01-01</td></tr>"
+        )
+    return f"<ng2-smart-table><table><tbody>{''.join(rows)}</tbody></table></ng2-smart-table>"
+
+
+class RoundTripCounter:
+    """Counts WebDriver commands by wrapping driver.execute (elements go through it too)"""
+
+    def __init__(self, driver):
+        self.count = 0
+        self._original = driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.count += 1
+            return self._original(driver_command, params)
+
+        driver.execute = counting_execute
+
+    def reset(self):
+        self.count = 0
+
+
+def run_benchmark(row_counts, repeat, headless):
+    # A bare browser: the profile template's warm-up would load BASE_URL and every route,
+    # and driver metrics would wrap execute around the round-trips being timed
+    Config.BROWSER_PROFILE_TEMPLATE_ENABLED = False
+    Config.DRIVER_METRICS_ENABLED = False
+    driver = DriverFactory.get_driver("chrome", headless=headless)
+    try:
+        driver.implicitly_wait(0)  # Measure round-trips, not implicit waits
+        driver.get("about:blank")
+        page = ProductsPage(driver)
+        counter = RoundTripCounter(driver)
+        results = []
+
+        for row_count in row_counts:
+            driver.execute_script("document.body.innerHTML = arguments[0];", build_products_table(row_count))
+
+            for mode, bulk in (("per-cell", False), ("bulk", True)):
+                timings = []
+                round_trips = 0
+                for _ in range(repeat):
+                    counter.reset()
+                    start = time.perf_counter()
+                    data = page.get_table_data(bulk=bulk)
+                    timings.append(time.perf_counter() - start)
+                    round_trips = counter.count
+                    assert len(data) == row_count, f"{mode}: expected {row_count} rows, got {len(data)}"
+
+                results.append((row_count, mode, round_trips, statistics.median(timings)))
+
+        return results
+    finally:
+        driver.quit()
+
+
+def print_results(results):
+    print("\n📊 TABLE EXTRACTION BENCHMARK")
+    print("=" * 60)
+    print(f"{'rows':>6} {'mode':<10} {'round-trips':>12} {'median latency':>16}")
+    print("-" * 60)
+    for row_count, mode, round_trips, latency in results:
+        print(f"{row_count:>6} {mode:<10} {round_trips:>12} {latency * 1000:>13.1f} ms")
+    print("=" * 60)
+
+    by_rows = {}
+    for row_count, mode, round_trips, latency in results:
+        by_rows.setdefault(row_count, {})[mode] = latency
+    for row_count, modes in by_rows.items():
+        if modes.get("bulk"):
+            print(f"⚡ {row_count} rows: bulk is {modes['per-cell'] / modes['bulk']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark smart table extraction modes")
+    parser.add_argument("--rows", default="10,100,1000", help="Comma separated row counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Measurements per mode")
+    parser.add_argument("--headless", action="store_true", help="Run Chrome headless")
+    args = parser.parse_args()
+
+    row_counts = [int(value) for value in args.rows.split(",")]
+    print_results(run_benchmark(row_counts, args.repeat, args.headless))
@@ -14,6 +14,110 @@ class Config:
     EXPLICIT_WAIT = 15
     PAGE_LOAD_TIMEOUT = 30
 
+    # Driver Pool - reuse live browsers across tests instead of relaunching them
+    DRIVER_POOL_ENABLED = os.getenv('DRIVER_POOL', 'true').lower() == 'true'
+    DRIVER_POOL_MAX_REUSE = int(os.getenv('DRIVER_POOL_MAX_REUSE', '50'))  # Leases before a browser is recycled
+    DRIVER_POOL_WARM_SIZE = int(os.getenv('DRIVER_POOL_WARM_SIZE', '0'))  # Spare browsers warmed in background (0 = off)
+    DRIVER_POOL_WARM_MAX = int(os.getenv('DRIVER_POOL_WARM_MAX', '4'))  # Upper bound when demand grows
+
+    # Driver Binary Cache - resolve chromedriver/geckodriver once, no network on later runs
+    DRIVER_CACHE_ENABLED = os.getenv('DRIVER_CACHE', 'true').lower() == 'true'
+    DRIVER_CACHE_DIR = os.getenv('DRIVER_CACHE_DIR', '.driver_cache')
+    DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', 'false').lower() == 'true'  # Air-gapped runners
+    CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')  # Pinned on-disk driver, skips all lookups
+    GECKODRIVER_PATH = os.getenv('GECKODRIVER_PATH')
+
+    # Warmed Browser Profile - golden Chrome user-data-dir with the app bundle cached, cloned per browser
+    BROWSER_PROFILE_TEMPLATE_ENABLED = os.getenv('BROWSER_PROFILE_TEMPLATE', 'true').lower() == 'true'
+    BROWSER_PROFILE_DIR = os.getenv('BROWSER_PROFILE_DIR', '.browser_profiles')
+    BROWSER_PROFILE_STALE_AFTER = int(os.getenv('BROWSER_PROFILE_STALE_AFTER', '86400'))  # Seconds before an orphaned clone is deleted
+
+    # Request Blocking - CDP blocked-URL profile (see utils/request_blocking.py) applied when a browser is leased
+    REQUEST_BLOCKING_ENABLED = os.getenv('REQUEST_BLOCKING', 'true').lower() == 'true'
+    REQUEST_BLOCKING_PROFILE = os.getenv('REQUEST_BLOCKING_PROFILE', 'none')  # For pages/tests that declare none
+    RESOURCE_SIZES_FILE = os.getenv('RESOURCE_SIZES_FILE', '.results/resource_sizes.json')  # Sizes for the bytes-saved estimate
+
+    # Saved Authentication State - log in once, restore the session into later drivers
+    AUTH_STATE_ENABLED = os.getenv('AUTH_STATE', 'true').lower() == 'true'
+    AUTH_STATE_FILE = os.getenv('AUTH_STATE_FILE', '.auth/storage_state.json')
+    AUTH_STATE_TTL = int(os.getenv('AUTH_STATE_TTL', '1800'))  # Seconds before a saved login is discarded
+    AUTH_STATE_ORIGIN_PATH = '/favicon.ico'  # Cheap same-origin URL used while injecting the state
+
+    # Shared Page Fixtures - *_page_ready loads a list page once per scope and resets it between tests
+    PAGE_FIXTURE_SCOPE = os.getenv('PAGE_FIXTURE_SCOPE', 'class')  # function | class | module
+
+    # Table Reading - one execute_script per table instead of one round-trip per cell
+    BULK_TABLE_EXTRACTION = os.getenv('BULK_TABLE_EXTRACTION', 'true').lower() == 'true'
+
+    # Table Settle Wait - resolve when the table body stops changing instead of sleeping
+    TABLE_SETTLE_QUIET_MS = int(os.getenv('TABLE_SETTLE_QUIET_MS', '300'))  # Mutation-free window that counts as settled
+    TABLE_SETTLE_CHANGE_MS = int(os.getenv('TABLE_SETTLE_CHANGE_MS', '1000'))  # Give up waiting for a first change after this
+    TABLE_SETTLE_TIMEOUT = float(os.getenv('TABLE_SETTLE_TIMEOUT', '10'))  # Upper bound for a table that keeps changing
+
+    # App Idle Wait - Angular whenStable + no fetch/XHR in flight, instead of fixed sleeps
+    APP_IDLE_QUIET_MS = int(os.getenv('APP_IDLE_QUIET_MS', '100'))  # Network must stay idle this long
+    APP_IDLE_TIMEOUT = float(os.getenv('APP_IDLE_TIMEOUT', '10'))  # Give up (and carry on) after this
+
+    # Page Load Timing - Navigation/Paint Timing and resources per route, kept per run in the results store
+    PAGE_TIMING_ENABLED = os.getenv('PAGE_TIMING', 'true').lower() == 'true'
+
+    # Performance Budgets - limits (seconds) for @pytest.mark.budget, per environment (BUDGET_ENV)
+    BUDGET_ENV = os.getenv('BUDGET_ENV', 'local')
+    BUDGET_MODE = os.getenv('BUDGET_MODE', 'fail')  # fail | warn - overridable per marker with mode=
+    PERFORMANCE_BUDGETS = {
+        # Defaults for metrics a marker names without a value; 'scale' multiplies explicit values
+        'local': {'route_load': 5.0, 'search_settle': 2.0, 'sort_settle': 2.0, 'scale': 1.0},
+        'ci': {'route_load': 8.0, 'search_settle': 3.0, 'sort_settle': 3.0, 'scale': 1.5},
+        'staging': {'route_load': 4.0, 'search_settle': 1.5, 'sort_settle': 1.5, 'scale': 1.0},
+        'production': {'route_load': 3.0, 'search_settle': 1.0, 'sort_settle': 1.0, 'scale': 1.0},
+    }
+
+    # Benchmarks - page-object operation timings (benchmark_page_operations.py)
+    BENCHMARK_WARMUP = int(os.getenv('BENCHMARK_WARMUP', '2'))  # Iterations run and discarded first
+    BENCHMARK_REPEATS = int(os.getenv('BENCHMARK_REPEATS', '10'))  # Measured iterations per operation
+    BENCHMARK_OUTPUT = os.getenv('BENCHMARK_OUTPUT', 'reports/benchmarks.json')
+    BENCHMARK_BASELINE_FILE = os.getenv('BENCHMARK_BASELINE', 'benchmark_baseline.json')
+    BENCHMARK_THRESHOLD = float(os.getenv('BENCHMARK_THRESHOLD', '0.10'))  # Median slowdown counted as a regression
+
+    # Admin Stand-in - offline Shopizer admin for framework benchmarks (utils/admin_stub_server.py)
+    STUB_SERVER_PORT = int(os.getenv('STUB_SERVER_PORT', '4200'))  # 0 = any free port
+    STUB_LATENCY_MS = int(os.getenv('STUB_LATENCY_MS', '50'))  # Added to every API response
+    STUB_JITTER_MS = int(os.getenv('STUB_JITTER_MS', '0'))  # Random extra API latency, 0..n ms
+    STUB_ROWS = int(os.getenv('STUB_ROWS', '120'))  # Rows in every list view
+    STUB_PAGE_SIZE = int(os.getenv('STUB_PAGE_SIZE', '10'))
+    STUB_RESULTS_DB = os.getenv('STUB_RESULTS_DB', '.results/results.stub.sqlite')  # Stand-in runs' history
+
+    # Record/Replay - WebDriver traffic captured against the real admin, served again without a browser
+    WEBDRIVER_RECORD_FILE = os.getenv('WEBDRIVER_RECORD', '')  # Cassette to record the run into
+    WEBDRIVER_REPLAY_FILE = os.getenv('WEBDRIVER_REPLAY', '')  # Cassette to replay instead of starting browsers
+    WEBDRIVER_RECORDINGS_DIR = os.getenv('WEBDRIVER_RECORDINGS_DIR', '.recordings')
+
+    # WebDriver Command Metrics - per-test command counts, latency histograms and sleep/wait time
+    DRIVER_METRICS_ENABLED = os.getenv('DRIVER_METRICS', 'true').lower() == 'true'
+    DRIVER_METRICS_FILE = os.getenv('DRIVER_METRICS_FILE', 'reports/driver_metrics.jsonl')
+
+    # Sleep Profiler - every time.sleep ranked by call site to find dead time worth removing
+    SLEEP_PROFILER_ENABLED = os.getenv('SLEEP_PROFILER', 'true').lower() == 'true'
+    SLEEP_PROFILE_FILE = os.getenv('SLEEP_PROFILE_FILE', 'reports/sleep_profile.json')
+
+    # Parallel Runs - worker processes used by the test runners (1 = serial pytest.main)
+    PARALLEL_WORKERS = int(os.getenv('WORKERS', '1'))
+
+    # Sharding - "i/N" runs only shard i of N (CI machines); durations come from a shared snapshot
+    SHARD = os.getenv('SHARD', '')
+    SHARD_DURATIONS_FILE = os.getenv('SHARD_DURATIONS_FILE', 'test_durations.json')
+
+    # Results Store - per-test phase durations and outcomes kept across runs (SQLite)
+    RESULTS_STORE_ENABLED = os.getenv('RESULTS_STORE', 'true').lower() == 'true'
+    RESULTS_DB = os.getenv('RESULTS_DB', '.results/results.sqlite')
+
+    # Regression Gate - wall time, per-test and per-page-method timings vs a saved baseline (run_tests.py --gate)
+    REGRESSION_GATE_ENABLED = os.getenv('REGRESSION_GATE', 'false').lower() == 'true'
+    REGRESSION_BASELINE_FILE = os.getenv('REGRESSION_BASELINE', 'wall_time_baseline.json')
+    REGRESSION_THRESHOLD = float(os.getenv('REGRESSION_THRESHOLD', '0.20'))  # Relative slowdown that fails the gate
+    REGRESSION_MIN_SECONDS = float(os.getenv('REGRESSION_MIN_SECONDS', '0.5'))  # Smaller test/wall slowdowns are noise
+    REGRESSION_MIN_CALL_SECONDS = float(os.getenv('REGRESSION_MIN_CALL_SECONDS', '0.05'))  # Same, per method call
+
     # Test Data
     VALID_USERNAME = os.getenv('VALID_USERNAME', 'admin@shopizer.com')  # Updated default
     VALID_PASSWORD = os.getenv('VALID_PASSWORD', 'password')  # Updated default
@@ -5,6 +5,7 @@ Page Object Model package for Selenium automation testing
 
 # Import all page classes for easy access
 from .base_page import BasePage
+from .smart_table_component import SmartTableComponent
 from .login_page import LoginPage
 from .home_page import HomePage
 from .products_page import ProductsPage
@@ -16,6 +17,7 @@ from .product_options_page import ProductOptionsPage
 
 __all__ = [
     'BasePage',
+    'SmartTableComponent',
     'LoginPage',
     'HomePage',
     'ProductsPage',
@@ -2,10 +2,130 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
+from config.config import Config
+from pages.routes import route_hash, route_path, route_url
+from utils.page_metrics import page_metrics
 import time
 import os
 
+# Resolves when every Angular app reports whenStable and no fetch/XHR request has been
+# in flight for arguments[0] ms. The request counter is installed once per document;
+# requests started before the first call are still covered by Angular's zone tracking.
+APP_IDLE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var start = performance.now();
+
+var net = window.__appIdleNet;
+if (!net) {
+    net = window.__appIdleNet = {inflight: 0, last: performance.now()};
+    var settle = function () { net.inflight = Math.max(0, net.inflight - 1); net.last = performance.now(); };
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        net.inflight++;
+        this.addEventListener('loadend', settle);
+        try { return send.apply(this, arguments); } catch (e) { settle(); throw e; }
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            net.inflight++;
+            return originalFetch.apply(this, arguments).then(
+                function (response) { settle(); return response; },
+                function (error) { settle(); throw error; });
+        };
+    }
+}
+
+// null = still waiting for whenStable, true = stable, false = not an Angular page
+var angular = null;
+var testabilities = window.getAllAngularTestabilities ? window.getAllAngularTestabilities() : [];
+if (!testabilities.length) {
+    angular = false;
+} else {
+    var pending = testabilities.length;
+    testabilities.forEach(function (testability) {
+        testability.whenStable(function () { if (--pending === 0) { angular = true; } });
+    });
+}
+
+(function poll() {
+    var now = performance.now();
+    if (angular !== null && net.inflight === 0 && now - net.last >= quietMs) {
+        done({idle: true, angular: angular, inflight: 0});
+        return;
+    }
+    if (now - start >= timeoutMs) {
+        done({idle: false, angular: angular, inflight: net.inflight});
+        return;
+    }
+    setTimeout(poll, 25);
+})();
+"""
+
+# Where the browser is and whether the admin shell (Angular + nb-layout) is already running
+APP_SHELL_SCRIPT = """
+return {
+    origin: location.origin,
+    hash: location.hash,
+    shell: !!(window.getAllAngularTestabilities && document.querySelector('nb-layout')),
+    now: performance.now()
+};
+"""
+
+# In-app route switch: the hash router picks up the change without reloading the bundle
+HASH_NAVIGATE_SCRIPT = """
+location.hash = arguments[0];
+"""
+
+# Navigation + Paint Timing of the current document and the resources fetched since arguments[0]
+# (a performance.now() value; 0 for a full load). LCP is only exposed to PerformanceObservers.
+PAGE_TIMING_SCRIPT = """
+var since = arguments[0], done = arguments[arguments.length - 1];
+var nav = performance.getEntriesByType('navigation')[0];
+var paint = {};
+performance.getEntriesByType('paint').forEach(function (e) { paint[e.name] = e.startTime; });
+var lcp = null;
+function finish() {
+    var all = performance.getEntriesByType('resource');
+    var resources = all.filter(function (e) { return e.startTime >= since; });
+    var transfer = 0, encoded = 0, cached = 0;
+    resources.forEach(function (e) {
+        transfer += e.transferSize || 0;
+        encoded += e.encodedBodySize || 0;
+        if (!e.transferSize && e.decodedBodySize) { cached += 1; }
+    });
+    // Keep the resource buffer (250 entries by default) from filling up in long-lived documents
+    if (all.length > 200) { performance.clearResourceTimings(); }
+    done({
+        ttfb: nav ? nav.responseStart : null,
+        dcl: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+        fcp: paint['first-contentful-paint'] || null,
+        lcp: lcp,
+        resources: resources.length,
+        transfer_bytes: transfer,
+        encoded_bytes: encoded,
+        cached_resources: cached
+    });
+}
+try {
+    new PerformanceObserver(function (list) {
+        var entries = list.getEntries();
+        if (entries.length) { lcp = entries[entries.length - 1].startTime; }
+    }).observe({type: 'largest-contentful-paint', buffered: true});
+} catch (e) {}
+setTimeout(finish, 50);
+"""
+
+# Document-level timings; meaningless after an in-app route switch (same document)
+DOCUMENT_TIMINGS = ("ttfb", "dcl", "load", "fcp", "lcp")
+
 class BasePage:
+    # Requests to block while this page is tested: a profile name ('admin', 'none'), a dict
+    # of BlockingProfile arguments or a BlockingProfile; None uses Config.REQUEST_BLOCKING_PROFILE
+    REQUEST_BLOCKING = None
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
@@ -101,4 +221,251 @@ class BasePage:
 
     def get_page_title(self):
         """Get current page title"""
-        return self.driver.title
\ No newline at end of file
+        return self.driver.title
+
+    def wait_for_app_idle(self, timeout=None):
+        """Wait until Angular is stable and no fetch/XHR request is in flight
+
+        Runs as a single async script, so the wait costs one round-trip however long it takes.
+
+        Returns:
+            bool: True when the app went idle, False on timeout or script failure
+        """
+        timeout = Config.APP_IDLE_TIMEOUT if timeout is None else timeout
+        start = time.perf_counter()
+
+        try:
+            result = self.driver.execute_async_script(
+                APP_IDLE_SCRIPT, Config.APP_IDLE_QUIET_MS, int(timeout * 1000)
+            ) or {}
+        except Exception as e:
+            print(f"⚠ App idle wait failed: {e}")
+            result = {}
+
+        elapsed = time.perf_counter() - start
+        idle = bool(result.get("idle"))
+        self._record_idle_wait(elapsed, idle)
+
+        if not idle and result:
+            print(f"⚠ App not idle after {timeout}s ({result.get('inflight', 0)} requests in flight)")
+        return idle
+
+    @classmethod
+    def _record_idle_wait(cls, seconds, idle):
+        stats = page_metrics.idle_stats
+        stats["waits"] += 1
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        if not idle:
+            stats["timeouts"] += 1
+
+    @classmethod
+    def idle_report(cls):
+        """App idle wait totals for the end-of-session report"""
+        stats = page_metrics.idle_stats
+        if not stats["waits"]:
+            return []
+        return [
+            f"waits={stats['waits']} total {stats['seconds']:.2f}s  "
+            f"avg {stats['seconds'] / stats['waits'] * 1000:.0f}ms  max {stats['max_seconds'] * 1000:.0f}ms  "
+            f"timeouts={stats['timeouts']}",
+        ]
+
+    # =======================
+    # ROUTE NAVIGATION
+    # =======================
+
+    def open_route(self, route, ready=None, force_reload=False):
+        """Show an admin route, without reloading the Angular bundle when possible
+
+        - already on the route: the page resets its state in place (reset_page_state),
+        - admin shell loaded: the hash changes and the in-app router switches views,
+        - otherwise (or if either of those fails): a full driver.get load.
+
+        Args:
+            route (str): Registry name ('brands') or route path (see pages.routes)
+            ready (callable): Returns True once the target page is usable
+                              (default: wait_for_app_idle)
+            force_reload (bool): Always do a full load
+
+        Returns:
+            bool: Result of the ready check
+        """
+        ready = ready or self.wait_for_app_idle
+        target = route_hash(route)
+        start = time.perf_counter()
+        self._timing_since = 0
+
+        mode = None if force_reload else self._switch_in_app(target)
+        if mode is not None and not ready():
+            print(f"⚠ In-app navigation to {target} not ready - falling back to a full load")
+            mode = None
+        if mode is None:
+            mode = "full"
+            self._timing_since = 0
+            self.driver.get(route_url(route))
+            result = ready()
+        else:
+            result = True
+
+        seconds = time.perf_counter() - start
+        self._record_navigation(mode, seconds, target)
+        # "current" only reset the page in place - no route was loaded to time
+        if result and mode != "current":
+            self.record_latency("route_load", seconds)
+            self.capture_page_timing(route, mode, seconds)
+        return result
+
+    def _switch_in_app(self, target):
+        """Move to the target hash inside the running app; None when a full load is needed"""
+        try:
+            shell = self.driver.execute_script(APP_SHELL_SCRIPT) or {}
+        except Exception:
+            return None
+        if not shell.get("shell") or shell.get("origin") != Config.BASE_URL.rstrip("/"):
+            return None
+        self._timing_since = shell.get("now") or 0
+
+        if shell.get("hash", "").split("?")[0] == target:
+            reset = getattr(self, "reset_page_state", None)
+            return "current" if reset is not None and reset() else None
+
+        self.driver.execute_script(HASH_NAVIGATE_SCRIPT, target)
+        try:
+            WebDriverWait(self.driver, Config.APP_IDLE_TIMEOUT).until(EC.url_contains(target))
+        except TimeoutException:
+            return None
+        return "in_app"
+
+    @classmethod
+    def _record_navigation(cls, mode, seconds, target):
+        stats = page_metrics.navigation_stats
+        stats[mode]["count"] += 1
+        stats[mode]["seconds"] += seconds
+
+        full = stats["full"]
+        if mode == "full" or not full["count"]:
+            print(f"🧭 {target}: {mode.replace('_', '-')} navigation in {seconds:.2f}s")
+        else:
+            baseline = full["seconds"] / full["count"]
+            print(f"🧭 {target}: {mode.replace('_', '-')} navigation in {seconds:.2f}s "
+                  f"(full load avg {baseline:.2f}s, ~{baseline - seconds:.2f}s saved)")
+
+    @classmethod
+    def navigation_report(cls):
+        """Route navigations by mode and the time saved against the average full load"""
+        stats = page_metrics.navigation_stats
+        if not any(entry["count"] for entry in stats.values()):
+            return []
+
+        lines = []
+        for mode, entry in stats.items():
+            if entry["count"]:
+                lines.append(f"{mode.replace('_', '-'):<8} navigations={entry['count']:<4} "
+                             f"total {entry['seconds']:.2f}s  avg {entry['seconds'] / entry['count'] * 1000:.0f}ms")
+
+        full = stats["full"]
+        if full["count"]:
+            baseline = full["seconds"] / full["count"]
+            saved = sum(entry["count"] * baseline - entry["seconds"]
+                        for mode, entry in stats.items() if mode != "full")
+            lines.append(f"time saved vs a full load each time: ~{saved:.2f}s")
+        return lines
+
+    # =======================
+    # LATENCIES
+    # =======================
+
+    @classmethod
+    def mark_table_action(cls, kind):
+        """Remember when a search ('search') or sort click ('sort') started; the next table
+        settle wait reports the latency as '<kind>_settle'"""
+        page_metrics.pending_table_action = (kind, time.perf_counter())
+
+    @classmethod
+    def record_latency(cls, kind, seconds):
+        """Hand a measured latency (route_load, search_settle, sort_settle) to the listeners"""
+        for listener in page_metrics.latency_listeners:
+            try:
+                listener(kind, seconds)
+            except Exception as e:
+                print(f"⚠ Latency listener failed: {e}")
+
+    # =======================
+    # PAGE LOAD TIMING
+    # =======================
+
+    def capture_page_timing(self, route, navigation="full", seconds=None):
+        """Record Navigation/Paint Timing and resource counts of the route just shown
+
+        Full loads get TTFB, DOMContentLoaded, load, FCP and LCP (ms from navigation start);
+        in-app switches only get their duration and the resources they fetched.
+
+        Returns:
+            dict: The recorded timing, or None when it could not be read
+        """
+        if not Config.PAGE_TIMING_ENABLED:
+            return None
+        try:
+            timing = self.driver.execute_async_script(PAGE_TIMING_SCRIPT, getattr(self, "_timing_since", 0))
+        except Exception:
+            return None
+        if not timing:
+            return None
+
+        if navigation != "full":
+            for key in DOCUMENT_TIMINGS:
+                timing[key] = None
+        timing.update(route=route_path(route), navigation=navigation,
+                      duration=round(seconds * 1000, 1) if seconds is not None else None,
+                      recorded_at=time.time())
+
+        page_metrics.page_timings.append(timing)
+        for listener in page_metrics.timing_listeners:
+            try:
+                listener(timing)
+            except Exception as e:
+                print(f"⚠ Page timing listener failed: {e}")
+        return timing
+
+    @classmethod
+    def page_timing_report(cls, baseline=None):
+        """Median page load timings per route and navigation mode
+
+        Args:
+            baseline (dict): (route, navigation) -> {metric: median} from earlier runs, shown
+                             next to this session's LCP (or duration for in-app switches)
+        """
+        groups = {}
+        for timing in page_metrics.page_timings:
+            groups.setdefault((timing["route"], timing["navigation"]), []).append(timing)
+        if not groups:
+            return []
+
+        def median(samples, key):
+            values = sorted(sample[key] for sample in samples if sample.get(key) is not None)
+            return values[len(values) // 2] if values else None
+
+        def ms(value):
+            return f"{value:6.0f}" if value is not None else "     -"
+
+        lines = [f"{'route':<40} {'mode':<8} {'n':>3} {'time':>6} {'ttfb':>6} {'dcl':>6} {'load':>6} "
+                 f"{'fcp':>6} {'lcp':>6} {'res':>4} {'KiB':>6}"]
+        for (route, navigation), samples in sorted(groups.items()):
+            medians = {key: median(samples, key) for key in ("duration",) + DOCUMENT_TIMINGS}
+            resources = median(samples, "resources") or 0
+            kib = (median(samples, "transfer_bytes") or 0) / 1024
+            line = (f"{route:<40} {navigation.replace('_', '-'):<8} {len(samples):>3} {ms(medians['duration'])} "
+                    + " ".join(ms(medians[key]) for key in DOCUMENT_TIMINGS)
+                    + f" {resources:>4} {kib:>6.0f}")
+            previous = (baseline or {}).get((route, navigation))
+            key = "lcp" if navigation == "full" else "duration"
+            if previous and previous.get(key) is not None and medians[key] is not None:
+                line += f"  ({key} prev {previous[key]:.0f}ms, {medians[key] - previous[key]:+.0f}ms)"
+            lines.append(line)
+        lines.append("all times in ms (time = navigation until the page was ready); KiB transferred, median per load")
+        return lines
+
+    def use_bulk_table_extraction(self, bulk=None):
+        """Resolve the per-call bulk flag against Config.BULK_TABLE_EXTRACTION"""
+        return Config.BULK_TABLE_EXTRACTION if bulk is None else bulk
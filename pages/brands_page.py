@@ -4,6 +4,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from pages.base_page import BasePage
+from pages.smart_table_component import SmartTableComponent
+from pages.routes import ROUTES
 import time
 
 class BrandsPage(BasePage):
@@ -46,9 +48,22 @@ class BrandsPage(BasePage):
     # Pagination
     PAGINATION_INFO = (By.CSS_SELECTOR, ".page-counts")
 
+    REQUEST_BLOCKING = "admin"
+
+    # Smart table layout: (field, column key, kind) in on-screen order
+    TABLE_ROUTE = ROUTES["brands"]
+    TABLE_COLUMNS = [
+        ('id', 'id', 'text'),
+        ('brand_name', 'description', 'text'),
+        ('code', 'code', 'text'),
+        ('has_actions', 'actions', 'has_actions'),
+    ]
+    SORTABLE_COLUMNS = ('id', 'brand_name', 'code')
+
     def __init__(self, driver):
         super().__init__(driver)
         self.wait = WebDriverWait(driver, 15)
+        self.table = SmartTableComponent(driver, route=self.TABLE_ROUTE, columns=self.TABLE_COLUMNS)
 
     # =======================
     # NAVIGATION METHOD
@@ -59,12 +74,8 @@ class BrandsPage(BasePage):
         try:
             print("🏷️ Navigating to brands page...")
 
-            # Direct navigation to brands page
-            # Note: Using the URL from the HTML structure provided
-            self.driver.get("http://localhost/#/pages/catalogue/brands/brands-list")
-
-            # Wait for page to load
-            if self.wait_for_page_load():
+            # In-app route switch when the admin is already loaded, full load otherwise
+            if self.open_route(self.TABLE_ROUTE, self.wait_for_page_load):
                 print("✓ Successfully navigated to brands page")
                 return True
 
@@ -87,8 +98,11 @@ class BrandsPage(BasePage):
                 )
             )
 
-            # Additional wait for Angular to finish rendering
-            time.sleep(2)
+            # Wait for Angular to finish rendering and the first table fetch
+            self.wait_for_app_idle()
+
+            # Watch the table from here on so later updates are caught by the settle wait
+            self.table.watch()
 
             print("✓ Brands page loaded successfully")
             return True
@@ -106,15 +120,15 @@ class BrandsPage(BasePage):
 
     def enter_general_search(self, text):
         """Enter text in the general search field (top section)"""
-        return self.enter_text(self.GENERAL_SEARCH_INPUT, text)
+        return self.table.enter_search(self.GENERAL_SEARCH_INPUT, text)
 
     def enter_brand_name_search(self, text):
         """Enter text in Brand Name search field"""
-        return self.enter_text(self.BRAND_NAME_SEARCH_INPUT, text)
+        return self.table.enter_search(self.BRAND_NAME_SEARCH_INPUT, text)
 
     def enter_code_search(self, text):
         """Enter text in Code search field"""
-        return self.enter_text(self.CODE_SEARCH_INPUT, text)
+        return self.table.enter_search(self.CODE_SEARCH_INPUT, text)
 
     def clear_general_search(self):
         """Clear general search field"""
@@ -145,7 +159,7 @@ class BrandsPage(BasePage):
         self.clear_general_search()
         self.clear_brand_name_search()
         self.clear_code_search()
-        time.sleep(1)  # Wait for table to refresh
+        self.wait_for_table_update()
 
     def click_search_button(self):
         """Click the search button"""
@@ -176,55 +190,26 @@ class BrandsPage(BasePage):
 
     def get_table_rows(self):
         """Get all table rows"""
-        return self.find_elements(self.TABLE_ROWS)
+        return self.table.get_rows()
 
     def get_table_row_count(self):
         """Get number of visible table rows"""
-        rows = self.get_table_rows()
-        return len(rows)
+        return self.table.get_row_count()
 
     def is_table_empty(self):
         """Check if table shows no data"""
-        try:
-            # Check for no data message or empty table
-            no_data = self.find_element(self.NO_DATA_MESSAGE, timeout=3)
-            if no_data and no_data.is_displayed():
-                return True
+        return self.table.is_empty()
 
-            # Alternative: check if table has no rows
-            rows = self.get_table_rows()
-            return len(rows) == 0
+    def get_table_data(self, bulk=None):
+        """Get all table data as list of dictionaries
 
-        except:
-            rows = self.get_table_rows()
-            return len(rows) == 0
-
-    def get_table_data(self):
-        """Get all table data as list of dictionaries"""
-        rows = self.get_table_rows()
-        table_data = []
-
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 4:  # Ensure we have enough columns (ID, Brand Name, Code, Actions)
-                row_data = {
-                    'id': cells[0].text.strip(),
-                    'brand_name': cells[1].text.strip(),
-                    'code': cells[2].text.strip(),
-                    'has_actions': self._has_action_buttons(cells[3])
-                }
-                table_data.append(row_data)
-
-        return table_data
-
-    def _has_action_buttons(self, cell):
-        """Check if action buttons are present in cell"""
-        try:
-            edit_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-edit")
-            delete_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-trash")
-            return edit_btn is not None and delete_btn is not None
-        except:
-            return False
+        Args:
+            bulk (bool): Read the whole table with one execute_script call instead of
+                one round-trip per cell (default: Config.BULK_TABLE_EXTRACTION)
+        """
+        if not self.use_bulk_table_extraction(bulk):
+            return self.table.get_data_per_cell()
+        return self.table.get_data()
 
     # =======================
     # SORTING METHODS
@@ -232,70 +217,19 @@ class BrandsPage(BasePage):
 
     def get_sort_order(self, header_locator):
         """Get current sort order of a column (asc, desc, or none)"""
-        try:
-            element = self.find_element(header_locator)
-            if element:
-                classes = element.get_attribute('class')
-                if 'asc' in classes:
-                    return 'asc'
-                elif 'desc' in classes:
-                    return 'desc'
-                else:
-                    return 'none'
-        except:
-            return 'none'
+        return self.table.get_sort_order(header_locator)
 
     def sort_by_column(self, column_name, order='asc'):
         """Sort by specific column with desired order"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'brand_name': self.BRAND_NAME_HEADER,
-            'code': self.CODE_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-        current_order = self.get_sort_order(header_locator)
-
-        if order == 'asc':
-            if current_order != 'asc':
-                self.click_element(header_locator)
-                if self.get_sort_order(header_locator) != 'asc':
-                    self.click_element(header_locator)  # Click again if needed
-        elif order == 'desc':
-            if current_order == 'none':
-                self.click_element(header_locator)  # First click for asc
-                time.sleep(0.5)
-            if self.get_sort_order(header_locator) != 'desc':
-                self.click_element(header_locator)  # Second click for desc
-
-        time.sleep(1)  # Wait for sorting to complete
-        return True
+        return self.table.sort_by(column_name, order)
 
     def click_sort_to_default(self, column_name):
         """Click column header until sorting returns to default (none)"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'brand_name': self.BRAND_NAME_HEADER,
-            'code': self.CODE_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-
-        # Click up to 3 times to cycle through: none -> asc -> desc -> none
-        for _ in range(3):
-            current_order = self.get_sort_order(header_locator)
-            if current_order == 'none':
-                return True
-            self.click_element(header_locator)
-            time.sleep(0.5)
-
-        return False
+        return self.table.sort_to_default(column_name)
 
     # =======================
     # BUTTON ACTIONS
@@ -322,13 +256,25 @@ class BrandsPage(BasePage):
     # =======================
 
     def refresh_page(self):
-        """Refresh the page to reset all filters and sorting"""
-        self.driver.refresh()
-        self.wait_for_page_load()
+        """Reload the page to reset all filters and sorting"""
+        self.open_route(self.TABLE_ROUTE, self.wait_for_page_load, force_reload=True)
 
     def wait_for_table_update(self, timeout=5):
         """Wait for table to update after filter/sort action"""
-        time.sleep(1)  # Basic wait for Angular table updates
+        self.table.wait_for_update(timeout)
+
+    def reset_page_state(self):
+        """Undo the general search, filters, sort order and selection in place
+
+        Returns:
+            bool: False if the page has to be reloaded instead
+        """
+        if self.get_general_search_value():
+            self.clear_general_search()
+            self.table.watch()
+            self.click_reset_button()
+            self.wait_for_table_update()
+        return self.table.reset_state()
 
     def search_and_verify_results(self, general_text="", brand_name_text="", code_text=""):
         """Search with given criteria and return results"""
@@ -344,16 +290,7 @@ class BrandsPage(BasePage):
 
     def verify_search_results_contain_text(self, search_text, column='brand_name'):
         """Verify that search results contain the expected text"""
-        table_data = self.get_table_data()
-
-        if not table_data:
-            return False
-
-        for row in table_data:
-            if column in row and search_text.lower() in row[column].lower():
-                return True
-
-        return False
+        return self.table.rows_contain_text(self.get_table_data(), search_text, column)
 
     def get_pagination_info(self):
         """Get pagination information"""
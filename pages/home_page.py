@@ -71,7 +71,7 @@ class HomePage(BasePage):
                     if english_option and english_option.is_displayed():
                         print(f"Found English option with selector: {selector}")
                         english_option.click()
-                        time.sleep(1.5)  # Wait for language change to take effect
+                        self.wait_for_app_idle()  # Wait for language change to take effect
                         print("✅ Language changed to English successfully!")
                         return True
                 except Exception as e:
@@ -205,8 +205,8 @@ class HomePage(BasePage):
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "nb-layout-header"))
             )
-            # Short additional wait for dynamic content
-            time.sleep(0.5)
+            # Wait for dynamic content
+            self.wait_for_app_idle()
             print("✅ Home page loaded")
             return True
         except TimeoutException:
@@ -266,7 +266,7 @@ class HomePage(BasePage):
                         option = self.find_element(selector, timeout=2)
                         if option:
                             option.click()
-                            time.sleep(2)
+                            self.wait_for_app_idle()
                             return True
                     except:
                         continue
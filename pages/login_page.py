@@ -3,6 +3,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from pages.base_page import BasePage
+from config.config import Config
 import time
 
 class LoginPage(BasePage):
@@ -34,15 +35,16 @@ class LoginPage(BasePage):
     # OPTIMIZED NAVIGATION METHODS
     # =======================
 
-    def navigate_to_login_page(self, base_url="http://localhost"):
-        """Optimized navigation - try most likely URL first"""
+    def navigate_to_login_page(self, base_url=None):
+        """Optimized navigation - try most likely URL first (default: Config.BASE_URL)"""
+        base_url = (base_url or Config.BASE_URL).rstrip("/")
         try:
             # Based on your success, try the working URL first
             login_url = f"{base_url}/#/auth"
             print(f"🚀 Navigating directly to: {login_url}")
 
             self.driver.get(login_url)
-            time.sleep(2)  # Reduced wait time
+            self.wait_for_app_idle()
 
             if self._quick_login_check():
                 print(f"✅ Login page loaded successfully")
@@ -78,7 +80,7 @@ class LoginPage(BasePage):
             try:
                 print(f"Trying fallback: {login_url}")
                 self.driver.get(login_url)
-                time.sleep(2)
+                self.wait_for_app_idle()
 
                 if self._quick_login_check():
                     print(f"✅ Fallback successful: {login_url}")
@@ -172,7 +174,7 @@ class LoginPage(BasePage):
                     lambda driver: driver.current_url != start_url and "auth" not in driver.current_url.lower()
                 )
                 print(f"✅ URL changed - login successful")
-                time.sleep(1)  # Minimal stabilization time
+                self.wait_for_app_idle()
                 return True
             except TimeoutException:
                 pass
@@ -4,6 +4,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from pages.base_page import BasePage
+from pages.smart_table_component import SmartTableComponent
+from pages.routes import ROUTES
 import time
 
 class OptionsSetPage(BasePage):
@@ -35,9 +37,24 @@ class OptionsSetPage(BasePage):
     # Notification/Alert Messages
     NOTIFICATION = (By.CSS_SELECTOR, ".toast, .alert, .notification")
 
+    REQUEST_BLOCKING = "admin"
+
+    # Smart table layout: (field, column key, kind) in on-screen order
+    TABLE_ROUTE = ROUTES["options_set"]
+    TABLE_COLUMNS = [
+        ('id', 'id', 'text'),
+        ('code', 'code', 'text'),
+        ('option_name', 'option', 'text'),
+        ('option_value', 'values', 'text'),
+        ('product_types', 'productTypes', 'text'),
+        ('has_actions', 'actions', 'has_actions'),
+    ]
+    SORTABLE_COLUMNS = ('id', 'code', 'option_name', 'option_value', 'product_types')
+
     def __init__(self, driver):
         super().__init__(driver)
         self.wait = WebDriverWait(driver, 15)
+        self.table = SmartTableComponent(driver, route=self.TABLE_ROUTE, columns=self.TABLE_COLUMNS)
 
     # =======================
     # NAVIGATION METHOD
@@ -48,11 +65,8 @@ class OptionsSetPage(BasePage):
         try:
             print("⚙️ Navigating to options set page...")
 
-            # Direct navigation to options set page
-            self.driver.get("http://localhost/#/pages/catalogue/options/options-set-list")
-
-            # Wait for page to load
-            if self.wait_for_page_load():
+            # In-app route switch when the admin is already loaded, full load otherwise
+            if self.open_route(self.TABLE_ROUTE, self.wait_for_page_load):
                 print("✓ Successfully navigated to options set page")
                 return True
 
@@ -74,8 +88,11 @@ class OptionsSetPage(BasePage):
                 )
             )
 
-            # Additional wait for Angular to finish rendering
-            time.sleep(2)
+            # Wait for Angular to finish rendering and the first table fetch
+            self.wait_for_app_idle()
+
+            # Watch the table from here on so later updates are caught by the settle wait
+            self.table.watch()
 
             print("✓ Options set page loaded successfully")
             return True
@@ -93,57 +110,26 @@ class OptionsSetPage(BasePage):
 
     def get_table_rows(self):
         """Get all table rows"""
-        return self.find_elements(self.TABLE_ROWS)
+        return self.table.get_rows()
 
     def get_table_row_count(self):
         """Get number of visible table rows"""
-        rows = self.get_table_rows()
-        return len(rows)
+        return self.table.get_row_count()
 
     def is_table_empty(self):
         """Check if table shows no data"""
-        try:
-            # Check for no data message or empty table
-            no_data = self.find_element(self.NO_DATA_MESSAGE, timeout=3)
-            if no_data and no_data.is_displayed():
-                return True
+        return self.table.is_empty()
 
-            # Alternative: check if table has no rows
-            rows = self.get_table_rows()
-            return len(rows) == 0
+    def get_table_data(self, bulk=None):
+        """Get all table data as list of dictionaries
 
-        except:
-            rows = self.get_table_rows()
-            return len(rows) == 0
-
-    def get_table_data(self):
-        """Get all table data as list of dictionaries"""
-        rows = self.get_table_rows()
-        table_data = []
-
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 6:  # Ensure we have enough columns
-                row_data = {
-                    'id': cells[0].text.strip(),
-                    'code': cells[1].text.strip(),
-                    'option_name': cells[2].text.strip(),
-                    'option_value': cells[3].text.strip(),
-                    'product_types': cells[4].text.strip(),
-                    'has_actions': self._has_action_buttons(cells[5])
-                }
-                table_data.append(row_data)
-
-        return table_data
-
-    def _has_action_buttons(self, cell):
-        """Check if action buttons are present in cell"""
-        try:
-            edit_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-edit")
-            delete_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-trash")
-            return edit_btn is not None and delete_btn is not None
-        except:
-            return False
+        Args:
+            bulk (bool): Read the whole table with one execute_script call instead of
+                one round-trip per cell (default: Config.BULK_TABLE_EXTRACTION)
+        """
+        if not self.use_bulk_table_extraction(bulk):
+            return self.table.get_data_per_cell()
+        return self.table.get_data()
 
     # =======================
     # SORTING METHODS
@@ -151,74 +137,19 @@ class OptionsSetPage(BasePage):
 
     def get_sort_order(self, header_locator):
         """Get current sort order of a column (asc, desc, or none)"""
-        try:
-            element = self.find_element(header_locator)
-            if element:
-                classes = element.get_attribute('class')
-                if 'asc' in classes:
-                    return 'asc'
-                elif 'desc' in classes:
-                    return 'desc'
-                else:
-                    return 'none'
-        except:
-            return 'none'
+        return self.table.get_sort_order(header_locator)
 
     def sort_by_column(self, column_name, order='asc'):
         """Sort by specific column with desired order"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'code': self.CODE_HEADER,
-            'option_name': self.OPTION_HEADER,
-            'option_value': self.VALUES_HEADER,
-            'product_types': self.PRODUCT_TYPES_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-        current_order = self.get_sort_order(header_locator)
-
-        if order == 'asc':
-            if current_order != 'asc':
-                self.click_element(header_locator)
-                if self.get_sort_order(header_locator) != 'asc':
-                    self.click_element(header_locator)  # Click again if needed
-        elif order == 'desc':
-            if current_order == 'none':
-                self.click_element(header_locator)  # First click for asc
-                time.sleep(0.5)
-            if self.get_sort_order(header_locator) != 'desc':
-                self.click_element(header_locator)  # Second click for desc
-
-        time.sleep(1)  # Wait for sorting to complete
-        return True
+        return self.table.sort_by(column_name, order)
 
     def click_sort_to_default(self, column_name):
         """Click column header until sorting returns to default (none)"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'code': self.CODE_HEADER,
-            'option_name': self.OPTION_HEADER,
-            'option_value': self.VALUES_HEADER,
-            'product_types': self.PRODUCT_TYPES_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-
-        # Click up to 3 times to cycle through: none -> asc -> desc -> none
-        for _ in range(3):
-            current_order = self.get_sort_order(header_locator)
-            if current_order == 'none':
-                return True
-            self.click_element(header_locator)
-            time.sleep(0.5)
-
-        return False
+        return self.table.sort_to_default(column_name)
 
     def get_column_data_for_verification(self, column_name):
         """Get data from specific column for sorting verification"""
@@ -283,13 +214,16 @@ class OptionsSetPage(BasePage):
     # =======================
 
     def refresh_page(self):
-        """Refresh the page to reset all filters and sorting"""
-        self.driver.refresh()
-        self.wait_for_page_load()
+        """Reload the page to reset all filters and sorting"""
+        self.open_route(self.TABLE_ROUTE, self.wait_for_page_load, force_reload=True)
 
     def wait_for_table_update(self, timeout=5):
         """Wait for table to update after sort action"""
-        time.sleep(1)  # Basic wait for Angular table updates
+        self.table.wait_for_update(timeout)
+
+    def reset_page_state(self):
+        """Undo filters, sort order and selection in place; False if a reload is needed"""
+        return self.table.reset_state()
 
     def take_options_set_screenshot(self, filename="options_set_page"):
         """Take screenshot of options set page"""
@@ -4,6 +4,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from pages.base_page import BasePage
+from pages.smart_table_component import SmartTableComponent
+from pages.routes import ROUTES
 import time
 
 class ProductOptionsPage(BasePage):
@@ -42,9 +44,22 @@ class ProductOptionsPage(BasePage):
     PAGINATION = (By.CSS_SELECTOR, ".pagination")
     PAGE_COUNTS = (By.CSS_SELECTOR, ".page-counts")
 
+    REQUEST_BLOCKING = "admin"
+
+    # Smart table layout: (field, column key, kind) in on-screen order
+    TABLE_ROUTE = ROUTES["product_options"]
+    TABLE_COLUMNS = [
+        ('id', 'id', 'text'),
+        ('name', 'descriptions', 'text'),
+        ('type', 'type', 'text'),
+        ('has_actions', 'actions', 'has_actions'),
+    ]
+    SORTABLE_COLUMNS = ('id', 'name', 'type')
+
     def __init__(self, driver):
         super().__init__(driver)
         self.wait = WebDriverWait(driver, 15)
+        self.table = SmartTableComponent(driver, route=self.TABLE_ROUTE, columns=self.TABLE_COLUMNS)
 
     # =======================
     # NAVIGATION METHOD
@@ -55,11 +70,8 @@ class ProductOptionsPage(BasePage):
         try:
             print("🔧 Navigating to product options page...")
 
-            # Direct navigation to product options page
-            self.driver.get("http://localhost/#/pages/catalogue/options/options-list")
-
-            # Wait for page to load
-            if self.wait_for_page_load():
+            # In-app route switch when the admin is already loaded, full load otherwise
+            if self.open_route(self.TABLE_ROUTE, self.wait_for_page_load):
                 print("✓ Successfully navigated to product options page")
                 return True
 
@@ -81,8 +93,11 @@ class ProductOptionsPage(BasePage):
                 )
             )
 
-            # Additional wait for Angular to finish rendering
-            time.sleep(2)
+            # Wait for Angular to finish rendering and the first table fetch
+            self.wait_for_app_idle()
+
+            # Watch the table from here on so later updates are caught by the settle wait
+            self.table.watch()
 
             print("✓ Product options page loaded successfully")
             return True
@@ -100,7 +115,7 @@ class ProductOptionsPage(BasePage):
 
     def enter_name_search(self, text):
         """Enter text in Name search field"""
-        return self.enter_text(self.NAME_SEARCH_INPUT, text)
+        return self.table.enter_search(self.NAME_SEARCH_INPUT, text)
 
     def clear_name_search(self):
         """Clear Name search field"""
@@ -134,55 +149,26 @@ class ProductOptionsPage(BasePage):
 
     def get_table_rows(self):
         """Get all table rows"""
-        return self.find_elements(self.TABLE_ROWS)
+        return self.table.get_rows()
 
     def get_table_row_count(self):
         """Get number of visible table rows"""
-        rows = self.get_table_rows()
-        return len(rows)
+        return self.table.get_row_count()
 
     def is_table_empty(self):
         """Check if table shows no data"""
-        try:
-            # Check for no data message or empty table
-            no_data = self.find_element(self.NO_DATA_MESSAGE, timeout=3)
-            if no_data and no_data.is_displayed():
-                return True
+        return self.table.is_empty()
 
-            # Alternative: check if table has no rows
-            rows = self.get_table_rows()
-            return len(rows) == 0
+    def get_table_data(self, bulk=None):
+        """Get all table data as list of dictionaries
 
-        except:
-            rows = self.get_table_rows()
-            return len(rows) == 0
-
-    def get_table_data(self):
-        """Get all table data as list of dictionaries"""
-        rows = self.get_table_rows()
-        table_data = []
-
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 4:  # Ensure we have enough columns (ID, Name, Type, Actions)
-                row_data = {
-                    'id': cells[0].text.strip(),
-                    'name': cells[1].text.strip(),
-                    'type': cells[2].text.strip(),
-                    'has_actions': self._has_action_buttons(cells[3])
-                }
-                table_data.append(row_data)
-
-        return table_data
-
-    def _has_action_buttons(self, cell):
-        """Check if action buttons are present in cell"""
-        try:
-            edit_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-edit")
-            delete_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-trash")
-            return edit_btn is not None and delete_btn is not None
-        except:
-            return False
+        Args:
+            bulk (bool): Read the whole table with one execute_script call instead of
+                one round-trip per cell (default: Config.BULK_TABLE_EXTRACTION)
+        """
+        if not self.use_bulk_table_extraction(bulk):
+            return self.table.get_data_per_cell()
+        return self.table.get_data()
 
     # =======================
     # SORTING METHODS
@@ -190,70 +176,19 @@ class ProductOptionsPage(BasePage):
 
     def get_sort_order(self, header_locator):
         """Get current sort order of a column (asc, desc, or none)"""
-        try:
-            element = self.find_element(header_locator)
-            if element:
-                classes = element.get_attribute('class')
-                if 'asc' in classes:
-                    return 'asc'
-                elif 'desc' in classes:
-                    return 'desc'
-                else:
-                    return 'none'
-        except:
-            return 'none'
+        return self.table.get_sort_order(header_locator)
 
     def sort_by_column(self, column_name, order='asc'):
         """Sort by specific column with desired order"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'name': self.NAME_HEADER,
-            'type': self.TYPE_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-        current_order = self.get_sort_order(header_locator)
-
-        if order == 'asc':
-            if current_order != 'asc':
-                self.click_element(header_locator)
-                if self.get_sort_order(header_locator) != 'asc':
-                    self.click_element(header_locator)  # Click again if needed
-        elif order == 'desc':
-            if current_order == 'none':
-                self.click_element(header_locator)  # First click for asc
-                time.sleep(0.5)
-            if self.get_sort_order(header_locator) != 'desc':
-                self.click_element(header_locator)  # Second click for desc
-
-        time.sleep(1)  # Wait for sorting to complete
-        return True
+        return self.table.sort_by(column_name, order)
 
     def click_sort_to_default(self, column_name):
         """Click column header until sorting returns to default (none)"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'name': self.NAME_HEADER,
-            'type': self.TYPE_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-
-        # Click up to 3 times to cycle through: none -> asc -> desc -> none
-        for _ in range(3):
-            current_order = self.get_sort_order(header_locator)
-            if current_order == 'none':
-                return True
-            self.click_element(header_locator)
-            time.sleep(0.5)
-
-        return False
+        return self.table.sort_to_default(column_name)
 
     # =======================
     # BUTTON ACTIONS
@@ -284,13 +219,16 @@ class ProductOptionsPage(BasePage):
     # =======================
 
     def refresh_page(self):
-        """Refresh the page to reset all filters and sorting"""
-        self.driver.refresh()
-        self.wait_for_page_load()
+        """Reload the page to reset all filters and sorting"""
+        self.open_route(self.TABLE_ROUTE, self.wait_for_page_load, force_reload=True)
 
     def wait_for_table_update(self, timeout=5):
         """Wait for table to update after filter/sort action"""
-        time.sleep(1)  # Basic wait for Angular table updates
+        self.table.wait_for_update(timeout)
+
+    def reset_page_state(self):
+        """Undo filters, sort order and selection in place; False if a reload is needed"""
+        return self.table.reset_state()
 
     def search_and_verify_results(self, name_text=""):
         """Search with given criteria and return results"""
@@ -302,16 +240,7 @@ class ProductOptionsPage(BasePage):
 
     def verify_search_results_contain_text(self, search_text, column='name'):
         """Verify that search results contain the expected text"""
-        table_data = self.get_table_data()
-
-        if not table_data:
-            return False
-
-        for row in table_data:
-            if column in row and search_text.lower() in row[column].lower():
-                return True
-
-        return False
+        return self.table.rows_contain_text(self.get_table_data(), search_text, column)
 
     def get_pagination_info(self):
         """Get pagination information"""
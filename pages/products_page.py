@@ -4,8 +4,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from pages.base_page import BasePage
+from pages.smart_table_component import SmartTableComponent
+from pages.routes import ROUTES
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
+from config.config import Config
 import time
 
 class ProductsPage(BasePage):
@@ -44,16 +47,32 @@ class ProductsPage(BasePage):
     # Notification/Alert Messages
     NOTIFICATION = (By.CSS_SELECTOR, ".toast, .alert, .notification")
 
+    REQUEST_BLOCKING = "admin"
+
+    # Smart table layout: (field, column key, kind) in on-screen order
+    TABLE_ROUTE = ROUTES["products"]
+    TABLE_COLUMNS = [
+        ('id', 'id', 'text'),
+        ('sku', 'sku', 'text'),
+        ('product_name', 'name', 'text'),
+        ('qty', 'quantity', 'text'),
+        ('available', 'available', 'checked'),
+        ('price', 'price', 'text'),
+        ('created', 'creationDate', 'text'),
+    ]
+    SORTABLE_COLUMNS = ('id', 'sku', 'product_name', 'qty', 'price', 'available', 'created')
+
     def __init__(self, driver):
         super().__init__(driver)
         self.wait = WebDriverWait(driver, 15)
+        self.table = SmartTableComponent(driver, route=self.TABLE_ROUTE, columns=self.TABLE_COLUMNS)
 
     # =======================
     # AUTHENTICATION & NAVIGATION METHODS
     # =======================
 
-    def ensure_authenticated_and_navigate(self, base_url="http://localhost", force_login=False):
-        """Ensure user is authenticated and navigate to products page"""
+    def ensure_authenticated_and_navigate(self, base_url=None, force_login=False):
+        """Ensure user is authenticated and navigate to products page (default: Config.BASE_URL)"""
         try:
             print("\n" + "="*60)
             print("ENSURING AUTHENTICATION AND NAVIGATION")
@@ -84,7 +103,7 @@ class ProductsPage(BasePage):
         # Check if we're on login page or if URL suggests we need to login
         if ("login" in current_url or
                 current_url.endswith("/") or
-                "localhost" == current_url.replace("http://", "").replace("https://", "")):
+                current_url == Config.BASE_URL.lower().rstrip("/")):
             return True
 
         # Check if we can access authenticated content
@@ -193,11 +212,8 @@ class ProductsPage(BasePage):
         try:
             print("Navigating to products page...")
 
-            # Method 1: Try direct URL (fastest)
-            self.driver.get("http://localhost/#/pages/catalogue/products/products-list")
-
-            # Wait for page to load
-            if self.wait_for_page_load():
+            # Method 1: In-app route switch when the admin is already loaded, full load otherwise
+            if self.open_route(self.TABLE_ROUTE, self.wait_for_page_load):
                 print("✓ Successfully navigated to products page")
                 return True
 
@@ -227,8 +243,11 @@ class ProductsPage(BasePage):
                 )
             )
 
-            # Additional wait for Angular to finish rendering
-            time.sleep(2)
+            # Wait for Angular to finish rendering and the first table fetch
+            self.wait_for_app_idle()
+
+            # Watch the table from here on so later updates are caught by the settle wait
+            self.table.watch()
 
             # Verify we're actually on the products page
             if self._is_on_products_page():
@@ -249,11 +268,11 @@ class ProductsPage(BasePage):
 
     def enter_sku_search(self, text):
         """Enter text in SKU search field"""
-        return self.enter_text(self.SKU_SEARCH_INPUT, text)
+        return self.table.enter_search(self.SKU_SEARCH_INPUT, text)
 
     def enter_product_name_search(self, text):
         """Enter text in Product Name search field"""
-        return self.enter_text(self.PRODUCT_NAME_SEARCH_INPUT, text)
+        return self.table.enter_search(self.PRODUCT_NAME_SEARCH_INPUT, text)
 
     def clear_sku_search(self):
         """Clear SKU search field"""
@@ -275,7 +294,7 @@ class ProductsPage(BasePage):
         """Clear all search fields"""
         self.clear_sku_search()
         self.clear_product_name_search()
-        time.sleep(1)  # Wait for table to refresh
+        self.wait_for_table_update()
 
     def get_sku_search_value(self):
         """Get current value in SKU search field"""
@@ -293,57 +312,26 @@ class ProductsPage(BasePage):
 
     def get_table_rows(self):
         """Get all table rows"""
-        return self.find_elements(self.TABLE_ROWS)
+        return self.table.get_rows()
 
     def get_table_row_count(self):
         """Get number of visible table rows"""
-        rows = self.get_table_rows()
-        return len(rows)
+        return self.table.get_row_count()
 
     def is_table_empty(self):
         """Check if table shows no data"""
-        try:
-            # Check for no data message or empty table
-            no_data = self.find_element(self.NO_DATA_MESSAGE, timeout=3)
-            if no_data and no_data.is_displayed():
-                return True
+        return self.table.is_empty()
 
-            # Alternative: check if table has no rows
-            rows = self.get_table_rows()
-            return len(rows) == 0
+    def get_table_data(self, bulk=None):
+        """Get all table data as list of dictionaries
 
-        except:
-            rows = self.get_table_rows()
-            return len(rows) == 0
-
-    def get_table_data(self):
-        """Get all table data as list of dictionaries"""
-        rows = self.get_table_rows()
-        table_data = []
-
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) >= 7:  # Ensure we have enough columns
-                row_data = {
-                    'id': cells[0].text.strip(),
-                    'sku': cells[1].text.strip(),
-                    'product_name': cells[2].text.strip(),
-                    'qty': cells[3].text.strip(),
-                    'available': self._is_checkbox_checked(cells[4]),
-                    'price': cells[5].text.strip(),
-                    'created': cells[6].text.strip()
-                }
-                table_data.append(row_data)
-
-        return table_data
-
-    def _is_checkbox_checked(self, cell):
-        """Check if checkbox in cell is checked"""
-        try:
-            checkbox = cell.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
-            return checkbox.is_selected()
-        except:
-            return False
+        Args:
+            bulk (bool): Read the whole table with one execute_script call instead of
+                one round-trip per cell (default: Config.BULK_TABLE_EXTRACTION)
+        """
+        if not self.use_bulk_table_extraction(bulk):
+            return self.table.get_data_per_cell()
+        return self.table.get_data()
 
     # =======================
     # SORTING METHODS
@@ -351,51 +339,13 @@ class ProductsPage(BasePage):
 
     def get_sort_order(self, header_locator):
         """Get current sort order of a column (asc, desc, or none)"""
-        try:
-            element = self.find_element(header_locator)
-            if element:
-                classes = element.get_attribute('class')
-                if 'asc' in classes:
-                    return 'asc'
-                elif 'desc' in classes:
-                    return 'desc'
-                else:
-                    return 'none'
-        except:
-            return 'none'
+        return self.table.get_sort_order(header_locator)
 
     def sort_by_column(self, column_name, order='asc'):
         """Sort by specific column with desired order"""
-        header_map = {
-            'id': self.ID_HEADER,
-            'sku': self.SKU_HEADER,
-            'product_name': self.PRODUCT_NAME_HEADER,
-            'qty': self.QTY_HEADER,
-            'price': self.PRICE_HEADER,
-            'available': self.AVAILABLE_HEADER,
-            'created': self.CREATED_HEADER
-        }
-
-        if column_name not in header_map:
+        if column_name not in self.SORTABLE_COLUMNS:
             return False
-
-        header_locator = header_map[column_name]
-        current_order = self.get_sort_order(header_locator)
-
-        if order == 'asc':
-            if current_order != 'asc':
-                self.click_element(header_locator)
-                if self.get_sort_order(header_locator) != 'asc':
-                    self.click_element(header_locator)  # Click again if needed
-        elif order == 'desc':
-            if current_order == 'none':
-                self.click_element(header_locator)  # First click for asc
-                time.sleep(0.5)
-            if self.get_sort_order(header_locator) != 'desc':
-                self.click_element(header_locator)  # Second click for desc
-
-        time.sleep(1)  # Wait for sorting to complete
-        return True
+        return self.table.sort_by(column_name, order)
 
     # =======================
     # TOGGLE/CHECKBOX METHODS
@@ -406,7 +356,7 @@ class ProductsPage(BasePage):
         checkboxes = self.find_elements(self.AVAILABLE_CHECKBOXES)
         if row_index < len(checkboxes):
             checkboxes[row_index].click()
-            time.sleep(0.5)  # Wait for potential notification
+            self.wait_for_app_idle()  # Wait for the update request and notification
             return True
         return False
 
@@ -431,13 +381,16 @@ class ProductsPage(BasePage):
     # =======================
 
     def refresh_page(self):
-        """Refresh the page to reset all filters and sorting"""
-        self.driver.refresh()
-        self.wait_for_page_load()
+        """Reload the page to reset all filters and sorting"""
+        self.open_route(self.TABLE_ROUTE, self.wait_for_page_load, force_reload=True)
 
     def wait_for_table_update(self, timeout=5):
         """Wait for table to update after filter/sort action"""
-        time.sleep(1)  # Basic wait for Angular table updates
+        self.table.wait_for_update(timeout)
+
+    def reset_page_state(self):
+        """Undo filters, sort order and selection in place; False if a reload is needed"""
+        return self.table.reset_state()
 
     def search_and_verify_results(self, sku_text="", product_name_text=""):
         """Search with given criteria and return results"""
@@ -451,16 +404,7 @@ class ProductsPage(BasePage):
 
     def verify_search_results_contain_text(self, search_text, column='sku'):
         """Verify that search results contain the expected text"""
-        table_data = self.get_table_data()
-
-        if not table_data:
-            return False
-
-        for row in table_data:
-            if column in row and search_text.lower() in row[column].lower():
-                return True
-
-        return False
+        return self.table.rows_contain_text(self.get_table_data(), search_text, column)
 
     def take_products_screenshot(self, filename="products_page"):
         """Take screenshot of products page"""
@@ -0,0 +1,30 @@
+from config.config import Config
+
+# Pages of the Shopizer admin, relative to the #/pages/ shell route
+ROUTES = {
+    "home": "home",
+    "products": "catalogue/products/products-list",
+    "brands": "catalogue/brands/brands-list",
+    "product_groups": "catalogue/products-groups/groups-list",
+    "product_types": "catalogue/types/types-list",
+    "product_options": "catalogue/options/options-list",
+    "options_set": "catalogue/options/options-set-list",
+    "create_product": "catalogue/products/create-product",
+}
+
+SHELL_HASH = "#/pages"
+
+
+def route_path(route):
+    """Route path for a registry name ('brands') or an explicit path ('catalogue/brands/brands-list')"""
+    return ROUTES.get(route, route)
+
+
+def route_hash(route):
+    """Hash fragment the Angular hash router uses for a route"""
+    return f"{SHELL_HASH}/{route_path(route)}"
+
+
+def route_url(route, base_url=None):
+    """Full URL of a route, for a cold load"""
+    return f"{(base_url or Config.BASE_URL).rstrip('/')}/{route_hash(route)}"
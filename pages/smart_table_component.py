@@ -0,0 +1,678 @@
+from selenium.webdriver.common.by import By
+from config.config import Config
+from pages.base_page import BasePage
+from utils.page_metrics import page_metrics
+import re
+import time
+
+# Header layout: the column key of every header cell, in body cell order.
+# ng2-smart-table renders <th class="ng2-smart-th {column key}">; the action column has no key.
+HEADER_SCRIPT_BODY = """
+function columnKeys(table) {
+    var headRow = table.querySelector('thead tr');
+    if (!headRow) { return []; }
+    return Array.prototype.map.call(headRow.querySelectorAll('th'), function (th, index) {
+        var classes = (th.className || '').split(/\\s+/);
+        if (classes.indexOf('ng2-smart-th') >= 0) {
+            for (var i = 0; i < classes.length; i++) {
+                var name = classes[i];
+                if (name && name !== 'ng2-smart-th' && name.indexOf('ng-') !== 0) { return name; }
+            }
+        }
+        if ((th.className || '').indexOf('actions') >= 0 || th.querySelector('[class*="actions"]')) {
+            return 'actions';
+        }
+        return 'col' + index;
+    });
+}
+"""
+
+# One round-trip for the whole table: optional header keys plus, per row and per
+# cell, text, checkbox state (null if none) and edit/delete action presence
+TABLE_DATA_SCRIPT = HEADER_SCRIPT_BODY + """
+var table = document.querySelector(arguments[0]);
+if (!table) { return {columns: [], rows: [], no_data: false}; }
+var noData = table.querySelector('.ng2-smart-no-data-message');
+return {
+    columns: arguments[1] ? columnKeys(table) : null,
+    no_data: !!(noData && noData.offsetParent !== null),
+    rows: Array.prototype.map.call(table.querySelectorAll('tbody tr'), function (row) {
+        return Array.prototype.map.call(row.querySelectorAll('td'), function (cell) {
+            var checkbox = cell.querySelector("input[type='checkbox']");
+            return {
+                text: (cell.innerText || '').trim(),
+                checked: checkbox ? checkbox.checked : null,
+                has_actions: !!(cell.querySelector('i.nb-edit') && cell.querySelector('i.nb-trash'))
+            };
+        });
+    })
+};
+"""
+
+HEADER_SCRIPT = HEADER_SCRIPT_BODY + """
+var table = document.querySelector(arguments[0]);
+return table ? columnKeys(table) : [];
+"""
+
+# Sort direction of every sortable column, read from the header link classes
+SORT_STATE_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+var state = {};
+if (!table) { return state; }
+Array.prototype.forEach.call(table.querySelectorAll('th.ng2-smart-th'), function (th) {
+    var classes = (th.className || '').split(/\\s+/).filter(function (name) {
+        return name && name !== 'ng2-smart-th' && name.indexOf('ng-') !== 0;
+    });
+    var link = th.querySelector('a');
+    var linkClass = link ? (link.className || '') : '';
+    var order = linkClass.indexOf('asc') >= 0 ? 'asc' : (linkClass.indexOf('desc') >= 0 ? 'desc' : 'none');
+    if (classes.length) { state[classes[0]] = order; }
+});
+return state;
+"""
+
+# Current value of every filter input in the header, keyed by column position
+FILTER_VALUES_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+var values = {};
+if (!table) { return values; }
+var rows = table.querySelectorAll('thead tr');
+for (var r = 1; r < rows.length; r++) {
+    Array.prototype.forEach.call(rows[r].querySelectorAll('th'), function (th, index) {
+        var input = th.querySelector('input:not([type="checkbox"]), select');
+        if (input) { values[index] = input.value; }
+    });
+}
+return values;
+"""
+
+# Empty every non-blank header filter and notify Angular; returns how many changed
+CLEAR_FILTERS_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+if (!table) { return 0; }
+var cleared = 0;
+Array.prototype.forEach.call(table.querySelectorAll('thead input:not([type="checkbox"])'), function (input) {
+    if (!input.value) { return; }
+    input.value = '';
+    ['input', 'change', 'keyup'].forEach(function (type) {
+        input.dispatchEvent(new Event(type, {bubbles: true}));
+    });
+    cleared++;
+});
+return cleared;
+"""
+
+# The merchant store autocomplete of the list pages (PrimeNG p-autocomplete) and its option panel
+AUTOCOMPLETE_SCRIPT_BODY = """
+var AUTOCOMPLETE_INPUTS = 'p-autocomplete input, input.ui-autocomplete-input';
+var AUTOCOMPLETE_PANELS = '.ui-autocomplete-panel';
+"""
+
+# Everything a test can leave behind on a list view, in one round-trip: the route, a merchant
+# store changed since the table was loaded (the watch remembers the loaded values), an open
+# autocomplete panel, non-blank header filters, sorted columns, checked selection boxes and
+# the current page
+VIEW_STATE_SCRIPT = AUTOCOMPLETE_SCRIPT_BODY + """
+var table = document.querySelector(arguments[0]);
+var state = {hash: location.hash, present: !!table, autocomplete: 0, overlays: 0, filters: 0, sorted: [],
+             selected: 0, page: 1};
+var watch = window.__smartTableWatch;
+var loaded = watch && watch.target === table ? watch.autocomplete : [];
+Array.prototype.forEach.call(document.querySelectorAll(AUTOCOMPLETE_INPUTS), function (input, index) {
+    if (input.value !== (loaded[index] || '')) { state.autocomplete++; }
+});
+Array.prototype.forEach.call(document.querySelectorAll(AUTOCOMPLETE_PANELS),
+    function (panel) { if (panel.offsetParent !== null) { state.overlays++; } });
+if (!table) { return state; }
+Array.prototype.forEach.call(table.querySelectorAll('thead input:not([type="checkbox"]), thead select'),
+    function (input) { if (input.value) { state.filters++; } });
+Array.prototype.forEach.call(table.querySelectorAll('th.ng2-smart-th'), function (th) {
+    var link = th.querySelector('a');
+    var linkClass = link ? (link.className || '') : '';
+    var key = (th.className || '').split(/\\s+/).filter(function (name) {
+        return name && name !== 'ng2-smart-th' && name.indexOf('ng-') !== 0;
+    })[0];
+    if (key && (linkClass.indexOf('asc') >= 0 || linkClass.indexOf('desc') >= 0)) { state.sorted.push(key); }
+});
+state.selected = table.querySelectorAll('.ng2-smart-actions input[type="checkbox"]:checked').length;
+var active = document.querySelector('ng2-smart-table-pager .page-item.active, .ng2-smart-pagination .active');
+if (active) { state.page = parseInt((active.innerText || '1').trim(), 10) || 1; }
+return state;
+"""
+
+# Close open autocomplete panels: Escape on their input, then a click outside for panels
+# that only close on blur
+CLOSE_AUTOCOMPLETE_SCRIPT = AUTOCOMPLETE_SCRIPT_BODY + """
+Array.prototype.forEach.call(document.querySelectorAll(AUTOCOMPLETE_INPUTS), function (input) {
+    input.dispatchEvent(new KeyboardEvent('keydown', {key: 'Escape', bubbles: true}));
+});
+document.body.click();
+"""
+
+# Untick every checked selection box (multi-select mode); returns how many were clicked
+CLEAR_SELECTION_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+if (!table) { return 0; }
+var boxes = table.querySelectorAll('.ng2-smart-actions input[type="checkbox"]:checked');
+Array.prototype.forEach.call(boxes, function (box) { box.click(); });
+return boxes.length;
+"""
+
+# Go back to the first page of the pager; returns false if there is no first-page link
+FIRST_PAGE_SCRIPT = """
+var link = document.querySelector('ng2-smart-table-pager .page-item:not(.disabled) a.page-link[aria-label="First"], ' +
+                                  '.ng2-smart-pagination .ng2-smart-page-link[aria-label="First"]');
+if (!link) { return false; }
+link.click();
+return true;
+"""
+
+
+# Persistent MutationObserver on the table body. Counts row/cell mutations and remembers
+# when the last one happened; `seen` is the count at the end of the previous wait.
+WATCH_SCRIPT_BODY = AUTOCOMPLETE_SCRIPT_BODY + """
+function watchTable(selector) {
+    var table = document.querySelector(selector);
+    if (!table) { return null; }
+    var state = window.__smartTableWatch;
+    if (state && state.target === table) { return state; }
+    if (state) { state.observer.disconnect(); }
+    // Merchant store autocomplete values as loaded with this table (see VIEW_STATE_SCRIPT)
+    state = {target: table, count: 0, seen: 0, last: performance.now(),
+             autocomplete: Array.prototype.map.call(document.querySelectorAll(AUTOCOMPLETE_INPUTS),
+                                                    function (input) { return input.value; })};
+    function inBody(node) {
+        var element = node.nodeType === 1 ? node : node.parentNode;
+        return !!(element && (element.tagName === 'TABLE' || (element.closest && element.closest('tbody'))));
+    }
+    state.observer = new MutationObserver(function (records) {
+        for (var i = 0; i < records.length; i++) {
+            if (inBody(records[i].target)) { state.count++; state.last = performance.now(); }
+        }
+    });
+    state.observer.observe(table, {childList: true, subtree: true, characterData: true, attributes: true});
+    window.__smartTableWatch = state;
+    return state;
+}
+"""
+
+# Arm the watch before an action: only mutations after this call count as the update
+WATCH_SCRIPT = WATCH_SCRIPT_BODY + """
+var state = watchTable(arguments[0]);
+if (state) { state.seen = state.count; }
+return !!state;
+"""
+
+# Resolve once the body changed and then stayed quiet for arguments[1] ms. If nothing
+# changes within arguments[2] ms the table is taken as already settled.
+SETTLE_SCRIPT = WATCH_SCRIPT_BODY + """
+var done = arguments[arguments.length - 1];
+var quietMs = arguments[1], changeMs = arguments[2], timeoutMs = arguments[3];
+var state = watchTable(arguments[0]);
+if (!state) { done({settled: false, mutations: 0, changed: false}); return; }
+var start = performance.now();
+function finish(settled, changed) {
+    var mutations = state.count - state.seen;
+    state.seen = state.count;
+    done({settled: settled, mutations: mutations, changed: changed});
+}
+(function poll() {
+    var now = performance.now();
+    var changed = state.count > state.seen;
+    if (changed && now - state.last >= quietMs) { finish(true, true); return; }
+    if (!changed && now - start >= changeMs) { finish(true, false); return; }
+    if (now - start >= timeoutMs) { finish(false, changed); return; }
+    setTimeout(poll, 25);
+})();
+"""
+
+
+class SmartTableComponent(BasePage):
+    """Reusable component for ng2-smart-table list views (products, brands, groups, ...)
+
+    Reads the header layout once and caches the column-key -> index map per route,
+    so page objects address cells by column key instead of hard-coded positions.
+    Reads, sort state and filter state are batched into single execute_script calls.
+
+    Page objects describe their columns as (field, column key, kind) tuples, where
+    kind is 'text', 'checked' (checkbox state) or 'has_actions' (edit + delete icons):
+
+        COLUMNS = [('id', 'id', 'text'), ('brand_name', 'description', 'text'),
+                   ('has_actions', 'actions', 'has_actions')]
+    """
+
+    TABLE = "ng2-smart-table"
+    TABLE_ROWS = (By.CSS_SELECTOR, "ng2-smart-table tbody tr")
+    NO_DATA_MESSAGE = (By.CSS_SELECTOR, ".ng2-smart-no-data-message")
+
+    # Column layout per route, shared by every instance in the session
+    _column_cache = {}
+
+    def __init__(self, driver, route=None, columns=None):
+        """
+        Args:
+            driver: WebDriver instance
+            route (str): Route of the list page, used as the column cache key
+            columns (list): (field, column key, kind) tuples in on-screen order
+        """
+        super().__init__(driver)
+        self.route = route
+        self.columns = columns or []
+
+    # =======================
+    # COLUMN LAYOUT
+    # =======================
+
+    def get_column_index(self):
+        """Column key -> cell index for this route (read once, then cached)"""
+        cache_key = self._cache_key()
+        if cache_key not in self._column_cache:
+            keys = self.driver.execute_script(HEADER_SCRIPT, self.TABLE) or []
+            self._remember_columns(cache_key, keys)
+        return self._column_cache.get(cache_key, {})
+
+    def invalidate_column_cache(self):
+        """Forget the cached layout of this route (e.g. after columns were toggled)"""
+        self._column_cache.pop(self._cache_key(), None)
+
+    def column_key(self, field):
+        """Column key for a page field name ('brand_name' -> 'description')"""
+        for name, key, _ in self.columns:
+            if name == field:
+                return key
+        return field
+
+    def _positions(self, column_index):
+        """Cell index of every configured field - falls back to declaration order"""
+        positions = {}
+        for position, (field, key, _) in enumerate(self.columns):
+            positions[field] = column_index.get(key, position)
+        return positions
+
+    def _remember_columns(self, cache_key, keys):
+        if keys:
+            self._column_cache[cache_key] = {key: index for index, key in enumerate(keys)}
+
+    def _cache_key(self):
+        return self.route or self.driver.current_url.split("?")[0]
+
+    # =======================
+    # BATCHED READS
+    # =======================
+
+    def read(self):
+        """Raw table snapshot in one round-trip: {'rows': [[cell, ...]], 'no_data': bool}"""
+        cache_key = self._cache_key()
+        need_header = cache_key not in self._column_cache
+        snapshot = self.driver.execute_script(TABLE_DATA_SCRIPT, self.TABLE, need_header) or {}
+        if need_header:
+            self._remember_columns(cache_key, snapshot.get("columns") or [])
+        return snapshot
+
+    def get_data(self):
+        """All rows as dictionaries keyed by the page's field names (single round-trip)"""
+        snapshot = self.read()
+        positions = self._positions(self._column_cache.get(self._cache_key(), {}))
+        return self._rows_to_dicts(snapshot.get("rows", []), positions)
+
+    def get_data_per_cell(self):
+        """Legacy read - one WebDriver round-trip per row and per cell"""
+        positions = self._positions(self.get_column_index())
+        min_cells = max(positions.values()) + 1 if positions else 0
+        table_data = []
+
+        for row in self.get_rows():
+            cells = row.find_elements(By.TAG_NAME, "td")
+            if len(cells) < min_cells:
+                continue
+
+            row_data = {}
+            for field, _, kind in self.columns:
+                cell = cells[positions[field]]
+                if kind == "checked":
+                    row_data[field] = self._is_checkbox_checked(cell)
+                elif kind == "has_actions":
+                    row_data[field] = self._has_action_buttons(cell)
+                else:
+                    row_data[field] = cell.text.strip()
+            table_data.append(row_data)
+
+        return table_data
+
+    def get_rows(self):
+        """Get all table row elements"""
+        return self.find_elements(self.TABLE_ROWS)
+
+    def get_row_count(self):
+        """Number of data rows (the 'no data' placeholder row is not counted)"""
+        snapshot = self.read()
+        if snapshot.get("no_data"):
+            return 0
+        return len(self._data_rows(snapshot.get("rows", [])))
+
+    def is_empty(self):
+        """True when the table shows its 'no data' message or has no data rows"""
+        return self.get_row_count() == 0
+
+    def rows_contain_text(self, rows, search_text, field):
+        """True if any row's field contains the text (case-insensitive)"""
+        if not rows:
+            return False
+
+        for row in rows:
+            if field in row and search_text.lower() in str(row[field]).lower():
+                return True
+
+        return False
+
+    def _rows_to_dicts(self, rows, positions):
+        table_data = []
+        for cells in self._data_rows(rows, positions):
+            row_data = {}
+            for field, _, kind in self.columns:
+                cell = cells[positions[field]]
+                if kind == "checked":
+                    row_data[field] = bool(cell["checked"])
+                elif kind == "has_actions":
+                    row_data[field] = cell["has_actions"]
+                else:
+                    row_data[field] = cell["text"]
+            table_data.append(row_data)
+        return table_data
+
+    def _data_rows(self, rows, positions=None):
+        """Drop placeholder rows (e.g. a single colspan 'No data found' cell)"""
+        if positions is None:
+            positions = self._positions(self._column_cache.get(self._cache_key(), {}))
+        min_cells = max(positions.values()) + 1 if positions else 2
+        return [cells for cells in rows if len(cells) >= min_cells]
+
+    def _is_checkbox_checked(self, cell):
+        """Check if checkbox in cell is checked"""
+        try:
+            checkbox = cell.find_element(By.CSS_SELECTOR, "input[type='checkbox']")
+            return checkbox.is_selected()
+        except:
+            return False
+
+    def _has_action_buttons(self, cell):
+        """Check if action buttons are present in cell"""
+        try:
+            edit_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-edit")
+            delete_btn = cell.find_element(By.CSS_SELECTOR, "i.nb-trash")
+            return edit_btn is not None and delete_btn is not None
+        except:
+            return False
+
+    # =======================
+    # SORTING
+    # =======================
+
+    def header_locator(self, column):
+        """Sort link locator for a column key or page field name"""
+        return (By.CSS_SELECTOR, f"th.ng2-smart-th.{self.column_key(column)} a")
+
+    def get_sort_state(self):
+        """Sort order of every sortable column in one round-trip"""
+        return self.driver.execute_script(SORT_STATE_SCRIPT, self.TABLE) or {}
+
+    def get_sort_order(self, column):
+        """
+        Current sort order of a column (asc, desc, or none)
+
+        Args:
+            column: Column key, page field name or a header locator tuple
+        """
+        if isinstance(column, tuple):
+            match = re.search(r"ng2-smart-th\.([\w-]+)", column[1])
+            column = match.group(1) if match else column[1]
+        try:
+            return self.get_sort_state().get(self.column_key(column), 'none')
+        except:
+            return 'none'
+
+    def sort_by(self, column, order='asc'):
+        """Sort by a column (key or field name) with the desired order"""
+        locator = self.header_locator(column)
+        current_order = self.get_sort_order(column)
+
+        if order == 'asc':
+            if current_order != 'asc':
+                self._click_and_settle(locator)
+                if self.get_sort_order(column) != 'asc':
+                    self._click_and_settle(locator)  # Click again if needed
+        elif order == 'desc':
+            if current_order == 'none':
+                self._click_and_settle(locator)  # First click for asc
+            if self.get_sort_order(column) != 'desc':
+                self._click_and_settle(locator)  # Second click for desc
+
+        return True
+
+    def sort_to_default(self, column):
+        """Click the column header until sorting returns to default (none)"""
+        locator = self.header_locator(column)
+
+        # Click up to 3 times to cycle through: none -> asc -> desc -> none
+        for _ in range(3):
+            if self.get_sort_order(column) == 'none':
+                return True
+            self._click_and_settle(locator)
+
+        return False
+
+    def _click_and_settle(self, locator):
+        self.watch()
+        self.mark_table_action("sort")
+        self.click_element(locator)
+        self.wait_for_update()
+
+    # =======================
+    # FILTERING
+    # =======================
+
+    def filter_locator(self, column):
+        """Filter input locator for a column key or page field name"""
+        position = self.get_column_index().get(self.column_key(column))
+        if position is None:
+            return None
+        return (By.CSS_SELECTOR,
+                f"ng2-smart-table thead tr:nth-of-type(2) th:nth-of-type({position + 1}) input")
+
+    def filter_by(self, column, text):
+        """Type into the header filter of a column and wait for the table"""
+        locator = self.filter_locator(column)
+        if locator is None:
+            return False
+        self.watch()
+        if not self.enter_search(locator, text):
+            return False
+        self.wait_for_update()
+        return True
+
+    def enter_search(self, locator, text):
+        """Type a search that reloads this table (header filter or a page's search field);
+        the next settle wait reports its latency as search_settle"""
+        if not self.enter_text(locator, text):
+            return False
+        self.mark_table_action("search")
+        return True
+
+    def get_filter_values(self):
+        """Current value of every header filter, keyed by column key (one round-trip)"""
+        by_position = self.driver.execute_script(FILTER_VALUES_SCRIPT, self.TABLE) or {}
+        keys_by_position = {index: key for key, index in self.get_column_index().items()}
+        return {keys_by_position.get(int(position), position): value
+                for position, value in by_position.items()}
+
+    def clear_filters(self):
+        """Empty every header filter in one round-trip; returns how many were changed"""
+        self.watch()
+        cleared = self.driver.execute_script(CLEAR_FILTERS_SCRIPT, self.TABLE) or 0
+        if cleared:
+            self.wait_for_update()
+        return cleared
+
+    # =======================
+    # VIEW STATE
+    # =======================
+
+    def get_view_state(self):
+        """Route, filter, sort, selection and pager state of the view in one round-trip"""
+        try:
+            return self.driver.execute_script(VIEW_STATE_SCRIPT, self.TABLE) or {}
+        except Exception:
+            return {}
+
+    def is_pristine(self, state=None):
+        """True if the view is on its route with the merchant store it loaded with, no open
+        autocomplete panel and no filters, sorting, selection or paging"""
+        state = self.get_view_state() if state is None else state
+        return bool(
+            state.get("present")
+            and (not self.route or self.route in state.get("hash", ""))
+            and not state.get("autocomplete")
+            and not state.get("overlays")
+            and not state.get("filters")
+            and not state.get("sorted")
+            and not state.get("selected")
+            and state.get("page", 1) == 1
+        )
+
+    def reset_state(self):
+        """Undo only what a previous test changed - open autocomplete panel, filters, sort order,
+        selection, paging
+
+        Lets a page fixture shared by several tests skip the SPA reload. Costs one script
+        call when the view is already clean.
+
+        Returns:
+            bool: True if the view is pristine afterwards; False if it has to be reloaded
+                  (table gone, route left, another merchant store chosen, an autocomplete
+                  panel that stays open, or a column that will not return to unsorted)
+        """
+        start = time.perf_counter()
+        state = self.get_view_state()
+
+        if self.is_pristine(state):
+            self._record_reset("clean", start)
+            return True
+        if (not state.get("present") or (self.route and self.route not in state.get("hash", ""))
+                or state.get("autocomplete")):
+            self._record_reset("failed", start)
+            return False
+
+        try:
+            if state.get("overlays"):
+                self.driver.execute_script(CLOSE_AUTOCOMPLETE_SCRIPT)
+            if state.get("filters"):
+                self.clear_filters()
+            for key in state.get("sorted", []):
+                self.sort_to_default(key)
+            if state.get("selected"):
+                self.watch()
+                self.driver.execute_script(CLEAR_SELECTION_SCRIPT, self.TABLE)
+                self.wait_for_update()
+            if state.get("page", 1) != 1:
+                self.watch()
+                if self.driver.execute_script(FIRST_PAGE_SCRIPT):
+                    self.wait_for_update()
+        except Exception as e:
+            print(f"⚠ Table reset failed: {e}")
+            self._record_reset("failed", start)
+            return False
+
+        restored = self.is_pristine()
+        self._record_reset("restored" if restored else "failed", start)
+        return restored
+
+    @classmethod
+    def _record_reset(cls, outcome, start):
+        page_metrics.reset_stats[outcome] += 1
+        page_metrics.reset_stats["seconds"] += time.perf_counter() - start
+
+    @classmethod
+    def reset_report(cls):
+        """Shared page fixture resets for the end-of-session report"""
+        stats = page_metrics.reset_stats
+        total = stats["clean"] + stats["restored"] + stats["failed"]
+        if not total:
+            return []
+        return [
+            f"resets={total} already clean={stats['clean']} restored in place={stats['restored']} "
+            f"reloaded={stats['failed']}  total {stats['seconds']:.2f}s "
+            f"avg {stats['seconds'] / total * 1000:.0f}ms",
+        ]
+
+    # =======================
+    # WAITS
+    # =======================
+
+    def watch(self):
+        """Arm the mutation watch so the next wait only counts changes made after this call"""
+        page_metrics.pending_table_action = None
+        try:
+            return bool(self.driver.execute_script(WATCH_SCRIPT, self.TABLE))
+        except Exception:
+            return False
+
+    def wait_for_update(self, timeout=None):
+        """Wait until the table body has changed and then stayed quiet
+
+        Waits for the app to go idle first (pending requests answered, Angular stable).
+        The table then resolves after Config.TABLE_SETTLE_QUIET_MS without row mutations;
+        if it never changed it resolves at once when the app went idle, otherwise after
+        Config.TABLE_SETTLE_CHANGE_MS.
+
+        Returns:
+            bool: False if the table kept changing (or was missing) until the timeout
+        """
+        timeout = Config.TABLE_SETTLE_TIMEOUT if timeout is None else timeout
+        start = time.perf_counter()
+        change_ms = 0 if self.wait_for_app_idle(timeout) else Config.TABLE_SETTLE_CHANGE_MS
+
+        try:
+            result = self.driver.execute_async_script(
+                SETTLE_SCRIPT, self.TABLE, Config.TABLE_SETTLE_QUIET_MS,
+                change_ms, int(timeout * 1000)
+            ) or {}
+        except Exception as e:
+            print(f"⚠ Table settle wait failed: {e}")
+            result = {}
+
+        elapsed = time.perf_counter() - start
+        settled = bool(result.get("settled"))
+        self._record_wait(elapsed, settled, result.get("changed", False))
+
+        action, page_metrics.pending_table_action = page_metrics.pending_table_action, None
+        if action and settled:
+            self.record_latency(f"{action[0]}_settle", time.perf_counter() - action[1])
+
+        if settled:
+            print(f"⏱ Table settled in {elapsed:.2f}s ({result.get('mutations', 0)} mutations)")
+        else:
+            print(f"⚠ Table did not settle within {timeout}s ({elapsed:.2f}s)")
+        return settled
+
+    @classmethod
+    def _record_wait(cls, seconds, settled, changed):
+        stats = page_metrics.settle_stats
+        stats["waits"] += 1
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        if not settled:
+            stats["timeouts"] += 1
+        elif not changed:
+            stats["unchanged"] += 1
+
+    @classmethod
+    def settle_report(cls):
+        """Table settle wait totals for the end-of-session report"""
+        stats = page_metrics.settle_stats
+        if not stats["waits"]:
+            return []
+        return [
+            f"waits={stats['waits']} total {stats['seconds']:.2f}s  "
+            f"avg {stats['seconds'] / stats['waits'] * 1000:.0f}ms  max {stats['max_seconds'] * 1000:.0f}ms",
+            f"settled without a change={stats['unchanged']} timeouts={stats['timeouts']}",
+        ]
@@ -0,0 +1,359 @@
+# run_tests.py
+"""
+Unified test runner for all Shopizer admin page suites
+
+Selects suites and markers across every page and runs them in ONE pytest session, so
+all pages share the warm driver pool and a single login. Replaces the per-page
+test_runner_*.py scripts, which are now thin wrappers around this module.
+
+Examples:
+    python run_tests.py                                  # Every suite, one session
+    python run_tests.py --smoke                          # Smoke tests of all pages
+    python run_tests.py brands products -m regression    # Two pages, regression only
+    python run_tests.py options_set:sorting              # A suite preset
+    python run_tests.py --smoke --headless --workers 4   # Parallel workers
+    python run_tests.py --shard 2/4                      # This CI machine's shard
+    python run_tests.py --smoke --gate                   # Fail on timings slower than the baseline
+    python run_tests.py --smoke --save-baseline          # Store the timing baseline
+    python run_tests.py --smoke --stub                   # Against the offline admin stand-in
+    python run_tests.py products --record                # Record the WebDriver traffic...
+    python run_tests.py products --replay                # ...and replay it without a browser
+    python run_tests.py --list                           # Suites and presets
+    python run_tests.py brands -- -x --lf                # Extra pytest arguments after --
+"""
+
+import argparse
+import os
+import sys
+import time
+from contextlib import nullcontext
+from datetime import datetime
+from config.config import Config
+from utils.parallel_runner import run_pytest
+from utils.admin_stub_server import stand_in
+from utils.regression_gate import run_gate, REGRESSION_EXIT_CODE
+
+# Suite name -> test file and its named selections (presets) from the old per-page runners
+SUITES = {
+    "products": {
+        "path": "tests/test_products_page.py",
+        "presets": {
+            "auth": {"nodes": ["TestAuthentication"]},
+        },
+    },
+    "brands": {
+        "path": "tests/test_brands_page.py",
+        "presets": {},
+    },
+    "options_set": {
+        "path": "tests/test_options_set_page.py",
+        "presets": {
+            "stress": {"nodes": ["TestOptionsSetPageStressTest"]},
+            "sorting": {"nodes": ["TestOptionsSetPageSorting"]},
+        },
+    },
+    "product_groups": {
+        "path": "tests/test_product_groups_page.py",
+        "presets": {},
+    },
+    "product_options": {
+        "path": "tests/test_product_options_page.py",
+        "presets": {},
+    },
+    "product_types": {
+        "path": "tests/test_product_types_page.py",
+        "presets": {},
+    },
+    "rich_text_editor": {
+        "path": "tests/test_rich_text_editor_component.py",
+        "presets": {
+            "performance": {"nodes": ["TestRichTextEditorPerformance"]},
+            "validation": {"nodes": ["TestRichTextEditorValidation"]},
+            "code_view": {"keyword": "code_view"},
+            "formatting": {"keyword": "font or style or format or color or align"},
+            "media": {"keyword": "link or video or image or table"},
+        },
+    },
+}
+
+MARKERS = ("smoke", "regression", "security", "ui", "slow")
+
+
+# =======================
+# ARGUMENTS
+# =======================
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python run_tests.py",
+        description="Run any combination of page suites and markers in a single pytest session",
+    )
+    parser.add_argument("suites", nargs="*", metavar="SUITE[:PRESET]",
+                        help="Suites to run (default: all); see --list")
+    parser.add_argument("-m", "--markers", default=None,
+                        help='Marker expression, e.g. "smoke or security"')
+    for marker in MARKERS:
+        parser.add_argument(f"--{marker}", action="append_const", const=marker, dest="marker_flags",
+                            help=f"Shortcut for -m {marker} (combinable with 'or')")
+    parser.add_argument("-k", "--keyword", default=None, help="pytest -k expression")
+    parser.add_argument("--browser", default=None, choices=("chrome", "firefox", "edge"))
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Parallel worker processes (default: {Config.PARALLEL_WORKERS})")
+    parser.add_argument("--shard", default=None, help="Run only shard i of N, e.g. 2/4")
+    parser.add_argument("--report", default=None,
+                        help="Report name under reports/ (default: derived from the selection)")
+    parser.add_argument("--no-html", action="store_true", help="Skip the pytest-html report")
+    parser.add_argument("--tb", default="short", help="Traceback style (default: short)")
+    parser.add_argument("--durations", type=int, default=10, help="Show the N slowest tests")
+    parser.add_argument("--gate", action="store_true", default=Config.REGRESSION_GATE_ENABLED,
+                        help=f"Exit {REGRESSION_EXIT_CODE} when wall time, a test or a page method got slower "
+                             f"than the timing baseline allows")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store the selected tests' recent timings as the timing baseline")
+    parser.add_argument("--baseline", default=Config.REGRESSION_BASELINE_FILE,
+                        help=f"Timing baseline file (default: {Config.REGRESSION_BASELINE_FILE})")
+    parser.add_argument("--stub", action="store_true",
+                        help="Run against the offline admin stand-in instead of BASE_URL (history in STUB_RESULTS_DB; "
+                             "keep a separate baseline)")
+    parser.add_argument("--stub-latency-ms", type=int, default=Config.STUB_LATENCY_MS,
+                        help="API latency of the stand-in")
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument("--record", nargs="?", const="", default=None, metavar="FILE",
+                           help=f"Record every WebDriver command and response (default file: "
+                                f"{Config.WEBDRIVER_RECORDINGS_DIR}/<selection>.json)")
+    recording.add_argument("--replay", nargs="?", const="", default=None, metavar="FILE",
+                           help="Replay a recording without a browser; fails on commands that differ from it")
+    parser.add_argument("--list", action="store_true", help="List suites and presets, then exit")
+    return parser
+
+
+def resolve_targets(suites):
+    """Turn SUITE[:PRESET] names into pytest node ids and a -k expression
+
+    Keyword presets only filter their own test module: the expression reads
+    "(not <module> or (<keywords>))" so other suites in the same session are untouched.
+
+    Returns:
+        tuple: (node ids, keyword expression or None)
+
+    Raises:
+        ValueError: For unknown suites or presets
+    """
+    if not suites:
+        return [suite["path"] for suite in SUITES.values()], None
+
+    targets = []
+    whole = set()
+    keywords = {}
+    for name in suites:
+        suite_name, _, preset_name = name.replace("-", "_").partition(":")
+        suite = SUITES.get(suite_name)
+        if suite is None:
+            raise ValueError(f"Unknown suite {suite_name!r}; choose from {', '.join(SUITES)}")
+        if not preset_name:
+            whole.add(suite_name)
+            targets.append(suite["path"])
+            continue
+
+        preset = suite["presets"].get(preset_name)
+        if preset is None:
+            known = ", ".join(suite["presets"]) or "none"
+            raise ValueError(f"Unknown preset {preset_name!r} for {suite_name} (presets: {known})")
+        if "nodes" in preset:
+            targets.extend(f"{suite['path']}::{node}" for node in preset["nodes"])
+        else:
+            targets.append(suite["path"])
+            keywords.setdefault(suite_name, []).append(preset["keyword"])
+
+    clauses = []
+    for suite_name, expressions in keywords.items():
+        if suite_name in whole:
+            continue
+        module = os.path.splitext(os.path.basename(SUITES[suite_name]["path"]))[0]
+        clauses.append(f"(not {module} or {' or '.join(f'({e})' for e in expressions)})")
+    # A whole suite already covers its presets; pytest would run overlapping node ids twice
+    covered = tuple(f"{SUITES[name]['path']}::" for name in whole)
+    targets = [target for target in dict.fromkeys(targets) if not (covered and target.startswith(covered))]
+    return targets, " and ".join(clauses) or None
+
+
+def build_pytest_args(options):
+    """pytest arguments for the parsed command line (extra arguments after -- are appended)"""
+    targets, keyword = resolve_targets(options.suites)
+
+    markers = marker_expression(options)
+    if options.keyword:
+        keyword = f"({keyword}) and ({options.keyword})" if keyword else options.keyword
+
+    args = list(targets) + ["-v", "-s", f"--tb={options.tb}", f"--durations={options.durations}"]
+    if markers:
+        args += ["-m", markers]
+    if keyword:
+        args += ["-k", keyword]
+    if options.browser:
+        args.append(f"--browser={options.browser}")
+    if options.headless:
+        args.append("--headless")
+    if not options.no_html:
+        args += [f"--html={report_path(options, markers)}", "--self-contained-html"]
+    return args + options.extra
+
+
+def marker_expression(options):
+    """-m expression combined with the marker shortcut flags"""
+    markers = options.markers
+    if options.marker_flags:
+        flags = " or ".join(options.marker_flags)
+        markers = f"({markers}) and ({flags})" if markers else flags
+    return markers
+
+
+def selection_name(options, markers):
+    parts = [name.replace(":", "_") for name in options.suites] or ["all"]
+    if markers:
+        parts.append("_".join(word for word in markers.replace("(", " ").replace(")", " ").split()
+                              if word not in ("and", "or", "not")))
+    return "_".join(parts)
+
+
+def report_path(options, markers):
+    name = options.report or selection_name(options, markers) + "_report"
+    return os.path.join(Config.REPORTS_DIR, f"{name}.html")
+
+
+def recording_path(path, options):
+    """Cassette for --record/--replay: the given file, else one named after the selection"""
+    return path or os.path.join(Config.WEBDRIVER_RECORDINGS_DIR,
+                                selection_name(options, marker_expression(options)) + ".json")
+
+
+def print_suites():
+    print("🧪 Suites (SUITE or SUITE:PRESET):")
+    for name, suite in SUITES.items():
+        presets = ", ".join(f"{name}:{preset}" for preset in suite["presets"])
+        print(f"    {name:<18} {suite['path']}")
+        if presets:
+            print(f"    {'':<18} presets: {presets}")
+    print(f"🏷️  Markers: {', '.join(MARKERS)}")
+
+
+# =======================
+# ENTRY POINTS
+# =======================
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    extra = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, extra = argv[:split], argv[split + 1:]
+
+    parser = build_parser()
+    options = parser.parse_args(argv)
+    options.extra = extra
+
+    if options.list:
+        print_suites()
+        return 0
+
+    try:
+        pytest_args = build_pytest_args(options)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if options.record is not None or options.replay is not None:
+        # One pytest session: browsers must start (and commands run) in the recorded order
+        if (Config.PARALLEL_WORKERS if options.workers is None else options.workers) > 1:
+            parser.error("--record/--replay run serially; drop --workers")
+        if options.replay is not None and options.stub:
+            parser.error("--replay needs no admin; drop --stub")
+    if options.record is not None:
+        Config.WEBDRIVER_RECORD_FILE = recording_path(options.record, options)
+        print(f"⏺️  Recording WebDriver traffic to {Config.WEBDRIVER_RECORD_FILE}")
+    if options.replay is not None:
+        Config.WEBDRIVER_REPLAY_FILE = recording_path(options.replay, options)
+        if not os.path.exists(Config.WEBDRIVER_REPLAY_FILE):
+            parser.error(f"No recording at {Config.WEBDRIVER_REPLAY_FILE}; run with --record first")
+        print(f"▶️  Replaying WebDriver traffic from {Config.WEBDRIVER_REPLAY_FILE}")
+
+    os.makedirs(Config.REPORTS_DIR, exist_ok=True)
+    os.makedirs(Config.SCREENSHOTS_DIR, exist_ok=True)
+
+    print("🚀 Starting Shopizer Admin Automation Tests (single session)...")
+    print(f"📅 Test execution started at: {datetime.now()}")
+    print(f"🧪 pytest {' '.join(pytest_args)}")
+    print("-" * 80)
+
+    started_at, start = time.time(), time.perf_counter()
+    # The gate runs inside the block too: it reads the stand-in's results store
+    with stand_in(latency_ms=options.stub_latency_ms) if options.stub else nullcontext():
+        exit_code = run_pytest(pytest_args, workers=options.workers, shard=options.shard)
+        wall = time.perf_counter() - start
+
+        if options.replay is not None and (options.save_baseline or options.gate):
+            print("⚠ Replayed runs are not timed against the baseline")
+        elif options.save_baseline and exit_code != 0:
+            print("⚠ Not saving a timing baseline from a failed run")
+        elif options.save_baseline or options.gate:
+            if not run_gate(started_at, wall, options.baseline, save=options.save_baseline) and exit_code == 0:
+                exit_code = REGRESSION_EXIT_CODE
+
+    print("-" * 80)
+    print(f"✅ Test execution completed at: {datetime.now()}")
+    print(f"📊 Exit code: {exit_code}")
+    if exit_code == 0:
+        print("\n🎉 All tests completed successfully!")
+    elif exit_code == REGRESSION_EXIT_CODE:
+        print("\n🐢 Tests passed but timings regressed against the baseline (see the regression gate above)")
+    else:
+        print(f"\n❌ Tests completed with exit code {exit_code}")
+        print("🔍 Check the HTML report for detailed results")
+    return int(exit_code)
+
+
+# Commands of the old per-page runners, as run_tests.py arguments
+LEGACY_COMMANDS = {
+    "all": [],
+    "smoke": ["--smoke"],
+    "security": ["--security"],
+    "regression": ["--regression"],
+    "ui": ["--ui"],
+    "slow": ["--slow"],
+    "chrome": ["--browser", "chrome", "--smoke"],
+    "firefox": ["--browser", "firefox", "--smoke"],
+    "edge": ["--browser", "edge", "--smoke"],
+    "headless": ["--headless", "--smoke"],
+}
+
+
+def run_legacy(suite, argv, default=None):
+    """Run a test_runner_<page>.py command (smoke, regression, chrome, a preset, ...) for one suite
+
+    Args:
+        suite (str): Suite name in SUITES
+        argv (list): Command line of the old runner; the first word is the command
+        default (list): Arguments used for "all" / no command (e.g. ["-m", "not slow"])
+    """
+    command = argv[0].lower().replace("-", "_") if argv else "all"
+    rest = list(argv[1:])
+    if command in ("help", "h", "_h", "__help"):
+        print(f"Usage: python {os.path.basename(sys.argv[0])} "
+              f"[{' | '.join(list(LEGACY_COMMANDS) + list(SUITES[suite]['presets']))}]")
+        print(f"Equivalent to: python run_tests.py {suite} [options]  (see python run_tests.py --help)")
+        return 0
+
+    report = f"{suite}_{command}_report"
+    if command in SUITES[suite]["presets"]:
+        return main([f"{suite}:{command}", "--report", report] + rest)
+    if command not in LEGACY_COMMANDS:
+        print(f"❌ Unknown command: {command}")
+        run_legacy(suite, ["help"])
+        return 1
+
+    arguments = LEGACY_COMMANDS[command] or (default or [])
+    return main([suite, "--report", report] + arguments + rest)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
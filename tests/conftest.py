@@ -12,9 +12,46 @@ from selenium.webdriver.support.ui import WebDriverWait
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.driver_factory import DriverFactory
+from utils.auth_state import AuthStateStore
+from utils.sleep_profiler import SleepProfiler
+from utils.results_store import ResultsStore, process_started_at
+from utils.sharding import apply_shard
+from utils.request_blocking import BlockingProfile
+from utils.performance_budget import PerformanceBudgetPlugin
+from utils.page_metrics import page_metrics
 from config.config import Config
+from pages.base_page import BasePage
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
+from pages.smart_table_component import SmartTableComponent
+from pages.brands_page import BrandsPage
+from pages.options_set_page import OptionsSetPage
+from pages.product_groups_page import ProductGroupsPage
+from pages.product_options_page import ProductOptionsPage
+from pages.product_types_page import ProductTypesPage
+from pages.products_page import ProductsPage
+
+# Records every time.sleep by call site and test (installed in pytest_configure)
+sleep_profiler = SleepProfiler(Config.SLEEP_PROFILE_FILE)
+
+# Per-test phase durations and outcomes, kept across runs for scheduling and predictions
+results_store = ResultsStore(Config.RESULTS_DB)
+
+# Route load and search/sort-to-settled latencies checked against @pytest.mark.budget
+performance_budget = PerformanceBudgetPlugin()
+
+# Fixtures that give a test a real browser; its page metrics count towards the session report
+BROWSER_FIXTURES = ("driver", "page_driver")
+
+@pytest.fixture(autouse=True)
+def page_metrics_isolation(request, monkeypatch):
+    """Empty page metrics, listeners and column cache for tests without a browser"""
+    if any(name in request.fixturenames for name in BROWSER_FIXTURES):
+        yield
+        return
+    monkeypatch.setattr(SmartTableComponent, "_column_cache", {})
+    with page_metrics.isolated():
+        yield
 
 @pytest.fixture(scope="session")
 def browser():
@@ -26,71 +63,173 @@ def base_url():
     """Base URL fixture"""
     return Config.BASE_URL
 
+@pytest.fixture(scope="session")
+def driver_pool(browser, auth_state_store):
+    """Session-wide pool of live browsers shared by all tests"""
+    pool = DriverFactory.get_pool()
+
+    if Config.DRIVER_POOL_ENABLED and pool.warm_size:
+        # Spare browsers log in and open the admin shell while tests run
+        def prepare(driver):
+            if not Config.AUTH_STATE_ENABLED:
+                return False
+            return _restore_saved_session(driver, Config.BASE_URL, auth_state_store)
+
+        pool.prepare = prepare
+        pool.start_warming(browser, Config.HEADLESS)
+
+    yield pool
+
+    DriverFactory.shutdown_pool()
+
+# Page fixtures -> page objects, whose REQUEST_BLOCKING applies to the browser they run in
+PAGE_FIXTURE_CLASSES = {
+    "products_page_session": ProductsPage,
+    "product_types_page_session": ProductTypesPage,
+    "product_groups_page_session": ProductGroupsPage,
+    "brands_page_session": BrandsPage,
+    "options_set_page_session": OptionsSetPage,
+    "product_options_page_session": ProductOptionsPage,
+}
+
+def _request_blocking(request):
+    """Blocking profile for a lease: the block_requests marker, else the page objects in use"""
+    marker = request.node.get_closest_marker("block_requests")
+    if marker:
+        return BlockingProfile.from_marker(marker)
+    return BlockingProfile.for_pages(
+        [PAGE_FIXTURE_CLASSES[name] for name in request.fixturenames if name in PAGE_FIXTURE_CLASSES])
+
+def _lease_driver(browser, driver_pool, request):
+    """Lease a reusable browser from the pool (or start a new one when pooling is off)"""
+    if Config.DRIVER_POOL_ENABLED:
+        driver_instance = driver_pool.lease(browser, Config.HEADLESS)
+    else:
+        driver_instance = DriverFactory.get_driver(browser, Config.HEADLESS)
+        driver_instance.implicitly_wait(5)  # Reduced from 10 to 5
+        driver_instance.set_page_load_timeout(15)  # Reduced from 30 to 15
+
+    if Config.REQUEST_BLOCKING_ENABLED:
+        DriverFactory.get_request_blocker().apply(driver_instance, _request_blocking(request))
+    return driver_instance
+
+def _return_driver(driver_instance, driver_pool):
+    """Cleanup - pooled browsers are reset and kept for the next test"""
+    if Config.REQUEST_BLOCKING_ENABLED:
+        DriverFactory.get_request_blocker().collect(driver_instance)
+    if Config.DRIVER_POOL_ENABLED:
+        driver_pool.release(driver_instance)
+    else:
+        driver_instance.quit()
+
 @pytest.fixture(scope="function")
-def driver(browser):
-    """Optimized WebDriver fixture - faster startup"""
-    driver_instance = DriverFactory.get_driver(browser, Config.HEADLESS)
-    driver_instance.implicitly_wait(5)  # Reduced from 10 to 5
-    driver_instance.set_page_load_timeout(15)  # Reduced from 30 to 15
+def driver(browser, driver_pool, request):
+    """Optimized WebDriver fixture - leases a reusable browser from the pool"""
+    driver_instance = _lease_driver(browser, driver_pool, request)
 
     yield driver_instance
 
-    # Cleanup
-    driver_instance.quit()
+    _return_driver(driver_instance, driver_pool)
 
-@pytest.fixture(scope="function")
-def authenticated_driver(driver, base_url):
-    """OPTIMIZED WebDriver fixture with faster authentication"""
+@pytest.fixture(scope="session")
+def auth_state_store():
+    """Storage-state file shared by every test (and worker) in the run"""
+    recording = DriverFactory.get_command_recording()
+    return recording.auth_state_store() if recording else AuthStateStore()
+
+def _restore_saved_session(driver, base_url, auth_state_store):
+    """Inject the saved login state and check that the app accepts it"""
+    state = auth_state_store.load(base_url)
+    if not state:
+        return False
+
+    if not auth_state_store.restore(driver, base_url, state):
+        return False
+
+    # Open the app shell - a rejected token sends us back to the auth route
+    driver.get(f"{base_url}/#/pages")
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.common.by import By
     try:
-        print("\n" + "="*50)
-        print("🚀 FAST AUTHENTICATION SETUP")
-        print("="*50)
+        WebDriverWait(driver, 10).until(
+            EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "nb-layout-header")),
+                EC.url_contains("auth")
+            )
+        )
+    except Exception:
+        pass
 
-        # OPTIMIZED STEP 1: Quick login
-        login_page = LoginPage(driver)
-        login_page.navigate_to_login_page(base_url)
+    if "auth" in driver.current_url.lower():
+        print("⚠ Saved auth state rejected - falling back to UI login")
+        auth_state_store.invalidate()
+        return False
 
-        if not login_page.is_login_page_loaded():
-            raise Exception("Login page did not load")
+    return True
 
-        print("✓ Login page ready")
+def _perform_ui_login(driver, base_url):
+    """Full UI login followed by the language check"""
+    # OPTIMIZED STEP 1: Quick login
+    login_page = LoginPage(driver)
+    login_page.navigate_to_login_page(base_url)
 
-        # STREAMLINED LOGIN
-        login_success = login_page.perform_login(
-            username="admin@shopizer.com",
-            password="password"
-        )
+    if not login_page.is_login_page_loaded():
+        raise Exception("Login page did not load")
+
+    print("✓ Login page ready")
 
-        if not login_success:
-            raise Exception("Login failed")
+    # STREAMLINED LOGIN
+    login_success = login_page.perform_login(
+        username=Config.VALID_USERNAME,
+        password=Config.VALID_PASSWORD
+    )
 
-        print("✓ Login successful")
+    if not login_success:
+        raise Exception("Login failed")
 
-        # OPTIMIZED STEP 2: Fast home page handling
-        home_page = HomePage(driver)
-        home_page.wait_for_home_page_load()
+    print("✓ Login successful")
 
-        print("✓ Home page ready")
+    # OPTIMIZED STEP 2: Fast home page handling
+    home_page = HomePage(driver)
+    home_page.wait_for_home_page_load()
 
-        # OPTIMIZED STEP 3: Fast language change (if needed)
-        if home_page.is_french_language():
-            print("🌐 Quick language change to English...")
+    print("✓ Home page ready")
 
-            if home_page.change_language_to_english():
-                # Just a short wait since the method already waits
-                time.sleep(1)
-                print("✓ Language: English")
-            else:
-                print("⚠ Language change skipped - continuing anyway")
+    # OPTIMIZED STEP 3: Fast language change (if needed)
+    if home_page.is_french_language():
+        print("🌐 Quick language change to English...")
+
+        if home_page.change_language_to_english():
+            # Just a short wait since the method already waits
+            time.sleep(1)
+            print("✓ Language: English")
         else:
-            print("✓ Language: Already acceptable")
+            print("⚠ Language change skipped - continuing anyway")
+    else:
+        print("✓ Language: Already acceptable")
+
+def _authenticate(driver, base_url, auth_state_store, driver_pool):
+    """Log the driver in - pre-warmed or saved session first, UI login only as fallback"""
+    try:
+        print("\n" + "="*50)
+        print("🚀 FAST AUTHENTICATION SETUP")
+        print("="*50)
+
+        if Config.DRIVER_POOL_ENABLED and driver_pool.is_prepared(driver):
+            print("✓ Pre-warmed browser already logged in")
+        elif Config.AUTH_STATE_ENABLED and _restore_saved_session(driver, base_url, auth_state_store):
+            print("✓ Session restored from saved auth state")
+        else:
+            _perform_ui_login(driver, base_url)
+
+            if Config.AUTH_STATE_ENABLED:
+                auth_state_store.save(auth_state_store.capture(driver, base_url))
+                print("💾 Auth state saved for the next tests")
 
         print("="*50)
         print("✅ FAST SETUP COMPLETED")
         print("="*50)
 
-        yield driver
-
     except Exception as e:
         print(f"\n❌ Fast authentication failed: {str(e)}")
         # Quick screenshot only on failure
@@ -100,85 +239,124 @@ def authenticated_driver(driver, base_url):
             pass
         raise
 
+@pytest.fixture(scope="function")
+def authenticated_driver(driver, base_url, auth_state_store, driver_pool):
+    """OPTIMIZED WebDriver fixture - restores a saved login, UI login only as fallback"""
+    _authenticate(driver, base_url, auth_state_store, driver_pool)
+    return driver
+
 @pytest.fixture(scope="function")
 def driver_with_base_url(authenticated_driver, base_url):
     """Legacy compatibility fixture"""
     return authenticated_driver
 
-
-# Add this fixture to your existing conftest.py file
-
-@pytest.fixture(scope="function")
-def product_types_page_ready(authenticated_driver):
-    """OPTIMIZED product types page setup"""
-    from pages.home_page import HomePage
-
+# =======================
+# SHARED PAGE FIXTURES
+# =======================
+
+def page_fixture_scope(fixture_name, config):
+    """Scope of the shared page fixtures - Config.PAGE_FIXTURE_SCOPE (function, class or module)"""
+    scope = Config.PAGE_FIXTURE_SCOPE
+    if scope not in ("function", "class", "module"):
+        raise pytest.UsageError(f"PAGE_FIXTURE_SCOPE must be function, class or module, not {scope!r}")
+    return scope
+
+@pytest.fixture(scope=page_fixture_scope)
+def page_driver(browser, base_url, auth_state_store, driver_pool, request):
+    """Logged-in browser shared by the page fixtures of one test class (or module)
+
+    Request blocking comes from the class/module block_requests marker or the page objects;
+    per-test markers cannot change a browser that is shared across tests.
+    """
+    driver_instance = _lease_driver(browser, driver_pool, request)
     try:
-        home_page = HomePage(authenticated_driver)
+        _authenticate(driver_instance, base_url, auth_state_store, driver_pool)
+    except Exception:
+        _return_driver(driver_instance, driver_pool)
+        raise
 
-        print("🏷️ Quick product types page setup...")
+    yield driver_instance
 
-        # Fast direct navigation to product types page
-        authenticated_driver.get("http://localhost/#/pages/catalogue/types/types-list")
+    _return_driver(driver_instance, driver_pool)
+
+def _open_page(page, label, force_reload=False):
+    """Open a list page - in-app route switch when the admin is already loaded, full load otherwise"""
+    print(f"{label} Quick page setup...")
+    if not page.open_route(page.TABLE_ROUTE, page.wait_for_page_load, force_reload=force_reload):
+        pytest.fail(f"{type(page).__name__} did not load ({page.TABLE_ROUTE})")
+    page.fresh = True
+    return page
+
+def _page_ready(page, label):
+    """Hand the shared page to the next test, resetting its state instead of reloading"""
+    if page.fresh:
+        page.fresh = False
+    elif page.reset_page_state():
+        print(f"{label} Page reused - filters, sort and selection reset in place")
+    else:
+        print(f"{label} Page state could not be reset - reloading")
+        _open_page(page, label, force_reload=True).fresh = False
+    return page.driver
+
+@pytest.fixture(scope=page_fixture_scope)
+def product_types_page_session(page_driver):
+    """Product types page loaded once per scope"""
+    return _open_page(ProductTypesPage(page_driver), "🏷️")
 
-        # Quick verification with shorter timeout
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
+@pytest.fixture(scope="function")
+def product_types_page_ready(product_types_page_session):
+    """OPTIMIZED product types page setup - shared page, clean state per test"""
+    return _page_ready(product_types_page_session, "🏷️")
 
-        try:
-            wait = WebDriverWait(authenticated_driver, 5)  # 5 seconds timeout
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Code']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "a.createBtn"))
-                )
-            )
-            print("✓ Product types page ready")
-        except:
-            print("⚠ Product types page verification timeout (5s), continuing...")
+@pytest.fixture(scope=page_fixture_scope)
+def products_page_session(page_driver):
+    """Products page loaded once per scope"""
+    return _open_page(ProductsPage(page_driver), "🛍️")
 
-        return authenticated_driver
+@pytest.fixture(scope="function")
+def products_page_ready(products_page_session):
+    """OPTIMIZED products page setup - shared page, clean state per test"""
+    return _page_ready(products_page_session, "🛍️")
 
-    except Exception as e:
-        print(f"❌ Product types page setup failed: {str(e)}")
-        raise
+@pytest.fixture(scope=page_fixture_scope)
+def product_groups_page_session(page_driver):
+    """Product groups page loaded once per scope"""
+    return _open_page(ProductGroupsPage(page_driver), "🏷️")
 
 @pytest.fixture(scope="function")
-def products_page_ready(authenticated_driver):
-    """OPTIMIZED products page setup"""
-    from pages.home_page import HomePage
+def product_groups_page_ready(product_groups_page_session):
+    """OPTIMIZED product groups page setup - shared page, clean state per test"""
+    return _page_ready(product_groups_page_session, "🏷️")
 
-    try:
-        home_page = HomePage(authenticated_driver)
+@pytest.fixture(scope=page_fixture_scope)
+def brands_page_session(page_driver):
+    """Brands page loaded once per scope"""
+    return _open_page(BrandsPage(page_driver), "🏷️")
 
-        print("🛍️ Quick products page setup...")
-
-        # Fast direct navigation (based on your successful test)
-        authenticated_driver.get("http://localhost/#/pages/catalogue/products/products-list")
+@pytest.fixture(scope="function")
+def brands_page_ready(brands_page_session):
+    """OPTIMIZED brands page setup - shared page, clean state per test"""
+    return _page_ready(brands_page_session, "🏷️")
 
-        # Quick verification with shorter timeout - FIXED: 5 seconds as requested
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
+@pytest.fixture(scope=page_fixture_scope)
+def options_set_page_session(page_driver):
+    """Options set page loaded once per scope"""
+    return _open_page(OptionsSetPage(page_driver), "⚙️")
 
-        try:
-            wait = WebDriverWait(authenticated_driver, 5)  # FIXED: Reduced to 5 seconds
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Sku']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Product name']"))
-                )
-            )
-            print("✓ Products page ready")
-        except:
-            print("⚠ Products page verification timeout (5s), continuing...")
+@pytest.fixture(scope="function")
+def options_set_page_ready(options_set_page_session):
+    """OPTIMIZED options set page setup - shared page, clean state per test"""
+    return _page_ready(options_set_page_session, "⚙️")
 
-        return authenticated_driver
+@pytest.fixture(scope=page_fixture_scope)
+def product_options_page_session(page_driver):
+    """Product options page loaded once per scope"""
+    return _open_page(ProductOptionsPage(page_driver), "🔧")
 
-    except Exception as e:
-        print(f"❌ Products page setup failed: {str(e)}")
-        raise
+@pytest.fixture(scope="function")
+def product_options_page_ready(product_options_page_session):
+    """OPTIMIZED product options page setup - shared page, clean state per test"""
+    return _page_ready(product_options_page_session, "🔧")
 
 # OPTIMIZED login credentials fixture
 @pytest.fixture(scope="session")
@@ -207,15 +385,131 @@ def pytest_configure(config):
         if not os.path.exists(directory):
             os.makedirs(directory)
 
+    config.addinivalue_line(
+        "markers", "block_requests(*resource_types, urls=(), third_party=False, profile=None): "
+                   "requests blocked in the test's browser (see utils/request_blocking.py)")
+
+    config.addinivalue_line(
+        "markers", "budget(*metrics, route_load=None, search_settle=None, sort_settle=None, mode=None): "
+                   "latency limits in seconds for the test (see Config.PERFORMANCE_BUDGETS)")
+    config.pluginmanager.register(performance_budget, "performance_budget")
+    page_metrics.latency_listeners.append(performance_budget.record)
+
+    recording = DriverFactory.get_command_recording()
+    if recording:
+        config.pluginmanager.register(recording, "webdriver_recording")
+
+    if Config.DRIVER_METRICS_ENABLED:
+        DriverFactory.get_metrics().install_timers()
+
+    if Config.PAGE_TIMING_ENABLED and Config.RESULTS_STORE_ENABLED:
+        page_metrics.timing_listeners.append(_store_page_timing)
+
+    if Config.SLEEP_PROFILER_ENABLED:
+        sleep_profiler.install()
+        if Config.DRIVER_METRICS_ENABLED:
+            sleep_profiler.listeners.append(DriverFactory.get_metrics().record_sleep)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Collect WebDriver command metrics and sleeps per test, setup and teardown included"""
+    metrics = DriverFactory.get_metrics() if Config.DRIVER_METRICS_ENABLED else None
+    if metrics:
+        metrics.start_test(item.nodeid)
+    sleep_profiler.start_test(item.nodeid)
+
+    yield
+
+    sleep_profiler.finish_test()
+    if metrics:
+        bucket = metrics.finish_test()
+        if bucket is not None and Config.RESULTS_STORE_ENABLED:
+            try:
+                results_store.record_page_methods(bucket.name, bucket.page_methods)
+            except Exception as e:
+                print(f"⚠ Could not record page method timings: {e}")
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Keep only this machine's shard; runs last so -m/-k selection is applied first"""
+    shard = config.getoption("--shard")
+    if not shard:
+        return
+    try:
+        selection = apply_shard(config, items, shard)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    print(f"\n{selection.summary()}")
+
+def pytest_collection_finish(session):
+    """Time the page objects the collected tests import, and predict the serial wall time of the
+    selected tests from their history"""
+    if Config.DRIVER_METRICS_ENABLED:
+        DriverFactory.get_metrics().install_page_timers(BasePage)
+
+    if not Config.RESULTS_STORE_ENABLED or session.config.option.collectonly or not session.items:
+        return
+
+    nodeids = [item.nodeid for item in session.items]
+    try:
+        predicted, known, unknown = results_store.predict(nodeids)
+        predicted += results_store.session_overhead()
+    except Exception as e:
+        print(f"⚠ Could not read test history: {e}")
+        return
+    if known:
+        print(f"\n🔮 Predicted wall time {predicted:.1f}s for {len(nodeids)} tests "
+              f"({known} with history, {unknown} estimated)")
+
+def _store_page_timing(timing):
+    """Keep page load timings per route and run in the results store"""
+    current = os.environ.get("PYTEST_CURRENT_TEST", "")
+    results_store.record_page_load(timing, current.rsplit(" ", 1)[0] or None)
+
+def pytest_sessionstart(session):
+    """Open the results store run from process start, so session overhead covers startup,
+    configuration and collection"""
+    if Config.RESULTS_STORE_ENABLED and not session.config.option.collectonly:
+        try:
+            results_store.start_run(os.getenv("WORKER_ID"), started_at=process_started_at())
+        except Exception as e:
+            print(f"⚠ Could not start a results run: {e}")
+
+def pytest_runtest_logreport(report):
+    """Keep setup/call/teardown durations and outcomes in the results store"""
+    if Config.RESULTS_STORE_ENABLED:
+        try:
+            results_store.record(report.nodeid, report.when, report.duration, report.outcome)
+        except Exception as e:
+            print(f"⚠ Could not record result: {e}")
+
+def pytest_sessionfinish(session, exitstatus):
+    """Flush command metrics, the sleep profile, resource sizes and the results store, and restore patches"""
+    if Config.DRIVER_METRICS_ENABLED:
+        DriverFactory.get_metrics().close()
+
+    if Config.REQUEST_BLOCKING_ENABLED:
+        DriverFactory.get_request_blocker().save_sizes()
+
+    if Config.SLEEP_PROFILER_ENABLED:
+        sleep_profiler.uninstall()
+        sleep_profiler.save()
+
+    if Config.RESULTS_STORE_ENABLED:
+        results_store.finish_run(exitstatus)
+        results_store.close()
+
 def pytest_runtest_makereport(item, call):
     """OPTIMIZED screenshot capture - only on failure"""
     if call.when == "call" and call.excinfo is not None:
         # Only take screenshots on test failures to save time
-        if "driver" in item.fixturenames:
+        if "driver" in item.fixturenames or "page_driver" in item.fixturenames:
             try:
                 test_driver = None
                 if "authenticated_driver" in item.fixturenames:
                     test_driver = item.funcargs.get("authenticated_driver")
+                elif "page_driver" in item.fixturenames:
+                    test_driver = item.funcargs.get("page_driver")
                 elif "driver" in item.fixturenames:
                     test_driver = item.funcargs.get("driver")
 
@@ -227,6 +521,88 @@ def pytest_runtest_makereport(item, call):
             except Exception as e:
                 print(f"Screenshot failed: {e}")
 
+def pytest_terminal_summary(terminalreporter):
+    """Report browser startup, driver pool, app/table wait, page reset/navigation/load timing, budgets, request blocking, sleep, WebDriver record/replay and command metrics"""
+    startup_lines = DriverFactory.startup_report()
+    if startup_lines:
+        terminalreporter.section("browser startup")
+        for line in startup_lines:
+            terminalreporter.write_line(line)
+
+    pool_lines = DriverFactory.get_pool().metrics_report()
+    if pool_lines:
+        terminalreporter.section("driver pool")
+        for line in pool_lines:
+            terminalreporter.write_line(line)
+
+    idle_lines = BasePage.idle_report()
+    if idle_lines:
+        terminalreporter.section("app idle waits")
+        for line in idle_lines:
+            terminalreporter.write_line(line)
+
+    settle_lines = SmartTableComponent.settle_report()
+    if settle_lines:
+        terminalreporter.section("table settle waits")
+        for line in settle_lines:
+            terminalreporter.write_line(line)
+
+    reset_lines = SmartTableComponent.reset_report()
+    if reset_lines:
+        terminalreporter.section("shared page resets")
+        for line in reset_lines:
+            terminalreporter.write_line(line)
+
+    navigation_lines = BasePage.navigation_report()
+    if navigation_lines:
+        terminalreporter.section("page navigation")
+        for line in navigation_lines:
+            terminalreporter.write_line(line)
+
+    baseline = {}
+    if Config.RESULTS_STORE_ENABLED and page_metrics.page_timings:
+        try:
+            baseline = results_store.page_load_baseline()
+        except Exception as e:
+            print(f"⚠ Could not read page load history: {e}")
+    timing_lines = BasePage.page_timing_report(baseline)
+    if timing_lines:
+        terminalreporter.section("page load timing")
+        for line in timing_lines:
+            terminalreporter.write_line(line)
+
+    budget_lines = performance_budget.report()
+    if budget_lines:
+        terminalreporter.section("performance budgets")
+        for line in budget_lines:
+            terminalreporter.write_line(line)
+
+    blocking_lines = DriverFactory.get_request_blocker().report() if Config.REQUEST_BLOCKING_ENABLED else []
+    if blocking_lines:
+        terminalreporter.section("request blocking")
+        for line in blocking_lines:
+            terminalreporter.write_line(line)
+
+    sleep_lines = sleep_profiler.report()
+    if sleep_lines:
+        terminalreporter.section("sleep profile")
+        for line in sleep_lines:
+            terminalreporter.write_line(line)
+
+    recording = DriverFactory.get_command_recording()
+    recording_lines = recording.report() if recording else []
+    if recording_lines:
+        terminalreporter.section("webdriver record/replay")
+        for line in recording_lines:
+            terminalreporter.write_line(line)
+
+    if Config.DRIVER_METRICS_ENABLED:
+        metrics_lines = DriverFactory.get_metrics().report()
+        if metrics_lines:
+            terminalreporter.section("webdriver commands")
+            for line in metrics_lines:
+                terminalreporter.write_line(line)
+
 # OPTIMIZED command line options
 def pytest_addoption(parser):
     """Add custom command line options"""
@@ -248,6 +624,12 @@ def pytest_addoption(parser):
         default=Config.BASE_URL,
         help="Base URL for testing"
     )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=Config.SHARD or None,
+        help="Run only shard i of N (e.g. 2/4), balanced on test_durations.json"
+    )
     parser.addoption(
         "--fast",
         action="store_true",
@@ -267,170 +649,6 @@ def setup_test_environment():
         if not os.path.exists(directory):
             os.makedirs(directory)
 
-
-
-# Add this fixture to your existing conftest.py file
-
-@pytest.fixture(scope="function")
-def product_groups_page_ready(authenticated_driver):
-    """OPTIMIZED product groups page setup"""
-    from pages.home_page import HomePage
-
-    try:
-        home_page = HomePage(authenticated_driver)
-
-        print("🏷️ Quick product groups page setup...")
-
-        # Fast direct navigation to product groups page
-        authenticated_driver.get("http://localhost/#/pages/catalogue/products-groups/groups-list")
-
-        # Quick verification with shorter timeout
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
-        try:
-            wait = WebDriverWait(authenticated_driver, 5)  # 5 seconds timeout
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Code']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "a.createBtn"))
-                )
-            )
-            print("✓ Product groups page ready")
-        except:
-            print("⚠ Product groups page verification timeout (5s), continuing...")
-
-        return authenticated_driver
-
-    except Exception as e:
-        print(f"❌ Product groups page setup failed: {str(e)}")
-        raise
-
-# Add this fixture to your existing conftest.py file
-
-@pytest.fixture(scope="function")
-def brands_page_ready(authenticated_driver):
-    """OPTIMIZED brands page setup"""
-    from pages.home_page import HomePage
-
-    try:
-        home_page = HomePage(authenticated_driver)
-
-        print("🏷️ Quick brands page setup...")
-
-        # Fast direct navigation to brands page
-        # Note: You may need to adjust this URL based on your actual routing
-        authenticated_driver.get("http://localhost/#/pages/catalogue/brands/brands-list")
-
-        # Quick verification with shorter timeout
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
-        try:
-            wait = WebDriverWait(authenticated_driver, 5)  # 5 seconds timeout
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input.search.form-control")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Brand name']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Code']"))
-                )
-            )
-            print("✓ Brands page ready")
-        except:
-            print("⚠ Brands page verification timeout (5s), continuing...")
-
-        return authenticated_driver
-
-    except Exception as e:
-        print(f"❌ Brands page setup failed: {str(e)}")
-        raise
-
-# Add this fixture to your existing conftest.py file
-# Insert this after the other page fixtures (around line 180)
-
-@pytest.fixture(scope="function")
-def options_set_page_ready(authenticated_driver):
-    """OPTIMIZED options set page setup"""
-    from pages.home_page import HomePage
-
-    try:
-        home_page = HomePage(authenticated_driver)
-
-        print("⚙️ Quick options set page setup...")
-
-        # Fast direct navigation to options set page
-        authenticated_driver.get("http://localhost/#/pages/catalogue/options/options-set-list")
-
-        # Quick verification with shorter timeout
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
-        try:
-            wait = WebDriverWait(authenticated_driver, 5)  # 5 seconds timeout
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "a.createBtn")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "th.ng2-smart-th.id a")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "h1.page_title"))
-                )
-            )
-            print("✓ Options set page ready")
-        except:
-            print("⚠ Options set page verification timeout (5s), continuing...")
-
-        return authenticated_driver
-
-    except Exception as e:
-        print(f"❌ Options set page setup failed: {str(e)}")
-        raise
-
-# Also update the pages/__init__.py file to include the new page class
-# Add this line to pages/__init__.py:
-
-# from .options_set_page import OptionsSetPage
-
-# And add 'OptionsSetPage' to the __all__ list
-
-@pytest.fixture(scope="function")
-def product_options_page_ready(authenticated_driver):
-    """OPTIMIZED product options page setup"""
-    from pages.home_page import HomePage
-
-    try:
-        home_page = HomePage(authenticated_driver)
-
-        print("🔧 Quick product options page setup...")
-
-        # Fast direct navigation to product options page
-        authenticated_driver.get("http://localhost/#/pages/catalogue/options/options-list")
-
-        # Quick verification with shorter timeout
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-
-        try:
-            wait = WebDriverWait(authenticated_driver, 5)  # 5 seconds timeout
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Name']")),
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "a.createBtn"))
-                )
-            )
-            print("✓ Product options page ready")
-        except:
-            print("⚠ Product options page verification timeout (5s), continuing...")
-
-        return authenticated_driver
-
-    except Exception as e:
-        print(f"❌ Product options page setup failed: {str(e)}")
-        raise
-
-
 # Run setup when conftest is loaded
 setup_test_environment()
 
@@ -0,0 +1,125 @@
+import json
+import os
+import time
+import urllib.request
+from urllib.error import HTTPError
+import pytest
+from config.config import Config
+from utils.admin_stub_server import AdminStubServer, TABLES, make_rows, parse_rows_for, query_rows, stand_in
+from pages.brands_page import BrandsPage
+from pages.products_page import ProductsPage
+
+
+class TestQueryRows:
+    """Test suite for the stand-in's filtering, sorting and paging"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.rows = make_rows("products", 30)
+
+    def test_filters_are_case_insensitive_substrings(self):
+        result = query_rows(self.rows, {"sku": "tab"}, count=100)
+
+        assert result["total"] == len(result["items"]) > 0
+        assert all("TAB" in row["sku"] for row in result["items"])
+
+    def test_sort_is_numeric_for_numbers(self):
+        items = query_rows(self.rows, sort="price", order="desc", count=100)["items"]
+
+        assert [row["price"] for row in items] == sorted((row["price"] for row in self.rows), reverse=True)
+
+    def test_pages_slice_the_matching_rows(self):
+        result = query_rows(self.rows, page=3, count=12)
+
+        assert result["total"] == 30
+        assert [row["id"] for row in result["items"]] == list(range(25, 31))
+
+    def test_every_list_view_has_the_columns_its_page_object_reads(self):
+        for name, page in (("products", ProductsPage), ("brands", BrandsPage)):
+            keys = [key for key, _, kind, _ in TABLES[name]["columns"]]
+            assert keys == [key for _, key, _ in page.TABLE_COLUMNS]
+        for name in TABLES:
+            row = make_rows(name, 1)[0]
+            assert {key for key, _, kind, _ in TABLES[name]["columns"] if kind != "actions"} <= set(row)
+
+    def test_rows_for_parses_per_view_counts(self):
+        assert parse_rows_for("products=5000, brands=20") == {"products": 5000, "brands": 20}
+        with pytest.raises(ValueError):
+            parse_rows_for("orders=10")
+
+
+class TestAdminStubServer:
+    """Test suite for the stand-in's HTTP endpoints"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.stub = AdminStubServer(port=0, latency_ms=0, rows=25, rows_for={"brands": 3}, page_size=10).start()
+        yield
+        self.stub.stop()
+
+    def request(self, path, method="GET", body=None):
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        request = urllib.request.Request(self.stub.url + path, data=data, method=method,
+                                         headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, response.read()
+        except HTTPError as e:
+            return e.code, e.read()
+
+    def test_app_shell_carries_the_list_layouts(self):
+        status, body = self.request("/auth")
+        html = body.decode("utf-8")
+
+        assert status == 200 and "<nb-layout" in html and "/static/app.js" in html
+        assert '"options_set": {"route": "catalogue/options/options-set-list"' in html
+
+    def test_static_assets_and_favicon_are_served(self):
+        assert self.request("/static/app.js")[0] == 200
+        assert self.request("/favicon.ico")[0] == 200
+        assert self.request("/static/../admin_stub_server.py")[0] == 404
+
+    def test_login_checks_the_configured_credentials(self):
+        status, body = self.request("/api/v1/private/login", "POST",
+                                    {"username": Config.VALID_USERNAME, "password": Config.VALID_PASSWORD})
+        assert status == 200 and json.loads(body)["token"]
+
+        assert self.request("/api/v1/private/login", "POST", {"username": "x", "password": "y"})[0] == 401
+
+    def test_row_counts_are_configurable_per_view(self):
+        products = json.loads(self.request("/api/v1/tables/products?page=3")[1])
+        brands = json.loads(self.request("/api/v1/tables/brands")[1])
+
+        assert products["total"] == 25 and len(products["items"]) == 5
+        assert brands["total"] == 3
+
+    def test_checkbox_updates_persist_until_reset(self):
+        status, _ = self.request("/api/v1/tables/product_groups/code/group-table-1", "PATCH", {"active": False})
+        assert status == 200
+        assert json.loads(self.request("/api/v1/tables/product_groups?f.code=group-table-1")[1])["items"][0] == {
+            "code": "group-table-1", "active": False}
+
+        self.stub.reset()
+        assert self.stub.data["product_groups"][0]["active"] is True
+
+    def test_api_latency_is_added_to_every_response(self):
+        self.stub.latency_ms = 150
+
+        start = time.perf_counter()
+        self.request("/api/v1/tables/brands")
+
+        assert time.perf_counter() - start >= 0.15
+        assert self.stub.stats["api"] == 1 and self.stub.stats["delayed_seconds"] == pytest.approx(0.15)
+
+    def test_stand_in_points_the_suites_at_it_and_restores_the_url(self):
+        previous = Config.BASE_URL
+        with stand_in(latency_ms=0, rows=1) as stub:
+            assert Config.BASE_URL == stub.url != previous
+        assert Config.BASE_URL == previous
+
+    def test_stand_in_keeps_its_results_out_of_the_real_history(self, monkeypatch):
+        monkeypatch.setenv("RESULTS_DB", "real.sqlite")
+        monkeypatch.setattr(Config, "RESULTS_DB", "real.sqlite")
+        with stand_in(latency_ms=0, rows=1):
+            assert Config.RESULTS_DB == os.environ["RESULTS_DB"] == Config.STUB_RESULTS_DB != "real.sqlite"
+        assert Config.RESULTS_DB == os.environ["RESULTS_DB"] == "real.sqlite"
@@ -0,0 +1,72 @@
+import time
+from utils.auth_state import AuthStateStore
+
+
+class RecordingDriver:
+    """Records the commands the auth state store sends"""
+
+    def __init__(self):
+        self.urls = []
+        self.scripts = []
+        self.added_cookies = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return {"local_storage": {"token": "abc", "lang": "en"}, "session_storage": {}}
+
+    def get_cookies(self):
+        return [{"name": "JSESSIONID", "value": "1", "httpOnly": True, "sameSite": "Lax"}]
+
+    def add_cookie(self, cookie):
+        self.added_cookies.append(cookie)
+
+
+class TestAuthStateStore:
+    """Test suite for the saved login state"""
+
+    BASE_URL = "http://localhost"
+
+    def test_saved_state_round_trip(self, tmp_path):
+        store = AuthStateStore(path=str(tmp_path / "state.json"), ttl=60)
+        state = store.capture(RecordingDriver(), self.BASE_URL)
+        store.save(state)
+
+        loaded = store.load(self.BASE_URL)
+
+        assert loaded["local_storage"]["token"] == "abc"
+        assert "language" not in loaded  # The preference travels in local_storage
+
+    def test_expired_state_is_ignored(self, tmp_path):
+        store = AuthStateStore(path=str(tmp_path / "state.json"), ttl=60)
+        store.save({"base_url": self.BASE_URL})
+        store.ttl = -1
+
+        assert store.load(self.BASE_URL) is None
+
+    def test_state_for_other_url_is_ignored(self, tmp_path):
+        store = AuthStateStore(path=str(tmp_path / "state.json"), ttl=60)
+        store.save({"base_url": "http://staging"})
+
+        assert store.load(self.BASE_URL) is None
+
+    def test_invalidate_removes_file(self, tmp_path):
+        store = AuthStateStore(path=str(tmp_path / "state.json"), ttl=60)
+        store.save({"base_url": self.BASE_URL, "saved_at": time.time()})
+        store.invalidate()
+
+        assert store.load(self.BASE_URL) is None
+
+    def test_restore_uses_single_script(self, tmp_path):
+        store = AuthStateStore(path=str(tmp_path / "state.json"), ttl=60)
+        driver = RecordingDriver()
+        state = store.capture(driver, self.BASE_URL)
+        driver.scripts.clear()
+
+        assert store.restore(driver, self.BASE_URL, state)
+        assert len(driver.urls) == 1
+        assert len(driver.scripts) == 1
+        # httpOnly cookies cannot be written from the page
+        assert driver.added_cookies == [{"name": "JSESSIONID", "value": "1", "httpOnly": True}]
@@ -0,0 +1,138 @@
+import pytest
+from utils.benchmark import (BenchmarkSuite, BenchmarkResult, BenchmarkError, median_interval, percentile,
+                             write_results, load_results, load_environment, baseline_path, compare)
+
+
+class FakeClock:
+    """perf_counter stand-in: each timed call takes the next of the given durations"""
+
+    def __init__(self, durations):
+        self.durations = iter(durations)
+        self.now = 0.0
+        self.started = False
+
+    def __call__(self):
+        if self.started:
+            self.now += next(self.durations)
+        self.started = not self.started
+        return self.now
+
+
+class TestStatistics:
+    """Test suite for the summary statistics"""
+
+    def test_percentile_interpolates_between_samples(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 0.5) == 3.0
+        assert percentile([1.0, 2.0], 0.95) == pytest.approx(1.95)
+
+    def test_median_interval_uses_order_statistics(self):
+        samples = [float(value) for value in range(1, 11)]
+
+        # n=10 at 95%: the 2nd smallest and 2nd largest samples
+        assert median_interval(samples) == (2.0, 9.0)
+
+    def test_too_few_samples_fall_back_to_the_range(self):
+        assert median_interval([1.0, 2.0, 3.0]) == (1.0, 3.0)
+
+    def test_result_summarises_its_samples(self):
+        result = BenchmarkResult("search.products_sku", [0.3, 0.1, 0.2, 0.4, 0.5])
+
+        assert result.median == 0.3 and result.min == 0.1 and result.max == 0.5
+        assert result.stddev == pytest.approx(0.158, abs=0.001)
+        assert result.group is None and result.measured
+
+
+class TestBenchmarkSuite:
+    """Test suite for warm-up, repeats and skipping"""
+
+    def test_warm_up_iterations_are_not_measured(self):
+        calls = []
+        suite = BenchmarkSuite(warmup=2, repeats=3, clock=FakeClock([9.0, 9.0, 1.0, 2.0, 3.0]))
+        suite.add("sort.brands_by_id", lambda: calls.append("sort"))
+
+        result = suite.run(verbose=False)["sort.brands_by_id"]
+
+        assert len(calls) == 5
+        assert result.samples == [1.0, 2.0, 3.0]
+        assert result.group == "sort" and result.warmup == 2
+
+    def test_setup_returning_false_skips_the_iteration(self):
+        french = iter([True, False, False])
+        suite = BenchmarkSuite(warmup=2, repeats=3, clock=FakeClock([1.5]))
+        suite.add("language.change", lambda: True, lambda: next(french), warmup=0)
+
+        result = suite.run(verbose=False)["language.change"]
+
+        assert result.samples == [1.5] and result.skipped == 2
+
+    def test_failed_operation_is_an_error_unless_unchecked(self):
+        suite = BenchmarkSuite(warmup=0, repeats=1, clock=FakeClock([1.0, 1.0]))
+        suite.add("language.is_french_language", lambda: False, check=False)
+        suite.add("login.perform_login", lambda: False)
+
+        with pytest.raises(BenchmarkError):
+            suite.run(verbose=False)
+
+    def test_only_runs_the_selected_groups(self):
+        suite = BenchmarkSuite(warmup=0, repeats=1, clock=FakeClock([1.0]))
+        suite.add("search.products_sku", lambda: None).add("sort.brands_by_id", lambda: None)
+
+        assert list(suite.run(["sort"], verbose=False)) == ["sort.brands_by_id"]
+
+
+class TestBaselineComparison:
+    """Test suite for the JSON results and the baseline comparison"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = str(tmp_path / "benchmarks.json")
+
+    def results(self, **samples):
+        return {name.replace("_", ".", 1): BenchmarkResult(name.replace("_", ".", 1), values)
+                for name, values in samples.items()}
+
+    def test_results_survive_a_round_trip_through_json(self):
+        written = self.results(search_sku=[0.2, 0.25, 0.3])
+        write_results(written, self.path, {"browser": "chrome"})
+
+        loaded = load_results(self.path)["search.sku"]
+
+        assert loaded.samples == [0.2, 0.25, 0.3] and loaded.median == 0.25
+
+    def test_clear_slowdown_is_a_regression(self):
+        baseline = self.results(sort_id=[1.0 + i / 100 for i in range(10)])
+        current = self.results(sort_id=[1.5 + i / 100 for i in range(10)])
+
+        (name, status, before, after, change), = compare(current, baseline, threshold=0.10)
+
+        assert status == "regressed" and change == pytest.approx(0.48, abs=0.01)
+
+    def test_noisy_samples_with_overlapping_intervals_are_unchanged(self):
+        baseline = self.results(sort_id=[1.0, 1.2, 0.8, 1.5, 0.9, 1.1, 1.3, 0.7, 1.4, 1.0])
+        current = self.results(sort_id=[1.2, 1.4, 1.0, 1.7, 1.1, 1.3, 1.5, 0.9, 1.6, 1.2])
+
+        assert compare(current, baseline, threshold=0.10)[0][1] == "unchanged"
+
+    def test_new_and_skipped_benchmarks_are_reported_as_such(self):
+        baseline = self.results(language_change=[2.0])
+        current = self.results(language_change=[], rich_bold=[0.1])
+
+        statuses = {name: status for name, status, *_ in compare(current, baseline)}
+
+        assert statuses == {"language.change": "skipped", "rich.bold": "new"}
+
+    def test_baseline_from_another_environment_is_incomparable(self):
+        baseline = self.results(table_read=[1.0 + i / 100 for i in range(10)])
+        current = self.results(table_read=[0.01 + i / 10000 for i in range(10)], table_new=[0.1])
+        write_results(baseline, self.path, {"browser": "chrome"})
+
+        rows = compare(current, load_results(self.path), environment={"browser": "fake", "base_url": "fake"},
+                       baseline_environment=load_environment(self.path))
+
+        assert [(name, status, change) for name, status, _, _, change in rows] == [
+            ("table.read", "incomparable", None), ("table.new", "new", None)]
+
+    def test_fake_and_stub_runs_keep_their_own_baseline(self):
+        assert baseline_path("benchmark_baseline.json") == "benchmark_baseline.json"
+        assert baseline_path("benchmark_baseline.json", "fake") == "benchmark_baseline.fake.json"
+        assert baseline_path("out/base.json", "stub") == "out/base.stub.json"
@@ -8,16 +8,10 @@ class TestBrandsPageFiltering:
 
     @pytest.fixture(autouse=True)
     def setup(self, brands_page_ready):
-        """Setup method using authenticated driver and navigate to brands page"""
+        """Setup method using the shared brands page (loaded once per class, reset between tests)"""
         self.driver = brands_page_ready
         self.brands_page = BrandsPage(self.driver)
 
-        # Navigate to brands page
-        if not self.brands_page.navigate_to_brands_page():
-            pytest.fail("Failed to navigate to brands page")
-
-        # Clear any existing filters
-        self.brands_page.clear_all_search_fields()
         print("✓ Brands page setup completed")
 
     @pytest.mark.smoke
@@ -241,10 +235,9 @@ class TestBrandsPageSorting:
     def setup(self, brands_page_ready):
         self.driver = brands_page_ready
         self.brands_page = BrandsPage(self.driver)
-        self.brands_page.navigate_to_brands_page()
-        self.brands_page.clear_all_search_fields()
 
     @pytest.mark.smoke
+    @pytest.mark.budget("sort_settle")
     def test_ascending_sort_all_columns(self):
         """Test Case 9: Testing sorting function ascending for all columns"""
         columns = ['id', 'brand_name', 'code']
@@ -380,7 +373,6 @@ class TestBrandsPageReset:
     def setup(self, brands_page_ready):
         self.driver = brands_page_ready
         self.brands_page = BrandsPage(self.driver)
-        self.brands_page.navigate_to_brands_page()
 
     @pytest.mark.regression
     def test_page_reset_functionality(self):
@@ -417,7 +409,6 @@ class TestBrandsPageSearchAndResetButtons:
     def setup(self, brands_page_ready):
         self.driver = brands_page_ready
         self.brands_page = BrandsPage(self.driver)
-        self.brands_page.navigate_to_brands_page()
 
     @pytest.mark.ui
     def test_search_button_functionality(self):
@@ -486,7 +477,6 @@ class TestBrandsPageActions:
     def setup(self, brands_page_ready):
         self.driver = brands_page_ready
         self.brands_page = BrandsPage(self.driver)
-        self.brands_page.navigate_to_brands_page()
 
     @pytest.mark.smoke
     def test_action_buttons_present(self):
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from utils.browser_profile import BrowserProfileTemplate, clone_tree
+
+
+def fake_warm(path):
+    """Stands in for the warm-up browser: leaves a cache file and Chrome's lock behind"""
+    os.makedirs(os.path.join(path, "Default", "Cache"))
+    with open(os.path.join(path, "Default", "Cache", "data_1"), "w") as handle:
+        handle.write("bundle")
+    os.symlink("host-1234", os.path.join(path, "SingletonLock"))
+
+
+class QuitDriver:
+    def __init__(self):
+        self.quits = 0
+
+    def quit(self):
+        self.quits += 1
+
+
+class TestBrowserProfileTemplate:
+    """Test suite for the warmed profile template and its clones"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.root = str(tmp_path / "profiles")
+        self.warms = []
+
+    def warm(self, path):
+        self.warms.append(path)
+        fake_warm(path)
+
+    def test_golden_profile_is_warmed_once_per_run(self):
+        BrowserProfileTemplate(self.root, run_id="run-1").ensure_warm(self.warm)
+        BrowserProfileTemplate(self.root, run_id="run-1").ensure_warm(self.warm)
+        assert len(self.warms) == 1
+
+        BrowserProfileTemplate(self.root, run_id="run-2").ensure_warm(self.warm)
+        assert len(self.warms) == 2
+
+    def test_failed_warm_up_still_allows_clones(self):
+        def broken(path):
+            raise RuntimeError("app not reachable")
+
+        template = BrowserProfileTemplate(self.root, run_id="run-1")
+        assert template.ensure_warm(broken) is False
+        assert os.path.isdir(template.clone())
+
+    def test_clone_is_an_independent_copy_without_chrome_locks(self):
+        template = BrowserProfileTemplate(self.root, run_id="run-1")
+        template.ensure_warm(self.warm)
+
+        clone = template.clone()
+        cached = os.path.join(clone, "Default", "Cache", "data_1")
+        with open(cached, "a") as handle:
+            handle.write(" + changes")
+
+        assert not os.path.lexists(os.path.join(clone, "SingletonLock"))
+        assert os.stat(cached).st_nlink == 1
+        with open(os.path.join(template.golden_dir, "Default", "Cache", "data_1")) as handle:
+            assert handle.read() == "bundle"
+
+    def test_filesystems_without_reflinks_report_a_plain_copy(self, tmp_path, monkeypatch):
+        commands = []
+
+        def cp_without_reflinks(command, **kwargs):
+            commands.append(command)
+            return subprocess.CompletedProcess(command, 1)  # What --reflink=always does on ext4
+
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setattr(subprocess, "run", cp_without_reflinks)
+        fake_warm(str(tmp_path / "golden"))
+
+        assert clone_tree(str(tmp_path / "golden"), str(tmp_path / "clone")) == "copy"
+        assert "--reflink=always" in commands[0]
+        assert os.path.isfile(os.path.join(tmp_path, "clone", "Default", "Cache", "data_1"))
+
+    def test_clone_is_removed_when_the_driver_quits(self):
+        template = BrowserProfileTemplate(self.root, run_id="run-1")
+        template.ensure_warm(self.warm)
+        driver = QuitDriver()
+        clone = template.clone()
+
+        template.attach(driver, clone).quit()
+
+        assert driver.quits == 1
+        assert not os.path.exists(clone)
+
+    def test_clones_of_dead_processes_and_old_clones_are_removed(self):
+        template = BrowserProfileTemplate(self.root, stale_after=3600, run_id="run-1")
+        finished = subprocess.Popen([sys.executable, "-c", "pass"])
+        finished.wait()
+
+        dead = os.path.join(template.clones_dir, f"{finished.pid}-aaaa")
+        old = os.path.join(template.clones_dir, f"{os.getppid()}-bbbb")
+        live = os.path.join(template.clones_dir, f"{os.getppid()}-cccc")
+        own = os.path.join(template.clones_dir, f"{os.getpid()}-dddd")
+        for path in (dead, old, live, own):
+            os.makedirs(path)
+        two_hours_ago = time.time() - 7200
+        os.utime(old, (two_hours_ago, two_hours_ago))
+
+        assert template.remove_stale() == 2
+        assert sorted(os.listdir(template.clones_dir)) == sorted(
+            os.path.basename(path) for path in (live, own))
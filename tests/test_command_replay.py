@@ -0,0 +1,171 @@
+import json
+import os
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from config.config import Config
+from pages.base_page import BasePage
+from pages.brands_page import BrandsPage
+from pages.routes import route_url
+from pages.smart_table_component import SmartTableComponent
+from utils.command_replay import (CommandRecorder, CommandReplay, RECORDED_SETTINGS, ReplayDivergence,
+                                  ReplayWebDriver)
+from utils.driver_factory import DriverFactory
+from utils.fake_webdriver import FakeWebDriver, fixture_html, virtual_time
+
+pytest_plugins = ["pytester"]
+
+
+class TestCommandReplay:
+    """Test suite for recording page objects against the fake WebDriver and replaying them"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        # Replays apply the recorded settings to Config
+        for name in RECORDED_SETTINGS + ("RESULTS_STORE_ENABLED",):
+            monkeypatch.setattr(Config, name, getattr(Config, name))
+        monkeypatch.setattr(Config, "AUTH_STATE_FILE", str(tmp_path / "storage_state.json"))
+        self.path = str(tmp_path / "cassette.json")
+
+    def record(self, flow):
+        recorder = CommandRecorder(self.path)
+        recorder.start_test("tests/test_flow.py::test_flow")
+        with virtual_time():
+            driver = recorder.attach(FakeWebDriver(pages={route_url("brands"): fixture_html("brands_list.html")}))
+            result = flow(driver)
+            driver.quit()
+        recorder.save()
+        return result
+
+    def replay(self, flow):
+        SmartTableComponent._column_cache.clear()  # As at the start of the recorded run
+        replay = CommandReplay(self.path, clock_modules=[])
+        replay.start_test("tests/test_flow.py::test_flow")
+        try:
+            driver = replay.new_driver("chrome")
+            result = flow(driver)
+            driver.quit()
+        finally:
+            replay.close()
+        return replay, result
+
+    @staticmethod
+    def browse_brands(driver):
+        page = BrandsPage(driver)
+        assert page.navigate_to_brands_page()
+        unsorted = page.get_table_data()
+        page.table.sort_by("brand_name", "desc")
+        return unsorted, page.get_table_data(), page.table.get_sort_state()
+
+    def test_replay_serves_the_recorded_run_without_a_browser(self):
+        recorded = self.record(self.browse_brands)
+
+        replay, replayed = self.replay(self.browse_brands)
+
+        assert replayed == recorded
+        assert [row["brand_name"] for row in replayed[1]] == sorted((row["brand_name"] for row in recorded[0]),
+                                                                    reverse=True)
+        assert replay.divergences == [] and replay.unplayed() == []
+        assert replay.served == len(replay.cassette["commands"]) > 10
+        assert "identical to the recording" in replay.report()[-1]
+
+    def test_errors_and_timeouts_replay_on_the_recorded_clock(self):
+        def look_for_missing_elements(driver):
+            driver.get(route_url("brands"))
+            found = BasePage(driver).find_element((By.CSS_SELECTOR, ".not-there"), timeout=10)
+            with pytest.raises(NoSuchElementException):
+                driver.find_element(By.XPATH, "//button[contains(text(), 'LOGIN')]")
+            return found
+        self.record(look_for_missing_elements)
+
+        start = time.perf_counter()
+        replay, found = self.replay(look_for_missing_elements)
+
+        assert found is None and replay.divergences == []
+        assert time.perf_counter() - start < 1 and replay.clock.elapsed >= 10
+
+    def test_skipped_and_unexpected_commands_are_divergences(self):
+        def read_header(driver):
+            driver.get(route_url("brands"))
+            title = driver.title
+            return title, driver.find_element(By.CSS_SELECTOR, "nb-card-header").text
+        self.record(read_header)
+
+        def refactored(driver):
+            driver.get(route_url("brands"))
+            header = driver.find_element(By.CSS_SELECTOR, "nb-card-header").text  # title no longer read
+            with pytest.raises(ReplayDivergence, match="unexpected w3cExecuteScript"):
+                driver.execute_script("return 1;")
+            return header
+        replay, header = self.replay(refactored)
+
+        assert header == "Brands"
+        assert [divergence["kind"] for divergence in replay.divergences] == ["missing", "unexpected"]
+        assert "getTitle" in replay.divergences[0]["message"]
+        assert replay.divergences[1]["test"] == "tests/test_flow.py::test_flow"
+        assert "2 divergences" in "\n".join(replay.report())
+
+    def test_more_browsers_than_recorded_is_a_divergence(self):
+        self.record(lambda driver: driver.title)
+        replay = CommandReplay(self.path, clock_modules=[])
+
+        assert isinstance(replay.new_driver("chrome"), ReplayWebDriver)
+        with pytest.raises(ReplayDivergence, match="browser session 2"):
+            replay.new_driver("chrome")
+        replay.close()
+
+    def test_cassette_carries_settings_and_the_saved_login(self, monkeypatch):
+        state = {"base_url": Config.BASE_URL, "saved_at": time.time(), "cookies": []}
+        with open(Config.AUTH_STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        monkeypatch.setattr(Config, "BULK_TABLE_EXTRACTION", False)
+        self.record(lambda driver: driver.title)
+
+        with open(self.path, encoding="utf-8") as f:
+            cassette = json.load(f)
+        assert cassette["settings"]["BULK_TABLE_EXTRACTION"] is False
+        assert [entry["command"] for entry in cassette["commands"]] == ["getTitle", "quit"]
+
+        Config.BULK_TABLE_EXTRACTION = True
+        replay = CommandReplay(self.path, clock_modules=[])
+        store = replay.auth_state_store()
+        assert Config.BULK_TABLE_EXTRACTION is False and Config.RESULTS_STORE_ENABLED is False
+        assert store.path != Config.AUTH_STATE_FILE and store.load(Config.BASE_URL) == state
+        replay.close()
+        assert not os.path.exists(store.path)
+
+
+class TestReplayPlugin:
+    """Test suite for the replay plugin in a small pytest session"""
+
+    def test_swallowed_divergences_still_fail_the_test(self, pytester, monkeypatch, tmp_path):
+        for name in RECORDED_SETTINGS + ("RESULTS_STORE_ENABLED",):
+            monkeypatch.setattr(Config, name, getattr(Config, name))
+        path = str(tmp_path / "cassette.json")
+        recorder = CommandRecorder(path)
+        driver = recorder.attach(FakeWebDriver(html="<title>Brands</title>"))
+        driver.title
+        driver.quit()
+        recorder.save()
+        replay = CommandReplay(path, clock_modules=[])
+        monkeypatch.setattr(DriverFactory, "_command_recording", replay)
+
+        pytester.makepyfile("""
+            from utils.driver_factory import DriverFactory
+
+            def test_refactored_page_object():
+                driver = DriverFactory.get_command_recording().new_driver("chrome")
+                try:
+                    driver.execute_script("return document.title;")
+                except Exception:
+                    pass  # like a page object that returns False on any error
+                assert driver.title == "Brands"
+                driver.quit()
+        """)
+        result = pytester.runpytest_inprocess("-p", "no:cacheprovider", plugins=[replay])
+
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*WebDriver commands differ from the recording*",
+                                     "*unexpected w3cExecuteScript*recorded: getTitle*"])
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
@@ -0,0 +1,87 @@
+import os
+import pytest
+from utils.driver_binary_cache import DriverBinaryCache
+from utils.file_lock import FileLock
+
+
+class TestDriverBinaryCache:
+    """Unit tests for offline driver binary resolution - no network needed"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        self.cache_dir = str(tmp_path / "cache")
+        self.downloads = []
+
+        fake_binary = tmp_path / "chromedriver"
+        fake_binary.write_text("#!/bin/sh\n")
+
+        def fake_download(cache, browser_name):
+            self.downloads.append(browser_name)
+            return str(fake_binary)
+
+        monkeypatch.setattr(DriverBinaryCache, "_download", fake_download)
+        self.browser_version = "130"
+        monkeypatch.setattr(DriverBinaryCache, "_browser_version", lambda cache, browser_name: self.browser_version)
+        monkeypatch.setattr(DriverBinaryCache, "_resolved", {})
+        monkeypatch.setattr("config.config.Config.CHROMEDRIVER_PATH", None)
+
+    def test_first_resolution_downloads_and_pins(self):
+        cache = DriverBinaryCache(cache_dir=self.cache_dir, offline=False)
+        path = cache.resolve("chrome")
+
+        assert cache.last_source == "download"
+        assert path.startswith(os.path.abspath(self.cache_dir))
+        assert os.path.isfile(path)
+
+    def test_later_resolutions_use_cache(self):
+        DriverBinaryCache(cache_dir=self.cache_dir, offline=False).resolve("chrome")
+        cache = DriverBinaryCache(cache_dir=self.cache_dir, offline=False)
+
+        cache.resolve("chrome")
+        assert cache.last_source == "memory"
+
+        DriverBinaryCache._resolved.clear()
+        cache.resolve("chrome")
+        assert cache.last_source == "disk"
+        assert self.downloads == ["chrome"]
+
+    def test_browser_update_resolves_a_matching_driver(self):
+        DriverBinaryCache(cache_dir=self.cache_dir, offline=False).resolve("chrome")
+        DriverBinaryCache._resolved.clear()
+        self.browser_version = "131"
+
+        cache = DriverBinaryCache(cache_dir=self.cache_dir, offline=False)
+        cache.resolve("chrome")
+        assert cache.last_source == "download"
+        assert self.downloads == ["chrome", "chrome"]
+
+        DriverBinaryCache._resolved.clear()
+        self.browser_version = "132"
+        offline = DriverBinaryCache(cache_dir=self.cache_dir, offline=True)
+        offline.resolve("chrome")
+        assert offline.last_source == "disk"
+
+    def test_offline_mode_never_downloads(self):
+        cache = DriverBinaryCache(cache_dir=self.cache_dir, offline=True)
+
+        with pytest.raises(RuntimeError):
+            cache.resolve("chrome")
+        assert self.downloads == []
+
+    def test_pinned_path_wins(self, tmp_path, monkeypatch):
+        pinned = tmp_path / "pinned-chromedriver"
+        pinned.write_text("")
+        monkeypatch.setattr("config.config.Config.CHROMEDRIVER_PATH", str(pinned))
+
+        cache = DriverBinaryCache(cache_dir=self.cache_dir, offline=True)
+
+        assert cache.resolve("chrome") == str(pinned)
+        assert cache.last_source == "pinned"
+
+    def test_file_lock_is_exclusive(self, tmp_path):
+        lock_path = str(tmp_path / "lock")
+        with FileLock(lock_path):
+            with pytest.raises(TimeoutError):
+                FileLock(lock_path, timeout=0.2).acquire()
+        with FileLock(lock_path, timeout=0.2):
+            pass
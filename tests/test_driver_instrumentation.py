@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+import pytest
+from selenium.webdriver.remote.command import Command
+from pages.base_page import BasePage
+from utils.driver_instrumentation import DriverMetrics, BACKGROUND
+
+
+class CommandDriver:
+    """Driver stand-in whose properties go through execute like the real one"""
+
+    def execute(self, driver_command, params=None):
+        return {"value": "Shopizer"}
+
+    @property
+    def title(self):
+        return self.execute(Command.GET_TITLE)["value"]
+
+
+class TestDriverMetrics:
+    """Test suite for command instrumentation"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = tmp_path / "metrics.jsonl"
+        self.metrics = DriverMetrics(str(self.path))
+        self.driver = self.metrics.attach(CommandDriver())
+
+    def test_commands_are_attributed_to_page_methods(self):
+        self.metrics.start_test("tests/test_x.py::test_title")
+        BasePage(self.driver).get_page_title()
+        self.driver.execute(Command.FIND_ELEMENT, {"using": "css selector", "value": "body"})
+        bucket = self.metrics.finish_test()
+
+        assert bucket.commands == 2
+        assert bucket.by_method["BasePage.get_page_title"]["count"] == 1
+        assert "test_driver_instrumentation.test_commands_are_attributed_to_page_methods" in bucket.by_method
+        assert bucket.by_kind["find"]["count"] == 1
+
+        record = json.loads(self.path.read_text().splitlines()[0])
+        assert record["test"] == "tests/test_x.py::test_title"
+        assert record["commands"] == 2
+        assert sum(record["by_kind"]["find"]["histogram"].values()) == 1
+
+    def test_background_threads_are_kept_apart(self):
+        self.metrics.start_test("tests/test_x.py::test_idle")
+        worker = threading.Thread(target=lambda: self.driver.title, name="driver-pool-warmer")
+        worker.start()
+        worker.join()
+        bucket = self.metrics.finish_test()
+
+        assert bucket.commands == 0
+        assert self.metrics.background.by_method[BACKGROUND]["count"] == 1
+
+    def test_explicit_sleeps_are_added_to_the_active_test(self):
+        self.metrics.start_test("tests/test_x.py::test_sleepy")
+        self.metrics.record_sleep(0.5)
+        bucket = self.metrics.finish_test()
+        self.metrics.record_sleep(0.5)  # Between tests - not attributed
+
+        assert bucket.sleep_seconds == 0.5
+
+
+class SlowPage(BasePage):
+    def wait_for_page_load(self):
+        time.sleep(0.01)
+        return True
+
+    def navigate(self):
+        return self.wait_for_page_load()
+
+
+class SlowerPage(SlowPage):
+    def wait_for_page_load(self):
+        return super().wait_for_page_load()
+
+
+class TestPageMethodTimers:
+    """Test suite for page-object method wall times"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.metrics = DriverMetrics(str(tmp_path / "metrics.jsonl"))
+        self.metrics.install_page_timers(SlowPage)
+        yield
+        self.metrics.uninstall_timers()
+
+    def test_nested_page_methods_are_each_timed(self):
+        self.metrics.start_test("tests/test_x.py::test_navigate")
+        SlowPage(CommandDriver()).navigate()
+        bucket = self.metrics.finish_test()
+
+        assert bucket.page_methods["SlowPage.navigate"]["calls"] == 1
+        assert bucket.page_methods["SlowPage.wait_for_page_load"]["seconds"] >= 0.01
+        assert "SlowPage.navigate" in bucket.to_dict()["page_methods"]
+
+    def test_override_calling_super_counts_once_under_the_instance_class(self):
+        self.metrics.start_test("tests/test_x.py::test_override")
+        SlowerPage(CommandDriver()).wait_for_page_load()
+        bucket = self.metrics.finish_test()
+
+        assert list(bucket.page_methods) == ["SlowerPage.wait_for_page_load"]
+        assert bucket.page_methods["SlowerPage.wait_for_page_load"]["calls"] == 1
+
+    def test_uninstall_restores_the_original_methods(self):
+        original = SlowPage.__dict__["wait_for_page_load"].__wrapped__
+
+        self.metrics.uninstall_timers()
+
+        assert SlowPage.__dict__["wait_for_page_load"] is original
@@ -0,0 +1,175 @@
+import collections
+import time
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.driver_pool import DriverPool
+
+
+class StubDriver:
+    """Minimal stand-in that records the calls the pool makes"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.handles = ["main"]
+        self.scripts = []
+        self.urls = []
+        self.cookies_cleared = 0
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("session deleted")
+        return list(self.handles)
+
+    @property
+    def current_window_handle(self):
+        return self.handles[0]
+
+    @property
+    def switch_to(self):
+        return self
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        self.handles.remove(self.current)
+
+    def get_window_size(self):
+        return {"width": 1920, "height": 1080}
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverPool:
+    """Test suite for the reusable driver pool"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.launched = []
+
+        def factory(browser_name, headless):
+            driver = StubDriver()
+            self.launched.append(driver)
+            return driver
+
+        self.pool = DriverPool(factory, max_reuse=3)
+
+    def test_released_driver_is_reused(self):
+        first = self.pool.lease("chrome", True)
+        self.pool.release(first)
+        second = self.pool.lease("chrome", True)
+
+        assert second is first
+        assert len(self.launched) == 1
+
+    def test_release_resets_browser_state(self):
+        driver = self.pool.lease("chrome", True)
+        driver.handles.append("popup")
+        self.pool.release(driver)
+
+        assert driver.handles == ["main"]
+        assert any("localStorage.clear()" in script for script in driver.scripts)
+        assert driver.cookies_cleared == 1
+        assert driver.urls[-1] == "about:blank"
+
+    def test_pool_is_keyed_by_browser_and_headless(self):
+        headless = self.pool.lease("chrome", True)
+        self.pool.release(headless)
+        headed = self.pool.lease("chrome", False)
+
+        assert headed is not headless
+        assert self.pool.idle_count("chrome", True) == 1
+
+    def test_driver_recycled_after_max_reuse(self):
+        driver = None
+        for _ in range(3):
+            driver = self.pool.lease("chrome", True)
+            self.pool.release(driver)
+
+        assert driver.quit_called
+        assert self.pool.stats["recycled"] == 1
+        assert self.pool.lease("chrome", True) is not driver
+
+    def test_unhealthy_driver_is_replaced(self):
+        driver = self.pool.lease("chrome", True)
+        self.pool.release(driver)
+        driver.alive = False
+
+        replacement = self.pool.lease("chrome", True)
+
+        assert replacement is not driver
+        assert driver.quit_called
+        assert self.pool.stats["unhealthy"] == 1
+
+    def test_shutdown_quits_everything(self):
+        leased = self.pool.lease("chrome", True)
+        idle = self.pool.lease("chrome", True)
+        self.pool.release(idle)
+
+        self.pool.shutdown()
+
+        assert leased.quit_called and idle.quit_called
+        assert self.pool.idle_count() == 0
+
+
+class TestDriverPoolWarming:
+    """Background warming of spare browsers"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.prepared = []
+
+        def prepare(driver):
+            self.prepared.append(driver)
+            return True
+
+        self.pool = DriverPool(lambda browser, headless: StubDriver(), warm_size=2,
+                               max_warm_size=4, prepare=prepare, wait_timeout=5)
+        yield
+        self.pool.shutdown()
+
+    def _wait_for_idle(self, count):
+        deadline = time.monotonic() + 5
+        while self.pool.idle_count("chrome", True) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_spares_are_warmed_and_prepared(self):
+        self.pool.start_warming("chrome", True)
+        self._wait_for_idle(2)
+
+        driver = self.pool.lease("chrome", True)
+
+        assert self.pool.is_prepared(driver)
+        assert self.pool.metrics["hits"] == 1
+        assert self.pool.metrics["misses"] == 0
+
+    def test_release_recycles_in_background(self):
+        self.pool.start_warming("chrome", True)
+        self._wait_for_idle(2)
+        driver = self.pool.lease("chrome", True)
+        self.pool.release(driver)
+        self._wait_for_idle(3)
+
+        assert driver.urls[-1] == "about:blank"
+        assert self.prepared.count(driver) == 2
+
+    def test_target_grows_with_demand(self):
+        key = ("chrome", True)
+        self.pool._warm_seconds = 2.0
+        now = time.time()
+        self.pool._lease_times[key] = collections.deque([now - 1.0, now - 0.5, now])
+
+        # 2 leases/s x 2s warm-up + 1 headroom = 5, capped at max_warm_size
+        assert self.pool.target_spares(key) == 4
@@ -0,0 +1,234 @@
+import time
+import pytest
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException, StaleElementReferenceException,
+                                        InvalidSelectorException, ElementNotInteractableException)
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+import pages.home_page
+from pages.base_page import BasePage
+from pages.brands_page import BrandsPage
+from pages.home_page import HomePage
+from pages.products_page import ProductsPage
+from pages.routes import route_url
+from utils.driver_instrumentation import DriverMetrics
+from utils.fake_dom import InvalidSelector, Node, parse_document, visible_text
+from utils.fake_webdriver import FakeWebDriver, fixture_html, virtual_time
+from utils.page_metrics import page_metrics
+
+
+class TestFakeDom:
+    """Test suite for the in-memory DOM and its selector engines"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.document = parse_document(fixture_html("brands_list.html"))
+
+    def test_css_covers_the_page_object_locators(self):
+        assert len(self.document.select("ng2-smart-table tbody tr")) == 6
+        assert self.document.select_one("th.ng2-smart-th.description a").text_content == "Brand name"
+        assert self.document.select_one("input[placeholder='Brand name']").get("data-key") == "description"
+        filter_input = self.document.select_one("ng2-smart-table thead tr:nth-of-type(2) th:nth-of-type(3) input")
+        assert filter_input.get("placeholder") == "Code"
+        assert len(self.document.select("a.ng2-smart-action-custom-custom i.nb-edit, .nope")) == 6
+        assert len(self.document.select('thead input:not([type="checkbox"])')) == 2
+
+    def test_xpath_covers_the_page_object_locators(self):
+        document = parse_document('<nb-context-menu><a title="Anglais"><span>Anglais</span></a></nb-context-menu>'
+                                  '<nb-menu><a>Produits</a><a href="#/auth">Logout</a></nb-menu>')
+
+        assert [node.tag for node in document.xpath("//span[text()='Anglais']/parent::a")] == ["a"]
+        assert document.xpath("//a[@title='Anglais']") == document.xpath("//span[contains(text(), 'Anglais')]/..")
+        assert len(document.xpath("//a[contains(text(), 'Products') or contains(text(), 'Produits')]")) == 1
+        assert document.xpath("//nb-menu/a[last()]")[0].get("href") == "#/auth"
+        assert document.xpath("//a[contains(text(), 'Anglais')]") == []  # text() is the link's own text only
+
+    def test_unsupported_selectors_are_rejected(self):
+        with pytest.raises(InvalidSelector):
+            self.document.select("a::before")
+        with pytest.raises(InvalidSelector):
+            self.document.xpath("//a/following::span")
+
+    def test_visible_text_skips_hidden_elements(self):
+        document = parse_document('<div>One <span style="display: none">secret</span><p>Two</p>'
+                                  '<table><tr><td>a</td><td>b</td></tr></table></div>')
+
+        assert visible_text(document.select_one("div")) == "One\nTwo\na b"
+
+
+class TestFakeWebDriver:
+    """Test suite for page objects against the in-memory fake WebDriver"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        with virtual_time(pages.home_page) as self.clock:
+            self.driver = FakeWebDriver(pages={
+                route_url("brands"): fixture_html("brands_list.html"),
+                route_url("products"): fixture_html("products_list.html"),
+            })
+            self.browser = self.driver.browser
+            yield
+            self.driver.quit()
+
+    def brands_page(self):
+        page = BrandsPage(self.driver)
+        assert page.navigate_to_brands_page()
+        return page
+
+    def test_table_rows_are_read_from_the_fixture(self):
+        page = self.brands_page()
+
+        rows = page.get_table_data()
+        assert len(rows) == 6
+        assert rows[0] == {'id': '1', 'brand_name': 'Acme 1', 'code': 'acme-1', 'has_actions': True}
+        assert page.table.get_data_per_cell() == rows
+
+    def test_checkbox_columns_and_in_app_navigation(self):
+        self.brands_page()
+        page = ProductsPage(self.driver)
+
+        assert page.navigate_to_products_page()
+        assert page_metrics.navigation_stats["in_app"]["count"] == 1
+        rows = page.get_table_data()
+        assert [row["available"] for row in rows[:4]] == [False, True, True, False]
+
+    def test_sort_clicks_cycle_and_reorder_the_rows(self):
+        page = self.brands_page()
+
+        page.table.sort_by("brand_name", "desc")
+        assert page.table.get_sort_state() == {"id": "none", "description": "desc", "code": "none"}
+        names = [row["brand_name"] for row in page.get_table_data()]
+        assert names == sorted(names, reverse=True)
+
+        assert page.table.sort_to_default("brand_name")
+        assert [row["id"] for row in page.get_table_data()] == ["1", "2", "3", "4", "5", "6"]
+
+    def test_filters_narrow_the_rows_and_reset_restores_the_view(self):
+        page = self.brands_page()
+
+        assert page.table.filter_by("code", "STARK")
+        assert [row["brand_name"] for row in page.get_table_data()] == ["Stark 5"]
+        assert page.table.get_filter_values() == {"description": "", "code": "STARK"}
+
+        page.table.filter_by("code", "nothing like this")
+        assert page.table.is_empty()
+
+        assert page.table.reset_state()
+        assert len(page.get_table_data()) == 6
+
+    def test_open_merchant_panel_is_closed_and_a_changed_store_reloads(self):
+        page = self.brands_page()
+        self.browser.select_one("span.ui-autocomplete").append(Node("div", {"class": "ui-autocomplete-panel"}))
+
+        assert not page.table.is_pristine()
+        assert page.table.reset_state()
+        assert self.browser.select(".ui-autocomplete-panel") == []
+
+        self.browser.select_one("input[name='merchant']").value = "OTHER"
+        assert not page.table.reset_state()
+
+    def test_locator_fallbacks_find_the_language_option(self):
+        self.browser.load_fixture("home_fr.html", route_url("home"))
+
+        def open_menu(browser, action):
+            browser.select_one("nb-context-menu").set("style", None)
+
+        def choose(browser, link):
+            label = "Languages - (English)" if link.get("data-language") == "en" else "Langues - (Français)"
+            browser.select_one("nb-action[nbcontextmenutag='language'] span").inner_html = label
+            browser.select_one("nb-context-menu").set("style", "display: none")
+            return True
+
+        self.browser.on_click("nb-action[nbcontextmenutag='language']", open_menu)
+        self.browser.on_click("a[data-language]", choose)
+        page = HomePage(self.driver)
+
+        start = time.perf_counter()
+        assert page.is_french_language()
+        assert page.change_language_to_english()  # no title attribute: found via //span[text()='Anglais']/parent::a
+        assert page.is_english_language()
+        assert time.perf_counter() - start < 1 and self.clock.offset >= 3
+
+    def test_missing_elements_time_out_without_waiting(self):
+        page = BasePage(self.driver)
+
+        start = time.perf_counter()
+        assert page.find_element((By.CSS_SELECTOR, ".not-there"), timeout=10) is None
+        assert time.perf_counter() - start < 1 and self.clock.offset >= 10
+        with pytest.raises(NoSuchElementException):
+            self.driver.find_element(By.XPATH, "//button[contains(text(), 'LOGIN')]")
+        with pytest.raises(InvalidSelectorException):
+            self.driver.find_element(By.CSS_SELECTOR, "a::after")
+
+    def test_elements_click_type_and_report_attributes(self):
+        self.driver.get(route_url("brands"))
+        search = self.driver.find_element(By.CSS_SELECTOR, "input.search.form-control")
+        submitted = []
+        self.browser.on_submit("form", lambda browser, form: submitted.append(form))
+
+        search.send_keys("acme", Keys.BACKSPACE, "e")
+        assert search.get_attribute("value") == "acme"
+        search.clear()
+        assert search.get_attribute("value") == "" and search.get_attribute("placeholder") == "Search"
+        assert self.driver.find_element(By.NAME, "merchant").get_attribute("value") == "DEFAULT"
+        assert self.driver.find_element(By.LINK_TEXT, "Create").get_attribute("href") == \
+            route_url("create_product")
+
+        ActionChains(self.driver).click(self.driver.find_element(By.XPATH, "//a[contains(text(), 'Products')]")) \
+            .perform()
+        assert self.driver.current_url == route_url("products")
+        assert self.driver.find_element(By.TAG_NAME, "nb-card-header").text == "Products"
+
+    def test_checkbox_clicks_toggle_and_hidden_elements_refuse_input(self):
+        self.driver.get(route_url("products"))
+        box = self.driver.find_element(By.CSS_SELECTOR, "tbody tr:first-child input[type='checkbox']")
+
+        assert not box.is_selected()
+        box.click()
+        assert box.is_selected() and box.get_attribute("checked") == "true"
+
+        self.browser.select_one("nb-card").set("hidden", "")
+        assert not box.is_displayed()
+        with pytest.raises(ElementNotInteractableException):
+            box.click()
+
+    def test_scripts_are_answered_by_hooks(self):
+        self.driver.get(route_url("brands"))
+        self.browser.on_script("return document.title;", lambda browser: browser.title)
+        self.browser.on_script("return arguments[0].closest('tr');", lambda browser, node: node.closest("tr"))
+
+        assert self.driver.execute_script("return document.title;") == "Shopizer Administration - Brands"
+        cell = self.driver.find_element(By.CSS_SELECTOR, "tbody td")
+        row = self.driver.execute_script("return arguments[0].closest('tr');", cell)
+        assert row.get_attribute("data-id") == "1"
+        with pytest.raises(JavascriptException):
+            self.driver.execute_script("return window.someUnknownThing;")
+
+    def test_navigation_makes_elements_stale(self):
+        self.driver.get(route_url("brands"))
+        header = self.driver.find_element(By.CSS_SELECTOR, "nb-card-header")
+
+        self.driver.get(route_url("products"))
+        with pytest.raises(StaleElementReferenceException):
+            header.text
+        self.driver.back()
+        assert self.driver.current_url == route_url("brands")
+
+    def test_screenshots_are_written_and_counted(self, tmp_path):
+        path = tmp_path / "shot.png"
+
+        assert self.driver.save_screenshot(str(path))
+        assert path.read_bytes().startswith(b"\x89PNG")
+        assert self.browser.screenshots == 1
+
+    def test_driver_metrics_see_every_command(self, tmp_path):
+        metrics = DriverMetrics(str(tmp_path / "metrics.jsonl"))
+        metrics.attach(self.driver)
+        metrics.start_test("tests/test_fake_webdriver.py::test_metrics")
+
+        self.brands_page().get_table_data()
+        bucket = metrics.finish_test()
+
+        assert bucket.commands == sum(count for command, count in self.browser.commands.items()
+                                      if command != "newSession")
+        assert bucket.by_method["BrandsPage.get_table_data"]["count"] == 1
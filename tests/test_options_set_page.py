@@ -8,14 +8,10 @@ class TestOptionsSetPageBasic:
 
     @pytest.fixture(autouse=True)
     def setup(self, options_set_page_ready):
-        """Setup method using authenticated driver and navigate to options set page"""
+        """Setup method using the shared options set page (loaded once per class, reset between tests)"""
         self.driver = options_set_page_ready
         self.options_set_page = OptionsSetPage(self.driver)
 
-        # Navigate to options set page
-        if not self.options_set_page.navigate_to_options_set_page():
-            pytest.fail("Failed to navigate to options set page")
-
         print("✓ Options set page setup completed")
 
     @pytest.mark.smoke
@@ -65,7 +61,6 @@ class TestOptionsSetPageSorting:
     def setup(self, options_set_page_ready):
         self.driver = options_set_page_ready
         self.options_set_page = OptionsSetPage(self.driver)
-        self.options_set_page.navigate_to_options_set_page()
 
     @pytest.mark.smoke
     def test_ascending_sort_all_columns(self):
@@ -215,7 +210,6 @@ class TestOptionsSetPageReset:
     def setup(self, options_set_page_ready):
         self.driver = options_set_page_ready
         self.options_set_page = OptionsSetPage(self.driver)
-        self.options_set_page.navigate_to_options_set_page()
 
     @pytest.mark.regression
     def test_page_reset_functionality(self):
@@ -258,7 +252,6 @@ class TestOptionsSetPageActions:
     def setup(self, options_set_page_ready):
         self.driver = options_set_page_ready
         self.options_set_page = OptionsSetPage(self.driver)
-        self.options_set_page.navigate_to_options_set_page()
 
     @pytest.mark.ui
     def test_create_button_visible(self):
@@ -324,7 +317,6 @@ class TestOptionsSetPageStressTest:
     def setup(self, options_set_page_ready):
         self.driver = options_set_page_ready
         self.options_set_page = OptionsSetPage(self.driver)
-        self.options_set_page.navigate_to_options_set_page()
 
     @pytest.mark.regression
     def test_rapid_sort_changes(self):
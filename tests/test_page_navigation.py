@@ -0,0 +1,172 @@
+import pytest
+from config.config import Config
+from pages.base_page import BasePage, APP_SHELL_SCRIPT, HASH_NAVIGATE_SCRIPT, PAGE_TIMING_SCRIPT
+from pages.routes import ROUTES, route_hash, route_url
+from utils.page_metrics import page_metrics
+
+
+class ShellDriver:
+    """Pretends to be a browser showing the admin shell (or not) and records navigations"""
+
+    TIMING = {"ttfb": 40.0, "dcl": 600.0, "load": 900.0, "fcp": 650.0, "lcp": 1100.0,
+              "resources": 30, "transfer_bytes": 512000, "encoded_bytes": 500000, "cached_resources": 0}
+
+    def __init__(self, hash_="", shell=True, origin=None):
+        self.origin = origin or Config.BASE_URL.rstrip("/")
+        self.hash = hash_
+        self.shell = shell
+        self.loads = []
+        self.hash_changes = []
+        self.timing_since = []
+
+    @property
+    def current_url(self):
+        return f"{self.origin}/{self.hash}"
+
+    def get(self, url):
+        self.loads.append(url)
+        self.hash = url[url.index("#"):]
+        self.shell = True
+
+    def execute_script(self, script, *args):
+        if script == APP_SHELL_SCRIPT:
+            return {"origin": self.origin, "hash": self.hash, "shell": self.shell, "now": 5000.0}
+        assert script == HASH_NAVIGATE_SCRIPT
+        self.hash_changes.append(args[0])
+        self.hash = args[0]
+
+    def execute_async_script(self, script, *args):
+        assert script == PAGE_TIMING_SCRIPT
+        self.timing_since.append(args[0])
+        return dict(self.TIMING)
+
+
+class ResettablePage(BasePage):
+    def __init__(self, driver, reset_result=True):
+        super().__init__(driver)
+        self.reset_result = reset_result
+        self.resets = 0
+
+    def reset_page_state(self):
+        self.resets += 1
+        return self.reset_result
+
+
+class TestRouteRegistry:
+    """Test suite for route names and URLs"""
+
+    def test_registry_name_and_path_resolve_to_the_same_hash(self):
+        assert route_hash("brands") == "#/pages/catalogue/brands/brands-list"
+        assert route_hash(ROUTES["brands"]) == route_hash("brands")
+
+    def test_url_uses_configured_base_url(self):
+        assert route_url("products") == f"{Config.BASE_URL.rstrip('/')}/#/pages/catalogue/products/products-list"
+        assert route_url("brands", "http://shop.test/") == "http://shop.test/#/pages/catalogue/brands/brands-list"
+
+
+class TestOpenRoute:
+    """Test suite for in-app vs full route navigation"""
+
+    def test_cold_browser_gets_a_full_load(self):
+        driver = ShellDriver(shell=False)
+
+        assert BasePage(driver).open_route("brands", ready=lambda: True)
+        assert driver.loads == [route_url("brands")]
+        assert page_metrics.navigation_stats["full"]["count"] == 1
+
+    def test_loaded_shell_switches_route_in_app(self):
+        driver = ShellDriver(hash_=route_hash("products"))
+
+        assert BasePage(driver).open_route("brands", ready=lambda: True)
+        assert driver.loads == []
+        assert driver.hash_changes == [route_hash("brands")]
+        assert page_metrics.navigation_stats["in_app"]["count"] == 1
+
+    def test_other_origin_is_never_switched_in_app(self):
+        driver = ShellDriver(hash_=route_hash("products"), origin="http://elsewhere.test")
+
+        BasePage(driver).open_route("brands", ready=lambda: True)
+
+        assert driver.hash_changes == []
+        assert len(driver.loads) == 1
+
+    def test_current_route_is_reset_in_place(self):
+        driver = ShellDriver(hash_=route_hash("brands"))
+        page = ResettablePage(driver)
+        latencies = []
+        page_metrics.latency_listeners.append(lambda kind, seconds: latencies.append(kind))
+
+        assert page.open_route("brands", ready=lambda: True)
+        assert page.resets == 1
+        assert driver.loads == [] and driver.hash_changes == []
+        assert page_metrics.navigation_stats["current"]["count"] == 1
+        assert latencies == [] and page_metrics.page_timings == []  # A reset is not a route load
+
+    def test_failed_reset_falls_back_to_full_load(self):
+        driver = ShellDriver(hash_=route_hash("brands"))
+
+        ResettablePage(driver, reset_result=False).open_route("brands", ready=lambda: True)
+
+        assert driver.loads == [route_url("brands")]
+
+    def test_in_app_switch_that_never_gets_ready_falls_back_to_full_load(self):
+        driver = ShellDriver(hash_=route_hash("products"))
+        readiness = iter([False, True])
+
+        assert BasePage(driver).open_route("brands", ready=lambda: next(readiness))
+        assert driver.hash_changes == [route_hash("brands")]
+        assert driver.loads == [route_url("brands")]
+        assert page_metrics.navigation_stats["in_app"]["count"] == 0
+
+    def test_force_reload_skips_the_shell(self):
+        driver = ShellDriver(hash_=route_hash("products"))
+
+        BasePage(driver).open_route("brands", ready=lambda: True, force_reload=True)
+
+        assert driver.hash_changes == []
+        assert len(driver.loads) == 1
+
+    def test_report_estimates_time_saved_against_full_loads(self):
+        stats = page_metrics.navigation_stats
+        stats["full"].update(count=2, seconds=6.0)
+        stats["in_app"].update(count=4, seconds=2.0)
+
+        lines = BasePage.navigation_report()
+
+        assert lines[-1] == "time saved vs a full load each time: ~10.00s"
+
+    def test_full_load_records_document_timings_per_route(self):
+        driver = ShellDriver(shell=False)
+        stored = []
+        page_metrics.timing_listeners.append(stored.append)
+
+        BasePage(driver).open_route("brands", ready=lambda: True)
+
+        timing, = stored
+        assert timing["route"] == ROUTES["brands"] and timing["navigation"] == "full"
+        assert timing["lcp"] == 1100.0 and timing["duration"] is not None
+        assert driver.timing_since == [0]
+
+    def test_in_app_switch_records_only_its_own_resources(self):
+        driver = ShellDriver(hash_=route_hash("products"))
+
+        BasePage(driver).open_route("brands", ready=lambda: True)
+
+        timing, = page_metrics.page_timings
+        assert timing["navigation"] == "in_app"
+        assert timing["ttfb"] is None and timing["lcp"] is None
+        assert timing["resources"] == 30
+        assert driver.timing_since == [5000.0]
+
+    def test_failed_navigation_records_no_timing(self):
+        BasePage(ShellDriver(shell=False)).open_route("brands", ready=lambda: False)
+
+        assert page_metrics.page_timings == []
+
+    def test_timing_report_compares_with_earlier_runs(self):
+        driver = ShellDriver(shell=False)
+        BasePage(driver).open_route("brands", ready=lambda: True)
+
+        lines = BasePage.page_timing_report({(ROUTES["brands"], "full"): {"lcp": 1000.0}})
+
+        assert "(lcp prev 1000ms, +100ms)" in lines[1]
@@ -0,0 +1,61 @@
+import pytest
+from utils.parallel_runner import build_groups, collect, collect_args, group_key, schedule, worker_args
+
+
+class TestParallelScheduling:
+    """Test suite for grouping and scheduling"""
+
+    ITEMS = [
+        ("tests/test_brands_page.py::TestBrands::test_a", ["authenticated_driver", "brands_page_ready"]),
+        ("tests/test_brands_page.py::TestBrands::test_b", ["authenticated_driver", "brands_page_ready"]),
+        ("tests/test_brands_page.py::TestBrands::test_c", ["authenticated_driver", "brands_page_ready"]),
+        ("tests/test_products_page.py::TestProducts::test_a", ["products_page_ready"]),
+        ("tests/test_products_page.py::TestProducts::test_b", ["products_page_ready"]),
+        ("tests/test_sample.py::test_one", ["driver"]),
+        ("tests/test_sample.py::test_two", ["driver"]),
+    ]
+
+    def test_tests_are_grouped_by_page_fixture(self):
+        groups = {group.key: group for group in build_groups(self.ITEMS)}
+
+        assert len(groups["brands_page_ready"].nodeids) == 3
+        assert len(groups["products_page_ready"].nodeids) == 2
+        assert group_key("tests/test_sample.py::test_one", ["driver"]) == "tests/test_sample.py::test_one"
+
+    def test_groups_never_split_across_workers(self):
+        plans = schedule(build_groups(self.ITEMS), workers=2)
+
+        for key in ("brands_page_ready", "products_page_ready"):
+            owners = [plan.index for plan in plans if any(g.key == key for g in plan.groups)]
+            assert len(owners) == 1
+        assert sorted(len(plan.nodeids) for plan in plans) == [3, 4]
+
+    def test_durations_drive_the_balance(self):
+        durations = {nodeid: 10.0 for nodeid, _ in self.ITEMS if "products" in nodeid}
+        plans = schedule(build_groups(self.ITEMS, durations), workers=2)
+
+        products = next(plan for plan in plans if any(g.key == "products_page_ready" for g in plan.groups))
+        assert products.nodeids == [nodeid for nodeid, _ in self.ITEMS if "products" in nodeid]
+
+    def test_worker_reports_do_not_collide(self):
+        args = worker_args(["tests/", "--html=reports/report.html", "--junitxml=x.xml", "-v"], 2)
+
+        assert args == ["tests/", "--html=reports/report.worker2.html", "-v"]
+        assert worker_args(["--junitxml", "x.xml", "tests/"], 2) == ["tests/"]
+
+    def test_run_only_options_are_dropped_with_their_values(self):
+        args = collect_args(["--tb", "short", "--durations=5", "--junitxml", "out.xml", "-s", "-sx",
+                             "--capture", "no", "-vv", "tests/test_brands_page.py", "-k", "sort"])
+
+        assert args == ["-sx", "tests/test_brands_page.py", "-k", "sort"]
+
+    def test_collection_runs_in_its_own_process(self, monkeypatch):
+        def in_process(*args, **kwargs):
+            raise AssertionError("collect() must not run pytest in the parent")
+        monkeypatch.setattr(pytest, "main", in_process)
+
+        items = collect(["tests/test_parallel_runner.py", "-v", "--tb", "short"])
+
+        nodeid = "tests/test_parallel_runner.py::TestParallelScheduling::test_collection_runs_in_its_own_process"
+        assert "monkeypatch" in dict(items)[nodeid]
+        assert len(items) == 6
@@ -0,0 +1,137 @@
+import pytest
+from pages.base_page import BasePage
+from utils.page_metrics import page_metrics
+from utils.performance_budget import PerformanceBudgetPlugin, budget_limits
+
+pytest_plugins = ["pytester"]
+
+BUDGETS = {"local": {"route_load": 5.0, "search_settle": 2.0, "sort_settle": 2.0, "scale": 1.0},
+           "ci": {"route_load": 8.0, "search_settle": 3.0, "sort_settle": 3.0, "scale": 1.5}}
+
+
+class Marker:
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class TestBudgetLimits:
+    """Test suite for resolving budget markers per environment"""
+
+    def test_named_metrics_use_environment_defaults(self):
+        assert budget_limits(Marker("route_load", "sort_settle"), "ci", BUDGETS) == {
+            "route_load": 8.0, "sort_settle": 3.0}
+
+    def test_explicit_limits_are_scaled_per_environment(self):
+        assert budget_limits(Marker(search_settle=1.0, mode="warn"), "ci", BUDGETS) == {"search_settle": 1.5}
+
+    def test_unknown_metric_or_environment_is_rejected(self):
+        with pytest.raises(ValueError):
+            budget_limits(Marker(paint=1.0), "local", BUDGETS)
+        with pytest.raises(ValueError):
+            budget_limits(Marker("route_load"), "moon", BUDGETS)
+
+
+class TestPerformanceBudgetPlugin:
+    """Test suite for the budget plugin in small pytest sessions"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, pytester, monkeypatch):
+        self.pytester = pytester
+        monkeypatch.setattr("config.config.Config.PERFORMANCE_BUDGETS", BUDGETS)
+
+    def run(self, source, mode="fail"):
+        plugin = PerformanceBudgetPlugin(env="local", mode=mode)
+        page_metrics.latency_listeners.append(plugin.record)
+        self.pytester.makepyfile(source)
+        return self.pytester.runpytest_inprocess("-p", "no:cacheprovider", "-W", "ignore::pytest.PytestUnknownMarkWarning",
+                                                 plugins=[plugin]), plugin
+
+    def test_latency_over_budget_fails_the_test(self):
+        result, plugin = self.run("""
+            import pytest
+            from pages.base_page import BasePage
+
+            @pytest.mark.budget(sort_settle=1.0)
+            def test_sort():
+                BasePage.record_latency("sort_settle", 0.4)
+                BasePage.record_latency("sort_settle", 1.3)
+        """)
+
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*Performance budget exceeded (local): sort_settle 1.30s > 1.00s*"])
+        assert "over budget" in plugin.report()[0]
+
+    def test_warn_mode_keeps_the_test_passing(self):
+        result, _ = self.run("""
+            import pytest
+            from pages.base_page import BasePage
+
+            @pytest.mark.budget(search_settle=1.0)
+            def test_search():
+                BasePage.record_latency("search_settle", 1.5)
+        """, mode="warn")
+
+        result.assert_outcomes(passed=1, warnings=1)
+
+    def test_route_loads_in_fixtures_count_but_settles_do_not(self):
+        result, _ = self.run("""
+            import pytest
+            from pages.base_page import BasePage
+
+            @pytest.fixture
+            def page():
+                BasePage.record_latency("route_load", 9.0)
+                BasePage.record_latency("sort_settle", 9.0)  # state reset, not the test's sort
+
+            @pytest.mark.budget("sort_settle")
+            def test_sort_only(page):
+                BasePage.record_latency("sort_settle", 0.5)
+
+            @pytest.mark.budget("route_load")
+            def test_route(page):
+                pass
+        """)
+
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines(["*route_load 9.00s > 5.00s*"])
+
+    def test_budgets_that_were_never_measured_follow_the_mode(self):
+        source = """
+            import pytest
+
+            @pytest.mark.budget(route_load=3.0)
+            def test_page_already_loaded_by_an_earlier_test():
+                pass
+        """
+        result, plugin = self.run(source)
+
+        result.assert_outcomes(failed=1)
+        result.stdout.fnmatch_lines(["*Performance budget not measured (local): route_load not measured*"])
+        assert "1 over budget" in plugin.report()[0]
+
+        result, _ = self.run(source, mode="warn")
+        result.assert_outcomes(passed=1, warnings=1)
+
+    def test_invalid_markers_do_not_leak_samples(self):
+        result, plugin = self.run("""
+            import pytest
+
+            @pytest.mark.budget(paint=1.0)
+            def test_invalid():
+                pass
+        """)
+
+        result.assert_outcomes(failed=1)
+        assert plugin.samples is None
+
+    def test_unbudgeted_tests_are_not_checked(self):
+        result, plugin = self.run("""
+            from pages.base_page import BasePage
+
+            def test_plain():
+                BasePage.record_latency("route_load", 60.0)
+        """)
+
+        result.assert_outcomes(passed=1)
+        assert plugin.report() == []
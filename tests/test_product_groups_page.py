@@ -8,16 +8,10 @@ class TestProductGroupsPageFiltering:
 
     @pytest.fixture(autouse=True)
     def setup(self, product_groups_page_ready):
-        """Setup method using authenticated driver and navigate to product groups page"""
+        """Setup method using the shared product groups page (loaded once per class, reset between tests)"""
         self.driver = product_groups_page_ready
         self.product_groups_page = ProductGroupsPage(self.driver)
 
-        # Navigate to product groups page
-        if not self.product_groups_page.navigate_to_product_groups_page():
-            pytest.fail("Failed to navigate to product groups page")
-
-        # Clear any existing filters
-        self.product_groups_page.clear_code_search()
         print("✓ Product groups page setup completed")
 
     @pytest.mark.smoke
@@ -190,7 +184,6 @@ class TestProductGroupsPageToggle:
     def setup(self, product_groups_page_ready):
         self.driver = product_groups_page_ready
         self.product_groups_page = ProductGroupsPage(self.driver)
-        self.product_groups_page.navigate_to_product_groups_page()
 
     @pytest.mark.ui
     def test_active_toggle_functionality(self):
@@ -235,8 +228,6 @@ class TestProductGroupsPageSorting:
     def setup(self, product_groups_page_ready):
         self.driver = product_groups_page_ready
         self.product_groups_page = ProductGroupsPage(self.driver)
-        self.product_groups_page.navigate_to_product_groups_page()
-        self.product_groups_page.clear_code_search()
 
     @pytest.mark.smoke
     def test_ascending_sort_all_columns(self):
@@ -371,7 +362,6 @@ class TestProductGroupsPageReset:
     def setup(self, product_groups_page_ready):
         self.driver = product_groups_page_ready
         self.product_groups_page = ProductGroupsPage(self.driver)
-        self.product_groups_page.navigate_to_product_groups_page()
 
     @pytest.mark.regression
     def test_page_reset_functionality(self):
@@ -406,7 +396,6 @@ class TestProductGroupsPageActions:
     def setup(self, product_groups_page_ready):
         self.driver = product_groups_page_ready
         self.product_groups_page = ProductGroupsPage(self.driver)
-        self.product_groups_page.navigate_to_product_groups_page()
 
     @pytest.mark.ui
     def test_create_button_visible(self):
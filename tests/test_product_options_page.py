@@ -8,16 +8,10 @@ class TestProductOptionsPageFiltering:
 
     @pytest.fixture(autouse=True)
     def setup(self, product_options_page_ready):
-        """Setup method using authenticated driver and navigate to product options page"""
+        """Setup method using the shared product options page (loaded once per class, reset between tests)"""
         self.driver = product_options_page_ready
         self.product_options_page = ProductOptionsPage(self.driver)
 
-        # Navigate to product options page
-        if not self.product_options_page.navigate_to_product_options_page():
-            pytest.fail("Failed to navigate to product options page")
-
-        # Clear any existing filters
-        self.product_options_page.clear_name_search()
         print("✓ Product options page setup completed")
 
     @pytest.mark.smoke
@@ -190,8 +184,6 @@ class TestProductOptionsPageSorting:
     def setup(self, product_options_page_ready):
         self.driver = product_options_page_ready
         self.product_options_page = ProductOptionsPage(self.driver)
-        self.product_options_page.navigate_to_product_options_page()
-        self.product_options_page.clear_name_search()
 
     @pytest.mark.smoke
     def test_ascending_sort_all_columns(self):
@@ -329,7 +321,6 @@ class TestProductOptionsPageReset:
     def setup(self, product_options_page_ready):
         self.driver = product_options_page_ready
         self.product_options_page = ProductOptionsPage(self.driver)
-        self.product_options_page.navigate_to_product_options_page()
 
     @pytest.mark.regression
     def test_page_reset_functionality(self):
@@ -363,7 +354,6 @@ class TestProductOptionsPageMerchantStore:
     def setup(self, product_options_page_ready):
         self.driver = product_options_page_ready
         self.product_options_page = ProductOptionsPage(self.driver)
-        self.product_options_page.navigate_to_product_options_page()
 
     @pytest.mark.ui
     def test_merchant_store_dropdown_functionality(self):
@@ -395,7 +385,6 @@ class TestProductOptionsPageActions:
     def setup(self, product_options_page_ready):
         self.driver = product_options_page_ready
         self.product_options_page = ProductOptionsPage(self.driver)
-        self.product_options_page.navigate_to_product_options_page()
 
     @pytest.mark.ui
     def test_create_button_visible(self):
@@ -8,16 +8,10 @@ class TestProductTypesPageBasic:
 
     @pytest.fixture(autouse=True)
     def setup(self, product_types_page_ready):
-        """Setup method using authenticated driver and navigate to product types page"""
+        """Setup method using the shared product types page (loaded once per class, reset between tests)"""
         self.driver = product_types_page_ready
         self.product_types_page = ProductTypesPage(self.driver)
 
-        # Navigate to product types page
-        if not self.product_types_page.navigate_to_product_types_page():
-            pytest.fail("Failed to navigate to product types page")
-
-        # Clear any existing filters
-        self.product_types_page.clear_code_search()
         print("✓ Product types page setup completed")
 
     @pytest.mark.smoke
@@ -53,7 +47,6 @@ class TestProductTypesPageFilters:
     def setup(self, product_types_page_ready):
         self.driver = product_types_page_ready
         self.product_types_page = ProductTypesPage(self.driver)
-        self.product_types_page.navigate_to_product_types_page()
 
     @pytest.mark.regression
     def test_special_characters_filter(self):
@@ -208,8 +201,6 @@ class TestProductTypesPageSorting:
     def setup(self, product_types_page_ready):
         self.driver = product_types_page_ready
         self.product_types_page = ProductTypesPage(self.driver)
-        self.product_types_page.navigate_to_product_types_page()
-        self.product_types_page.clear_code_search()
 
     @pytest.mark.smoke
     def test_ascending_sort_all_columns(self):
@@ -347,7 +338,6 @@ class TestProductTypesPageReset:
     def setup(self, product_types_page_ready):
         self.driver = product_types_page_ready
         self.product_types_page = ProductTypesPage(self.driver)
-        self.product_types_page.navigate_to_product_types_page()
 
     @pytest.mark.regression
     def test_page_reset_functionality(self):
@@ -381,7 +371,6 @@ class TestProductTypesPageActions:
     def setup(self, product_types_page_ready):
         self.driver = product_types_page_ready
         self.product_types_page = ProductTypesPage(self.driver)
-        self.product_types_page.navigate_to_product_types_page()
 
     @pytest.mark.ui
     def test_create_button_visible(self):
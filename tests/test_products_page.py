@@ -2,23 +2,17 @@ import pytest
 import time
 from selenium.webdriver.common.keys import Keys
 from pages.products_page import ProductsPage
+from config.config import Config
 
 class TestProductsPageFiltering:
     """Test suite for Products page filtering and search functionality with authentication"""
 
     @pytest.fixture(autouse=True)
     def setup(self, products_page_ready):
-        """Setup method using authenticated driver and navigate to products page"""
+        """Setup method using the shared products page (loaded once per class, reset between tests)"""
         self.driver = products_page_ready
         self.products_page = ProductsPage(self.driver)
 
-        # Ensure we're on the products page and authenticated
-        success = self.products_page.ensure_authenticated_and_navigate()
-        if not success:
-            pytest.fail("Failed to setup authenticated products page")
-
-        # Clear any existing filters
-        self.products_page.clear_all_search_fields()
         print("✓ Products page setup completed")
 
     @pytest.mark.smoke
@@ -69,6 +63,7 @@ class TestProductsPageFiltering:
             "Table should show no data for non-existent special characters in product name"
 
     @pytest.mark.smoke
+    @pytest.mark.budget("search_settle")
     def test_valid_existing_sku_search(self):
         """Test Case 2: Submit valid text for existing SKU"""
         # First get some existing data to test with
@@ -268,7 +263,6 @@ class TestProductsPageToggle:
     def setup(self, products_page_ready):
         self.driver = products_page_ready
         self.products_page = ProductsPage(self.driver)
-        self.products_page.ensure_authenticated_and_navigate()
 
     @pytest.mark.ui
     def test_available_toggle_functionality(self):
@@ -296,8 +290,6 @@ class TestProductsPageSorting:
     def setup(self, products_page_ready):
         self.driver = products_page_ready
         self.products_page = ProductsPage(self.driver)
-        self.products_page.ensure_authenticated_and_navigate()
-        self.products_page.clear_all_search_fields()
 
     @pytest.mark.smoke
     def test_ascending_sort_all_columns(self):
@@ -421,7 +413,6 @@ class TestProductsPageReset:
     def setup(self, products_page_ready):
         self.driver = products_page_ready
         self.products_page = ProductsPage(self.driver)
-        self.products_page.ensure_authenticated_and_navigate()
 
     @pytest.mark.regression
     def test_page_reset_functionality(self):
@@ -459,7 +450,7 @@ class TestAuthentication:
         products_page = ProductsPage(driver)
 
         # Test authentication and navigation
-        success = products_page.ensure_authenticated_and_navigate("http://localhost")
+        success = products_page.ensure_authenticated_and_navigate(Config.BASE_URL)
         assert success, "Authentication and navigation should succeed"
 
         # Verify we're on the products page
@@ -0,0 +1,97 @@
+import pytest
+from utils.results_store import ResultsStore
+from utils.regression_gate import find_regressions, gate_report, run_gate, snapshot
+
+LOAD = "ProductsPage.wait_for_page_load"
+SORT = "BrandsPage.sort_by_column"
+
+
+def timings(tests, wall_seconds=None):
+    """Snapshot from {nodeid: (seconds, {method: (calls, seconds)})}"""
+    return snapshot({nodeid: seconds for nodeid, (seconds, _) in tests.items()},
+                    {nodeid: {method: {"calls": calls, "seconds": spent} for method, (calls, spent) in methods.items()}
+                     for nodeid, (_, methods) in tests.items()},
+                    wall_seconds)
+
+
+class TestFindRegressions:
+    """Test suite for comparing a run with the timing baseline"""
+
+    BASELINE = {
+        "t::search": (10.0, {LOAD: (4, 4.0), SORT: (1, 0.5)}),
+        "t::sort": (6.0, {LOAD: (2, 2.0), SORT: (4, 2.0)}),
+    }
+
+    def test_page_method_slowdown_points_to_the_method_and_its_tests(self):
+        current = {
+            "t::search": (11.2, {LOAD: (4, 5.2), SORT: (1, 0.5)}),
+            "t::sort": (6.6, {LOAD: (2, 2.6), SORT: (4, 2.0)}),
+        }
+
+        regressions, notes = find_regressions(timings(self.BASELINE, 16.0), timings(current, 17.8), threshold=0.2)
+
+        regression, = regressions
+        assert (regression.kind, regression.name) == ("page_method", LOAD)
+        assert regression.change == pytest.approx(0.3)
+        assert [name for name, _ in regression.culprits] == ["t::search", "t::sort"]
+        assert notes == []
+
+    def test_slower_test_names_the_page_methods_that_grew(self):
+        current = dict(self.BASELINE, **{"t::sort": (9.0, {LOAD: (2, 2.0), SORT: (4, 4.5)})})
+
+        regressions, _ = find_regressions(timings(self.BASELINE), timings(current), threshold=0.2)
+
+        kinds = {(r.kind, r.name): r for r in regressions}
+        assert kinds[("test", "t::sort")].culprits == [(SORT, pytest.approx(2.5))]
+        assert ("page_method", SORT) in kinds
+        assert any("slower page methods: BrandsPage.sort_by_column +2.50s" in line
+                   for line in gate_report(regressions, []))
+
+    def test_wall_time_is_only_compared_for_the_same_selection(self):
+        regressions, _ = find_regressions(timings(self.BASELINE, 16.0), timings(self.BASELINE, 30.0))
+        assert [r.kind for r in regressions] == ["wall_time"]
+
+        fewer = {"t::search": self.BASELINE["t::search"]}
+        regressions, notes = find_regressions(timings(self.BASELINE, 16.0), timings(fewer, 30.0))
+        assert regressions == []
+        assert "different test selection" in notes[0]
+
+    def test_small_absolute_slowdowns_are_noise(self):
+        baseline = {"t::quick": (0.2, {LOAD: (1, 0.01)})}
+        current = {"t::quick": (0.4, {LOAD: (1, 0.02)})}
+
+        assert find_regressions(timings(baseline), timings(current), threshold=0.2)[0] == []
+
+
+class TestRunGate:
+    """Test suite for saving and checking the baseline from the results store"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.db = str(tmp_path / "results.sqlite")
+        self.baseline = str(tmp_path / "wall_time_baseline.json")
+
+    def _run(self, seconds):
+        store = ResultsStore(self.db)
+        store.start_run()
+        started_at = store.last_runs(1)[0][1]
+        store.record("t::a", "call", seconds, "passed")
+        store.record_page_methods("t::a", {LOAD: {"calls": 1, "seconds": seconds}})
+        store.finish_run(0)
+        store.close()
+        return started_at
+
+    def test_saved_baseline_catches_a_later_slowdown(self):
+        since = self._run(2.0)
+        assert run_gate(since, 3.0, self.baseline, save=True, db_path=self.db)
+
+        since = self._run(2.1)
+        assert run_gate(since, 3.1, self.baseline, db_path=self.db)
+
+        since = self._run(4.0)
+        assert not run_gate(since, 5.0, self.baseline, db_path=self.db)
+
+    def test_missing_baseline_passes(self):
+        since = self._run(2.0)
+
+        assert run_gate(since, 3.0, self.baseline, db_path=self.db)
@@ -0,0 +1,133 @@
+import json
+import pytest
+from pages.base_page import BasePage
+from pages.products_page import ProductsPage
+from pages.rich_text_editor_component import RichTextEditorComponent
+from utils.request_blocking import BlockingProfile, RequestBlocker, PROFILES
+
+
+def log_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class CdpDriver:
+    """Records CDP commands and hands out a canned performance log"""
+
+    def __init__(self, log=None):
+        self.commands = []
+        self.log = log or []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+    def get_log(self, kind):
+        assert kind == "performance"
+        entries, self.log = self.log, []
+        return entries
+
+
+class Marker:
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class ImagePage(BasePage):
+    REQUEST_BLOCKING = {"resource_types": ["image"]}
+
+
+class FontPage(BasePage):
+    REQUEST_BLOCKING = {"resource_types": ["font"], "url_patterns": ["*/analytics.js"]}
+
+
+class TestBlockingProfile:
+    """Test suite for blocking declarations"""
+
+    def test_resource_types_become_url_patterns(self):
+        patterns = BlockingProfile(["font"]).patterns()
+
+        assert "*.woff2" in patterns and "*.woff2?*" in patterns
+        assert not any(pattern.startswith("*.png") for pattern in patterns)
+
+    def test_favicon_used_for_auth_state_is_never_blocked(self):
+        assert not any("ico" in pattern for pattern in PROFILES["admin"].patterns())
+
+    def test_unknown_resource_type_is_rejected(self):
+        with pytest.raises(ValueError):
+            BlockingProfile(["images"])
+
+    def test_undeclared_pages_use_configured_default(self, monkeypatch):
+        monkeypatch.setattr("config.config.Config.REQUEST_BLOCKING_PROFILE", "none")
+
+        assert BlockingProfile.for_pages([BasePage]).patterns() == []
+        assert BlockingProfile.for_pages([]) is PROFILES["none"]
+
+    def test_list_pages_declare_the_admin_profile(self, monkeypatch):
+        monkeypatch.setattr("config.config.Config.REQUEST_BLOCKING_PROFILE", "none")
+
+        assert BlockingProfile.for_pages([ProductsPage]) is PROFILES["admin"]
+        assert BlockingProfile.for_pages([RichTextEditorComponent]) is PROFILES["none"]
+
+    def test_pages_sharing_a_browser_get_the_union(self):
+        profile = BlockingProfile.for_pages([ImagePage, FontPage])
+
+        assert profile.resource_types == ("font", "image")
+        assert "*/analytics.js" in profile.patterns()
+
+    def test_marker_declares_types_patterns_or_a_profile(self):
+        profile = BlockingProfile.from_marker(Marker("media", urls=["*/tracking/*"], third_party=True))
+        assert profile.resource_types == ("media",)
+        assert "*/tracking/*" in profile.patterns()
+        assert "*://fonts.gstatic.com/*" in profile.patterns()
+
+        assert BlockingProfile.from_marker(Marker(profile="none")) is PROFILES["none"]
+
+
+class TestRequestBlocker:
+    """Test suite for applying profiles and counting savings"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.sizes_file = str(tmp_path / "resource_sizes.json")
+
+    def test_profile_is_sent_once_and_cleared_for_the_next_lease(self):
+        blocker = RequestBlocker(self.sizes_file)
+        driver = CdpDriver()
+
+        blocker.apply(driver, PROFILES["admin"])
+        blocker.apply(driver, PROFILES["admin"])
+        blocker.apply(driver, PROFILES["none"])
+
+        blocked_urls = [params["urls"] for command, params in driver.commands if command == "Network.setBlockedURLs"]
+        assert len(blocked_urls) == 2
+        assert blocked_urls[-1] == []
+        assert blocker.stats["applied"] == {"admin": 2, "none": 1}
+
+    def test_browser_without_cdp_is_left_alone(self):
+        assert RequestBlocker(self.sizes_file).apply(object(), PROFILES["admin"]) is False
+
+    def test_bytes_saved_use_sizes_learned_from_unblocked_loads(self):
+        learner = RequestBlocker(self.sizes_file)
+        learner.collect(CdpDriver([
+            log_entry("Network.requestWillBeSent", requestId="1", type="Font",
+                      request={"url": "http://localhost/assets/icons.woff2?v=3"}),
+            log_entry("Network.loadingFinished", requestId="1", encodedDataLength=40960),
+        ]))
+        learner.save_sizes()
+
+        blocker = RequestBlocker(self.sizes_file)
+        blocker.apply(CdpDriver(), PROFILES["admin"])
+        blocker.collect(CdpDriver([
+            log_entry("Network.requestWillBeSent", requestId="7", type="Font",
+                      request={"url": "http://localhost/assets/icons.woff2?v=4"}),
+            log_entry("Network.loadingFailed", requestId="7", type="Font", blockedReason="inspector"),
+            log_entry("Network.requestWillBeSent", requestId="8", type="Image",
+                      request={"url": "http://localhost/assets/logo.png"}),
+            log_entry("Network.loadingFailed", requestId="8", type="Image", blockedReason="inspector"),
+            log_entry("Network.loadingFailed", requestId="9", type="XHR", errorText="net::ERR_ABORTED"),
+        ]))
+
+        assert blocker.stats["blocked"] == {"font": 1, "image": 1}
+        assert blocker.stats["bytes_saved"] == 40960
+        assert blocker.stats["unknown_size"] == 1
+        assert "requests blocked: 2 (font 1, image 1)" in blocker.report()
@@ -0,0 +1,118 @@
+import time
+import pytest
+from utils.results_store import ResultsStore, process_started_at
+
+
+class TestResultsStore:
+    """Test suite for the SQLite results history"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = str(tmp_path / "results.sqlite")
+
+    def _run(self, durations):
+        store = ResultsStore(self.path)
+        for nodeid, (setup, call) in durations.items():
+            store.record(nodeid, "setup", setup, "passed")
+            store.record(nodeid, "call", call, "passed")
+            store.record(nodeid, "teardown", 0.0, "passed")
+        store.finish_run(0)
+        store.close()
+
+    def test_expected_duration_is_median_of_recent_runs(self):
+        self._run({"t::a": (1.0, 1.0), "t::b": (0.0, 1.0)})
+        self._run({"t::a": (1.0, 3.0)})
+        self._run({"t::a": (1.0, 9.0)})
+
+        durations = ResultsStore(self.path).expected_durations()
+
+        assert durations == {"t::a": 4.0, "t::b": 1.0}
+
+    def test_history_window_drops_old_runs(self):
+        for call in (100.0, 1.0, 1.0):
+            self._run({"t::a": (0.0, call)})
+
+        assert ResultsStore(self.path, history=2).expected_durations() == {"t::a": 1.0}
+
+    def test_prediction_fills_unknown_tests_with_the_median(self):
+        self._run({"t::a": (0.0, 2.0), "t::b": (0.0, 4.0), "t::c": (0.0, 6.0)})
+
+        predicted, known, unknown = ResultsStore(self.path).predict(["t::a", "t::b", "t::c", "t::new"])
+
+        assert (predicted, known, unknown) == (16.0, 3, 1)
+
+    def test_runs_are_recorded(self):
+        self._run({"t::a": (0.0, 1.0)})
+
+        (run_id, started, finished, worker, exit_status), = ResultsStore(self.path).last_runs()
+        assert finished >= started and exit_status == 0
+
+    def test_session_overhead_excludes_test_time(self):
+        self._run({"t::a": (0.0, 0.0)})
+
+        assert 0.0 <= ResultsStore(self.path).session_overhead() < 1.0
+
+    def test_overhead_counts_from_process_start(self):
+        store = ResultsStore(self.path)
+        store.start_run(started_at=time.time() - 2.0)
+        store.record("t::a", "call", 0.5, "passed")
+        store.finish_run(0)
+        store.close()
+
+        assert ResultsStore(self.path).session_overhead() >= 1.5
+        assert time.time() - 600 < process_started_at() <= time.time()
+
+    def test_missing_database_has_no_history(self, tmp_path):
+        assert ResultsStore(str(tmp_path / "none.sqlite")).expected_durations() == {}
+
+    def _page_loads(self, lcps, route="catalogue/brands/brands-list"):
+        store = ResultsStore(self.path)
+        for lcp in lcps:
+            store.record_page_load({"route": route, "navigation": "full", "lcp": lcp, "ttfb": 50.0,
+                                    "resources": 12, "transfer_bytes": 2048}, nodeid="t::a")
+        store.finish_run(0)
+        store.close()
+        return store.run_id
+
+    def test_page_loads_are_kept_per_route_and_run(self):
+        self._page_loads([800.0, 900.0, 1000.0])
+        self._page_loads([1200.0])
+
+        history = ResultsStore(self.path).page_load_history("catalogue/brands/brands-list")
+
+        assert [(count, medians["lcp"]) for _, _, count, medians in history] == [(1, 1200.0), (3, 900.0)]
+
+    def test_page_load_baseline_excludes_the_current_run(self):
+        self._page_loads([900.0])
+        store = ResultsStore(self.path)
+        store.record_page_load({"route": "catalogue/brands/brands-list", "navigation": "full", "lcp": 5000.0})
+
+        baseline = store.page_load_baseline()
+
+        assert baseline[("catalogue/brands/brands-list", "full")]["lcp"] == 900.0
+        assert baseline[("catalogue/brands/brands-list", "full")]["duration"] is None
+
+    def _page_methods(self, seconds, calls=2):
+        store = ResultsStore(self.path)
+        store.record("t::a", "call", seconds, "passed")
+        store.record_page_methods("t::a", {"ProductsPage.wait_for_page_load": {"calls": calls, "seconds": seconds}})
+        store.finish_run(0)
+        store.close()
+        return store.run_id
+
+    def test_page_method_durations_are_medians_of_recent_runs(self):
+        for seconds in (1.0, 2.0, 9.0):
+            self._page_methods(seconds)
+
+        methods = ResultsStore(self.path).page_method_durations()
+
+        assert methods == {"t::a": {"ProductsPage.wait_for_page_load": {"calls": 2, "seconds": 2.0}}}
+
+    def test_durations_can_be_limited_to_some_runs(self):
+        self._page_methods(1.0)
+        latest = self._page_methods(5.0, calls=3)
+        store = ResultsStore(self.path)
+
+        assert store.expected_durations(run_ids=[latest]) == {"t::a": 5.0}
+        assert store.page_method_durations(run_ids=[latest])["t::a"]["ProductsPage.wait_for_page_load"]["calls"] == 3
+        assert store.runs_since(0) == [latest - 1, latest]
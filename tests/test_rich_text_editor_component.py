@@ -2,6 +2,7 @@ import pytest
 import time
 from selenium.webdriver.common.keys import Keys
 from pages.rich_text_editor_component import RichTextEditorComponent
+from pages.routes import route_url
 
 class TestRichTextEditorComponent:
     """Test suite for Rich Text Editor Component functionality"""
@@ -14,7 +15,7 @@ class TestRichTextEditorComponent:
 
         # Navigate to create product page where the editor component is used
         print("🏗️ Navigating to create product page...")
-        self.driver.get("http://localhost/#/pages/catalogue/products/create-product")
+        self.driver.get(route_url("create_product"))
 
         # Wait for page and editor to load
         success = self.editor.wait_for_editor_load()
@@ -742,7 +743,7 @@ class TestRichTextEditorValidation:
     def setup(self, authenticated_driver):
         self.driver = authenticated_driver
         self.editor = RichTextEditorComponent(self.driver)
-        self.driver.get("http://localhost/#/pages/catalogue/products/create-product")
+        self.driver.get(route_url("create_product"))
         self.editor.wait_for_editor_load()
 
     @pytest.mark.regression
@@ -825,7 +826,7 @@ class TestRichTextEditorPerformance:
     def setup(self, authenticated_driver):
         self.driver = authenticated_driver
         self.editor = RichTextEditorComponent(self.driver)
-        self.driver.get("http://localhost/#/pages/catalogue/products/create-product")
+        self.driver.get(route_url("create_product"))
         self.editor.wait_for_editor_load()
 
     @pytest.mark.slow
@@ -0,0 +1,56 @@
+import os
+import pytest
+from run_tests import build_parser, build_pytest_args, recording_path, resolve_targets, SUITES
+
+
+class TestUnifiedRunner:
+    """Test suite for the run_tests.py command line"""
+
+    def _args(self, *argv):
+        options = build_parser().parse_args(list(argv))
+        options.extra = []
+        return build_pytest_args(options)
+
+    def test_default_runs_every_suite_in_one_session(self):
+        targets, keyword = resolve_targets([])
+
+        assert targets == [suite["path"] for suite in SUITES.values()]
+        assert keyword is None
+
+    def test_marker_shortcuts_combine(self):
+        args = self._args("--smoke", "--security", "-m", "not slow")
+
+        assert args[args.index("-m") + 1] == "(not slow) and (smoke or security)"
+
+    def test_node_presets_are_dropped_when_the_whole_suite_runs(self):
+        targets, _ = resolve_targets(["products:auth", "products", "options_set:sorting"])
+
+        assert targets == ["tests/test_products_page.py",
+                           "tests/test_options_set_page.py::TestOptionsSetPageSorting"]
+
+    def test_keyword_presets_only_filter_their_own_module(self):
+        targets, keyword = resolve_targets(["brands", "rich_text_editor:code_view"])
+
+        assert targets == ["tests/test_brands_page.py", "tests/test_rich_text_editor_component.py"]
+        assert keyword == "(not test_rich_text_editor_component or (code_view))"
+
+    def test_unknown_suite_or_preset(self):
+        with pytest.raises(ValueError):
+            resolve_targets(["checkout"])
+        with pytest.raises(ValueError):
+            resolve_targets(["brands:stress"])
+
+    def test_report_name_follows_the_selection(self):
+        args = self._args("brands", "--regression")
+
+        assert "--html=reports/brands_regression_report.html" in args
+        assert "--html" not in " ".join(self._args("brands", "--no-html"))
+
+    def test_recordings_are_named_after_the_selection(self):
+        options = build_parser().parse_args(["products", "--smoke", "--record"])
+
+        assert options.record == ""
+        assert recording_path(options.record, options) == os.path.join(".recordings", "products_smoke.json")
+        assert recording_path("mine.json", options) == "mine.json"
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["--record", "--replay"])
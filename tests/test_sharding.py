@@ -0,0 +1,96 @@
+import json
+import xml.etree.ElementTree as ET
+import pytest
+from utils.parallel_runner import merge_junit, shard_args, worker_args
+from utils.sharding import load_snapshot, parse_shard, split
+
+
+class TestSharding:
+    """Test suite for duration-balanced sharding and report merging"""
+
+    ITEMS = [
+        ("tests/test_brands_page.py::TestBrands::test_a", ["brands_page_ready"]),
+        ("tests/test_brands_page.py::TestBrands::test_b", ["brands_page_ready"]),
+        ("tests/test_products_page.py::TestProducts::test_a", ["products_page_ready"]),
+        ("tests/test_products_page.py::TestProducts::test_b", ["products_page_ready"]),
+        ("tests/test_sample.py::test_one", ["driver"]),
+        ("tests/test_sample.py::test_two", ["driver"]),
+        ("tests/test_sample.py::test_three", ["driver"]),
+    ]
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.tmp_path = tmp_path
+
+    def _shards(self, count, durations=None, items=None):
+        items = items or self.ITEMS
+        return [split(items, index, count, durations or {}).nodeids for index in range(1, count + 1)]
+
+    def test_shards_partition_the_suite(self):
+        shards = self._shards(3)
+
+        all_nodeids = [nodeid for shard in shards for nodeid in shard]
+        assert sorted(all_nodeids) == sorted(nodeid for nodeid, _ in self.ITEMS)
+        assert all(shards)
+
+    def test_split_ignores_collection_order(self):
+        assert self._shards(3) == [sorted(shard, key=[n for n, _ in self.ITEMS].index)
+                                   for shard in self._shards(3, items=list(reversed(self.ITEMS)))]
+
+    def test_page_fixture_groups_stay_together(self):
+        for shard in self._shards(3):
+            brands = [nodeid for nodeid in shard if "brands" in nodeid]
+            assert len(brands) in (0, 2)
+
+    def test_durations_balance_the_shards(self):
+        durations = {nodeid: 1.0 for nodeid, _ in self.ITEMS}
+        durations["tests/test_sample.py::test_one"] = 30.0
+        shards = self._shards(2, durations)
+
+        heavy = next(shard for shard in shards if "tests/test_sample.py::test_one" in shard)
+        assert heavy == ["tests/test_sample.py::test_one"]
+
+    def test_more_shards_than_groups_leaves_empty_shards(self):
+        shards = self._shards(8)
+
+        assert sum(1 for shard in shards if shard) == 5
+
+    def test_parse_shard(self):
+        assert parse_shard("2/4") == (2, 4)
+        for value in ("0/4", "5/4", "2-4", "a/b"):
+            with pytest.raises(ValueError):
+                parse_shard(value)
+
+    def test_snapshot_round_trip(self):
+        path = self.tmp_path / "durations.json"
+        path.write_text(json.dumps({"t::a": 1.5}))
+
+        assert load_snapshot(str(path)) == {"t::a": 1.5}
+        assert load_snapshot(str(self.tmp_path / "missing.json")) == {}
+
+    def test_shard_report_paths(self):
+        args = shard_args(["tests/", "--html=reports/report.html"], "2/4")
+
+        assert args == ["tests/", "--html=reports/report.shard2of4.html",
+                        "--junitxml=reports/junit.shard2of4.xml", "--shard=2/4"]
+        assert worker_args(args, 0) == ["tests/", "--html=reports/report.shard2of4.worker0.html"]
+        assert worker_args(["tests/", "--shard", "1/2", "-v"], 1) == ["tests/", "-v"]
+
+    def test_merged_report_sums_shards_and_flags_duplicates(self):
+        paths = []
+        for index, cases in enumerate((["a", "b"], ["c", "a"]), 1):
+            suite = ET.Element("testsuite", name="pytest", tests=str(len(cases)), failures="0",
+                               errors="0", skipped="0", time="1.5")
+            for name in cases:
+                ET.SubElement(suite, "testcase", classname="tests.test_x", name=name)
+            path = str(self.tmp_path / f"junit.shard{index}of2.xml")
+            ET.ElementTree(suite).write(path)
+            paths.append(path)
+
+        output = str(self.tmp_path / "junit.xml")
+        totals = merge_junit(paths, output)
+
+        root = ET.parse(output).getroot()
+        assert root.get("tests") == "4"
+        assert [suite.get("name") for suite in root] == ["junit.shard1of2", "junit.shard2of2"]
+        assert totals["duplicates"] == ["tests.test_x.a"]
@@ -0,0 +1,58 @@
+import time
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.sleep_profiler import SleepProfiler, NO_TEST
+
+
+def pause():
+    time.sleep(0.01)
+
+
+class TestSleepProfiler:
+    """Test suite for the sleep profiler"""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.path = tmp_path / "sleep_profile.json"
+        self.profiler = SleepProfiler(str(self.path))
+        self.profiler.install()
+        yield
+        self.profiler.uninstall()
+
+    def test_sleeps_are_ranked_by_call_site(self):
+        self.profiler.start_test("tests/test_x.py::test_a")
+        pause()
+        pause()
+        time.sleep(0.03)
+        self.profiler.finish_test()
+
+        ranked = self.profiler.ranked_call_sites()
+        assert len(ranked) == 2
+        assert ranked[0][0].endswith("test_sleeps_are_ranked_by_call_site")
+        assert ranked[1][1]["count"] == 2
+        assert "tests/test_sleep_profiler.py:8 pause" in ranked[1][0]
+
+    def test_sleeps_are_attributed_to_tests(self):
+        self.profiler.start_test("tests/test_x.py::test_a")
+        pause()
+        self.profiler.finish_test()
+        pause()
+
+        assert set(self.profiler.by_test) == {"tests/test_x.py::test_a", NO_TEST}
+
+    def test_webdriver_wait_polling_is_not_dead_time(self):
+        calls = []
+        WebDriverWait(None, 1, poll_frequency=0.01).until(lambda _: calls.append(1) or len(calls) > 2)
+
+        assert self.profiler.call_sites == {}
+        assert self.profiler.poll_seconds > 0
+
+    def test_listeners_and_saved_profile(self):
+        heard = []
+        self.profiler.listeners.append(heard.append)
+        pause()
+        self.profiler.save()
+
+        assert len(heard) == 1
+        assert '"call_sites"' in self.path.read_text()
+        assert self.profiler.report()
@@ -0,0 +1,191 @@
+import pytest
+from selenium.webdriver.common.by import By
+from pages.base_page import APP_IDLE_SCRIPT
+from pages.smart_table_component import (SmartTableComponent, TABLE_DATA_SCRIPT, SORT_STATE_SCRIPT, SETTLE_SCRIPT,
+                                         VIEW_STATE_SCRIPT, CLEAR_FILTERS_SCRIPT, CLEAR_SELECTION_SCRIPT,
+                                         CLOSE_AUTOCOMPLETE_SCRIPT)
+from utils.fake_webdriver import FakeWebDriver
+from utils.page_metrics import page_metrics
+
+
+def cell(text="", checked=None, has_actions=False):
+    return {"text": text, "checked": checked, "has_actions": has_actions}
+
+
+class ScriptDriver:
+    """Answers the component's scripts with canned results and counts the calls"""
+
+    current_url = "http://localhost/#/pages/catalogue/brands/brands-list"
+
+    def __init__(self, columns, rows, sort_state=None, settle=None):
+        self.columns = columns
+        self.rows = rows
+        self.sort_state = sort_state or {}
+        self.settle = settle or {"settled": True, "mutations": 3, "changed": True}
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(script)
+        if script == TABLE_DATA_SCRIPT:
+            return {"columns": list(self.columns) if args[1] else None,
+                    "rows": self.rows, "no_data": False}
+        if script == SORT_STATE_SCRIPT:
+            return self.sort_state
+        return list(self.columns)
+
+    def execute_async_script(self, script, *args):
+        self.calls.append((script, args))
+        if script == APP_IDLE_SCRIPT:
+            return {"idle": True, "angular": True, "inflight": 0}
+        assert script == SETTLE_SCRIPT
+        return self.settle
+
+
+class TestSmartTableComponent:
+    """Test suite for column mapping and caching"""
+
+    COLUMNS = [('id', 'id', 'text'), ('brand_name', 'description', 'text'),
+               ('has_actions', 'actions', 'has_actions')]
+
+    def test_cells_are_addressed_by_header_key(self):
+        # Columns rendered in a different order than declared
+        driver = ScriptDriver(["description", "id", "actions"],
+                              [[cell("Acme"), cell("7"), cell(has_actions=True)]])
+        table = SmartTableComponent(driver, route="brands", columns=self.COLUMNS)
+
+        assert table.get_data() == [{'id': '7', 'brand_name': 'Acme', 'has_actions': True}]
+
+    def test_header_is_read_once_per_route(self):
+        driver = ScriptDriver(["id", "description", "actions"],
+                              [[cell("1"), cell("Acme"), cell(has_actions=True)]])
+        SmartTableComponent(driver, route="brands", columns=self.COLUMNS).get_data()
+        SmartTableComponent(driver, route="brands", columns=self.COLUMNS).get_data()
+
+        assert SmartTableComponent._column_cache["brands"] == {"id": 0, "description": 1, "actions": 2}
+        assert len(driver.calls) == 2
+
+    def test_placeholder_row_is_not_data(self):
+        driver = ScriptDriver(["id", "description", "actions"], [[cell("No data found")]])
+        table = SmartTableComponent(driver, route="brands", columns=self.COLUMNS)
+
+        assert table.get_data() == []
+        assert table.is_empty()
+
+    def test_sort_order_accepts_locator_key_or_field(self):
+        driver = ScriptDriver([], [], sort_state={"id": "asc", "description": "desc"})
+        table = SmartTableComponent(driver, route="brands", columns=self.COLUMNS)
+
+        assert table.get_sort_order(("css selector", "th.ng2-smart-th.id a")) == "asc"
+        assert table.get_sort_order("brand_name") == "desc"
+        assert table.get_sort_order("code") == "none"
+
+    def test_settle_wait_is_recorded(self):
+        table = SmartTableComponent(ScriptDriver([], []), route="brands", columns=self.COLUMNS)
+        assert table.wait_for_update()
+
+        table.driver.settle = {"settled": False, "mutations": 40, "changed": True}
+        assert not table.wait_for_update(timeout=1)
+
+        stats = page_metrics.settle_stats
+        assert stats["waits"] == 2 and stats["timeouts"] == 1
+        assert SmartTableComponent.settle_report()
+
+    def test_settle_reports_latency_of_the_action_that_caused_it(self):
+        latencies = []
+        page_metrics.latency_listeners.append(lambda kind, seconds: latencies.append(kind))
+        table = SmartTableComponent(ScriptDriver([], []), route="brands", columns=self.COLUMNS)
+
+        table.mark_table_action("sort")
+        table.wait_for_update()
+        table.wait_for_update()  # Nothing pending - no latency
+        table.mark_table_action("search")
+        table.watch()  # A new watch (page load, next action) drops the stale action
+        table.wait_for_update()
+
+        assert latencies == ["sort_settle"]
+
+    def test_only_table_searches_are_marked(self):
+        driver = FakeWebDriver(html='<input id="username"><input id="search">')
+        table = SmartTableComponent(driver, route="brands", columns=self.COLUMNS)
+
+        assert table.enter_text((By.ID, "username"), "admin")
+        assert page_metrics.pending_table_action is None  # A login form is not a table search
+
+        assert table.enter_search((By.ID, "search"), "Bra")
+        assert page_metrics.pending_table_action[0] == "search"
+
+    def test_idle_app_skips_the_change_window(self):
+        driver = ScriptDriver([], [])
+        SmartTableComponent(driver, route="brands", columns=self.COLUMNS).wait_for_update()
+
+        (idle_script, _), (settle_script, settle_args) = driver.calls
+        assert idle_script == APP_IDLE_SCRIPT and settle_script == SETTLE_SCRIPT
+        assert settle_args[2] == 0  # No first-change grace period once the app is idle
+        assert page_metrics.idle_stats["waits"] == 1
+
+
+class ViewStateDriver(ScriptDriver):
+    """Keeps a mutable view state that the reset scripts act on"""
+
+    def __init__(self, **state):
+        super().__init__([], [])
+        self.state = {"hash": "#/pages/catalogue/brands/brands-list", "present": True,
+                      "autocomplete": 0, "overlays": 0, "filters": 0, "sorted": [], "selected": 0, "page": 1}
+        self.state.update(state)
+
+    def execute_script(self, script, *args):
+        if script == VIEW_STATE_SCRIPT:
+            self.calls.append(script)
+            return dict(self.state)
+        if script == CLEAR_FILTERS_SCRIPT:
+            self.calls.append(script)
+            cleared, self.state["filters"] = self.state["filters"], 0
+            return cleared
+        if script == CLOSE_AUTOCOMPLETE_SCRIPT:
+            self.calls.append(script)
+            self.state["overlays"] = 0
+            return None
+        if script == CLEAR_SELECTION_SCRIPT:
+            self.calls.append(script)
+            cleared, self.state["selected"] = self.state["selected"], 0
+            return cleared
+        return super().execute_script(script, *args)
+
+
+class TestSmartTableReset:
+    """Test suite for the in-place reset used by the shared page fixtures"""
+
+    ROUTE = "catalogue/brands/brands-list"
+
+    def test_clean_view_costs_one_script(self):
+        driver = ViewStateDriver()
+
+        assert SmartTableComponent(driver, route=self.ROUTE).reset_state()
+        assert driver.calls == [VIEW_STATE_SCRIPT]
+        assert page_metrics.reset_stats["clean"] == 1
+
+    def test_filters_and_selection_are_undone_in_place(self):
+        driver = ViewStateDriver(filters=2, selected=1)
+
+        assert SmartTableComponent(driver, route=self.ROUTE).reset_state()
+        assert CLEAR_FILTERS_SCRIPT in driver.calls and CLEAR_SELECTION_SCRIPT in driver.calls
+        assert page_metrics.reset_stats["restored"] == 1
+
+    def test_open_autocomplete_is_closed_in_place(self):
+        driver = ViewStateDriver(overlays=1)
+
+        assert SmartTableComponent(driver, route=self.ROUTE).reset_state()
+        assert CLOSE_AUTOCOMPLETE_SCRIPT in driver.calls
+
+    def test_changed_merchant_store_asks_for_a_reload(self):
+        driver = ViewStateDriver(autocomplete=1)
+
+        assert not SmartTableComponent(driver, route=self.ROUTE).reset_state()
+        assert driver.calls == [VIEW_STATE_SCRIPT]
+
+    def test_left_route_asks_for_a_reload(self):
+        driver = ViewStateDriver(hash="#/pages/catalogue/brands/brand-details/3", filters=1)
+
+        assert not SmartTableComponent(driver, route=self.ROUTE).reset_state()
+        assert driver.calls == [VIEW_STATE_SCRIPT]
+        assert SmartTableComponent.reset_report()[0].startswith("resets=1 already clean=0 restored in place=0 reloaded=1")
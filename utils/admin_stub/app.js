@@ -0,0 +1,692 @@
+/*
+ * Shopizer admin stand-in (served by utils/admin_stub_server.py)
+ *
+ * Hash router, login, admin shell with the language menu, ng2-smart-table list views
+ * and a Summernote-like editor, rendered with the markup the page objects target.
+ * Rows come from /api/v1/tables/<list>; settings from window.STUB_CONFIG.
+ */
+(function () {
+    'use strict';
+
+    var config = window.STUB_CONFIG;
+    var layout = document.getElementById('app');
+    var overlay = document.querySelector('.cdk-overlay-container');
+    var TOKEN_KEY = 'token';
+    var LANGUAGE_KEY = 'language';
+
+    // =======================
+    // ANGULAR TESTABILITY SHIM
+    // =======================
+
+    // Requests and pending debounce timers of the app - whenStable waits for both, like zone.js
+    var pending = 0;
+    var stableCallbacks = [];
+
+    function notifyIfStable() {
+        if (pending) { return; }
+        var callbacks = stableCallbacks;
+        stableCallbacks = [];
+        callbacks.forEach(function (callback) { callback(true); });
+    }
+
+    function track(promise) {
+        pending++;
+        function done() { pending--; setTimeout(notifyIfStable, 0); }
+        return promise.then(function (value) { done(); return value; }, function (error) { done(); throw error; });
+    }
+
+    function later(callback, ms) {
+        var timer = {cancelled: false};
+        track(new Promise(function (resolve) {
+            setTimeout(function () {
+                if (!timer.cancelled) { callback(); }
+                resolve();
+            }, ms);
+        }));
+        return timer;
+    }
+
+    window.getAllAngularTestabilities = function () {
+        return [{
+            isStable: function () { return pending === 0; },
+            whenStable: function (callback) { stableCallbacks.push(callback); setTimeout(notifyIfStable, 0); }
+        }];
+    };
+
+    function api(method, url, body) {
+        var options = {method: method, headers: {'Content-Type': 'application/json'}};
+        if (body !== undefined) { options.body = JSON.stringify(body); }
+        // window.fetch looked up per call, so request trackers installed later see it
+        return track(window.fetch(url, options).then(function (response) {
+            return response.json().then(function (data) { return {status: response.status, data: data}; });
+        }));
+    }
+
+    // =======================
+    // HELPERS
+    // =======================
+
+    function escape(value) {
+        return String(value === null || value === undefined ? '' : value)
+            .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+    }
+
+    function toast(message) {
+        var element = document.createElement('div');
+        element.className = 'toast toast-success';
+        element.textContent = message;
+        overlay.appendChild(element);
+        setTimeout(function () { element.remove(); }, 1500);
+    }
+
+    function french() {
+        return (localStorage.getItem(LANGUAGE_KEY) || 'fr') === 'fr';
+    }
+
+    // =======================
+    // ROUTER
+    // =======================
+
+    function route() {
+        closeMenus();
+        var hash = location.hash.replace(/^#\/?/, '').split('?')[0];
+        if (!hash || hash === 'login') { location.replace('#/auth'); return; }
+        if (hash.indexOf('auth') === 0) { renderLogin(); return; }
+        if (hash.indexOf('pages/') !== 0) { location.replace('#/pages/home'); return; }
+        if (!localStorage.getItem(TOKEN_KEY)) { location.replace('#/auth'); return; }
+        renderPage(hash.slice('pages/'.length));
+    }
+
+    function tableFor(path) {
+        for (var name in config.tables) {
+            if (config.tables[name].route === path) { return name; }
+        }
+        return null;
+    }
+
+    // =======================
+    // LOGIN
+    // =======================
+
+    function renderLogin() {
+        layout.innerHTML =
+            '<nb-layout-column class="auth-column"><nb-card class="nb-card auth-card">' +
+            '<nb-card-header class="nb-card-header">Shopizer administration</nb-card-header>' +
+            '<nb-card-body><form class="login-form" novalidate>' +
+            '<input type="email" name="username" class="form-control" placeholder="Username" autocomplete="username">' +
+            '<input type="password" name="password" class="form-control" placeholder="Password" ' +
+            'autocomplete="current-password">' +
+            '<p><label><input type="checkbox" name="remember"> Remember me</label></p>' +
+            '<div class="login-error"></div>' +
+            '<button type="submit" class="btn btn-primary login-btn">LOGIN</button>' +
+            '</form></nb-card-body></nb-card></nb-layout-column>';
+        var form = layout.querySelector('form');
+        form.addEventListener('submit', function (event) {
+            event.preventDefault();
+            api('POST', '/api/v1/private/login', {username: form.username.value, password: form.password.value})
+                .then(function (response) {
+                    if (response.status === 200) {
+                        localStorage.setItem(TOKEN_KEY, response.data.token);
+                        location.hash = '#/pages/home';
+                    } else {
+                        layout.querySelector('.login-error').innerHTML =
+                            '<div class="alert alert-danger">' + escape(response.data.message) + '</div>';
+                    }
+                });
+        });
+    }
+
+    // =======================
+    // ADMIN SHELL
+    // =======================
+
+    var SIDEBAR = [['home', 'Home'], ['products', 'Products'], ['brands', 'Brands'],
+                   ['product_groups', 'Product groups'], ['product_types', 'Product types'],
+                   ['product_options', 'Options'], ['options_set', 'Options set'], ['create_product', 'Create product']];
+
+    function renderShell() {
+        if (layout.querySelector('nb-layout-header')) { return; }
+        layout.innerHTML =
+            '<nb-layout-header fixed><nav class="navbar"><div class="logo">Shopizer</div><nb-actions>' +
+            '<nb-action class="language-action" nbcontextmenutag="language"></nb-action>' +
+            '<nb-action class="user-action"><nb-user class="user-profile admin-user">admin</nb-user></nb-action>' +
+            '</nb-actions></nav></nb-layout-header>' +
+            '<div class="layout-container"><nb-sidebar class="sidebar menu-sidebar"><nb-menu>' +
+            SIDEBAR.map(function (item) {
+                return '<a href="#/pages/' + config.routes[item[0]] + '" title="' + item[1] + '">' + item[1] + '</a>';
+            }).join('') +
+            '<a href="#/auth" class="logout">Logout</a>' +
+            '</nb-menu></nb-sidebar><nb-layout-column class="main-content"></nb-layout-column></div>';
+        layout.querySelector('.logout').addEventListener('click', function () {
+            localStorage.removeItem(TOKEN_KEY);
+        });
+        layout.querySelector('nb-action[nbcontextmenutag="language"]').addEventListener('click', function (event) {
+            event.stopPropagation();
+            toggleLanguageMenu();
+        });
+    }
+
+    function renderLanguage() {
+        layout.querySelector('nb-action[nbcontextmenutag="language"]').innerHTML =
+            french() ? '<span>Langues - (Français)</span>' : '<span>Languages - (English)</span>';
+    }
+
+    function toggleLanguageMenu() {
+        if (overlay.querySelector('nb-context-menu')) { closeMenus(); return; }
+        var items = french() ? [['en', 'Anglais'], ['fr', 'Français']] : [['en', 'English'], ['fr', 'French']];
+        var menu = document.createElement('nb-context-menu');
+        menu.innerHTML = '<nb-menu><ul class="menu-items">' + items.map(function (item) {
+            return '<li class="menu-item"><a title="' + item[1] + '" data-language="' + item[0] + '">' +
+                   '<span class="menu-title">' + item[1] + '</span></a></li>';
+        }).join('') + '</ul></nb-menu>';
+        menu.addEventListener('click', function (event) {
+            var link = event.target.closest('a[data-language]');
+            if (!link) { return; }
+            localStorage.setItem(LANGUAGE_KEY, link.getAttribute('data-language'));
+            closeMenus();
+            renderLanguage();
+        });
+        overlay.appendChild(menu);
+    }
+
+    function closeMenus() {
+        Array.prototype.forEach.call(overlay.querySelectorAll('nb-context-menu'), function (menu) { menu.remove(); });
+    }
+
+    document.addEventListener('click', function (event) {
+        if (!event.target.closest('nb-context-menu')) { closeMenus(); }
+    });
+
+    function renderPage(path) {
+        renderShell();
+        renderLanguage();
+        var content = layout.querySelector('.main-content');
+        var table = tableFor(path);
+        if (path === config.routes.home) {
+            content.innerHTML = '<nb-card class="nb-card"><nb-card-header class="nb-card-header">Dashboard' +
+                                '</nb-card-header><nb-card-body>Shopizer administration</nb-card-body></nb-card>';
+        } else if (table) {
+            renderTable(content, table);
+        } else if (path === config.routes.create_product) {
+            renderProductForm(content);
+        } else {
+            content.innerHTML = '<nb-card class="nb-card"><nb-card-body>Page not found</nb-card-body></nb-card>';
+        }
+    }
+
+    // =======================
+    // NG2-SMART-TABLE
+    // =======================
+
+    function renderTable(content, name) {
+        var table = config.tables[name];
+        var view = {filters: {}, search: '', sort: null, order: 'asc', page: 1, request: 0, debounce: null};
+        var columns = table.columns;
+
+        content.innerHTML =
+            '<nb-card class="nb-card"><nb-card-header class="nb-card-header">' + escape(table.title) +
+            '</nb-card-header><nb-card-body><div class="toolbar">' +
+            (table.merchant ? '<span class="ui-autocomplete"><input name="merchant" class="ui-autocomplete-input" ' +
+                              'value="DEFAULT"><button type="button" class="ui-autocomplete-dropdown ui-button">' +
+                              '&#9660;</button></span>' : '') +
+            (table.search ? '<input class="search form-control" placeholder="Search">' +
+                            '<img title="Search" alt="Search"><img title="Reset" alt="Reset">' : '') +
+            (table.create ? '<a class="createBtn btn btn-primary" href="#/pages/' + config.routes.create_product +
+                            '">Create</a>' : '') +
+            '</div><ng2-smart-table><table><thead><tr class="ng2-smart-titles">' +
+            columns.map(function (column) {
+                if (column.kind === 'actions') {
+                    return '<th class="ng2-smart-actions-title ng2-smart-actions-title-custom">' + column.title + '</th>';
+                }
+                return '<th class="ng2-smart-th ' + column.key + '"><a href="#" class="ng2-smart-sort-link sort" ' +
+                       'data-key="' + column.key + '">' + escape(column.title) + '</a></th>';
+            }).join('') +
+            '</tr><tr class="ng2-smart-filters">' +
+            columns.map(function (column) {
+                return '<th>' + (column.filter ? '<input type="text" class="form-control" data-key="' + column.key +
+                                 '" placeholder="' + escape(column.filter) + '">' : '') + '</th>';
+            }).join('') +
+            '</tr></thead><tbody></tbody></table><ng2-smart-table-pager></ng2-smart-table-pager></ng2-smart-table>' +
+            '<div class="page-counts"></div></nb-card-body></nb-card>';
+
+        var element = content.querySelector('ng2-smart-table');
+        var body = element.querySelector('tbody');
+
+        function load() {
+            var request = ++view.request;
+            var query = ['page=' + view.page, 'count=' + config.pageSize];
+            if (view.sort) { query.push('sort=' + encodeURIComponent(view.sort), 'order=' + view.order); }
+            if (view.search) { query.push('search=' + encodeURIComponent(view.search)); }
+            Object.keys(view.filters).forEach(function (key) {
+                if (view.filters[key]) { query.push('f.' + key + '=' + encodeURIComponent(view.filters[key])); }
+            });
+            return api('GET', '/api/v1/tables/' + name + '?' + query.join('&')).then(function (response) {
+                if (request === view.request && document.body.contains(element)) { renderRows(response.data); }
+            });
+        }
+
+        function cell(column, row) {
+            if (column.kind === 'checkbox') {
+                return '<td><input type="checkbox" data-key="' + column.key + '"' + (row[column.key] ? ' checked' : '') +
+                       '></td>';
+            }
+            if (column.kind === 'actions') {
+                return '<td class="ng2-smart-actions"><ng2-st-tbody-custom>' +
+                       '<a href="#" class="ng2-smart-action ng2-smart-action-custom-custom" title="Edit">' +
+                       '<i class="nb-edit"></i></a>' +
+                       '<a href="#" class="ng2-smart-action ng2-smart-action-custom-custom" title="Delete">' +
+                       '<i class="nb-trash"></i></a></ng2-st-tbody-custom></td>';
+            }
+            var value = row[column.key];
+            if (column.key === 'price') { value = Number(value).toFixed(2); }
+            return '<td><div class="ng2-smart-cell">' + escape(value) + '</div></td>';
+        }
+
+        function renderRows(data) {
+            var identity = columns[0].key;
+            body.innerHTML = data.items.length ? data.items.map(function (row) {
+                return '<tr class="ng2-smart-row" data-id="' + escape(row[identity]) + '">' +
+                       columns.map(function (column) { return cell(column, row); }).join('') + '</tr>';
+            }).join('') : '<tr><td colspan="' + columns.length + '" class="ng2-smart-no-data-message">' +
+                          'No data found</td></tr>';
+            renderPager(data);
+            var first = data.total ? (data.page - 1) * data.count + 1 : 0;
+            content.querySelector('.page-counts').textContent =
+                first + ' - ' + Math.min(data.page * data.count, data.total) + ' of ' + data.total;
+        }
+
+        function renderPager(data) {
+            var pages = Math.max(1, Math.ceil(data.total / data.count));
+            var pager = element.querySelector('ng2-smart-table-pager');
+            if (pages === 1) { pager.innerHTML = ''; return; }
+            function link(label, page, disabled) {
+                return '<li class="ng2-smart-page-item page-item' + (disabled ? ' disabled' : '') + '">' +
+                       '<a class="ng2-smart-page-link page-link" href="#" aria-label="' + label + '" data-page="' +
+                       page + '">' + {First: '&laquo;', Prev: '&lt;', Next: '&gt;', Last: '&raquo;'}[label] +
+                       '</a></li>';
+            }
+            var start = Math.max(1, Math.min(view.page - 2, pages - 4));
+            var items = [link('First', 1, view.page === 1), link('Prev', view.page - 1, view.page === 1)];
+            for (var page = start; page <= Math.min(pages, start + 4); page++) {
+                items.push(page === view.page
+                    ? '<li class="ng2-smart-page-item page-item active"><span class="ng2-smart-page-link page-link">' +
+                      page + '</span></li>'
+                    : '<li class="ng2-smart-page-item page-item"><a class="ng2-smart-page-link page-link" href="#" ' +
+                      'data-page="' + page + '">' + page + '</a></li>');
+            }
+            items.push(link('Next', view.page + 1, view.page === pages), link('Last', pages, view.page === pages));
+            pager.innerHTML = '<nav class="ng2-smart-pagination-nav"><ul class="ng2-smart-pagination pagination">' +
+                              items.join('') + '</ul></nav>';
+        }
+
+        // Sort: none -> asc -> desc -> none on the clicked column; other columns go back to none
+        element.querySelector('thead').addEventListener('click', function (event) {
+            var link = event.target.closest('a.ng2-smart-sort-link');
+            if (!link) { return; }
+            event.preventDefault();
+            var key = link.getAttribute('data-key');
+            if (view.sort !== key) {
+                view.sort = key;
+                view.order = 'asc';
+            } else if (view.order === 'asc') {
+                view.order = 'desc';
+            } else {
+                view.sort = null;
+            }
+            Array.prototype.forEach.call(element.querySelectorAll('a.ng2-smart-sort-link'), function (other) {
+                var active = view.sort && other.getAttribute('data-key') === view.sort;
+                other.className = 'ng2-smart-sort-link sort' + (active ? ' ' + view.order : '');
+            });
+            load();
+        });
+
+        function filterChanged(event) {
+            var input = event.target;
+            if (!input.matches('input[data-key]') || view.filters[input.getAttribute('data-key')] === input.value) {
+                return;
+            }
+            view.filters[input.getAttribute('data-key')] = input.value;
+            view.page = 1;
+            if (view.debounce) { view.debounce.cancelled = true; }
+            view.debounce = later(load, config.filterDebounceMs);
+        }
+        element.querySelector('thead').addEventListener('input', filterChanged);
+        element.querySelector('thead').addEventListener('change', filterChanged);
+
+        element.querySelector('ng2-smart-table-pager').addEventListener('click', function (event) {
+            var link = event.target.closest('a[data-page]');
+            if (!link) { return; }
+            event.preventDefault();
+            view.page = parseInt(link.getAttribute('data-page'), 10);
+            load();
+        });
+
+        body.addEventListener('click', function (event) {
+            if (event.target.closest('a.ng2-smart-action')) { event.preventDefault(); return; }
+            var box = event.target.closest('input[type="checkbox"][data-key]');
+            if (!box) { return; }
+            var row = box.closest('tr');
+            var change = {};
+            change[box.getAttribute('data-key')] = box.checked;
+            api('PATCH', '/api/v1/tables/' + name + '/' + columns[0].key + '/' +
+                encodeURIComponent(row.getAttribute('data-id')), change).then(function (response) {
+                toast(response.status === 200 ? 'Updated' : 'Update failed');
+            });
+        });
+
+        if (table.search) {
+            var search = content.querySelector('input.search');
+            content.querySelector('img[title="Search"]').addEventListener('click', function () {
+                view.search = search.value;
+                view.page = 1;
+                load();
+            });
+            content.querySelector('img[title="Reset"]').addEventListener('click', function () {
+                search.value = view.search = '';
+                view.page = 1;
+                load();
+            });
+        }
+
+        load();
+    }
+
+    // =======================
+    // SUMMERNOTE EDITOR
+    // =======================
+
+    function button(className, label, text, attributes) {
+        return '<button type="button" class="note-btn ' + className + '" aria-label="' + label + '" ' +
+               (attributes || '') + '>' + text + '</button>';
+    }
+
+    function dropdown(label, text, items) {
+        return '<div class="note-btn-group">' +
+               '<button type="button" class="note-btn dropdown-toggle" aria-label="' + label + '" ' +
+               'data-toggle="dropdown">' + text + '</button><div class="note-dropdown-menu dropdown-menu">' +
+               items + '</div></div>';
+    }
+
+    function items(command, values) {
+        return values.map(function (value) {
+            return '<a class="note-dropdown-item" href="#" data-command="' + command + '" data-value="' + value +
+                   '">' + value + '</a>';
+        }).join('');
+    }
+
+    function modal(className, label, body, buttonClass, buttonText) {
+        return '<div class="note-modal ' + className + '" aria-label="' + label + '" tabindex="-1">' +
+               '<div class="note-modal-header"><button type="button" class="close" aria-label="Close">&times;' +
+               '</button><h4 class="note-modal-title">' + label + '</h4></div><div class="note-modal-body">' + body +
+               '</div><div class="note-modal-footer"><input type="button" class="note-btn note-btn-primary ' +
+               buttonClass + '" value="' + buttonText + '" disabled></div></div>';
+    }
+
+    function renderProductForm(content) {
+        var colors = ['#000000', '#FF0000', '#0000FF', '#00FF00', '#FFFF00'];
+        content.innerHTML =
+            '<nb-card class="nb-card"><nb-card-header class="nb-card-header">Create product</nb-card-header>' +
+            '<nb-card-body><input name="sku" class="form-control" placeholder="Sku"> ' +
+            '<input name="name" class="form-control" placeholder="Product name"></nb-card-body></nb-card>' +
+            '<nb-card class="nb-card inline-form-card"><nb-card-header class="nb-card-header">Description' +
+            '</nb-card-header><nb-card-body><div class="note-editor note-frame">' +
+            '<div class="note-toolbar" role="toolbar">' +
+            dropdown('Style', 'Style', items('formatBlock', ['p', 'h1', 'h2', 'h3', 'blockquote', 'pre'])) +
+            button('note-btn-bold', 'Bold (CTRL+B)', '<b>B</b>', 'data-command="bold"') +
+            button('note-btn-italic', 'Italic (CTRL+I)', '<i>I</i>', 'data-command="italic"') +
+            button('note-btn-underline', 'Underline (CTRL+U)', '<u>U</u>', 'data-command="underline"') +
+            button('note-btn-strikethrough', 'Strikethrough (CTRL+SHIFT+S)', '<s>S</s>',
+                   'data-command="strikeThrough"') +
+            button('note-btn-superscript', 'Superscript (CTRL+SHIFT+=)', 'x&sup2;', 'data-command="superscript"') +
+            button('note-btn-subscript', 'Subscript (CTRL+=)', 'x&#8322;', 'data-command="subscript"') +
+            button('', 'Remove Font Style (CTRL+\\)', 'Tx', 'data-command="removeFormat"') +
+            dropdown('Font Family', 'Font', items('fontName', ['Arial', 'Comic Sans MS', 'Helvetica', 'Times'])) +
+            dropdown('Font Size', 'Size', items('fontSize', ['8', '12', '14', '18', '24'])) +
+            '<div class="note-btn-group note-color">' +
+            button('note-current-color-button', 'Recent Color', 'A', 'data-command="foreColor" data-value="#FF0000"') +
+            dropdown('More Color', '&#9662;', colors.map(function (color) {
+                return '<button type="button" class="note-color-btn" data-command="foreColor" data-value="' + color +
+                       '" style="background-color:' + color + '" aria-label="' + color + '"></button>';
+            }).join('')) + '</div>' +
+            button('', 'Unordered list (CTRL+SHIFT+NUM7)', '&bull;', 'data-command="insertUnorderedList"') +
+            button('', 'Ordered list (CTRL+SHIFT+NUM8)', '1.', 'data-command="insertOrderedList"') +
+            dropdown('Paragraph', '&para;',
+                     button('', 'Align left (CTRL+SHIFT+L)', 'L', 'data-command="justifyLeft"') +
+                     button('', 'Align center (CTRL+SHIFT+E)', 'C', 'data-command="justifyCenter"') +
+                     button('', 'Align right (CTRL+SHIFT+R)', 'R', 'data-command="justifyRight"') +
+                     button('', 'Justify full (CTRL+SHIFT+J)', 'J', 'data-command="justifyFull"')) +
+            dropdown('Line Height', '&#8597;', items('lineHeight', ['1.0', '1.5', '2.0'])) +
+            dropdown('Table', '&#9638;', '<div class="note-dimension-picker">' +
+                     '<div class="note-dimension-picker-mousecatcher" data-event="insertTable"></div>' +
+                     '<div class="note-dimension-picker-highlighted"></div></div>' +
+                     '<div class="note-dimension-display">1 x 1</div>') +
+            button('', 'Link (CTRL+K)', '&#128279;', 'data-dialog="link-dialog"') +
+            button('', 'Gallery', '&#128247;', 'data-dialog="image-dialog"') +
+            button('', 'Video', '&#9654;', 'data-dialog="video-dialog"') +
+            button('', 'Insert Horizontal Rule (CTRL+ENTER)', '&mdash;', 'data-command="insertHorizontalRule"') +
+            button('btn-codeview', 'Code View', '&lt;/&gt;', 'data-codeview="true"') +
+            button('', 'Undo (CTRL+Z)', '&#8630;', 'data-command="undo"') +
+            button('', 'Redo (CTRL+Y)', '&#8631;', 'data-command="redo"') +
+            '</div><div class="note-editing-area"><textarea class="note-codable" aria-multiline="true"></textarea>' +
+            '<div class="note-editable" contenteditable="true" role="textbox" aria-multiline="true"></div></div>' +
+            '<output class="note-status-output" role="status" aria-live="polite"></output>' +
+            '<div class="note-statusbar" role="status"></div>' +
+            modal('link-dialog', 'Insert Link',
+                  '<label>Text to display</label><input class="note-link-text note-form-control" type="text">' +
+                  '<label>To what URL should this link go?</label>' +
+                  '<input class="note-link-url note-form-control" type="text" value="http://">' +
+                  '<div class="sn-checkbox-open-in-new-window"><label><input type="checkbox" checked> ' +
+                  'Open in new window</label></div>', 'note-link-btn', 'Insert Link') +
+            modal('image-dialog', 'Insert Image',
+                  '<label>Select from files</label><input class="note-image-input note-form-control" type="file" ' +
+                  'accept="image/*"><label>Image URL</label><input class="note-image-url note-form-control" ' +
+                  'type="text">', 'note-image-btn', 'Insert Image') +
+            modal('video-dialog', 'Insert Video',
+                  '<label>Video URL</label><input class="note-video-url note-form-control" type="text">',
+                  'note-video-btn', 'Insert Video') +
+            '<div class="note-popover popover note-link-popover"><div class="popover-content">' +
+            '<a class="note-link-href" target="_blank"></a> ' +
+            button('', 'Edit', 'Edit', 'data-dialog="link-dialog"') +
+            button('', 'Unlink', 'Unlink', 'data-command="unlink"') + '</div></div>' +
+            '</div></nb-card-body></nb-card>';
+        bindEditor(content.querySelector('.note-editor'));
+    }
+
+    function bindEditor(editor) {
+        var editable = editor.querySelector('.note-editable');
+        var codable = editor.querySelector('.note-codable');
+        var popover = editor.querySelector('.note-link-popover');
+        var savedRange = null;
+        var openDialog = null;
+
+        function saveRange() {
+            var selection = window.getSelection();
+            if (selection.rangeCount && editable.contains(selection.getRangeAt(0).commonAncestorContainer)) {
+                savedRange = selection.getRangeAt(0).cloneRange();
+            }
+        }
+
+        function restoreRange() {
+            editable.focus();
+            if (savedRange) {
+                var selection = window.getSelection();
+                selection.removeAllRanges();
+                selection.addRange(savedRange);
+            }
+        }
+
+        function run(command, value) {
+            restoreRange();
+            if (command === 'fontSize') {
+                // execCommand only knows sizes 1-7; wrap in a span with the pixel size like Summernote
+                document.execCommand('fontSize', false, '7');
+                Array.prototype.forEach.call(editable.querySelectorAll('font[size="7"]'), function (font) {
+                    var span = document.createElement('span');
+                    span.style.fontSize = value + 'px';
+                    span.innerHTML = font.innerHTML;
+                    font.replaceWith(span);
+                });
+            } else if (command === 'lineHeight') {
+                var node = window.getSelection().anchorNode;
+                var block = node && (node.nodeType === 1 ? node : node.parentElement);
+                block = block && block.closest('p, div, li, h1, h2, h3, blockquote, pre');
+                (block && editable.contains(block) && block !== editable ? block : editable).style.lineHeight = value;
+            } else if (command === 'formatBlock') {
+                document.execCommand('formatBlock', false, '<' + value + '>');
+            } else {
+                document.execCommand(command, false, value || null);
+            }
+            saveRange();
+        }
+
+        function closeDropdowns() {
+            Array.prototype.forEach.call(editor.querySelectorAll('.note-btn-group.open'), function (group) {
+                group.classList.remove('open');
+            });
+        }
+
+        function showDialog(name) {
+            closeDropdowns();
+            openDialog = editor.querySelector('.note-modal.' + name);
+            if (name === 'link-dialog') {
+                var link = selectedLink();
+                openDialog.querySelector('.note-link-text').value = link ? link.textContent
+                    : (savedRange ? savedRange.toString() : '');
+                openDialog.querySelector('.note-link-url').value = link ? link.getAttribute('href') : 'http://';
+            }
+            openDialog.classList.add('open');
+            updateDialogButton();
+        }
+
+        function closeDialog() {
+            if (openDialog) { openDialog.classList.remove('open'); }
+            openDialog = null;
+        }
+
+        function updateDialogButton() {
+            if (!openDialog) { return; }
+            var url = openDialog.querySelector('.note-link-url, .note-video-url, .note-image-url');
+            var file = openDialog.querySelector('.note-image-input');
+            var ready = (url && url.value && url.value !== 'http://') || (file && file.files && file.files.length);
+            openDialog.querySelector('.note-modal-footer input').disabled = !ready;
+        }
+
+        function selectedLink() {
+            var node = savedRange && savedRange.commonAncestorContainer;
+            var element = node && (node.nodeType === 1 ? node : node.parentElement);
+            return element && editable.contains(element) ? element.closest('a') : null;
+        }
+
+        function insertFromDialog() {
+            var dialog = openDialog;
+            closeDialog();
+            restoreRange();
+            if (dialog.classList.contains('link-dialog')) {
+                var text = dialog.querySelector('.note-link-text').value;
+                var url = dialog.querySelector('.note-link-url').value;
+                var target = dialog.querySelector('.sn-checkbox-open-in-new-window input').checked
+                    ? ' target="_blank"' : '';
+                var existing = selectedLink();
+                if (existing) {
+                    existing.setAttribute('href', url);
+                    existing.textContent = text || url;
+                } else {
+                    document.execCommand('insertHTML', false,
+                                         '<a href="' + escape(url) + '"' + target + '>' + escape(text || url) + '</a>');
+                }
+            } else if (dialog.classList.contains('video-dialog')) {
+                document.execCommand('insertHTML', false, '<iframe class="note-video-clip" width="640" height="360" ' +
+                                     'frameborder="0" src="' + escape(dialog.querySelector('.note-video-url').value) +
+                                     '"></iframe>');
+            } else {
+                var file = dialog.querySelector('.note-image-input');
+                var source = file.files && file.files.length ? file.files[0].name
+                    : dialog.querySelector('.note-image-url').value;
+                document.execCommand('insertHTML', false, '<img src="' + escape(source) + '" style="width: 25%;">');
+            }
+            saveRange();
+        }
+
+        function insertTable(rows, cols) {
+            var html = '<table class="table table-bordered"><tbody>';
+            for (var r = 0; r < rows; r++) {
+                html += '<tr>' + new Array(cols + 1).join('<td><br></td>') + '</tr>';
+            }
+            run('insertHTML', html + '</tbody></table>');
+        }
+
+        // Toolbar buttons keep the editor selection: mousedown would otherwise move focus
+        editor.querySelector('.note-toolbar').addEventListener('mousedown', function (event) {
+            if (!event.target.closest('input')) { event.preventDefault(); }
+        });
+
+        editor.addEventListener('click', function (event) {
+            var target = event.target;
+            var toggle = target.closest('.dropdown-toggle');
+            if (toggle) {
+                var group = toggle.parentElement;
+                var open = group.classList.contains('open');
+                closeDropdowns();
+                group.classList.toggle('open', !open);
+                return;
+            }
+            var catcher = target.closest('.note-dimension-picker-mousecatcher');
+            if (catcher) {
+                closeDropdowns();
+                insertTable(Math.max(1, Math.ceil(event.offsetY / 18)), Math.max(1, Math.ceil(event.offsetX / 18)));
+                return;
+            }
+            var commandElement = target.closest('[data-command]');
+            if (commandElement) {
+                event.preventDefault();
+                closeDropdowns();
+                run(commandElement.getAttribute('data-command'), commandElement.getAttribute('data-value'));
+                popover.classList.remove('open');
+                return;
+            }
+            var dialogButton = target.closest('[data-dialog]');
+            if (dialogButton) {
+                popover.classList.remove('open');
+                showDialog(dialogButton.getAttribute('data-dialog'));
+                return;
+            }
+            if (target.closest('.note-modal .close')) { closeDialog(); return; }
+            if (target.closest('.note-modal-footer input') && !target.disabled) { insertFromDialog(); return; }
+            if (target.closest('[data-codeview]')) {
+                if (editor.classList.toggle('codeview')) {
+                    codable.value = editable.innerHTML;
+                } else {
+                    editable.innerHTML = codable.value;
+                }
+            }
+        });
+
+        editor.querySelector('.note-dimension-picker-mousecatcher').addEventListener('mousemove', function (event) {
+            var cols = Math.max(1, Math.ceil(event.offsetX / 18));
+            var rows = Math.max(1, Math.ceil(event.offsetY / 18));
+            var highlighted = editor.querySelector('.note-dimension-picker-highlighted');
+            highlighted.style.width = cols * 18 + 'px';
+            highlighted.style.height = rows * 18 + 'px';
+            editor.querySelector('.note-dimension-display').textContent = rows + ' x ' + cols;
+        });
+
+        editor.addEventListener('input', updateDialogButton);
+        editor.addEventListener('change', updateDialogButton);
+        codable.addEventListener('input', function () { editable.innerHTML = codable.value; });
+
+        ['keyup', 'mouseup', 'input'].forEach(function (type) {
+            editable.addEventListener(type, function () {
+                saveRange();
+                var link = selectedLink();
+                popover.classList.toggle('open', !!link);
+                if (link) {
+                    var anchor = popover.querySelector('.note-link-href');
+                    anchor.textContent = anchor.href = link.getAttribute('href');
+                }
+            });
+        });
+    }
+
+    window.addEventListener('hashchange', route);
+    route();
+})();
@@ -0,0 +1,447 @@
+# utils/admin_stub_server.py
+"""
+Offline stand-in for the Shopizer admin
+
+Serves a small single-page app with the DOM the page objects target - the login form,
+the admin shell with its language menu, the ng2-smart-table list views (products,
+brands, groups, types, options, options set) and the Summernote editor on
+create-product - backed by generated rows kept in memory. API latency and row counts
+are settings, so the framework itself can be timed and regression-tested on any box
+without the Java stack.
+
+Usage:
+    python -m utils.admin_stub_server [--port 4200] [--latency-ms 50] [--jitter-ms 10]
+                                      [--rows 120] [--rows-for products=5000,brands=20]
+    BASE_URL=http://127.0.0.1:4200 python run_tests.py --smoke
+    python run_tests.py --smoke --stub          # Starts a stand-in for the run
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import urlsplit, parse_qs
+from config.config import Config
+from pages.routes import ROUTES
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "admin_stub")
+
+ASSET_TYPES = {".html": "text/html; charset=utf-8", ".js": "application/javascript; charset=utf-8",
+               ".css": "text/css; charset=utf-8"}
+
+# Shell paths the login page falls back to; all of them serve the app
+APP_PATHS = ("/", "/index.html", "/auth", "/login")
+
+# 1x1 GIF - AUTH_STATE_ORIGIN_PATH must be a cheap same-origin document
+FAVICON = (b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+           b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;")
+
+# =======================
+# LIST VIEWS
+# =======================
+
+# Columns of every list view as (column key, title, kind, filter placeholder or None), in
+# the on-screen order the page objects' TABLE_COLUMNS expect. kind: text | checkbox | actions
+TABLES = {
+    "products": {
+        "route": ROUTES["products"], "title": "Products", "create": True, "merchant": True,
+        "columns": [("id", "ID", "text", None), ("sku", "Sku", "text", "Sku"),
+                    ("name", "Product name", "text", "Product name"), ("quantity", "Qty", "text", None),
+                    ("available", "Available", "checkbox", None), ("price", "Price", "text", None),
+                    ("creationDate", "Created", "text", None)],
+    },
+    "brands": {
+        "route": ROUTES["brands"], "title": "Brands", "create": True, "merchant": True, "search": True,
+        "columns": [("id", "ID", "text", None), ("description", "Brand name", "text", "Brand name"),
+                    ("code", "Code", "text", "Code"), ("actions", "Actions", "actions", None)],
+    },
+    "product_groups": {
+        "route": ROUTES["product_groups"], "title": "Product groups", "create": True, "merchant": True,
+        "columns": [("code", "Code", "text", "Code"), ("active", "Active", "checkbox", None),
+                    ("actions", "Actions", "actions", None)],
+    },
+    "product_types": {
+        "route": ROUTES["product_types"], "title": "Product types", "create": True,
+        "columns": [("id", "ID", "text", None), ("store", "Merchant store", "text", "Merchant store"),
+                    ("code", "Code", "text", "Code"), ("actions", "Actions", "actions", None)],
+    },
+    "product_options": {
+        "route": ROUTES["product_options"], "title": "Options", "create": True,
+        "columns": [("id", "ID", "text", None), ("descriptions", "Name", "text", "Name"),
+                    ("type", "Type", "text", None), ("actions", "Actions", "actions", None)],
+    },
+    "options_set": {
+        "route": ROUTES["options_set"], "title": "Options set", "create": True,
+        "columns": [("id", "ID", "text", None), ("code", "Code", "text", "Code"),
+                    ("option", "Option", "text", "Option"), ("values", "Values", "text", None),
+                    ("productTypes", "Product types", "text", None), ("actions", "Actions", "actions", None)],
+    },
+}
+
+ADJECTIVES = ["Classic", "Vintage", "Modern", "Rustic", "Compact", "Deluxe", "Urban", "Nordic", "Bold", "Soft"]
+NOUNS = ["Table", "Chair", "Lamp", "Bag", "Shirt", "Mug", "Desk", "Scarf", "Watch", "Sofa", "Jacket", "Clock"]
+BRANDS = ["Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay", "Oceanic", "Tyrell"]
+OPTIONS = ["Color", "Size", "Material", "Finish", "Length", "Pattern"]
+OPTION_TYPES = ["select", "radio", "checkbox", "text"]
+VALUES = ["Red", "Blue", "Small", "Large", "Oak", "Steel", "Matte", "Striped"]
+STORES = ["DEFAULT", "BOUTIQUE", "OUTLET"]
+
+
+def make_row(table, index):
+    """Row `index` (0-based) of a list view - deterministic, so runs are comparable"""
+    number = index + 1
+    word = NOUNS[index % len(NOUNS)]
+    if table == "products":
+        return {"id": number, "sku": f"{word[:3].upper()}-{number:05d}",
+                "name": f"{ADJECTIVES[index % len(ADJECTIVES)]} {word}", "quantity": (index * 7) % 50,
+                "available": index % 3 != 0, "price": round((index * 13) % 500 + 9.99, 2),
+                "creationDate": (date(2024, 1, 1) + timedelta(days=index % 700)).isoformat()}
+    if table == "brands":
+        brand = BRANDS[index % len(BRANDS)]
+        return {"id": number, "description": f"{brand} {number}", "code": f"{brand.lower()}-{number}"}
+    if table == "product_groups":
+        return {"code": f"group-{word.lower()}-{number}", "active": index % 2 == 0}
+    if table == "product_types":
+        return {"id": number, "store": STORES[index % len(STORES)],
+                "code": "general" if index == 0 else f"type-{word.lower()}-{number}"}
+    if table == "product_options":
+        option = OPTIONS[index % len(OPTIONS)]
+        return {"id": number, "descriptions": f"{option} {number}", "type": OPTION_TYPES[index % len(OPTION_TYPES)]}
+    if table == "options_set":
+        option = OPTIONS[index % len(OPTIONS)]
+        return {"id": number, "code": f"{option.lower()}-set-{number}", "option": option,
+                "values": ", ".join(VALUES[(index + step) % len(VALUES)] for step in range(2)),
+                "productTypes": "general"}
+    raise KeyError(table)
+
+
+def make_rows(table, count):
+    return [make_row(table, index) for index in range(count)]
+
+
+def _sort_key(value):
+    return (0, value, "") if isinstance(value, (int, float)) else (1, 0, str(value).lower())
+
+
+def query_rows(rows, filters=None, search=None, sort=None, order="asc", page=1, count=10):
+    """
+    Filter, sort and page rows the way the admin's list endpoints do
+
+    Args:
+        filters (dict): column key -> text; case-insensitive substring match
+        search (str): Text any column may contain (general search box)
+        sort (str): Column key to sort by, or None for the stored order
+        order (str): asc | desc
+        page (int): 1-based page number
+        count (int): Rows per page
+
+    Returns:
+        dict: {"items": [...], "total": matching rows, "page": page, "count": count}
+    """
+    matching = rows
+    for key, text in (filters or {}).items():
+        if text:
+            matching = [row for row in matching if text.lower() in str(row.get(key, "")).lower()]
+    if search:
+        matching = [row for row in matching
+                    if any(search.lower() in str(value).lower() for value in row.values())]
+    if sort:
+        matching = sorted(matching, key=lambda row: _sort_key(row.get(sort, "")), reverse=order == "desc")
+    start = (max(page, 1) - 1) * count
+    return {"items": matching[start:start + count], "total": len(matching), "page": page, "count": count}
+
+
+# =======================
+# SERVER
+# =======================
+
+class AdminStubServer:
+    """The stand-in admin on a background thread
+
+        with AdminStubServer(latency_ms=50, rows=1000) as stub:
+            Config.BASE_URL = stub.url
+    """
+
+    def __init__(self, host="127.0.0.1", port=None, latency_ms=None, jitter_ms=None, rows=None, rows_for=None,
+                 page_size=None, asset_latency_ms=0, username=None, password=None, seed=0, verbose=False):
+        """
+        Args:
+            port (int): 0 picks a free port
+            latency_ms (int): Added to every API response
+            jitter_ms (int): Random extra API latency, 0..jitter_ms
+            rows (int): Rows in every list view
+            rows_for (dict): Per-view row counts overriding rows ({"products": 5000})
+            page_size (int): Rows per pager page
+            asset_latency_ms (int): Added to the app shell and its static files
+        """
+        self.host = host
+        self.port = Config.STUB_SERVER_PORT if port is None else port
+        self.latency_ms = Config.STUB_LATENCY_MS if latency_ms is None else latency_ms
+        self.jitter_ms = Config.STUB_JITTER_MS if jitter_ms is None else jitter_ms
+        self.rows = Config.STUB_ROWS if rows is None else rows
+        self.rows_for = dict(rows_for or {})
+        self.page_size = Config.STUB_PAGE_SIZE if page_size is None else page_size
+        self.asset_latency_ms = asset_latency_ms
+        self.username = username or Config.VALID_USERNAME
+        self.password = password or Config.VALID_PASSWORD
+        self.verbose = verbose
+        self.stats = {"requests": 0, "api": 0, "delayed_seconds": 0.0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._pause = threading.Event()  # Never set: wait() delays without time.sleep (see _delay)
+        self._httpd = None
+        self._thread = None
+        self.reset()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def reset(self):
+        """Regenerate every list view (undoes checkbox updates)"""
+        with self._lock:
+            self.data = {name: make_rows(name, self.rows_for.get(name, self.rows)) for name in TABLES}
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), name="admin-stub",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join(timeout=5)
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # =======================
+    # REQUEST HANDLING
+    # =======================
+
+    def client_config(self):
+        """Settings the app reads from window.STUB_CONFIG"""
+        return {
+            "routes": ROUTES,
+            "pageSize": self.page_size,
+            "filterDebounceMs": 300,  # ng2-smart-table's filter debounce
+            "tables": {name: {"route": table["route"], "title": table["title"],
+                              "create": table.get("create", False), "merchant": table.get("merchant", False),
+                              "search": table.get("search", False),
+                              "columns": [{"key": key, "title": title, "kind": kind, "filter": placeholder}
+                                          for key, title, kind, placeholder in table["columns"]]}
+                       for name, table in TABLES.items()},
+        }
+
+    def render_index(self):
+        with open(os.path.join(ASSETS_DIR, "index.html"), encoding="utf-8") as handle:
+            return Template(handle.read()).safe_substitute(config=json.dumps(self.client_config()))
+
+    def login(self, credentials):
+        if credentials.get("username") == self.username and credentials.get("password") == self.password:
+            return 200, {"token": f"stub-{int(time.time())}", "id": 1, "userName": self.username}
+        return 401, {"message": "Invalid username or password"}
+
+    def list_rows(self, table, params):
+        if table not in self.data:
+            return 404, {"message": f"Unknown list {table}"}
+        first = {key: values[0] for key, values in params.items()}
+        filters = {key[2:]: value for key, value in first.items() if key.startswith("f.")}
+        with self._lock:
+            return 200, query_rows(self.data[table], filters, first.get("search"), first.get("sort") or None,
+                                   first.get("order", "asc"), int(first.get("page", 1)),
+                                   int(first.get("count", self.page_size)))
+
+    def update_row(self, table, key, value, changes):
+        """Apply a PATCH to the first row whose `key` column equals `value`"""
+        with self._lock:
+            for row in self.data.get(table, []):
+                if str(row.get(key)) == value:
+                    row.update({name: changes[name] for name in changes if name in row})
+                    return 200, row
+        return 404, {"message": f"No {table} row with {key}={value}"}
+
+    def _delay(self, milliseconds):
+        # Event.wait rather than time.sleep: an in-process stand-in must not show up as
+        # test dead time in the sleep profiler
+        if milliseconds > 0:
+            self._pause.wait(milliseconds / 1000)
+            with self._lock:
+                self.stats["delayed_seconds"] += milliseconds / 1000
+
+    def api_delay(self):
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0
+        self._delay(self.latency_ms + jitter)
+
+
+@contextmanager
+def stand_in(**settings):
+    """
+    Run a stand-in for the duration of the block and point the suites at it
+
+    Sets Config.BASE_URL and Config.RESULTS_DB, and their environment variables
+    (inherited by parallel workers), and restores them afterwards. Stand-in timings go
+    to Config.STUB_RESULTS_DB so they never mix with the real admin's history.
+    Settings are AdminStubServer arguments; the port defaults to any free one.
+    """
+    settings.setdefault("port", 0)
+    previous = {name: (getattr(Config, name), os.environ.get(name)) for name in ("BASE_URL", "RESULTS_DB")}
+    with AdminStubServer(**settings) as stub:
+        Config.BASE_URL = os.environ["BASE_URL"] = stub.url
+        Config.RESULTS_DB = os.environ["RESULTS_DB"] = Config.STUB_RESULTS_DB
+        print(f"🧪 Running against the admin stand-in at {stub.url} (API latency {stub.latency_ms}ms)")
+        try:
+            yield stub
+        finally:
+            for name, (value, env) in previous.items():
+                setattr(Config, name, value)
+                if env is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = env
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def stub(self):
+        return self.server.stub
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        self._count(parts.path)
+        if parts.path in APP_PATHS:
+            self.stub._delay(self.stub.asset_latency_ms)
+            return self._send(200, self.stub.render_index().encode("utf-8"), ASSET_TYPES[".html"],
+                              cache="no-cache")
+        if parts.path == "/favicon.ico":
+            return self._send(200, FAVICON, "image/gif", cache="max-age=86400")
+        if parts.path.startswith("/static/"):
+            return self._asset(parts.path[len("/static/"):])
+        if parts.path.startswith("/api/v1/tables/"):
+            self.stub.api_delay()
+            return self._json(*self.stub.list_rows(parts.path.rsplit("/", 1)[-1], parse_qs(parts.query)))
+        self._json(404, {"message": "Not found"})
+
+    def do_POST(self):
+        self._count(self.path)
+        if urlsplit(self.path).path == "/api/v1/private/login":
+            self.stub.api_delay()
+            return self._json(*self.stub.login(self._body()))
+        self._json(404, {"message": "Not found"})
+
+    def do_PATCH(self):
+        self._count(self.path)
+        # /api/v1/tables/<table>/<key>/<value>
+        parts = urlsplit(self.path).path.split("/")
+        if len(parts) == 7 and parts[1:4] == ["api", "v1", "tables"]:
+            self.stub.api_delay()
+            return self._json(*self.stub.update_row(parts[4], parts[5], parts[6], self._body()))
+        self._json(404, {"message": "Not found"})
+
+    def _asset(self, name):
+        path = os.path.join(ASSETS_DIR, os.path.basename(name))
+        extension = os.path.splitext(path)[1]
+        if extension not in ASSET_TYPES or not os.path.isfile(path):
+            return self._json(404, {"message": "Not found"})
+        self.stub._delay(self.stub.asset_latency_ms)
+        with open(path, "rb") as handle:
+            self._send(200, handle.read(), ASSET_TYPES[extension], cache="max-age=3600")
+
+    def _count(self, path):
+        with self.stub._lock:
+            self.stub.stats["requests"] += 1
+            if path.startswith("/api/"):
+                self.stub.stats["api"] += 1
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def _json(self, status, document):
+        self._send(status, json.dumps(document).encode("utf-8"), "application/json", cache="no-store")
+
+    def _send(self, status, body, content_type, cache):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", cache)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.stub.verbose:
+            super().log_message(format, *args)
+
+
+# =======================
+# COMMAND LINE
+# =======================
+
+def parse_rows_for(text):
+    """'products=5000,brands=20' -> {'products': 5000, 'brands': 20}"""
+    counts = {}
+    for item in filter(None, (part.strip() for part in (text or "").split(","))):
+        name, _, count = item.partition("=")
+        if name not in TABLES or not count.isdigit():
+            raise ValueError(f"Invalid row count '{item}' (expected <list>=<rows>, lists: {', '.join(TABLES)})")
+        counts[name] = int(count)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline stand-in for the Shopizer admin")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=Config.STUB_SERVER_PORT, help="0 picks a free port")
+    parser.add_argument("--latency-ms", type=int, default=Config.STUB_LATENCY_MS, help="Added to every API response")
+    parser.add_argument("--jitter-ms", type=int, default=Config.STUB_JITTER_MS, help="Random extra API latency")
+    parser.add_argument("--asset-latency-ms", type=int, default=0, help="Added to the app shell and static files")
+    parser.add_argument("--rows", type=int, default=Config.STUB_ROWS, help="Rows in every list view")
+    parser.add_argument("--rows-for", default="", help="Per-view row counts, e.g. products=5000,brands=20")
+    parser.add_argument("--page-size", type=int, default=Config.STUB_PAGE_SIZE, help="Rows per pager page")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    try:
+        rows_for = parse_rows_for(args.rows_for)
+    except ValueError as e:
+        parser.error(str(e))
+
+    stub = AdminStubServer(args.host, args.port, args.latency_ms, args.jitter_ms, args.rows, rows_for,
+                           args.page_size, args.asset_latency_ms, verbose=args.verbose).start()
+    print(f"🧪 Shopizer admin stand-in at {stub.url}  (API latency {args.latency_ms}+{args.jitter_ms}ms, "
+          f"{args.rows} rows per list)")
+    print(f"   Log in with {stub.username} / {stub.password}; run the suites with BASE_URL={stub.url}")
+    try:
+        while True:
+            stub._pause.wait(3600)
+    except KeyboardInterrupt:
+        print(f"\n🛑 Stopped after {stub.stats['requests']} requests ({stub.stats['api']} API)")
+    finally:
+        stub.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+import json
+import os
+import time
+from config.config import Config
+
+
+# Runs in the page: applies cookies and storage in a single WebDriver round-trip
+RESTORE_STATE_SCRIPT = """
+var state = arguments[0];
+var localItems = state.local_storage || {};
+var sessionItems = state.session_storage || {};
+Object.keys(localItems).forEach(function (key) { window.localStorage.setItem(key, localItems[key]); });
+Object.keys(sessionItems).forEach(function (key) { window.sessionStorage.setItem(key, sessionItems[key]); });
+(state.cookies || []).forEach(function (c) {
+    if (c.httpOnly) { return; }
+    var cookie = c.name + '=' + c.value + '; path=' + (c.path || '/');
+    if (c.expiry) { cookie += '; expires=' + new Date(c.expiry * 1000).toUTCString(); }
+    if (c.domain && c.domain.charAt(0) === '.') { cookie += '; domain=' + c.domain; }
+    if (c.secure) { cookie += '; secure'; }
+    if (c.sameSite) { cookie += '; samesite=' + c.sameSite; }
+    document.cookie = cookie;
+});
+return true;
+"""
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+return {local_storage: dump(window.localStorage), session_storage: dump(window.sessionStorage)};
+"""
+
+
+class AuthStateStore:
+    """Saves a logged-in browser state to disk so later drivers can skip the UI login
+
+    The storage-state file holds cookies, localStorage/sessionStorage (auth token and
+    language preference) and a timestamp. States older than the TTL, or captured for a
+    different base URL, are ignored.
+    """
+
+    def __init__(self, path=None, ttl=None):
+        self.path = path or Config.AUTH_STATE_FILE
+        self.ttl = Config.AUTH_STATE_TTL if ttl is None else ttl
+
+    # =======================
+    # FILE HANDLING
+    # =======================
+
+    def load(self, base_url):
+        """Load a saved state, or None when it is missing, expired or for another URL"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("base_url") != base_url:
+            return None
+        if time.time() - state.get("saved_at", 0) > self.ttl:
+            print("⌛ Saved auth state expired")
+            return None
+        return state
+
+    def save(self, state):
+        """Write the state atomically so concurrent workers never read half a file"""
+        state["saved_at"] = time.time()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.path)
+
+    def invalidate(self):
+        """Delete the saved state so the next driver performs a UI login"""
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    # =======================
+    # BROWSER STATE
+    # =======================
+
+    def capture(self, driver, base_url):
+        """Read the current authenticated state from the browser"""
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT) or {}
+        return {
+            "base_url": base_url,
+            "cookies": driver.get_cookies(),
+            "local_storage": storage.get("local_storage", {}),
+            "session_storage": storage.get("session_storage", {}),
+        }
+
+    def restore(self, driver, base_url, state):
+        """
+        Inject a saved state into the browser
+
+        The browser must be on the app origin before storage can be written, so a
+        lightweight same-origin URL is loaded first; everything else is applied by a
+        single script. Only httpOnly cookies need separate add_cookie calls.
+
+        Returns:
+            bool: True if the state was injected (not yet verified by the app)
+        """
+        try:
+            driver.get(f"{base_url}{Config.AUTH_STATE_ORIGIN_PATH}")
+            driver.execute_script(RESTORE_STATE_SCRIPT, state)
+
+            for cookie in state.get("cookies", []):
+                if cookie.get("httpOnly"):
+                    driver.add_cookie({key: value for key, value in cookie.items() if key != "sameSite"})
+            return True
+
+        except Exception as e:
+            print(f"⚠ Could not restore auth state: {e}")
+            return False
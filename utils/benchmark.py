@@ -0,0 +1,298 @@
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from datetime import datetime
+from config.config import Config
+
+
+class BenchmarkError(Exception):
+    """A benchmarked operation reported failure (returned False) - its timing is meaningless"""
+
+
+def percentile(sorted_samples, fraction):
+    """Linear-interpolated percentile of already sorted samples (fraction 0..1)"""
+    if not sorted_samples:
+        return None
+    position = (len(sorted_samples) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def median_interval(sorted_samples, confidence=0.95):
+    """
+    Distribution-free confidence interval for the median from order statistics
+
+    The number of samples below the true median is Binomial(n, 1/2); the interval runs
+    from the k-th smallest to the k-th largest sample for the largest k whose tail stays
+    within (1 - confidence) / 2. With fewer than 6 samples no such k exists at 95% and
+    the full range is returned (its coverage is lower than asked for).
+
+    Returns:
+        tuple: (low, high) seconds
+    """
+    n = len(sorted_samples)
+    if n == 0:
+        return None, None
+    tail = (1 - confidence) / 2
+    k = 0
+    cumulative = 0.0
+    while k < n // 2:
+        probability = math.comb(n, k) / 2 ** n
+        if cumulative + probability > tail:
+            break
+        cumulative += probability
+        k += 1
+    if k == 0:
+        return sorted_samples[0], sorted_samples[-1]
+    return sorted_samples[k - 1], sorted_samples[n - k]
+
+
+class BenchmarkResult:
+    """Samples of one benchmarked operation and their summary statistics"""
+
+    def __init__(self, name, samples, group=None, warmup=0, skipped=0, confidence=0.95):
+        self.name = name
+        self.samples = list(samples)
+        self.group = group
+        self.warmup = warmup
+        self.skipped = skipped
+        self.confidence = confidence
+        ordered = sorted(self.samples)
+        self.median = statistics.median(ordered) if ordered else None
+        self.p95 = percentile(ordered, 0.95)
+        self.mean = statistics.fmean(ordered) if ordered else None
+        self.stddev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+        self.min = ordered[0] if ordered else None
+        self.max = ordered[-1] if ordered else None
+        self.ci_low, self.ci_high = median_interval(ordered, confidence)
+
+    @property
+    def measured(self):
+        return bool(self.samples)
+
+    def to_dict(self):
+        return {"group": self.group, "samples": self.samples, "warmup": self.warmup, "skipped": self.skipped,
+                "median": self.median, "p95": self.p95, "mean": self.mean, "stddev": self.stddev,
+                "min": self.min, "max": self.max, "ci_low": self.ci_low, "ci_high": self.ci_high,
+                "confidence": self.confidence}
+
+    @classmethod
+    def from_dict(cls, name, data):
+        return cls(name, data.get("samples", []), data.get("group"), data.get("warmup", 0),
+                   data.get("skipped", 0), data.get("confidence", 0.95))
+
+    def summary(self):
+        """One report line: median with its confidence interval, p95 and spread"""
+        if not self.measured:
+            return f"{self.name:<40} skipped ({self.skipped} iterations not runnable)"
+        return (f"{self.name:<40} median {self.median * 1000:>8.1f} ms "
+                f"[{self.ci_low * 1000:.1f}-{self.ci_high * 1000:.1f}] "
+                f"p95 {self.p95 * 1000:>8.1f} ms  sd {self.stddev * 1000:>6.1f} ms  n={len(self.samples)}")
+
+
+class Benchmark:
+    """A named operation to time, with optional untimed setup before every iteration
+
+    setup returning False skips the iteration (e.g. a language change when the UI is
+    already in English). With check (the default) the operation returning False raises
+    BenchmarkError: page-object actions report failure that way, and a failed action's
+    time says nothing. Queries whose answer may be False (is_french_language) pass
+    check=False. warmup overrides the suite's for operations that can only run a few times.
+    """
+
+    def __init__(self, name, func, setup=None, group=None, check=True, warmup=None):
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.group = group or name.split(".", 1)[0]
+        self.check = check
+        self.warmup = warmup
+
+    def iterate(self, clock=time.perf_counter):
+        """Run setup and the timed operation once; the elapsed seconds or None when skipped"""
+        if self.setup is not None and self.setup() is False:
+            return None
+        start = clock()
+        outcome = self.func()
+        elapsed = clock() - start
+        if self.check and outcome is False:
+            raise BenchmarkError(f"{self.name} failed")
+        return elapsed
+
+
+class BenchmarkSuite:
+    """Runs benchmarks with warm-up iterations and repeated measurements
+
+    Warm-up iterations are run and thrown away (first-use costs: JIT in the page, caches,
+    lazy Angular modules); the measured repeats give median, p95, standard deviation and a
+    confidence interval for the median, so two runs can be compared for real differences.
+    """
+
+    def __init__(self, warmup=None, repeats=None, confidence=0.95, clock=time.perf_counter):
+        self.warmup = Config.BENCHMARK_WARMUP if warmup is None else warmup
+        self.repeats = Config.BENCHMARK_REPEATS if repeats is None else repeats
+        self.confidence = confidence
+        self.clock = clock
+        self.benchmarks = []
+
+    def add(self, name, func, setup=None, group=None, check=True, warmup=None):
+        self.benchmarks.append(Benchmark(name, func, setup, group, check, warmup))
+        return self
+
+    def groups(self):
+        return list(dict.fromkeys(benchmark.group for benchmark in self.benchmarks))
+
+    def run(self, only=None, verbose=True):
+        """
+        Run the benchmarks (only those in the given groups or with the given names)
+
+        Returns:
+            dict: name -> BenchmarkResult, in run order
+        """
+        results = {}
+        for benchmark in self.benchmarks:
+            if only and benchmark.group not in only and benchmark.name not in only:
+                continue
+            warmup = self.warmup if benchmark.warmup is None else benchmark.warmup
+            if verbose:
+                print(f"⏱️ {benchmark.name}: {warmup} warm-up + {self.repeats} measured")
+            for _ in range(warmup):
+                benchmark.iterate(self.clock)
+            samples = []
+            skipped = 0
+            for _ in range(self.repeats):
+                elapsed = benchmark.iterate(self.clock)
+                if elapsed is None:
+                    skipped += 1
+                else:
+                    samples.append(elapsed)
+            result = BenchmarkResult(benchmark.name, samples, benchmark.group, warmup, skipped,
+                                     self.confidence)
+            results[benchmark.name] = result
+            if verbose:
+                print(f"   {result.summary()}")
+        return results
+
+
+# =======================
+# RESULTS FILES
+# =======================
+
+# Environment entries that must match for timings to be comparable
+COMPARABLE_ENVIRONMENT = ("browser", "base_url")
+
+
+def baseline_path(path, backend=None):
+    """The baseline file of a backend (fake, stub); the real admin's is `path` itself"""
+    if not backend:
+        return path
+    stem, extension = os.path.splitext(path)
+    return f"{stem}.{backend}{extension}"
+
+
+def run_environment(metadata=None):
+    """Environment recorded with results; metadata entries override the defaults"""
+    return {"base_url": Config.BASE_URL, "python": platform.python_version(),
+            "platform": platform.platform(), **(metadata or {})}
+
+
+def write_results(results, path=None, metadata=None):
+    """Save results as JSON (also the format of the baseline file)"""
+    path = path or Config.BENCHMARK_OUTPUT
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    document = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": run_environment(metadata),
+        "benchmarks": {name: result.to_dict() for name, result in results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+    return path
+
+
+def load_results(path):
+    """
+    Results from a file written by write_results
+
+    Raises:
+        FileNotFoundError: If there is no such file
+    """
+    with open(path, encoding="utf-8") as handle:
+        document = json.load(handle)
+    return {name: BenchmarkResult.from_dict(name, data) for name, data in document.get("benchmarks", {}).items()}
+
+
+def load_environment(path):
+    """The environment a results file was written in (empty for files without one)"""
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle).get("environment", {})
+
+
+def environment_mismatch(environment, baseline_environment):
+    """COMPARABLE_ENVIRONMENT entries that differ, as {key: (baseline, current)}"""
+    return {key: (baseline_environment.get(key), environment.get(key)) for key in COMPARABLE_ENVIRONMENT
+            if environment.get(key) != baseline_environment.get(key)}
+
+
+# =======================
+# BASELINE COMPARISON
+# =======================
+
+def compare(results, baseline, threshold=None, environment=None, baseline_environment=None):
+    """
+    Compare results with a baseline
+
+    A benchmark regressed when its median is more than `threshold` (a fraction) above the
+    baseline's and the two medians' confidence intervals do not overlap; improved is the
+    mirror image. Anything else is noise as far as these samples can tell. When both
+    environments are given and their browser or base_url differ, measured benchmarks are
+    incomparable: a fake or stand-in run says nothing about the real admin's timings.
+
+    Returns:
+        list: (name, status, baseline median, current median, relative change) with status
+        one of regressed, improved, unchanged, new, skipped, incomparable
+    """
+    threshold = Config.BENCHMARK_THRESHOLD if threshold is None else threshold
+    incomparable = (environment is not None and baseline_environment is not None
+                    and bool(environment_mismatch(environment, baseline_environment)))
+    rows = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not result.measured:
+            rows.append((name, "skipped", before.median if before else None, None, None))
+            continue
+        if before is None or not before.measured:
+            rows.append((name, "new", None, result.median, None))
+            continue
+        if incomparable:
+            rows.append((name, "incomparable", before.median, result.median, None))
+            continue
+        change = (result.median - before.median) / before.median if before.median else 0.0
+        if change > threshold and result.ci_low > before.ci_high:
+            status = "regressed"
+        elif change < -threshold and result.ci_high < before.ci_low:
+            status = "improved"
+        else:
+            status = "unchanged"
+        rows.append((name, status, before.median, result.median, change))
+    return rows
+
+
+def comparison_report(rows):
+    """Report lines for compare() rows"""
+    icons = {"regressed": "❌", "improved": "🚀", "unchanged": "✅", "new": "🆕", "skipped": "⏭",
+             "incomparable": "≠"}
+    lines = []
+    for name, status, before, current, change in rows:
+        if change is None:
+            lines.append(f"{icons[status]} {name}: {status}")
+        else:
+            lines.append(f"{icons[status]} {name}: {before * 1000:.1f} ms -> {current * 1000:.1f} ms "
+                         f"({change:+.0%}) {status}")
+    return lines
@@ -0,0 +1,250 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from config.config import Config
+from utils.file_lock import FileLock
+
+
+def current_run_id():
+    """Id shared by every process of one test run (parallel workers inherit it)"""
+    run_id = os.environ.get("TEST_RUN_ID")
+    if not run_id:
+        run_id = f"{os.getpid()}-{int(time.time())}"
+        os.environ["TEST_RUN_ID"] = run_id
+    return run_id
+
+
+def clone_tree(source, target):
+    """Copy a directory tree, sharing data blocks copy-on-write where the filesystem can
+
+    Uses `cp --reflink=always` on Linux (btrfs/XFS; it fails rather than silently copying on
+    ext4/overlayfs) and `cp -c` (APFS clonefile) on macOS, falling back to a plain copy. Hard
+    links are never used: Chrome rewrites cache and database files in place, so a linked clone
+    would write through into the golden profile and every sibling clone.
+
+    Returns:
+        str: "reflink" or "copy"
+    """
+    command = None
+    if sys.platform.startswith("linux"):
+        command = ["cp", "-R", "--reflink=always", source, target]
+    elif sys.platform == "darwin":
+        command = ["cp", "-c", "-R", source, target]
+
+    if command and shutil.which("cp"):
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode == 0:
+            return "reflink"
+        shutil.rmtree(target, ignore_errors=True)
+
+    shutil.copytree(source, target, symlinks=True)
+    return "copy"
+
+
+def _process_alive(pid):
+    if os.name == "nt":
+        return True  # os.kill would terminate the process; rely on the age limit instead
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class BrowserProfileTemplate:
+    """Golden Chrome user-data-dir, warmed once per test run and cloned for every new browser
+
+    A fresh Chrome starts with an empty HTTP cache and downloads the whole admin bundle on
+    its first navigation. The golden profile loads the app once per run so the bundle sits
+    in its disk cache; each browser then starts from a private clone of it.
+
+    Layout under the profile directory:
+        golden/          warmed template (never used by a running browser)
+        clones/<pid>-*/  one user-data-dir per browser, removed when the driver quits
+        manifest.json    run id and outcome of the last warm-up
+    """
+
+    GOLDEN_DIR = "golden"
+    CLONES_DIR = "clones"
+    MANIFEST_FILE = "manifest.json"
+    LOCK_FILE = ".lock"
+
+    # Chrome's single-instance markers; a copied one makes the clone look like it is in use
+    SINGLETON_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+    def __init__(self, root=None, stale_after=None, run_id=None):
+        self.root = root or Config.BROWSER_PROFILE_DIR
+        self.stale_after = Config.BROWSER_PROFILE_STALE_AFTER if stale_after is None else stale_after
+        self.run_id = run_id or current_run_id()
+        self.clone_stats = []
+        self.warm_seconds = None
+        self.removed_stale = 0
+
+    @property
+    def golden_dir(self):
+        return os.path.join(self.root, self.GOLDEN_DIR)
+
+    @property
+    def clones_dir(self):
+        return os.path.join(self.root, self.CLONES_DIR)
+
+    # =======================
+    # GOLDEN PROFILE
+    # =======================
+
+    def ensure_warm(self, warm):
+        """
+        Warm the golden profile unless another process of this run already did
+
+        Args:
+            warm (callable): Called with the golden user-data-dir; launches a browser on it,
+                             loads the app and quits so the cache is flushed to disk
+
+        Returns:
+            bool: True if the golden profile holds a warmed cache
+        """
+        with FileLock(os.path.join(self.root, self.LOCK_FILE)):
+            manifest = self._read_manifest()
+            if manifest.get("run_id") == self.run_id and os.path.isdir(self.golden_dir):
+                return manifest.get("warmed", False)
+
+            shutil.rmtree(self.golden_dir, ignore_errors=True)
+            os.makedirs(self.golden_dir)
+            start = time.perf_counter()
+            try:
+                warm(self.golden_dir)
+                warmed = True
+            except Exception as e:
+                print(f"⚠ Browser profile warm-up failed, browsers start with an empty cache: {e}")
+                warmed = False
+            self.warm_seconds = time.perf_counter() - start
+            self._drop_singletons(self.golden_dir)
+
+            self._write_manifest({"run_id": self.run_id, "warmed": warmed,
+                                  "warmed_at": time.time(), "seconds": round(self.warm_seconds, 2)})
+            if warmed:
+                print(f"🔥 Warmed browser profile template in {self.warm_seconds:.1f}s")
+            return warmed
+
+    # =======================
+    # CLONES
+    # =======================
+
+    def clone(self):
+        """
+        Create a private user-data-dir for one browser from the golden profile
+
+        Returns:
+            str: Path of the clone
+        """
+        self.remove_stale()
+        os.makedirs(self.clones_dir, exist_ok=True)
+        path = os.path.join(self.clones_dir, f"{os.getpid()}-{uuid.uuid4().hex[:8]}")
+
+        start = time.perf_counter()
+        # Shared lock with ensure_warm: the golden profile is never rebuilt mid-copy
+        with FileLock(os.path.join(self.root, self.LOCK_FILE)):
+            if os.path.isdir(self.golden_dir):
+                method = clone_tree(self.golden_dir, path)
+            else:
+                os.makedirs(path)
+                method = "empty"
+        self._drop_singletons(path)
+        self.clone_stats.append({"method": method, "seconds": time.perf_counter() - start})
+        return path
+
+    def attach(self, driver, path):
+        """Remove the clone when the driver quits"""
+        original = driver.quit
+
+        def quit_and_remove_profile():
+            try:
+                return original()
+            finally:
+                self.remove(path)
+
+        driver.quit = quit_and_remove_profile
+        driver._profile_dir = path
+        return driver
+
+    def remove(self, path):
+        shutil.rmtree(path, ignore_errors=True)
+
+    def remove_own(self):
+        """Delete every clone of this process (at exit, for drivers that were never quit)"""
+        prefix = f"{os.getpid()}-"
+        for name in self._clone_names():
+            if name.startswith(prefix):
+                self.remove(os.path.join(self.clones_dir, name))
+
+    def remove_stale(self):
+        """Delete clones left behind by processes that are gone or older than stale_after
+
+        Returns:
+            int: Number of clones removed
+        """
+        removed = 0
+        now = time.time()
+        for name in self._clone_names():
+            pid = name.split("-", 1)[0]
+            if not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            path = os.path.join(self.clones_dir, name)
+            try:
+                age = now - os.path.getmtime(path)
+            except OSError:
+                continue
+            if not _process_alive(int(pid)) or age > self.stale_after:
+                self.remove(path)
+                removed += 1
+        self.removed_stale += removed
+        return removed
+
+    def report(self):
+        """Clone counts and timings for the browser startup report"""
+        if not self.clone_stats:
+            return []
+        lines = []
+        by_method = {}
+        for stat in self.clone_stats:
+            by_method.setdefault(stat["method"], []).append(stat["seconds"])
+        for method, seconds in sorted(by_method.items()):
+            lines.append(f"  profile clones via {method:<7} x{len(seconds):<3} "
+                         f"avg {sum(seconds) / len(seconds) * 1000:8.1f} ms")
+        if self.warm_seconds is not None:
+            lines.append(f"  profile template warmed in {self.warm_seconds:.2f}s")
+        if self.removed_stale:
+            lines.append(f"  stale profile clones removed: {self.removed_stale}")
+        return lines
+
+    def _clone_names(self):
+        try:
+            return os.listdir(self.clones_dir)
+        except FileNotFoundError:
+            return []
+
+    def _drop_singletons(self, path):
+        for name in self.SINGLETON_FILES:
+            target = os.path.join(path, name)
+            if os.path.lexists(target):
+                try:
+                    os.remove(target)
+                except OSError:
+                    pass
+
+    def _read_manifest(self):
+        try:
+            with open(os.path.join(self.root, self.MANIFEST_FILE), encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        with open(os.path.join(self.root, self.MANIFEST_FILE), "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
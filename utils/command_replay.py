@@ -0,0 +1,460 @@
+# utils/command_replay.py
+"""
+Record WebDriver traffic against the real admin, replay it without a browser
+
+CommandRecorder wraps each driver's command executor and writes every command, its
+parameters and the browser's response (errors included) to a JSON cassette, together with
+the settings that shape the command sequence and the saved login state. CommandReplay serves
+the same run from that cassette: DriverFactory hands out ReplayWebDriver sessions - selenium's
+RemoteWebDriver with the recording as its executor - in the order the browsers were started,
+so page objects, waits and error handling run unchanged, just without a browser or network.
+
+    python run_tests.py products --record        # .recordings/products.json
+    python run_tests.py products --replay        # seconds, no browser
+
+Every replayed command is compared with the next recorded one of its session. A command the
+recording does not have, or recorded commands the replay skipped, are divergences: the test
+that caused them fails with both sequences in its report. That makes a refactor of a page
+object checkable in seconds - the same tests must issue the same commands.
+
+Waits are replayed on the recorded timeline (ReplayClock): WebDriverWait timeouts, polling
+loops and the latencies the page objects measure see the time the recorded run saw.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.support import wait as wait_module
+
+from config.config import Config
+from utils.auth_state import AuthStateStore
+
+CASSETTE_VERSION = 1
+
+# Settings that change which commands the suites send; a replay runs with the recorded values
+RECORDED_SETTINGS = (
+    "BASE_URL", "BROWSER", "HEADLESS", "DRIVER_POOL_ENABLED", "DRIVER_POOL_MAX_REUSE",
+    "AUTH_STATE_ENABLED", "AUTH_STATE_TTL", "REQUEST_BLOCKING_ENABLED", "REQUEST_BLOCKING_PROFILE",
+    "PAGE_FIXTURE_SCOPE", "BULK_TABLE_EXTRACTION", "PAGE_TIMING_ENABLED", "TABLE_SETTLE_QUIET_MS",
+    "TABLE_SETTLE_CHANGE_MS", "TABLE_SETTLE_TIMEOUT", "APP_IDLE_QUIET_MS", "APP_IDLE_TIMEOUT",
+)
+
+# Parameters that legitimately differ between runs: the session id and the auth state timestamp
+IGNORED_PARAM_KEYS = frozenset(("sessionId", "saved_at"))
+
+# How far ahead a replay looks for its command before calling it unexpected
+RESYNC_WINDOW = 50
+
+# Browsers whose sessions get execute_cdp_cmd / get_log, like selenium's Chromium drivers
+CHROMIUM_BROWSERS = ("chrome", "chrome-headless-shell", "MicrosoftEdge", "msedge")
+
+
+class ReplayDivergence(AssertionError):
+    """A replayed command differs from the recording"""
+
+
+def command_key(command, params):
+    """Comparable form of a command: parameters without the per-run values, keys sorted"""
+    return json.dumps([command, _normalize(params or {})], sort_keys=True, default=str)
+
+
+def _normalize(value):
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items() if key not in IGNORED_PARAM_KEYS}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _describe(command, params, limit=160):
+    text = json.dumps(_normalize(params or {}), sort_keys=True, default=str)
+    return f"{command} {text if len(text) <= limit else text[:limit] + '...'}"
+
+
+class CommandRecording:
+    """What recording and replay share as a pytest plugin: the current test, divergence
+    failures, the end-of-session hook and the report (conftest registers the active one)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.current_test = None
+        self.divergences = []
+        self._checked = 0
+        self._lock = threading.Lock()
+
+    def start_test(self, nodeid):
+        self.current_test = nodeid
+
+    def finish_test(self):
+        self.current_test = None
+
+    def auth_state_store(self):
+        """Storage-state file the run logs in from"""
+        return AuthStateStore()
+
+    def close(self, session=None):
+        """Finish the recording or replay at the end of the run"""
+
+    def report(self):
+        return []
+
+    # =======================
+    # PYTEST HOOKS
+    # =======================
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self.start_test(item.nodeid)
+        yield
+        self.finish_test()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        new = self.divergences[self._checked:]
+        self._checked = len(self.divergences)
+        mine = [divergence for divergence in new if divergence["test"] == item.nodeid]
+        if not mine or report.failed:
+            return
+        report.outcome = "failed"
+        report.longrepr = "WebDriver commands differ from the recording:\n" + "\n".join(
+            divergence["message"] for divergence in mine)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.close(session)
+
+
+# =======================
+# RECORDING
+# =======================
+
+class CommandRecorder(CommandRecording):
+    """Writes every WebDriver command and response of the run to a cassette
+
+    Args:
+        path (str): Cassette file written by save()
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.sessions = []
+        self.entries = []
+        self.tests = set()
+        self.started_at = time.time()
+        self._start = time.monotonic()
+        self.auth_state = self._read_auth_state()
+
+    @staticmethod
+    def _read_auth_state():
+        """The saved login the run starts from - replays log in the same way"""
+        try:
+            with open(Config.AUTH_STATE_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def attach(self, driver):
+        """Record every command the driver sends from now on"""
+        executor = driver.command_executor
+        execute = executor.execute
+        with self._lock:
+            session = len(self.sessions)
+            self.sessions.append({"browser": driver.name, "capabilities": driver.caps, "test": self.current_test})
+
+        def recorded_execute(command, params):
+            response = execute(command, params)
+            self._append(session, command, params, response)
+            return response
+
+        executor.execute = recorded_execute
+        return driver
+
+    def _append(self, session, command, params, response):
+        # Serialised at once: RemoteWebDriver.execute replaces the response value with WebElements
+        entry = json.dumps({
+            "session": session,
+            "test": self.current_test,
+            "command": command,
+            "params": {key: value for key, value in (params or {}).items() if key != "sessionId"},
+            "response": response,
+            "t": round(time.monotonic() - self._start, 6),
+        }, default=str)
+        with self._lock:
+            self.entries.append(entry)
+            if self.current_test:
+                self.tests.add(self.current_test)
+
+    def save(self):
+        """Write the cassette; one command per line so recordings diff readably"""
+        header = {
+            "version": CASSETTE_VERSION,
+            "started_at": self.started_at,
+            "recorded_seconds": round(time.monotonic() - self._start, 3),
+            "settings": {name: getattr(Config, name) for name in RECORDED_SETTINGS},
+            "auth_state": self.auth_state,
+            "sessions": self.sessions,
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            body = ",\n".join(self.entries)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(header, default=str)[:-1])
+            f.write(f', "commands": [\n{body}\n]}}\n' if body else ', "commands": []}\n')
+
+    def close(self, session=None):
+        self.save()
+
+    def report(self):
+        if not self.entries:
+            return []
+        return [f"Recorded {len(self.entries)} commands from {len(self.sessions)} browser sessions "
+                f"and {len(self.tests)} tests -> {self.path}"]
+
+
+# =======================
+# REPLAY
+# =======================
+
+class CommandReplay(CommandRecording):
+    """Serves a recorded run to ReplayWebDriver sessions and reports where it differs
+
+    Loading the cassette applies its recorded settings to Config and turns the results store
+    off, so replays neither depend on the local environment nor pollute the timing history.
+
+    Args:
+        path (str): Cassette written by CommandRecorder
+        clock_modules (list): Modules whose time is the replay clock besides selenium's
+            WebDriverWait (default: the page objects, the tests and utils.auth_state)
+    """
+
+    def __init__(self, path, clock_modules=None):
+        super().__init__(path)
+        with open(path, "r", encoding="utf-8") as f:
+            cassette = json.load(f)
+        if cassette.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"{path}: unsupported cassette version {cassette.get('version')!r}")
+
+        self.cassette = cassette
+        self.sessions = cassette["sessions"]
+        self.streams = [[] for _ in self.sessions]
+        for entry in cassette["commands"]:
+            entry["key"] = command_key(entry["command"], entry["params"])
+            self.streams[entry["session"]].append(entry)
+        self.positions = [0] * len(self.sessions)
+        self.started = 0
+        self.served = 0
+        self.clock = ReplayClock(cassette["started_at"])
+        self.clock_modules = clock_modules
+        self._auth_state_path = None
+        self.apply_settings()
+
+    def apply_settings(self):
+        for name, value in self.cassette["settings"].items():
+            if getattr(Config, name, value) != value:
+                print(f"▶ Replay uses the recorded {name}={value!r} (configured: {getattr(Config, name)!r})")
+            setattr(Config, name, value)
+        Config.RESULTS_STORE_ENABLED = False
+
+    def auth_state_store(self):
+        """Store seeded with the login state the recorded run started from"""
+        if self._auth_state_path is None:
+            handle, self._auth_state_path = tempfile.mkstemp(prefix="replay_auth_", suffix=".json")
+            with os.fdopen(handle, "w", encoding="utf-8") as f:
+                json.dump(self.cassette["auth_state"], f)
+        return AuthStateStore(self._auth_state_path)
+
+    # =======================
+    # SESSIONS
+    # =======================
+
+    def new_driver(self, browser_name=None):
+        """The next recorded browser session as a ReplayWebDriver
+
+        Raises:
+            ReplayDivergence: When the run starts more browsers than were recorded
+        """
+        with self._lock:
+            index = self.started
+            if index >= len(self.sessions):
+                message = f"browser session {index + 1} started, the recording has {len(self.sessions)}"
+                self._diverge(index, "extra session", message)
+                raise ReplayDivergence(message)
+            self.started += 1
+        if index == 0:
+            self.clock.install(self.clock_modules)
+
+        session = self.sessions[index]
+        driver_class = ChromiumReplayWebDriver if session["browser"] in CHROMIUM_BROWSERS else ReplayWebDriver
+        return driver_class(ReplayExecutor(self, index, session["capabilities"]))
+
+    def execute(self, session, command, params):
+        """Recorded response to the command, or ReplayDivergence
+
+        Recorded commands the replay skipped are reported once the replay catches up with a
+        later one (within RESYNC_WINDOW); a command not in the recording is reported and
+        raises, leaving the stream where it was.
+        """
+        key = command_key(command, params)
+        with self._lock:
+            stream = self.streams[session]
+            position = self.positions[session]
+            for index in range(position, min(len(stream), position + RESYNC_WINDOW)):
+                entry = stream[index]
+                if entry["key"] != key:
+                    continue
+                if index > position:
+                    skipped = stream[position:index]
+                    self._diverge(session, "missing", f"{len(skipped)} recorded commands not sent before "
+                                  f"{command} (session {session}, command {position}): "
+                                  + "; ".join(_describe(e["command"], e["params"], 80) for e in skipped[:5])
+                                  + ("; ..." if len(skipped) > 5 else ""))
+                self.positions[session] = index + 1
+                self.served += 1
+                self.clock.advance_to(entry["t"])
+                return entry["response"]  # Served once: the driver may modify it
+
+            expected = (_describe(stream[position]["command"], stream[position]["params"])
+                        if position < len(stream) else "the end of the session")
+            message = (f"unexpected {_describe(command, params)} (session {session}, command {position}); "
+                       f"recorded: {expected}")
+            self._diverge(session, "unexpected", message)
+        raise ReplayDivergence(message)
+
+    def _diverge(self, session, kind, message):
+        self.divergences.append({"test": self.current_test, "session": session, "kind": kind, "message": message})
+
+    def unplayed(self):
+        """(session, recorded commands never replayed) for every session that stopped early"""
+        return [(session, len(stream) - self.positions[session])
+                for session, stream in enumerate(self.streams) if self.positions[session] < len(stream)]
+
+    def close(self, session=None):
+        self.clock.uninstall()
+        if self._auth_state_path:
+            try:
+                os.remove(self._auth_state_path)
+            except OSError:
+                pass
+            self._auth_state_path = None
+        if session is not None and (self.unplayed() or self.divergences) and session.exitstatus == 0:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def report(self):
+        recorded = sum(len(stream) for stream in self.streams)
+        lines = [f"Replayed {self.served} of {recorded} recorded commands in {self.started} of "
+                 f"{len(self.sessions)} browser sessions from {self.path} "
+                 f"(recorded run: {self.cassette.get('recorded_seconds', 0):.1f} s)"]
+        for session, count in self.unplayed():
+            lines.append(f"  ✗ session {session}: {count} recorded commands never replayed")
+        if self.divergences:
+            lines.append(f"  ✗ {len(self.divergences)} divergences from the recording:")
+            for divergence in self.divergences[:20]:
+                lines.append(f"    {divergence['test'] or '(outside tests)'}: {divergence['message']}")
+            if len(self.divergences) > 20:
+                lines.append(f"    ... {len(self.divergences) - 20} more")
+        elif not self.unplayed():
+            lines.append("  ✓ command sequence identical to the recording")
+        return lines
+
+
+class ReplayExecutor:
+    """Command executor of one replayed browser session"""
+
+    def __init__(self, replay, session, capabilities):
+        self.replay = replay
+        self.session = session
+        self.capabilities = capabilities
+
+    def execute(self, command, params):
+        if command == Command.NEW_SESSION:  # Sessions are started before the recorder attaches
+            return {"value": {"sessionId": f"replay-{self.session}", "capabilities": self.capabilities}}
+        return self.replay.execute(self.session, command, params)
+
+    def close(self):
+        pass
+
+
+class ReplayWebDriver(RemoteWebDriver):
+    """selenium's RemoteWebDriver answered from a recording - no driver binary, no browser"""
+
+    def __init__(self, executor):
+        super().__init__(command_executor=executor, options=ChromeOptions())
+        self._is_remote = False  # send_keys sends text, as the local drivers that were recorded do
+
+
+class ChromiumReplayWebDriver(ReplayWebDriver):
+    """Replayed Chrome/Edge session: also has the Chromium-only commands the suites use"""
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def get_log(self, log_type):
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+
+# =======================
+# RECORDED TIME
+# =======================
+
+class ReplayClock:
+    """Drop-in for the time module that follows the recorded timeline
+
+    Each replayed response moves the clock to the moment it was recorded, sleep() adds to it
+    without blocking. monotonic()/perf_counter() only ever move forward; time() is the
+    recorded wall-clock time, so saved logins expire as they did in the recorded run.
+    """
+
+    def __init__(self, started_at):
+        self.started_at = started_at
+        self.elapsed = 0.0
+        self._monotonic = time.monotonic()
+        self._perf_counter = time.perf_counter()
+        self._saved = []
+
+    def advance_to(self, recorded_seconds):
+        self.elapsed = max(self.elapsed, recorded_seconds)
+
+    def sleep(self, seconds):
+        self.elapsed += max(0.0, seconds)
+
+    def monotonic(self):
+        return self._monotonic + self.elapsed
+
+    def perf_counter(self):
+        return self._perf_counter + self.elapsed
+
+    def time(self):
+        return self.started_at + self.elapsed
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    @staticmethod
+    def clock_modules():
+        """Loaded page objects, tests and conftest, and the auth state store"""
+        return [module for name, module in list(sys.modules.items())
+                if module is not None and getattr(module, "time", None) is time
+                and (name.startswith(("pages.", "tests.")) or name.rsplit(".", 1)[-1] == "conftest"
+                     or name == "utils.auth_state")]
+
+    def install(self, modules=None):
+        modules = self.clock_modules() if modules is None else list(modules)
+        for module in [wait_module] + modules:
+            self._saved.append((module, module.time))
+            module.time = self
+
+    def uninstall(self):
+        for module, original in reversed(self._saved):
+            module.time = original
+        self._saved = []
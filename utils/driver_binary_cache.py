@@ -0,0 +1,161 @@
+import json
+import os
+import shutil
+import stat
+import time
+from config.config import Config
+from utils.file_lock import FileLock
+
+
+class DriverBinaryCache:
+    """Resolves chromedriver/geckodriver once and pins the binary on disk
+
+    Resolution order:
+        1. An explicitly pinned path (CHROMEDRIVER_PATH / GECKODRIVER_PATH)
+        2. The path already resolved by this process
+        3. The on-disk cache manifest shared by all workers (guarded by a file lock)
+        4. webdriver-manager download - skipped entirely when DRIVER_OFFLINE=true
+
+    A downloaded binary is copied into the cache directory so later runs never need
+    the network again. The manifest keeps the browser's major version next to it; after a
+    browser update the cached driver is resolved again instead of failing to start sessions.
+    """
+
+    MANIFEST_FILE = "manifest.json"
+    LOCK_FILE = ".lock"
+
+    _resolved = {}
+
+    def __init__(self, cache_dir=None, offline=None):
+        self.cache_dir = cache_dir or Config.DRIVER_CACHE_DIR
+        self.offline = Config.DRIVER_OFFLINE if offline is None else offline
+        self.last_source = None
+        self.last_seconds = 0.0
+
+    # =======================
+    # RESOLUTION
+    # =======================
+
+    def resolve(self, browser_name):
+        """
+        Get the path of the driver executable for a browser
+
+        Args:
+            browser_name (str): chrome or firefox
+
+        Returns:
+            str: Path to the driver executable
+        """
+        browser_name = browser_name.lower()
+        start = time.perf_counter()
+
+        path, source = self._resolve(browser_name)
+
+        self.last_source = source
+        self.last_seconds = time.perf_counter() - start
+        return path
+
+    def _resolve(self, browser_name):
+        pinned = self._pinned_path(browser_name)
+        if pinned:
+            if not os.path.isfile(pinned):
+                raise FileNotFoundError(f"Pinned {browser_name} driver not found: {pinned}")
+            return pinned, "pinned"
+
+        key = (os.path.abspath(self.cache_dir), browser_name)
+        if key in self._resolved:
+            return self._resolved[key], "memory"
+
+        with FileLock(os.path.join(self.cache_dir, self.LOCK_FILE)):
+            manifest = self._read_manifest()
+            entry = manifest.get(browser_name)
+            # Offline runs cannot fetch a newer driver, so they keep the cached one regardless
+            browser_version = None if self.offline else self._browser_version(browser_name)
+            if entry and os.path.isfile(entry["path"]):
+                cached_version = entry.get("browser_version")
+                if not (browser_version and cached_version and browser_version != cached_version):
+                    self._resolved[key] = entry["path"]
+                    return entry["path"], "disk"
+                print(f"🔄 {browser_name} {browser_version} installed, cached driver is for {cached_version} "
+                      f"- resolving a matching one")
+
+            if self.offline:
+                raise RuntimeError(
+                    f"No cached {browser_name} driver in {self.cache_dir} and DRIVER_OFFLINE is set. "
+                    f"Pin one with {browser_name.upper()}DRIVER_PATH or run once with network access."
+                )
+
+            start = time.perf_counter()
+            path = self._pin(browser_name, self._download(browser_name))
+            manifest[browser_name] = {
+                "path": path,
+                "browser_version": browser_version,
+                "resolved_at": time.time(),
+                "download_seconds": time.perf_counter() - start,
+            }
+            self._write_manifest(manifest)
+
+        self._resolved[key] = path
+        return path, "download"
+
+    def download_seconds(self, browser_name):
+        """Time the last uncached resolution took - the cost the cache avoids"""
+        entry = self._read_manifest().get(browser_name.lower())
+        return entry.get("download_seconds") if entry else None
+
+    # =======================
+    # INTERNAL HELPERS
+    # =======================
+
+    def _pinned_path(self, browser_name):
+        if browser_name == "chrome":
+            return Config.CHROMEDRIVER_PATH
+        if browser_name == "firefox":
+            return Config.GECKODRIVER_PATH
+        return None
+
+    def _browser_version(self, browser_name):
+        """Major version of the installed browser, or None when it cannot be detected"""
+        try:
+            from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+            browser_type = ChromeType.GOOGLE if browser_name == "chrome" else browser_name
+            version = OperationSystemManager().get_browser_version_from_os(browser_type)
+        except Exception:
+            return None
+        return version.split(".")[0] if version else None
+
+    def _download(self, browser_name):
+        """Resolve through webdriver-manager (version lookup + download)"""
+        if browser_name == "chrome":
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install()
+        if browser_name == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+        raise ValueError(f"Unsupported browser for driver cache: {browser_name}")
+
+    def _pin(self, browser_name, source_path):
+        """Copy the downloaded binary into the cache so it no longer depends on ~/.wdm"""
+        target_dir = os.path.join(self.cache_dir, browser_name)
+        os.makedirs(target_dir, exist_ok=True)
+        target = os.path.join(target_dir, os.path.basename(source_path))
+
+        temp_target = f"{target}.{os.getpid()}.tmp"
+        shutil.copy2(source_path, temp_target)
+        os.chmod(temp_target, os.stat(temp_target).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.replace(temp_target, target)
+        return os.path.abspath(target)
+
+    def _read_manifest(self):
+        try:
+            with open(os.path.join(self.cache_dir, self.MANIFEST_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest):
+        path = os.path.join(self.cache_dir, self.MANIFEST_FILE)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, path)
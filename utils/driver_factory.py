@@ -5,10 +5,32 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from config.config import Config
+from utils.driver_binary_cache import DriverBinaryCache
+from utils.driver_instrumentation import DriverMetrics
+from utils.driver_pool import DriverPool
+from utils.browser_profile import BrowserProfileTemplate
+from utils.command_replay import CommandRecorder, CommandReplay
+from utils.request_blocking import RequestBlocker
+from pages.base_page import BasePage, HASH_NAVIGATE_SCRIPT
+from pages.routes import ROUTES, route_hash, route_url
+from utils.auth_state import AuthStateStore
+import atexit
+import os
+import time
 
 class DriverFactory:
-    @staticmethod
-    def get_driver(browser_name="chrome", headless=False):
+    _pool = None
+    _metrics = None
+    _binary_cache = None
+    _profile_template = None
+    _request_blocker = None
+    _command_recording = None
+    _last_resolve_source = None
+    startup_stats = []
+
+    @classmethod
+    def get_driver(cls, browser_name="chrome", headless=False):
         """
         Optimized factory method to create WebDriver instance with faster startup
 
@@ -20,71 +42,27 @@ class DriverFactory:
             WebDriver: Configured WebDriver instance
         """
         driver = None
+        start_time = time.perf_counter()
+        recording = cls.get_command_recording()
 
-        if browser_name.lower() == "chrome":
-            chrome_options = ChromeOptions()
+        if isinstance(recording, CommandReplay):
+            resolved_time = time.perf_counter()
+            driver = recording.new_driver(browser_name)
 
-            # Basic options
-            if headless:
-                chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--window-size=1920,1080")
-
-            # PERFORMANCE OPTIMIZATIONS - These significantly reduce startup time
-            chrome_options.add_argument("--disable-extensions")
-            chrome_options.add_argument("--disable-plugins")
-            chrome_options.add_argument("--disable-images")  # Faster page loading
-            chrome_options.add_argument("--disable-javascript")  # Remove if your app needs JS
-            chrome_options.add_argument("--disable-css")  # Remove if you need styling
-
-            # DISABLE ML/AI FEATURES (fixes TensorFlow warnings)
-            chrome_options.add_argument("--disable-features=VizDisplayCompositor")
-            chrome_options.add_argument("--disable-features=TranslateUI")
-            chrome_options.add_argument("--disable-features=BlinkGenPropertyTrees")
-            chrome_options.add_argument("--disable-machine-learning-model-download")
-            chrome_options.add_argument("--disable-component-extensions-with-background-pages")
-
-            # DISABLE UNNECESSARY FEATURES
-            chrome_options.add_argument("--disable-default-apps")
-            chrome_options.add_argument("--disable-background-timer-throttling")
-            chrome_options.add_argument("--disable-renderer-backgrounding")
-            chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-            chrome_options.add_argument("--disable-client-side-phishing-detection")
-            chrome_options.add_argument("--disable-sync")
-            chrome_options.add_argument("--disable-translate")
-            chrome_options.add_argument("--disable-ipc-flooding-protection")
-
-            # MEMORY AND CPU OPTIMIZATIONS
-            chrome_options.add_argument("--memory-pressure-off")
-            chrome_options.add_argument("--max_old_space_size=4096")
-            chrome_options.add_argument("--aggressive-cache-discard")
-
-            # NETWORK OPTIMIZATIONS
-            chrome_options.add_argument("--aggressive")
-            chrome_options.add_argument("--disable-background-networking")
-
-            # LOGGING OPTIMIZATIONS (reduce console spam)
-            chrome_options.add_argument("--log-level=3")  # Only fatal errors
-            chrome_options.add_argument("--silent")
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-
-            # FASTER PREFERENCES
-            prefs = {
-                "profile.default_content_setting_values": {
-                    "notifications": 2,  # Block notifications
-                    "media_stream": 2,   # Block media access
-                    "geolocation": 2     # Block location access
-                },
-                "profile.managed_default_content_settings": {
-                    "images": 2          # Block images for faster loading
-                }
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
+        elif browser_name.lower() == "chrome":
+            profile_dir = cls._clone_profile() if Config.BROWSER_PROFILE_TEMPLATE_ENABLED else None
+            chrome_options = cls._chrome_options(headless, profile_dir)
 
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            service = Service(cls._resolve_driver_path("chrome"))
+            resolved_time = time.perf_counter()
+            try:
+                driver = webdriver.Chrome(service=service, options=chrome_options)
+            except Exception:
+                if profile_dir:
+                    cls._profile_template.remove(profile_dir)
+                raise
+            if profile_dir:
+                cls._profile_template.attach(driver, profile_dir)
 
         elif browser_name.lower() == "firefox":
             firefox_options = FirefoxOptions()
@@ -95,12 +73,283 @@ class DriverFactory:
             firefox_options.add_argument("--disable-extensions")
             firefox_options.add_argument("--disable-plugins")
 
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(cls._resolve_driver_path("firefox"))
+            resolved_time = time.perf_counter()
             driver = webdriver.Firefox(service=service, options=firefox_options)
 
+        if isinstance(recording, CommandRecorder):
+            recording.attach(driver)
+
+        if Config.DRIVER_METRICS_ENABLED:
+            cls.get_metrics().attach(driver)
+
         # OPTIMIZED TIMEOUTS - Shorter for better performance
         driver.maximize_window()
         driver.implicitly_wait(5)  # Reduced from 10 to 5 seconds
         driver.set_page_load_timeout(15)  # Add page load timeout
 
-        return driver
\ No newline at end of file
+        cls._record_startup(browser_name, start_time, resolved_time)
+        return driver
+
+    @classmethod
+    def _chrome_options(cls, headless, user_data_dir=None):
+        """Chrome options shared by test browsers and the profile warm-up browser"""
+        chrome_options = ChromeOptions()
+        if user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
+
+        # Basic options
+        if headless:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+
+        # PERFORMANCE OPTIMIZATIONS - These significantly reduce startup time
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-plugins")
+        # Images, fonts and third-party requests are blocked per page over CDP (utils/request_blocking.py)
+
+        # DISABLE ML/AI FEATURES (fixes TensorFlow warnings)
+        chrome_options.add_argument("--disable-features=VizDisplayCompositor")
+        chrome_options.add_argument("--disable-features=TranslateUI")
+        chrome_options.add_argument("--disable-features=BlinkGenPropertyTrees")
+        chrome_options.add_argument("--disable-machine-learning-model-download")
+        chrome_options.add_argument("--disable-component-extensions-with-background-pages")
+
+        # DISABLE UNNECESSARY FEATURES
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+        chrome_options.add_argument("--disable-client-side-phishing-detection")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-translate")
+        chrome_options.add_argument("--disable-ipc-flooding-protection")
+
+        # MEMORY AND CPU OPTIMIZATIONS
+        chrome_options.add_argument("--memory-pressure-off")
+        chrome_options.add_argument("--max_old_space_size=4096")
+        chrome_options.add_argument("--aggressive-cache-discard")
+
+        # NETWORK OPTIMIZATIONS
+        chrome_options.add_argument("--aggressive")
+        chrome_options.add_argument("--disable-background-networking")
+
+        # LOGGING OPTIMIZATIONS (reduce console spam)
+        chrome_options.add_argument("--log-level=3")  # Only fatal errors
+        chrome_options.add_argument("--silent")
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        # FASTER PREFERENCES
+        prefs = {
+            "profile.default_content_setting_values": {
+                "notifications": 2,  # Block notifications
+                "media_stream": 2,   # Block media access
+                "geolocation": 2     # Block location access
+            }
+        }
+        chrome_options.add_experimental_option("prefs", prefs)
+
+        # Network events in the performance log - blocked/loaded request counts
+        if Config.REQUEST_BLOCKING_ENABLED:
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+        return chrome_options
+
+    # =======================
+    # WARMED BROWSER PROFILE
+    # =======================
+
+    @classmethod
+    def get_profile_template(cls):
+        """Get the golden Chrome profile template, creating it on first use"""
+        if cls._profile_template is None:
+            cls._profile_template = BrowserProfileTemplate()
+            atexit.register(cls._profile_template.remove_own)
+        return cls._profile_template
+
+    @classmethod
+    def _clone_profile(cls):
+        """User-data-dir cloned from the warmed template (None if the template is unusable)"""
+        template = cls.get_profile_template()
+        try:
+            template.ensure_warm(cls._warm_profile)
+            return template.clone()
+        except Exception as e:
+            print(f"⚠ Browser profile template unavailable, using a fresh profile: {e}")
+            return None
+
+    @classmethod
+    def _warm_profile(cls, user_data_dir):
+        """Load the admin and every route once with the golden profile so the main bundle and
+        the lazy-loaded route bundles land in the disk cache"""
+        service = Service(cls._resolve_driver_path("chrome"))
+        driver = webdriver.Chrome(service=service, options=cls._chrome_options(True, user_data_dir))
+        try:
+            driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+            driver.get(f"{Config.BASE_URL.rstrip('/')}/#/auth")
+            page = BasePage(driver)
+            page.wait_for_app_idle()
+            cls._warm_routes(driver, page)
+            if Config.REQUEST_BLOCKING_ENABLED:
+                cls.get_request_blocker().collect(driver)  # Unblocked sizes for the bytes-saved estimate
+        finally:
+            driver.quit()
+
+    @classmethod
+    def _warm_routes(cls, driver, page):
+        """Visit every route in-app; guarded routes only load their bundles when logged in, so a
+        saved login is borrowed for the visit and cleared again before the profile is kept"""
+        store = AuthStateStore()
+        state = store.load(Config.BASE_URL) if Config.AUTH_STATE_ENABLED else None
+        logged_in = bool(state) and store.restore(driver, Config.BASE_URL, state)
+        try:
+            if logged_in:
+                driver.get(route_url("home"))
+                page.wait_for_app_idle()
+            for route in ROUTES:
+                driver.execute_script(HASH_NAVIGATE_SCRIPT, route_hash(route))
+                page.wait_for_app_idle()
+        except Exception as e:
+            print(f"⚠ Could not warm every admin route: {e}")
+        finally:
+            if logged_in:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+                driver.delete_all_cookies()
+
+    # =======================
+    # DRIVER BINARY RESOLUTION
+    # =======================
+
+    @classmethod
+    def _resolve_driver_path(cls, browser_name):
+        """Driver executable path - from the local cache unless it is disabled"""
+        if not Config.DRIVER_CACHE_ENABLED:
+            cls._last_resolve_source = "manager"
+            if browser_name == "firefox":
+                return GeckoDriverManager().install()
+            return ChromeDriverManager().install()
+
+        if cls._binary_cache is None:
+            cls._binary_cache = DriverBinaryCache()
+        path = cls._binary_cache.resolve(browser_name)
+        cls._last_resolve_source = cls._binary_cache.last_source
+        return path
+
+    @classmethod
+    def _record_startup(cls, browser_name, start_time, resolved_time):
+        """Keep per-launch timings for the startup report"""
+        cls.startup_stats.append({
+            "browser": browser_name.lower(),
+            "resolve_source": cls._last_resolve_source,
+            "resolve_seconds": resolved_time - start_time,
+            "launch_seconds": time.perf_counter() - resolved_time,
+        })
+
+    @classmethod
+    def startup_report(cls):
+        """Summarise browser startup time with and without the driver cache"""
+        if not cls.startup_stats:
+            return []
+
+        lines = [f"Browser launches: {len(cls.startup_stats)}"]
+        by_source = {}
+        for stat in cls.startup_stats:
+            by_source.setdefault(stat["resolve_source"], []).append(stat)
+
+        for source, stats in sorted(by_source.items()):
+            resolve = sum(s["resolve_seconds"] for s in stats) / len(stats)
+            launch = sum(s["launch_seconds"] for s in stats) / len(stats)
+            lines.append(f"  driver from {source:<8} x{len(stats):<3} "
+                         f"resolve {resolve * 1000:8.1f} ms   launch {launch:6.2f} s")
+
+        if cls._binary_cache is not None:
+            for browser in sorted({s["browser"] for s in cls.startup_stats}):
+                uncached = cls._binary_cache.download_seconds(browser)
+                if uncached:
+                    lines.append(f"  uncached {browser} driver resolution (last measured): {uncached * 1000:.1f} ms")
+
+        if cls._profile_template is not None:
+            lines.extend(cls._profile_template.report())
+        return lines
+
+    # =======================
+    # COMMAND METRICS
+    # =======================
+
+    @classmethod
+    def get_metrics(cls):
+        """Get the process-wide WebDriver command metrics, creating them on first use"""
+        if cls._metrics is None:
+            cls._metrics = DriverMetrics(Config.DRIVER_METRICS_FILE)
+        return cls._metrics
+
+    # =======================
+    # REQUEST BLOCKING
+    # =======================
+
+    @classmethod
+    def get_request_blocker(cls):
+        """Get the process-wide request blocker, creating it on first use"""
+        if cls._request_blocker is None:
+            cls._request_blocker = RequestBlocker(Config.RESOURCE_SIZES_FILE)
+        return cls._request_blocker
+
+    # =======================
+    # RECORD / REPLAY
+    # =======================
+
+    @classmethod
+    def get_command_recording(cls):
+        """Get the process-wide WebDriver recorder (Config.WEBDRIVER_RECORD_FILE) or replay
+        (Config.WEBDRIVER_REPLAY_FILE), creating it on first use; None when neither is set"""
+        if cls._command_recording is None:
+            if Config.WEBDRIVER_REPLAY_FILE:
+                cls._command_recording = CommandReplay(Config.WEBDRIVER_REPLAY_FILE)
+            elif Config.WEBDRIVER_RECORD_FILE:
+                cls._command_recording = CommandRecorder(Config.WEBDRIVER_RECORD_FILE)
+        return cls._command_recording
+
+    # =======================
+    # POOLED DRIVERS
+    # =======================
+
+    @classmethod
+    def get_pool(cls):
+        """Get the process-wide driver pool, creating it on first use"""
+        if cls._pool is None:
+            cls._pool = DriverPool(
+                cls.get_driver,
+                max_reuse=Config.DRIVER_POOL_MAX_REUSE,
+                # Recorded sessions are replayed in start order, so browsers only start when leased
+                warm_size=0 if cls.get_command_recording() else Config.DRIVER_POOL_WARM_SIZE,
+                max_warm_size=Config.DRIVER_POOL_WARM_MAX
+            )
+        return cls._pool
+
+    @classmethod
+    def lease_driver(cls, browser_name="chrome", headless=False):
+        """
+        Lease a reusable WebDriver from the pool
+
+        Args:
+            browser_name (str): Browser name (chrome, firefox, edge)
+            headless (bool): Run browser in headless mode
+
+        Returns:
+            WebDriver: Healthy, freshly reset WebDriver instance
+        """
+        return cls.get_pool().lease(browser_name, headless)
+
+    @classmethod
+    def release_driver(cls, driver):
+        """Return a leased WebDriver to the pool"""
+        cls.get_pool().release(driver)
+
+    @classmethod
+    def shutdown_pool(cls):
+        """Quit every pooled browser"""
+        if cls._pool is not None:
+            cls._pool.shutdown()
@@ -0,0 +1,382 @@
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.support.ui import WebDriverWait
+
+# WebDriver commands grouped the way we reason about test time
+COMMAND_KINDS = {
+    Command.FIND_ELEMENT: "find",
+    Command.FIND_ELEMENTS: "find",
+    Command.FIND_CHILD_ELEMENT: "find",
+    Command.FIND_CHILD_ELEMENTS: "find",
+    Command.CLICK_ELEMENT: "click",
+    Command.GET_ELEMENT_TEXT: "text",
+    Command.W3C_EXECUTE_SCRIPT: "execute_script",
+    Command.W3C_EXECUTE_SCRIPT_ASYNC: "execute_async_script",
+    Command.GET: "get",
+    Command.SEND_KEYS_TO_ELEMENT: "send_keys",
+    Command.GET_ELEMENT_ATTRIBUTE: "attribute",
+    Command.GET_ELEMENT_PROPERTY: "attribute",
+}
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+BACKGROUND = "<pool-warmup>"
+
+
+def bucket_labels():
+    labels = [f"<{bound}ms" for bound in HISTOGRAM_BUCKETS_MS]
+    labels.append(f">={HISTOGRAM_BUCKETS_MS[-1]}ms")
+    return labels
+
+
+class CommandBucket:
+    """Command counts, timings and latency histograms for one test (or the background)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.duration = None
+        self.by_kind = {}
+        self.by_method = {}
+        self.page_methods = {}
+        self.sleep_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    @property
+    def commands(self):
+        return sum(stats["count"] for stats in self.by_kind.values())
+
+    @property
+    def round_trip_seconds(self):
+        return sum(stats["seconds"] for stats in self.by_kind.values())
+
+    def add_command(self, kind, method, seconds):
+        stats = self.by_kind.setdefault(kind, {"count": 0, "seconds": 0.0,
+                                               "histogram": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)})
+        stats["count"] += 1
+        stats["seconds"] += seconds
+        stats["histogram"][self._bucket(seconds)] += 1
+
+        per_method = self.by_method.setdefault(method, {"count": 0, "seconds": 0.0})
+        per_method["count"] += 1
+        per_method["seconds"] += seconds
+
+    def add_page_method(self, method, seconds):
+        stats = self.page_methods.setdefault(method, {"calls": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+
+    def to_dict(self):
+        labels = bucket_labels()
+        return {
+            "test": self.name,
+            "duration": round(self.duration, 4) if self.duration is not None else None,
+            "commands": self.commands,
+            "round_trip_seconds": round(self.round_trip_seconds, 4),
+            "sleep_seconds": round(self.sleep_seconds, 4),
+            "wait_seconds": round(self.wait_seconds, 4),
+            "by_kind": {
+                kind: {
+                    "count": stats["count"],
+                    "seconds": round(stats["seconds"], 4),
+                    "histogram": dict(zip(labels, stats["histogram"])),
+                }
+                for kind, stats in sorted(self.by_kind.items())
+            },
+            "by_method": {
+                method: {"count": stats["count"], "seconds": round(stats["seconds"], 4)}
+                for method, stats in sorted(self.by_method.items(), key=lambda item: -item[1]["seconds"])
+            },
+            "page_methods": {
+                method: {"calls": stats["calls"], "seconds": round(stats["seconds"], 4)}
+                for method, stats in sorted(self.page_methods.items(), key=lambda item: -item[1]["seconds"])
+            },
+        }
+
+    @staticmethod
+    def _bucket(seconds):
+        ms = seconds * 1000
+        for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if ms < bound:
+                return index
+        return len(HISTOGRAM_BUCKETS_MS)
+
+
+class DriverMetrics:
+    """Counts and times every WebDriver command and attributes it to the calling page method
+
+    Drivers are instrumented by wrapping their `execute` method, which every WebDriver and
+    WebElement command goes through. Commands are attributed to the outermost page-object
+    method on the call stack (e.g. ProductsPage.sort_by_column), falling back to the test or
+    fixture function. Commands issued by background pool threads go to a separate bucket.
+
+    While a test is active `WebDriverWait.until` is timed as well and explicit sleeps are fed
+    in through `record_sleep` (see SleepProfiler), so each test record has command,
+    round-trip, sleep and wait totals. With page timers installed, the wall time of every
+    page-object method call is kept too (nested calls included, so both open_route and the
+    wait_for_page_load it runs show up) - the per-method numbers the regression gate compares.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): JSON-lines file receiving one record per finished test
+        """
+        self.path = path
+        self.current = None
+        self.finished = []
+        self.background = CommandBucket(BACKGROUND)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._originals = None
+        self._page_originals = {}
+        self._file_ready = False
+
+    # =======================
+    # DRIVER WRAPPING
+    # =======================
+
+    def attach(self, driver):
+        """Instrument a driver in place (idempotent)"""
+        if getattr(driver, "_command_metrics", None) is self:
+            return driver
+
+        original = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                self.record_command(driver_command, time.perf_counter() - start)
+
+        driver.execute = timed_execute
+        driver._command_metrics = self
+        return driver
+
+    def record_command(self, driver_command, seconds):
+        kind = COMMAND_KINDS.get(driver_command, driver_command)
+        background = threading.current_thread().name.startswith("driver-pool")
+        method = BACKGROUND if background else self._caller()
+
+        with self._lock:
+            bucket = self.background if background or self.current is None else self.current
+            bucket.add_command(kind, method, seconds)
+            if kind == "execute_async_script" and bucket is self.current:
+                # Async scripts are our event-driven waits (app idle, table settle)
+                bucket.wait_seconds += seconds
+
+    def _caller(self):
+        """Outermost page-object method on the stack, else the nearest test/fixture function"""
+        frame = sys._getframe(3)
+        page_method = None
+        fallback = None
+
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module.startswith("pages."):
+                owner = frame.f_locals.get("self")
+                owner_name = type(owner).__name__ if owner is not None else module.split(".")[-1]
+                page_method = f"{owner_name}.{frame.f_code.co_name}"
+            elif fallback is None and not module.startswith(("selenium", "utils.driver_instrumentation")):
+                fallback = f"{module.split('.')[-1]}.{frame.f_code.co_name}"
+            frame = frame.f_back
+
+        return page_method or fallback or "<unknown>"
+
+    # =======================
+    # SLEEP AND WAIT TIMING
+    # =======================
+
+    def install_timers(self):
+        """Time WebDriverWait.until/until_not for the active test"""
+        if self._originals is not None:
+            return
+
+        self._originals = (WebDriverWait.until, WebDriverWait.until_not)
+        original_until, original_until_not = self._originals
+        metrics = self
+
+        def timed_wait(original):
+            def wrapper(wait, method, message=""):
+                depth = getattr(metrics._local, "wait_depth", 0)
+                metrics._local.wait_depth = depth + 1
+                start = time.perf_counter()
+                try:
+                    return original(wait, method, message)
+                finally:
+                    metrics._local.wait_depth = depth
+                    if depth == 0:
+                        metrics.record_wait(time.perf_counter() - start)
+            return wrapper
+
+        WebDriverWait.until = timed_wait(original_until)
+        WebDriverWait.until_not = timed_wait(original_until_not)
+
+    def uninstall_timers(self):
+        if self._originals is not None:
+            WebDriverWait.until, WebDriverWait.until_not = self._originals
+            self._originals = None
+        for (page_class, name), original in self._page_originals.items():
+            setattr(page_class, name, original)
+        self._page_originals = {}
+
+    def install_page_timers(self, base_class):
+        """Time the methods of base_class and all its subclasses imported so far
+
+        Call again once more page modules are imported (idempotent). Methods are recorded as
+        <class of the instance>.<method>, the naming command attribution uses.
+        """
+        classes = [base_class]
+        for page_class in classes:
+            classes.extend(page_class.__subclasses__())
+            for name, function in list(vars(page_class).items()):
+                if name.startswith("__") or not inspect.isfunction(function):
+                    continue
+                if (page_class, name) in self._page_originals:
+                    continue
+                self._page_originals[(page_class, name)] = function
+                setattr(page_class, name, self._timed_page_method(function))
+
+    def _timed_page_method(self, function):
+        metrics = self
+
+        @functools.wraps(function)
+        def wrapper(page, *args, **kwargs):
+            method = f"{type(page).__name__}.{function.__name__}"
+            active = metrics._local.__dict__.setdefault("page_methods", set())
+            if method in active:
+                # An override calling super() - the outer call already covers it
+                return function(page, *args, **kwargs)
+            active.add(method)
+            start = time.perf_counter()
+            try:
+                return function(page, *args, **kwargs)
+            finally:
+                active.discard(method)
+                metrics.record_page_method(method, time.perf_counter() - start)
+        return wrapper
+
+    def record_page_method(self, method, seconds):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        with self._lock:
+            if self.current is not None:
+                self.current.add_page_method(method, seconds)
+
+    def record_sleep(self, seconds):
+        """Add an explicit time.sleep to the active test"""
+        if threading.current_thread() is not threading.main_thread():
+            return
+        with self._lock:
+            if self.current is not None:
+                self.current.sleep_seconds += seconds
+
+    def record_wait(self, seconds):
+        if threading.current_thread() is not threading.main_thread():
+            return
+        with self._lock:
+            if self.current is not None:
+                self.current.wait_seconds += seconds
+
+    # =======================
+    # PER-TEST LIFECYCLE
+    # =======================
+
+    def start_test(self, nodeid):
+        with self._lock:
+            self.current = CommandBucket(nodeid)
+
+    def finish_test(self):
+        """Close the active test record and append it to the JSON-lines file"""
+        with self._lock:
+            bucket, self.current = self.current, None
+        if bucket is None:
+            return None
+
+        bucket.duration = time.perf_counter() - bucket.started
+        self.finished.append(bucket)
+        self._write(bucket)
+        return bucket
+
+    def close(self):
+        """Write the background bucket once the session is over"""
+        if self.background.commands:
+            self.background.duration = time.perf_counter() - self.background.started
+            self._write(self.background)
+        self.uninstall_timers()
+
+    def _write(self, bucket):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            mode = "a" if self._file_ready else "w"
+            with open(self.path, mode, encoding="utf-8") as handle:
+                handle.write(json.dumps(bucket.to_dict()) + "\n")
+            self._file_ready = True
+        except OSError as e:
+            print(f"⚠ Could not write driver metrics: {e}")
+
+    # =======================
+    # REPORTING
+    # =======================
+
+    def report(self, top=10):
+        """Session totals, per-command histograms and the most expensive methods and tests"""
+        tests = self.finished
+        if not any(t.commands for t in tests):
+            return []
+
+        commands = sum(t.commands for t in tests)
+        round_trip = sum(t.round_trip_seconds for t in tests)
+        sleep = sum(t.sleep_seconds for t in tests)
+        wait = sum(t.wait_seconds for t in tests)
+        wall = sum(t.duration or 0 for t in tests)
+        lines = [
+            f"tests={len(tests)} commands={commands} round-trip {round_trip:.2f}s  "
+            f"sleep {sleep:.2f}s  wait {wait:.2f}s  test wall time {wall:.2f}s",
+        ]
+
+        by_kind = {}
+        by_method = {}
+        for bucket in tests:
+            for kind, stats in bucket.by_kind.items():
+                total = by_kind.setdefault(kind, {"count": 0, "seconds": 0.0,
+                                                  "histogram": [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)})
+                total["count"] += stats["count"]
+                total["seconds"] += stats["seconds"]
+                total["histogram"] = [a + b for a, b in zip(total["histogram"], stats["histogram"])]
+            for method, stats in bucket.by_method.items():
+                total = by_method.setdefault(method, {"count": 0, "seconds": 0.0})
+                total["count"] += stats["count"]
+                total["seconds"] += stats["seconds"]
+
+        labels = bucket_labels()
+        lines.append(f"  {'command':<22}{'count':>8}{'total':>10}{'avg':>9}   latency histogram")
+        for kind, stats in sorted(by_kind.items(), key=lambda item: -item[1]["seconds"]):
+            histogram = " ".join(f"{label}:{count}" for label, count in zip(labels, stats["histogram"]) if count)
+            lines.append(f"  {kind:<22}{stats['count']:>8}{stats['seconds']:>9.2f}s"
+                         f"{stats['seconds'] / stats['count'] * 1000:>7.1f}ms   {histogram}")
+
+        lines.append(f"  top {top} page methods by round-trip time:")
+        for method, stats in sorted(by_method.items(), key=lambda item: -item[1]["seconds"])[:top]:
+            lines.append(f"    {stats['seconds']:8.2f}s {stats['count']:>6} cmds  {method}")
+
+        lines.append(f"  slowest tests:")
+        for bucket in sorted(tests, key=lambda t: -(t.duration or 0))[:5]:
+            lines.append(f"    {bucket.duration:8.2f}s {bucket.commands:>6} cmds  "
+                         f"sleep {bucket.sleep_seconds:5.1f}s  wait {bucket.wait_seconds:5.1f}s  {bucket.name}")
+
+        if self.background.commands:
+            lines.append(f"  background (pool warm-up): {self.background.commands} commands, "
+                         f"{self.background.round_trip_seconds:.2f}s")
+        lines.append(f"  per-test records: {self.path}")
+        return lines
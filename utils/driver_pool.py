@@ -0,0 +1,427 @@
+import collections
+import math
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+
+
+class PooledDriver:
+    """A live browser session owned by the pool"""
+
+    def __init__(self, driver, key):
+        self.driver = driver
+        self.key = key
+        self.leases = 0
+        self.created_at = time.time()
+        self.primary_handle = None
+        self.window_size = None
+        self.prepared = False
+
+
+class DriverPool:
+    """Session-wide pool that leases live browsers to tests instead of relaunching them
+
+    Browsers are keyed by (browser_name, headless). Between leases every browser is
+    reset (cookies, localStorage, sessionStorage, extra windows, URL) and it is retired
+    after `max_reuse` leases or as soon as a health check fails.
+
+    With `warm_size` > 0 the pool keeps spare browsers warming in background threads:
+    new browsers are launched and released ones are reset there, then handed to the
+    `prepare` hook (log in, open the admin shell) so a lease is served with near-zero
+    wait. The number of spares grows with the lease rate, up to `max_warm_size`.
+    """
+
+    DEMAND_WINDOW = 20  # Recent leases used to estimate the consumption rate
+
+    def __init__(self, factory, max_reuse=50, warm_size=0, max_warm_size=None,
+                 prepare=None, wait_timeout=60):
+        """
+        Args:
+            factory (callable): factory(browser_name, headless) -> WebDriver
+            max_reuse (int): Number of leases before a browser is recycled
+            warm_size (int): Minimum spare browsers kept warm per key (0 = no warming)
+            max_warm_size (int): Upper bound for the adaptive spare count
+            prepare (callable): prepare(driver) -> bool, run on spare browsers in the background
+            wait_timeout (float): Seconds a lease waits for a warming browser before launching one
+        """
+        self._factory = factory
+        self.max_reuse = max_reuse
+        self.warm_size = warm_size
+        self.max_warm_size = max(warm_size, max_warm_size or warm_size)
+        self.prepare = prepare
+        self.wait_timeout = wait_timeout
+        self._idle = {}
+        self._leased = {}
+        self._warming = {}
+        self._lease_times = {}
+        self._threads = []
+        self._warm_seconds = None
+        self._closed = False
+        self._lock = threading.Condition()
+        self.stats = {
+            "leases": 0,
+            "launches": 0,
+            "reused": 0,
+            "recycled": 0,
+            "unhealthy": 0,
+            "reset_failures": 0,
+        }
+        self.metrics = {
+            "hits": 0,
+            "waits": 0,
+            "misses": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    # =======================
+    # LEASING
+    # =======================
+
+    def lease(self, browser_name="chrome", headless=False):
+        """Lease a healthy browser - idle first, then a warming one, then a cold launch"""
+        key = (browser_name.lower(), bool(headless))
+        start = time.perf_counter()
+        waited = False
+
+        with self._lock:
+            self._lease_times.setdefault(key, collections.deque(maxlen=self.DEMAND_WINDOW)).append(time.time())
+
+        while True:
+            entry, had_to_wait = self._take_idle(key)
+            waited = waited or had_to_wait
+
+            if entry is None:
+                entry = self._launch(key)
+                outcome = "misses"
+                break
+
+            if self._is_healthy(entry.driver):
+                self._count("reused")
+                outcome = "waits" if waited else "hits"
+                break
+
+            print("⚠ Pooled browser failed health check, discarding it")
+            self._count("unhealthy")
+            self._quit(entry)
+
+        wait_seconds = time.perf_counter() - start
+        with self._lock:
+            self.metrics[outcome] += 1
+            self.metrics["wait_seconds"] += wait_seconds
+            self.metrics["max_wait_seconds"] = max(self.metrics["max_wait_seconds"], wait_seconds)
+            entry.leases += 1
+            self.stats["leases"] += 1
+            self._leased[id(entry.driver)] = entry
+
+        self._replenish(key)
+        return entry.driver
+
+    def release(self, driver):
+        """Return a leased browser to the pool after resetting its state"""
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+
+        if entry is None:
+            # Not one of ours - nothing to reuse
+            self._quit_driver(driver)
+            return
+
+        if entry.leases >= self.max_reuse:
+            self._count("recycled")
+            self._quit(entry)
+            self._replenish(entry.key)
+            return
+
+        if self.warm_size:
+            # Reset and re-prepare in the background so teardown does not block
+            self._start_worker(entry.key, self._recycle, entry)
+            return
+
+        entry.prepared = False
+        if not self._reset(entry):
+            self._count("reset_failures")
+            self._quit(entry)
+            return
+
+        self._add_idle(entry)
+
+    def discard(self, driver):
+        """Quit a leased browser instead of returning it to the pool"""
+        with self._lock:
+            entry = self._leased.pop(id(driver), None)
+        if entry:
+            self._quit(entry)
+        else:
+            self._quit_driver(driver)
+
+    def is_prepared(self, driver):
+        """True when the leased browser already went through the prepare hook"""
+        with self._lock:
+            entry = self._leased.get(id(driver))
+        return bool(entry and entry.prepared)
+
+    def start_warming(self, browser_name="chrome", headless=False):
+        """Begin filling the pool with spare browsers before the first lease"""
+        self._replenish((browser_name.lower(), bool(headless)))
+
+    def shutdown(self, join_timeout=30):
+        """Quit every browser owned by the pool, including ones still warming"""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+            self._lock.notify_all()
+
+        for thread in threads:
+            thread.join(join_timeout)
+
+        with self._lock:
+            entries = [entry for idle in self._idle.values() for entry in idle]
+            entries.extend(self._leased.values())
+            self._idle.clear()
+            self._leased.clear()
+
+        for entry in entries:
+            self._quit(entry)
+
+    def idle_count(self, browser_name=None, headless=None):
+        """Number of idle browsers, optionally for a single key"""
+        with self._lock:
+            if browser_name is None:
+                return sum(len(idle) for idle in self._idle.values())
+            return len(self._idle.get((browser_name.lower(), bool(headless)), []))
+
+    def summary(self):
+        """One-line pool statistics for the end-of-session report"""
+        return (f"leases={self.stats['leases']} launches={self.stats['launches']} "
+                f"reused={self.stats['reused']} recycled={self.stats['recycled']} "
+                f"unhealthy={self.stats['unhealthy']} reset_failures={self.stats['reset_failures']}")
+
+    def metrics_report(self):
+        """Pool hit/miss and lease wait metrics"""
+        leases = self.stats["leases"]
+        if not leases:
+            return []
+
+        hit_rate = self.metrics["hits"] / leases * 100
+        return [
+            self.summary(),
+            f"hits={self.metrics['hits']} waits={self.metrics['waits']} misses={self.metrics['misses']} "
+            f"(hit rate {hit_rate:.0f}%)",
+            f"lease wait: total {self.metrics['wait_seconds']:.2f}s  "
+            f"avg {self.metrics['wait_seconds'] / leases * 1000:.0f}ms  "
+            f"max {self.metrics['max_wait_seconds'] * 1000:.0f}ms",
+        ]
+
+    # =======================
+    # BACKGROUND WARMING
+    # =======================
+
+    def target_spares(self, key):
+        """Spare browsers wanted for a key: lease rate x warm-up time, within bounds"""
+        if not self.warm_size:
+            return 0
+
+        with self._lock:
+            times = list(self._lease_times.get(key, []))
+            warm_seconds = self._warm_seconds
+
+        if len(times) < 2 or not warm_seconds:
+            return self.warm_size
+
+        span = times[-1] - times[0]
+        if span <= 0:
+            return self.max_warm_size
+
+        rate = (len(times) - 1) / span
+        wanted = math.ceil(rate * warm_seconds) + 1
+        return max(self.warm_size, min(self.max_warm_size, wanted))
+
+    def _replenish(self, key):
+        """Start warmers until idle + warming browsers reach the target"""
+        target = self.target_spares(key)
+
+        with self._lock:
+            if self._closed:
+                return
+            have = len(self._idle.get(key, [])) + self._warming.get(key, 0)
+            missing = target - have
+
+        for _ in range(missing):
+            self._start_worker(key, self._warm_new, key)
+
+    def _start_worker(self, key, target, argument):
+        with self._lock:
+            if self._closed:
+                return
+            self._warming[key] = self._warming.get(key, 0) + 1
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            thread = threading.Thread(target=self._run_worker, args=(key, target, argument),
+                                      name="driver-pool-warmer", daemon=True)
+            self._threads.append(thread)
+        thread.start()
+
+    def _run_worker(self, key, target, argument):
+        try:
+            target(argument)
+        except Exception as e:
+            print(f"⚠ Background browser warm-up failed: {e}")
+        finally:
+            with self._lock:
+                self._warming[key] -= 1
+                self._lock.notify_all()
+
+    def _warm_new(self, key):
+        """Launch and prepare a spare browser"""
+        start = time.perf_counter()
+        entry = self._launch(key)
+        self._prepare(entry)
+        self._record_warm_time(time.perf_counter() - start)
+        self._add_idle(entry)
+
+    def _recycle(self, entry):
+        """Reset and re-prepare a released browser"""
+        entry.prepared = False
+        if not self._reset(entry):
+            self._count("reset_failures")
+            self._quit(entry)
+            return
+        self._prepare(entry)
+        self._add_idle(entry)
+
+    def _prepare(self, entry):
+        if self.prepare is None:
+            return
+        try:
+            entry.prepared = bool(self.prepare(entry.driver))
+        except Exception as e:
+            print(f"⚠ Browser prepare hook failed: {e}")
+            entry.prepared = False
+
+    def _record_warm_time(self, seconds):
+        with self._lock:
+            if self._warm_seconds is None:
+                self._warm_seconds = seconds
+            else:
+                self._warm_seconds = 0.7 * self._warm_seconds + 0.3 * seconds
+
+    # =======================
+    # INTERNAL HELPERS
+    # =======================
+
+    def _count(self, name):
+        """Bump a stats counter - warmer threads update them too"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def _take_idle(self, key):
+        """Pop an idle browser, waiting for one that is warming if necessary"""
+        waited = False
+        deadline = time.monotonic() + self.wait_timeout
+
+        with self._lock:
+            while True:
+                idle = self._idle.get(key)
+                if idle:
+                    return idle.pop(0), waited
+
+                remaining = deadline - time.monotonic()
+                if not self._warming.get(key) or remaining <= 0 or self._closed:
+                    return None, waited
+
+                waited = True
+                self._lock.wait(remaining)
+
+    def _add_idle(self, entry):
+        with self._lock:
+            if not self._closed:
+                self._idle.setdefault(entry.key, []).append(entry)
+                self._lock.notify_all()
+                return
+        self._quit(entry)
+
+    def _launch(self, key):
+        """Start a new browser for the given key"""
+        browser_name, headless = key
+        driver = self._factory(browser_name, headless)
+        entry = PooledDriver(driver, key)
+        try:
+            entry.primary_handle = driver.current_window_handle
+            entry.window_size = driver.get_window_size()
+        except WebDriverException:
+            pass
+        self._count("launches")
+        return entry
+
+    def _is_healthy(self, driver):
+        """Cheap liveness probe - a dead session raises on any command"""
+        try:
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _reset(self, entry):
+        """Bring a browser back to a blank state between leases"""
+        try:
+            self._reset_state(entry)
+            return True
+        except Exception:
+            pass
+
+        # A leftover alert blocks every command - dismiss it and try once more
+        try:
+            entry.driver.switch_to.alert.dismiss()
+        except Exception:
+            pass
+
+        try:
+            self._reset_state(entry)
+            return True
+        except Exception as e:
+            print(f"⚠ Browser reset failed: {e}")
+            return False
+
+    def _reset_state(self, entry):
+        """Close extra windows, clear storage and cookies and park on about:blank"""
+        driver = entry.driver
+
+        # Close every window except the primary one
+        handles = driver.window_handles
+        primary = entry.primary_handle if entry.primary_handle in handles else handles[0]
+        if len(handles) > 1:
+            for handle in handles:
+                if handle != primary:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            driver.switch_to.window(primary)
+        entry.primary_handle = primary
+
+        # Storage is per origin, so clear it before leaving the page
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        self._clear_cookies(driver)
+
+        if entry.window_size and driver.get_window_size() != entry.window_size:
+            driver.set_window_size(entry.window_size["width"], entry.window_size["height"])
+
+        driver.get("about:blank")
+
+    def _clear_cookies(self, driver):
+        """Clear cookies for every domain where the browser allows it"""
+        if hasattr(driver, "execute_cdp_cmd"):
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                return
+            except Exception:
+                pass
+        driver.delete_all_cookies()
+
+    def _quit(self, entry):
+        self._quit_driver(entry.driver)
+
+    def _quit_driver(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
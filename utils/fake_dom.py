@@ -0,0 +1,942 @@
+# utils/fake_dom.py
+"""
+In-memory DOM for the fake WebDriver (utils/fake_webdriver.py)
+
+Parses HTML fixtures with the standard library parser into a small element tree and
+queries it with a CSS and XPath subset - the locators the page objects use:
+
+- CSS: tag, #id, .class, [attr], [attr=|*=|^=|$=|~=value], *, the descendant / > / + / ~
+  combinators, selector lists and :not(), :checked, :disabled, :enabled, :empty,
+  :first-child, :last-child, :first-of-type, :nth-child(an+b), :nth-of-type(an+b)
+- XPath: / and // paths, the child/descendant/parent/ancestor/sibling/self axes, .., *,
+  and predicates with @attr, text(), ., position, contains(), starts-with(),
+  normalize-space(), not(), =, !=, and, or
+
+Anything else raises InvalidSelector, so a test never silently matches nothing.
+"""
+
+import re
+from functools import lru_cache
+from html import escape
+from html.parser import HTMLParser
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source",
+             "track", "wbr"}
+
+# Start tags that implicitly close an open element of the same group (li, tr, td, ...)
+IMPLIED_END = {"li": {"li"}, "tr": {"tr", "td", "th"}, "td": {"td", "th"}, "th": {"td", "th"},
+               "option": {"option"}, "p": {"p"}}
+
+# Rendered on their own line in visible text
+BLOCK_TAGS = {"address", "article", "aside", "blockquote", "dd", "div", "dl", "dt", "fieldset", "figure",
+              "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol",
+              "p", "pre", "section", "table", "tbody", "thead", "tfoot", "tr", "ul", "nb-card", "nb-card-header",
+              "nb-card-body", "nb-layout-header", "nb-sidebar"}
+
+NEVER_RENDERED = {"head", "script", "style", "template", "title", "meta", "link", "noscript"}
+
+BOOLEAN_ATTRIBUTES = {"checked", "disabled", "hidden", "multiple", "readonly", "required", "selected",
+                      "autofocus", "novalidate"}
+
+HIDDEN_STYLE = re.compile(r"(?:^|;)\s*(?:display\s*:\s*none|visibility\s*:\s*hidden)", re.I)
+
+
+class InvalidSelector(ValueError):
+    """A CSS or XPath expression outside the supported subset"""
+
+
+# =======================
+# NODES
+# =======================
+
+class Node:
+    """An element, text node (tag '#text') or document (tag '#document')"""
+
+    __slots__ = ("tag", "is_element", "attrs", "children", "parent", "data", "_value", "_checked", "owner")
+
+    def __init__(self, tag, attrs=None, data="", owner=None):
+        self.tag = tag
+        self.is_element = not tag.startswith("#")
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = None
+        self.data = data
+        self._value = None  # None: still the value attribute / textarea text
+        self._checked = None
+        self.owner = owner  # Mutation listener: owner.mutated(node)
+
+    def __repr__(self):
+        if self.tag == "#text":
+            return f"<text {self.data[:20]!r}>"
+        attrs = "".join(f" {name}={value!r}" for name, value in list(self.attrs.items())[:3])
+        return f"<{self.tag}{attrs}>"
+
+    # ---- attributes and state ----
+
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+    def set(self, name, value):
+        if value is None:
+            self.attrs.pop(name, None)
+        else:
+            self.attrs[name] = str(value)
+        self._mutated()
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def has_class(self, name):
+        return name in self.classes
+
+    def add_class(self, name):
+        if name not in self.classes:
+            self.set("class", " ".join(self.classes + [name]))
+
+    def remove_class(self, name):
+        if name in self.classes:
+            self.set("class", " ".join(c for c in self.classes if c != name))
+
+    @property
+    def value(self):
+        if self._value is not None:
+            return self._value
+        if self.tag == "textarea":
+            return self.text_content
+        if self.tag == "select":
+            selected = [option for option in self.select("option") if option.checked] or self.select("option")[:1]
+            return selected[0].value if selected else ""
+        if self.tag == "option" and "value" not in self.attrs:
+            return self.text_content.strip()
+        return self.attrs.get("value", "")
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    @property
+    def checked(self):
+        """checked for checkboxes/radios, selected for options"""
+        if self._checked is not None:
+            return self._checked
+        return ("selected" if self.tag == "option" else "checked") in self.attrs
+
+    @checked.setter
+    def checked(self, checked):
+        self._checked = bool(checked)
+
+    @property
+    def disabled(self):
+        node = self
+        while node is not None and node.is_element:
+            if "disabled" in node.attrs and node.tag in ("button", "input", "select", "textarea", "option",
+                                                          "fieldset", "optgroup"):
+                return True
+            node = node.parent
+        return False
+
+    # ---- tree ----
+
+    @property
+    def elements(self):
+        return [child for child in self.children if child.is_element]
+
+    def iter(self):
+        """Descendant elements in document order (self excluded)"""
+        stack = self.children[::-1]
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            node = pop()
+            if node.is_element:
+                yield node
+                if node.children:
+                    extend(node.children[::-1])
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None and node.is_element:
+            yield node
+            node = node.parent
+
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def closest(self, css):
+        node = self
+        while node is not None and node.is_element:
+            if node.matches(css):
+                return node
+            node = node.parent
+        return None
+
+    def append(self, child):
+        if child.parent is not None:
+            child.parent.children.remove(child)
+        child.parent = self
+        self.children.append(child)
+        self._mutated()
+        return child
+
+    def remove(self):
+        if self.parent is not None:
+            parent = self.parent
+            parent.children.remove(self)
+            self.parent = None
+            parent._mutated()
+
+    def replace_children(self, children):
+        for child in self.children:
+            child.parent = None
+        self.children = []
+        for child in children:
+            if child.parent is not None:
+                child.parent.children.remove(child)
+            child.parent = self
+            self.children.append(child)
+        self._mutated()
+
+    def _mutated(self):
+        if self.owner is not None:
+            self.owner.mutated(self)
+
+    # ---- text and markup ----
+
+    @property
+    def text_content(self):
+        if self.tag == "#text":
+            return self.data
+        return "".join(child.text_content for child in self.children)
+
+    @property
+    def inner_html(self):
+        return "".join(child.outer_html for child in self.children)
+
+    @inner_html.setter
+    def inner_html(self, html):
+        self.replace_children(parse_fragment(html, self.owner))
+
+    @property
+    def outer_html(self):
+        if self.tag == "#text":
+            return self.data if self.parent is not None and self.parent.tag in ("script", "style") \
+                else escape(self.data, quote=False)
+        if self.tag == "#document":
+            return self.inner_html
+        attrs = "".join(f' {name}="{escape(value)}"' if value != "" or name not in BOOLEAN_ATTRIBUTES
+                        else f" {name}" for name, value in self.attrs.items())
+        if self.tag in VOID_TAGS:
+            return f"<{self.tag}{attrs}>"
+        return f"<{self.tag}{attrs}>{self.inner_html}</{self.tag}>"
+
+    # ---- queries ----
+
+    def matches(self, css):
+        return self.is_element and any(_match_complex(self, parts) for parts in parse_css(css))
+
+    def select(self, css):
+        """Descendant elements matching a CSS selector, in document order"""
+        selectors, subjects = parse_css(css), _subjects(css)
+        return [node for node in self.iter()
+                if _may_match(node, subjects) and any(_match_complex(node, parts) for parts in selectors)]
+
+    def select_one(self, css):
+        selectors, subjects = parse_css(css), _subjects(css)
+        for node in self.iter():
+            if _may_match(node, subjects) and any(_match_complex(node, parts) for parts in selectors):
+                return node
+        return None
+
+    def xpath(self, expression):
+        """Elements matching an XPath expression, with this node as the context node"""
+        return evaluate_xpath(self, expression)
+
+
+# =======================
+# PARSING
+# =======================
+
+class _TreeBuilder(HTMLParser):
+
+    def __init__(self, owner):
+        super().__init__(convert_charrefs=True)
+        self.owner = owner
+        self.document = Node("#document", owner=None)
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag, attrs):
+        implied = IMPLIED_END.get(tag)
+        if implied:
+            for index in range(len(self.stack) - 1, 0, -1):
+                if self.stack[index].tag in implied:
+                    del self.stack[index:]
+                    break
+                if self.stack[index].tag in ("table", "tbody", "thead", "ul", "ol", "select"):
+                    break
+        if tag == "tr" and self.stack[-1].tag == "table":
+            self._push(Node("tbody", owner=self.owner))
+        node = Node(tag, {name: "" if value is None else value for name, value in attrs}, owner=self.owner)
+        self.stack[-1].children.append(node)
+        node.parent = self.stack[-1]
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.stack[-1].tag == tag:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        if not data:
+            return
+        text = Node("#text", data=data, owner=self.owner)
+        text.parent = self.stack[-1]
+        self.stack[-1].children.append(text)
+
+    def _push(self, node):
+        node.parent = self.stack[-1]
+        self.stack[-1].children.append(node)
+        self.stack.append(node)
+
+
+def _parse(html, owner):
+    builder = _TreeBuilder(owner)
+    builder.feed(html)
+    builder.close()
+    return builder.document
+
+
+def parse_fragment(html, owner=None):
+    """Top-level nodes of an HTML fragment (not attached anywhere)"""
+    nodes = list(_parse(html, owner).children)
+    for node in nodes:
+        node.parent = None
+    return nodes
+
+
+def parse_document(html, owner=None):
+    """A document with html, head and body, like a browser builds from any markup"""
+    document = _parse(html, owner)
+    document.owner = owner
+    html_node = next((node for node in document.elements if node.tag == "html"), None)
+    if html_node is None:
+        content = list(document.children)
+        document.children = []
+        html_node = Node("html", owner=owner)
+        html_node.parent = document
+        document.children.append(html_node)
+        head, body = Node("head", owner=owner), Node("body", owner=owner)
+        for node in (head, body):
+            node.parent = html_node
+            html_node.children.append(node)
+        for node in content:
+            target = head if node.tag in ("title", "meta", "link", "base") else body
+            node.parent = target
+            target.children.append(node)
+    elif not any(node.tag == "body" for node in html_node.elements):
+        body = Node("body", owner=owner)
+        body.children = [node for node in html_node.children if node.tag != "head"]
+        html_node.children = [node for node in html_node.children if node.tag == "head"] + [body]
+        body.parent = html_node
+        for node in body.children:
+            node.parent = body
+    return document
+
+
+# =======================
+# VISIBILITY AND TEXT
+# =======================
+
+def is_hidden_self(node, hidden_selectors=()):
+    """Hidden by the node itself (not its ancestors)"""
+    if node.tag in NEVER_RENDERED or "hidden" in node.attrs:
+        return True
+    if node.tag == "input" and node.attrs.get("type", "").lower() == "hidden":
+        return True
+    if HIDDEN_STYLE.search(node.attrs.get("style", "")):
+        return True
+    return any(node.matches(css) for css in hidden_selectors)
+
+
+def is_displayed(node, hidden_selectors=()):
+    """Roughly Selenium's isDisplayed: attached and neither it nor an ancestor is hidden"""
+    if node.root().tag != "#document":
+        return False
+    return not any(is_hidden_self(each, hidden_selectors) for each in [node] + list(node.ancestors()))
+
+
+def visible_text(node, hidden_selectors=()):
+    """Rendered text like WebElement.text / innerText: block elements on their own lines,
+    whitespace collapsed, hidden elements skipped"""
+    parts = []
+
+    def walk(current):
+        if current.tag == "#text":
+            parts.append(current.data)
+            return
+        if is_hidden_self(current, hidden_selectors):
+            return
+        if current.tag == "br":
+            parts.append("\n")
+            return
+        block = current.tag in BLOCK_TAGS
+        if block:
+            parts.append("\n")
+        for child in current.children:
+            walk(child)
+        if block:
+            parts.append("\n")
+        elif current.tag in ("td", "th"):
+            parts.append(" ")
+
+    if node.tag == "#text":
+        return node.data.strip()
+    for child in node.children:
+        walk(child)
+    lines = (re.sub(r"[ \t\r\f\v ]+", " ", line).strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+# =======================
+# CSS SELECTORS
+# =======================
+
+_CSS_TOKEN = re.compile(r"""
+    \s*(?P<combinator>[>+~])\s*
+  | (?P<space>\s+)
+  | (?P<comma>\s*,\s*)
+  | (?P<star>\*)
+  | (?P<tag>[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~|]?=)\s*(?P<val>"[^"]*"|'[^']*'|[^\]\s]+))?\s*(?P<flag>[iI])?\s*\]
+  | :(?P<pseudo>[\w-]+)(?:\((?P<arg>(?:[^()]|\([^()]*\))*)\))?
+""", re.X)
+
+PSEUDOS = {"not", "checked", "disabled", "enabled", "empty", "first-child", "last-child", "first-of-type",
+           "last-of-type", "nth-child", "nth-of-type", "only-child"}
+
+
+class _Compound:
+    __slots__ = ("tag", "ids", "classes", "attrs", "pseudos")
+
+    def __init__(self):
+        self.tag = None
+        self.ids = []
+        self.classes = []
+        self.attrs = []
+        self.pseudos = []
+
+    def empty(self):
+        return self.tag is None and not (self.ids or self.classes or self.attrs or self.pseudos)
+
+
+@lru_cache(maxsize=512)
+def parse_css(css):
+    """Selector list -> tuple of complex selectors, each a tuple of (combinator, compound)"""
+    text = css.strip()
+    if not text:
+        raise InvalidSelector("Empty CSS selector")
+    selectors, parts = [], []
+    compound, combinator = _Compound(), None
+    position = 0
+
+    def close_compound():
+        nonlocal compound
+        if compound.empty():
+            raise InvalidSelector(f"Invalid CSS selector: {css!r}")
+        parts.append((combinator, compound))
+        compound = _Compound()
+
+    while position < len(text):
+        match = _CSS_TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise InvalidSelector(f"Unsupported CSS selector: {css!r} (at {text[position:]!r})")
+        position = match.end()
+        kind = match.lastgroup if match.lastgroup not in ("op", "val", "flag", "arg") else None
+        groups = match.groupdict()
+        if groups["combinator"]:
+            close_compound()
+            combinator = groups["combinator"]
+        elif groups["comma"] is not None and "," in match.group(0):
+            close_compound()
+            selectors.append(tuple(parts))
+            parts, combinator = [], None
+        elif groups["space"] is not None:
+            if position < len(text):
+                close_compound()
+                combinator = " "
+        elif groups["star"]:
+            compound.tag = compound.tag or "*"
+        elif groups["tag"]:
+            compound.tag = groups["tag"].lower()
+        elif groups["id"]:
+            compound.ids.append(groups["id"])
+        elif groups["cls"]:
+            compound.classes.append(groups["cls"])
+        elif groups["attr"]:
+            value = groups["val"]
+            if value and value[0] in "\"'":
+                value = value[1:-1]
+            compound.attrs.append((groups["attr"].lower(), groups["op"], value, bool(groups["flag"])))
+        elif groups["pseudo"]:
+            name, argument = groups["pseudo"].lower(), groups["arg"]
+            if name not in PSEUDOS:
+                raise InvalidSelector(f"Unsupported CSS pseudo-class :{name} in {css!r}")
+            if name == "not":
+                argument = parse_css(argument)
+            elif name in ("nth-child", "nth-of-type"):
+                argument = _parse_nth(argument, css)
+            compound.pseudos.append((name, argument))
+        elif kind is None:
+            raise InvalidSelector(f"Unsupported CSS selector: {css!r}")
+    close_compound()
+    selectors.append(tuple(parts))
+    return tuple(selectors)
+
+
+@lru_cache(maxsize=512)
+def _subjects(css):
+    """(tag, class) each selector's subject needs (None: any) - a cheap check before full matching"""
+    subjects = []
+    for parts in parse_css(css):
+        compound = parts[-1][1]
+        subjects.append((compound.tag if compound.tag != "*" else None,
+                         compound.classes[0] if compound.classes else None))
+    return tuple(subjects)
+
+
+def _may_match(node, subjects):
+    for tag, name in subjects:
+        if (tag is None or node.tag == tag) and (name is None or name in node.attrs.get("class", "")):
+            return True
+    return False
+
+
+def _parse_nth(argument, css):
+    text = (argument or "").replace(" ", "").lower()
+    if text == "odd":
+        return 2, 1
+    if text == "even":
+        return 2, 0
+    match = re.fullmatch(r"([+-]?\d*)n([+-]\d+)?|([+-]?\d+)", text)
+    if not match:
+        raise InvalidSelector(f"Unsupported :nth argument {argument!r} in {css!r}")
+    if match.group(3) is not None:
+        return 0, int(match.group(3))
+    step = match.group(1)
+    step = 1 if step in ("", "+") else -1 if step == "-" else int(step)
+    return step, int(match.group(2) or 0)
+
+
+def _nth_matches(position, step, offset):
+    if step == 0:
+        return position == offset
+    return (position - offset) % step == 0 and (position - offset) // step >= 0
+
+
+def _match_compound(node, compound):
+    if compound.tag not in (None, "*") and node.tag != compound.tag:
+        return False
+    if compound.ids and any(node.attrs.get("id") != identifier for identifier in compound.ids):
+        return False
+    if compound.classes:
+        classes = node.classes
+        if any(name not in classes for name in compound.classes):
+            return False
+    for name, op, expected, ignore_case in compound.attrs:
+        if name not in node.attrs:
+            return False
+        if op is None:
+            continue
+        actual = node.attrs[name]
+        if ignore_case:
+            actual, expected = actual.lower(), expected.lower()
+        if op == "=" and actual != expected:
+            return False
+        if op == "*=" and (not expected or expected not in actual):
+            return False
+        if op == "^=" and (not expected or not actual.startswith(expected)):
+            return False
+        if op == "$=" and (not expected or not actual.endswith(expected)):
+            return False
+        if op == "~=" and expected not in actual.split():
+            return False
+        if op == "|=" and actual != expected and not actual.startswith(expected + "-"):
+            return False
+    for name, argument in compound.pseudos:
+        if not _match_pseudo(node, name, argument):
+            return False
+    return True
+
+
+def _match_pseudo(node, name, argument):
+    if name == "not":
+        return not any(_match_complex(node, parts) for parts in argument)
+    if name == "checked":
+        return node.tag in ("input", "option") and node.checked
+    if name == "disabled":
+        return node.disabled
+    if name == "enabled":
+        return node.tag in ("button", "input", "select", "textarea", "option") and not node.disabled
+    if name == "empty":
+        return not node.children
+    siblings = node.parent.elements if node.parent is not None else [node]
+    if name in ("first-of-type", "last-of-type", "nth-of-type"):
+        siblings = [sibling for sibling in siblings if sibling.tag == node.tag]
+    position = siblings.index(node) + 1
+    if name in ("first-child", "first-of-type"):
+        return position == 1
+    if name in ("last-child", "last-of-type"):
+        return position == len(siblings)
+    if name == "only-child":
+        return len(siblings) == 1
+    return _nth_matches(position, *argument)
+
+
+def _match_complex(node, parts, index=None):
+    index = len(parts) - 1 if index is None else index
+    combinator, compound = parts[index]
+    if not _match_compound(node, compound):
+        return False
+    if index == 0:
+        return True
+    if combinator == ">":
+        parent = node.parent
+        return parent is not None and parent.is_element and _match_complex(parent, parts, index - 1)
+    if combinator == " ":
+        return any(_match_complex(ancestor, parts, index - 1) for ancestor in node.ancestors())
+    siblings = node.parent.elements if node.parent is not None else [node]
+    before = siblings[:siblings.index(node)]
+    if combinator == "+":
+        return bool(before) and _match_complex(before[-1], parts, index - 1)
+    return any(_match_complex(sibling, parts, index - 1) for sibling in before)
+
+
+# =======================
+# XPATH
+# =======================
+
+_XPATH_TOKEN = re.compile(r"""
+    \s*(?:
+      (?P<string>"[^"]*"|'[^']*')
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<op>//|/|\.\.|\.|\[|\]|\(|\)|,|!=|=|\*|@|::|\|)
+    | (?P<name>[a-zA-Z_][\w.-]*)
+    )""", re.X)
+
+AXES = {"child", "descendant", "descendant-or-self", "parent", "ancestor", "ancestor-or-self",
+        "following-sibling", "preceding-sibling", "self"}
+
+FUNCTIONS = {"contains", "starts-with", "normalize-space", "not", "text", "last", "position", "string"}
+
+
+@lru_cache(maxsize=512)
+def _tokenize_xpath(expression):
+    tokens, position = [], 0
+    while position < len(expression):
+        if expression[position:].strip() == "":
+            break
+        match = _XPATH_TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise InvalidSelector(f"Unsupported XPath: {expression!r} (at {expression[position:]!r})")
+        position = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tuple(tokens)
+
+
+class _XPathParser:
+    """Recursive descent over the token list; produces nested tuples evaluated below"""
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = _tokenize_xpath(expression)
+        self.index = 0
+
+    def fail(self, reason="unsupported syntax"):
+        raise InvalidSelector(f"Unsupported XPath {self.expression!r}: {reason}")
+
+    def peek(self, offset=0):
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        token = self.peek()
+        if value is not None and token[1] != value:
+            self.fail(f"expected {value!r}, got {token[1]!r}")
+        self.index += 1
+        return token
+
+    def parse(self):
+        path = self.path()
+        paths = [path]
+        while self.peek()[1] == "|":
+            self.take()
+            paths.append(self.path())
+        if self.index != len(self.tokens):
+            self.fail(f"unexpected {self.peek()[1]!r}")
+        return tuple(paths)
+
+    def path(self):
+        absolute = self.peek()[1] in ("/", "//")
+        steps = []
+        separator = self.take()[1] if absolute else "/"
+        while True:
+            steps.append((separator,) + self.step())
+            if self.peek()[1] in ("/", "//"):
+                separator = self.take()[1]
+            else:
+                break
+        return absolute, tuple(steps)
+
+    def step(self):
+        kind, value = self.peek()
+        if value == "..":
+            self.take()
+            return "parent", "*", ()
+        if value == ".":
+            self.take()
+            return "self", "*", ()
+        axis = "child"
+        if value == "@":
+            self.fail("attribute steps are not supported (use a predicate)")
+        if kind == "name" and self.peek(1)[1] == "::":
+            axis = self.take()[1]
+            self.take("::")
+            if axis not in AXES:
+                self.fail(f"axis {axis}")
+        kind, value = self.take()
+        if value == "*":
+            test = "*"
+        elif kind == "name":
+            if self.peek()[1] == "(":
+                self.fail(f"{value}() as a step")
+            test = value.lower()
+        else:
+            self.fail(f"unexpected {value!r}")
+        predicates = []
+        while self.peek()[1] == "[":
+            self.take()
+            predicates.append(self.or_expr())
+            self.take("]")
+        return axis, test, tuple(predicates)
+
+    def or_expr(self):
+        left = self.and_expr()
+        while self.peek() == ("name", "or"):
+            self.take()
+            left = ("or", left, self.and_expr())
+        return left
+
+    def and_expr(self):
+        left = self.compare()
+        while self.peek() == ("name", "and"):
+            self.take()
+            left = ("and", left, self.compare())
+        return left
+
+    def compare(self):
+        left = self.operand()
+        if self.peek()[1] in ("=", "!="):
+            op = self.take()[1]
+            return (op, left, self.operand())
+        return left
+
+    def operand(self):
+        kind, value = self.peek()
+        if kind == "string":
+            self.take()
+            return ("literal", value[1:-1])
+        if kind == "number":
+            self.take()
+            return ("number", float(value))
+        if value == "@":
+            self.take()
+            kind, name = self.take()
+            if kind != "name" and name != "*":
+                self.fail("attribute name")
+            return ("attr", name.lower())
+        if value == ".":
+            self.take()
+            return ("self",)
+        if value == "(":
+            self.take()
+            inner = self.or_expr()
+            self.take(")")
+            return inner
+        if kind == "name" and self.peek(1)[1] == "(":
+            if value not in FUNCTIONS:
+                self.fail(f"function {value}()")
+            self.take()
+            self.take("(")
+            arguments = []
+            while self.peek()[1] != ")":
+                arguments.append(self.or_expr())
+                if self.peek()[1] == ",":
+                    self.take()
+            self.take(")")
+            return ("call", value, tuple(arguments))
+        self.fail(f"unexpected {value!r} in a predicate")
+
+
+@lru_cache(maxsize=512)
+def parse_xpath(expression):
+    return _XPathParser(expression).parse()
+
+
+def _axis_nodes(node, axis):
+    if axis == "child":
+        return node.elements
+    if axis == "descendant":
+        return list(node.iter())
+    if axis == "descendant-or-self":
+        return ([node] if node.is_element else []) + list(node.iter())
+    if axis == "parent":
+        return [node.parent] if node.parent is not None and node.parent.is_element else []
+    if axis == "ancestor":
+        return list(node.ancestors())
+    if axis == "ancestor-or-self":
+        return [node] + list(node.ancestors())
+    if axis == "self":
+        return [node] if node.is_element else []
+    siblings = node.parent.elements if node.parent is not None else []
+    if node not in siblings:
+        return []
+    position = siblings.index(node)
+    if axis == "following-sibling":
+        return siblings[position + 1:]
+    return list(reversed(siblings[:position]))
+
+
+def _text_nodes(node):
+    return [child.data for child in node.children if child.tag == "#text"]
+
+
+def _string(value):
+    """XPath string() of an evaluated operand"""
+    if isinstance(value, list):
+        return value[0] if value else ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return value
+
+
+def _truth(value):
+    if isinstance(value, list):
+        return bool(value)
+    if isinstance(value, str):
+        return value != ""
+    return bool(value)
+
+
+def _evaluate(node, expression, position, size):
+    kind = expression[0]
+    if kind == "literal":
+        return expression[1]
+    if kind == "number":
+        return expression[1]
+    if kind == "attr":
+        if expression[1] == "*":
+            return list(node.attrs.values())
+        return [node.attrs[expression[1]]] if expression[1] in node.attrs else []
+    if kind == "self":
+        return [node.text_content]
+    if kind in ("and", "or"):
+        left = _truth(_evaluate(node, expression[1], position, size))
+        if kind == "and" and not left:
+            return False
+        if kind == "or" and left:
+            return True
+        return _truth(_evaluate(node, expression[2], position, size))
+    if kind in ("=", "!="):
+        left = _evaluate(node, expression[1], position, size)
+        right = _evaluate(node, expression[2], position, size)
+        lefts = left if isinstance(left, list) else [left]
+        rights = right if isinstance(right, list) else [right]
+        if kind == "=":
+            return any(_equal(a, b) for a in lefts for b in rights)
+        return any(not _equal(a, b) for a in lefts for b in rights)
+    if kind == "call":
+        name, arguments = expression[1], expression[2]
+        if name == "text":
+            return _text_nodes(node)
+        if name == "last":
+            return float(size)
+        if name == "position":
+            return float(position)
+        values = [_evaluate(node, argument, position, size) for argument in arguments]
+        if name == "not":
+            return not _truth(values[0])
+        if name == "string":
+            return _string(values[0]) if values else node.text_content
+        if name == "normalize-space":
+            text = _string(values[0]) if values else node.text_content
+            return " ".join(text.split())
+        if name == "contains":
+            return _string(values[1]) in _string(values[0])
+        if name == "starts-with":
+            return _string(values[0]).startswith(_string(values[1]))
+    raise InvalidSelector(f"Unsupported XPath expression {expression!r}")
+
+
+def _equal(left, right):
+    if isinstance(left, float) or isinstance(right, float):
+        try:
+            return float(left) == float(right)
+        except ValueError:
+            return False
+    return _string(left) == _string(right)
+
+
+def _apply_predicates(nodes, predicates):
+    for predicate in predicates:
+        size = len(nodes)
+        kept = []
+        for position, node in enumerate(nodes, 1):
+            result = _evaluate(node, predicate, position, size)
+            if isinstance(result, float) and not isinstance(result, bool):
+                if result == position:
+                    kept.append(node)
+            elif _truth(result):
+                kept.append(node)
+        nodes = kept
+    return nodes
+
+
+def evaluate_xpath(context, expression):
+    """Elements selected by an XPath expression, in document order"""
+    results = []
+    for absolute, steps in parse_xpath(expression):
+        current = [context.root()] if absolute else [context]
+        for separator, axis, test, predicates in steps:
+            following = []
+            for node in current:
+                bases = _axis_nodes(node, "descendant-or-self") + ([node] if node.tag == "#document" else []) \
+                    if separator == "//" else [node]
+                for base in bases:
+                    candidates = [candidate for candidate in _axis_nodes(base, axis)
+                                  if test == "*" or candidate.tag == test]
+                    following.extend(_apply_predicates(candidates, predicates))
+            current = following
+        results.extend(current)
+    return _document_order(context.root(), results)
+
+
+def _document_order(root, nodes):
+    unique = {id(node): node for node in nodes}
+    if len(unique) <= 1:
+        return list(unique.values())
+    order = {id(node): index for index, node in enumerate(root.iter())}
+    return sorted(unique.values(), key=lambda node: order.get(id(node), -1))
@@ -0,0 +1,986 @@
+# utils/fake_webdriver.py
+"""
+In-memory fake WebDriver for page-object unit tests
+
+FakeWebDriver is selenium's own RemoteWebDriver with a FakeBrowser as its command
+executor, so find_element(s), WebElement, WebDriverWait, expected conditions, ActionChains,
+the error types and anything hooked into driver.execute (DriverMetrics) behave exactly as
+against a real browser. The FakeBrowser answers the W3C commands from a DOM parsed out of
+HTML fixtures (utils.fake_dom):
+
+- find_element(s) by CSS, XPath, id, name, tag, class and link text, also within an element
+- click, send_keys (Enter submits, Backspace deletes), clear, text, tag_name, get_attribute,
+  get_property, is_displayed / is_enabled / is_selected, ActionChains clicks and typing
+- get, refresh, back/forward and hash navigation between registered pages
+- save_screenshot (a 1x1 PNG) and cookies / localStorage / sessionStorage
+- execute_script / execute_async_script answered by Python hooks. The scripts of BasePage,
+  SmartTableComponent and AuthStateStore are built in; tests register their own with
+  on_script(). A script without a hook raises JavascriptException.
+
+Pages do not run JavaScript, so app behaviour is emulated with hooks: on_click, on_input and
+on_submit handlers. ng2-smart-table sorting (header clicks cycle none -> asc -> desc) and
+header filtering are built in.
+
+    with virtual_time():
+        driver = FakeWebDriver()
+        driver.browser.add_page(route_url("brands"), fixture_html("brands_list.html"))
+        page = BrandsPage(driver)
+        page.navigate_to_brands_page()
+        rows = page.get_table_data()
+
+virtual_time() makes WebDriverWait timeouts (and time.sleep in the given modules) advance
+a virtual clock, so a locator that is never found costs no real time.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from urllib.parse import urljoin, urlsplit
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.support import wait as wait_module
+
+from config.config import Config
+from pages.base_page import (APP_IDLE_SCRIPT, APP_SHELL_SCRIPT, HASH_NAVIGATE_SCRIPT, PAGE_TIMING_SCRIPT)
+from pages.smart_table_component import (HEADER_SCRIPT, TABLE_DATA_SCRIPT, SORT_STATE_SCRIPT, FILTER_VALUES_SCRIPT,
+                                         CLEAR_FILTERS_SCRIPT, VIEW_STATE_SCRIPT, CLEAR_SELECTION_SCRIPT,
+                                         CLOSE_AUTOCOMPLETE_SCRIPT, FIRST_PAGE_SCRIPT, WATCH_SCRIPT, SETTLE_SCRIPT)
+from utils.auth_state import RESTORE_STATE_SCRIPT, CAPTURE_STORAGE_SCRIPT
+from utils.fake_dom import (InvalidSelector, Node, is_displayed, is_hidden_self, parse_document, parse_fragment,
+                            visible_text)
+
+# W3C web element identifier in command parameters and responses
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+BLANK_PAGE = "<html><head></head><body></body></html>"
+
+# 1x1 transparent PNG returned for every screenshot
+SCREENSHOT_PNG = ("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=")
+
+# HTTP status selenium's ErrorHandler expects with each W3C error code
+ERROR_STATUS = {"no such element": 404, "stale element reference": 404, "invalid selector": 400,
+                "invalid argument": 400, "element not interactable": 400, "javascript error": 500,
+                "unknown command": 404, "no such cookie": 404}
+
+SUBMIT_KEYS = (Keys.ENTER, Keys.RETURN)
+
+# The merchant store autocomplete of the list pages (see VIEW_STATE_SCRIPT)
+AUTOCOMPLETE_INPUTS = "p-autocomplete input, input.ui-autocomplete-input"
+
+LEGACY_LOCATORS = {"id": '[id="{}"]', "name": '[name="{}"]', "tag name": "{}", "class name": ".{}"}
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), Config.TEST_DATA_DIR,
+                           "html")
+
+
+def fixture_html(name):
+    """Contents of an HTML fixture in test_data/html/"""
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class FakeCommandError(Exception):
+    """A W3C error (e.g. 'no such element') to hand back to selenium"""
+
+    def __init__(self, error, message):
+        super().__init__(message)
+        self.error = error
+        self.message = message
+
+
+# =======================
+# BROWSER
+# =======================
+
+class FakeBrowser:
+    """One in-memory browser session; the command executor of FakeWebDriver
+
+    Args:
+        pages (dict): URL, URL without fragment or '#fragment' -> HTML, or a callable
+                      (browser, url) -> HTML, served by get() and hash navigation
+        html (str): Document to start with (default: a blank page)
+        url (str): URL of that document (default: Config.BASE_URL)
+        hidden (tuple): CSS selectors the app stylesheet hides (display: none)
+        smart_table (bool): Emulate ng2-smart-table header sorting and filtering
+    """
+
+    def __init__(self, pages=None, html=None, url=None, hidden=(), smart_table=True):
+        self.pages = dict(pages or {})
+        self.hidden = tuple(hidden)
+        self.commands = Counter()
+        self.screenshots = 0
+        self.cookies = {}
+        self.local_storage = {}
+        self.session_storage = {}
+        self.timeouts = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+        self.history, self.history_index = [], -1
+        self.document = None
+        self.url = "about:blank"
+        self.active = None
+        self._scripts = {}
+        self._script_fragments = []
+        self._hooks = {"click": [], "input": [], "submit": []}
+        self._refs, self._ref_ids = {}, {}
+        self._tables = {}
+        self._watch = None
+        self._loaded_at = time.perf_counter()
+        self._install_builtin_scripts()
+        if smart_table:
+            self.on_click("th.ng2-smart-th a", _smart_table_sort)
+            self.on_input("ng2-smart-table thead input, ng2-smart-table thead select", _smart_table_filter)
+        self.load(html if html is not None else BLANK_PAGE, url or Config.BASE_URL)
+
+    # =======================
+    # HOOKS
+    # =======================
+
+    def on_script(self, script, handler):
+        """Answer execute_script / execute_async_script of exactly this script text
+
+        handler(browser, *args) gets elements as utils.fake_dom.Node; the value it
+        returns (Nodes included) is what the driver call returns.
+        """
+        self._scripts[script] = handler
+        return self
+
+    def on_script_containing(self, fragment, handler):
+        """Answer any script whose text contains the fragment (checked after exact matches)"""
+        self._script_fragments.insert(0, (fragment, handler))
+        return self
+
+    def on_click(self, css, handler):
+        """Run handler(browser, target) when a click lands on (or inside) an element matching css
+
+        A truthy return value prevents the default action (link navigation, checkbox toggle,
+        form submit). Later registrations run first.
+        """
+        self._hooks["click"].insert(0, (css, handler))
+        return self
+
+    def on_input(self, css, handler):
+        """Run handler(browser, target) after typing, clear() or a checkbox toggle changes the target"""
+        self._hooks["input"].insert(0, (css, handler))
+        return self
+
+    def on_submit(self, css, handler):
+        """Run handler(browser, form) when a form matching css is submitted (Enter or a submit button)"""
+        self._hooks["submit"].insert(0, (css, handler))
+        return self
+
+    def _run_hooks(self, kind, node):
+        for css, handler in self._hooks[kind]:
+            target = node.closest(css)
+            if target is not None and handler(self, target):
+                return True
+        return False
+
+    # =======================
+    # DOCUMENT
+    # =======================
+
+    def add_page(self, url, html):
+        """Serve html (or a callable (browser, url) -> html) for a URL, URL prefix or '#fragment'"""
+        self.pages[url] = html
+        return self
+
+    def load(self, html, url=None):
+        """Replace the document; elements found before become stale"""
+        self.document = parse_document(html, owner=self)
+        self._served = html
+        self.url = url or self.url
+        self.active = None
+        self._refs, self._ref_ids, self._tables = {}, {}, {}
+        self._watch = None
+        self._loaded_at = time.perf_counter()
+        return self.document
+
+    def load_fixture(self, name, url=None):
+        return self.load(fixture_html(name), url)
+
+    @property
+    def body(self):
+        return self.document.select_one("body")
+
+    @property
+    def title(self):
+        title = self.document.select_one("title")
+        return title.text_content.strip() if title is not None else ""
+
+    def select(self, css):
+        return self.document.select(css)
+
+    def select_one(self, css):
+        return self.document.select_one(css)
+
+    def is_displayed(self, node):
+        return is_displayed(node, self.hidden)
+
+    def text(self, node):
+        return visible_text(node, self.hidden) if self.is_displayed(node) else ""
+
+    def hidden_below(self, node, ancestor):
+        """Whether node, or an element between it and ancestor, hides it (ancestor not checked)"""
+        while node is not None and node is not ancestor:
+            if is_hidden_self(node, self.hidden):
+                return True
+            node = node.parent
+        return False
+
+    def mutated(self, node):
+        """DOM change notification (see Node._mutated); counts changes inside the watched table"""
+        watch = self._watch
+        if watch is None or watch["target"].root() is not self.document:
+            return
+        inside = node is watch["target"] or watch["target"] in node.ancestors()
+        if inside and (node.tag == "table" or node.tag == "tbody" or any(a.tag == "tbody" for a in node.ancestors())):
+            watch["count"] += 1
+
+    # =======================
+    # NAVIGATION
+    # =======================
+
+    def navigate(self, url, record=True):
+        """Go to a URL; a fragment-only change keeps the document unless a page is registered for it"""
+        url = urljoin(self.url, url)
+        same_document = url.split("#")[0] == self.url.split("#")[0] and "#" in url
+        page = self._page_for(url, same_document)
+        if page is None and same_document:
+            self.url = url
+        else:
+            self.load(page if page is not None else BLANK_PAGE, url)
+        if record:
+            del self.history[self.history_index + 1:]
+            self.history.append(url)
+            self.history_index = len(self.history) - 1
+
+    def _page_for(self, url, fragment_only=False):
+        fragment = urlsplit(url).fragment
+        candidates = [url, "#" + fragment] if fragment else [url]
+        if not fragment_only:
+            candidates.append(url.split("#")[0])
+        for key in candidates:
+            if key in self.pages:
+                page = self.pages[key]
+                return page(self, url) if callable(page) else page
+        return None
+
+    def refresh(self):
+        """Reload the current URL: its registered page, or the current markup as it was served"""
+        page = self._page_for(self.url)
+        self.load(page if page is not None else self._served, self.url)
+
+    def _go(self, step):
+        index = self.history_index + step
+        if 0 <= index < len(self.history):
+            self.history_index = index
+            self.navigate(self.history[index], record=False)
+
+    @property
+    def origin(self):
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc}" if parts.netloc else "null"
+
+    @property
+    def hash(self):
+        fragment = urlsplit(self.url).fragment
+        return "#" + fragment if fragment else ""
+
+    # =======================
+    # ELEMENT ACTIONS
+    # =======================
+
+    def click(self, node):
+        """Click like a user would: hooks first, then the element's default action"""
+        self._check_interactable(node)
+        self.active = node
+        if self._run_hooks("click", node):
+            return
+        target = node.closest("a[href], button, input, option, label") or node
+        if target.tag == "input" and target.get("type", "").lower() in ("checkbox", "radio"):
+            if target.get("type").lower() == "radio":
+                for other in target.root().select(f"input[type='radio'][name='{target.get('name', '')}']"):
+                    other.checked = False
+                target.checked = True
+            else:
+                target.checked = not target.checked
+            self._run_hooks("input", target)
+        elif target.tag == "option":
+            select = target.closest("select")
+            if select is not None and "multiple" not in select.attrs:
+                for option in select.select("option"):
+                    option.checked = False
+            target.checked = not target.checked if select is not None and "multiple" in select.attrs else True
+            self._run_hooks("input", select or target)
+        elif target.tag == "a":
+            href = target.get("href", "")
+            if href and href != "#" and not href.startswith("javascript:"):
+                self.navigate(href)
+        elif target.tag == "button" or (target.tag == "input" and target.get("type", "").lower() == "submit"):
+            if target.get("type", "submit").lower() == "submit":
+                self.submit(target)
+
+    def submit(self, node):
+        form = node.closest("form")
+        if form is not None:
+            self._run_hooks("submit", form)
+
+    def type_text(self, node, text):
+        """send_keys: printable characters are inserted, Enter submits, Backspace deletes"""
+        self._check_interactable(node)
+        self.active = node
+        editable = node.closest("[contenteditable]")
+        for char in text:
+            if char in SUBMIT_KEYS:
+                self.submit(node)
+            elif char == Keys.BACKSPACE:
+                self._set_text(node, editable, self._get_text(node, editable)[:-1])
+            elif "\ue000" <= char <= "\uf8ff":
+                continue  # Other special keys (arrows, Tab, modifiers) do not change the text
+            else:
+                self._set_text(node, editable, self._get_text(node, editable) + char)
+        self._run_hooks("input", node)
+
+    def clear(self, node):
+        self._check_interactable(node)
+        self._set_text(node, node.closest("[contenteditable]"), "")
+        self._run_hooks("input", node)
+
+    def _get_text(self, node, editable):
+        return editable.text_content if editable is not None and node.tag not in ("input", "textarea") \
+            else node.value
+
+    def _set_text(self, node, editable, text):
+        if editable is not None and node.tag not in ("input", "textarea"):
+            editable.replace_children([Node("#text", data=text, owner=self)] if text else [])
+        else:
+            node.value = text
+
+    def _check_interactable(self, node):
+        if not self.is_displayed(node):
+            raise FakeCommandError("element not interactable", f"Element {node!r} is not displayed")
+        if node.disabled and node.tag in ("input", "textarea", "select", "button"):
+            raise FakeCommandError("element not interactable", f"Element {node!r} is disabled")
+
+    # =======================
+    # LOCATORS
+    # =======================
+
+    def find(self, using, value, root=None):
+        root = root if root is not None else self.document
+        if using in LEGACY_LOCATORS:
+            # WebElement.find_element(s) sends By.ID / NAME / TAG_NAME / CLASS_NAME unconverted
+            using, value = "css selector", LEGACY_LOCATORS[using].format(value.replace('"', '\\"'))
+        try:
+            if using == "css selector":
+                return root.select(value)
+            if using == "xpath":
+                return root.xpath(value)
+        except InvalidSelector as e:
+            raise FakeCommandError("invalid selector", str(e))
+        if using in ("link text", "partial link text"):
+            links = root.select("a")
+            if using == "link text":
+                return [link for link in links if self.text(link) == value]
+            return [link for link in links if value in self.text(link)]
+        raise FakeCommandError("invalid argument", f"Unsupported locator strategy: {using}")
+
+    def ref(self, node):
+        """Element reference handed to selenium (stable for the node while the document lives)"""
+        key = id(node)
+        if key not in self._ref_ids:
+            ref = f"fake-{len(self._refs) + 1}"
+            self._ref_ids[key] = ref
+            self._refs[ref] = node
+        return self._ref_ids[key]
+
+    def node(self, ref):
+        node = self._refs.get(ref)
+        if node is None or node.root() is not self.document:
+            raise FakeCommandError("stale element reference", f"Element {ref} is no longer attached to the page")
+        return node
+
+    def _to_wire(self, value):
+        if isinstance(value, Node):
+            return {ELEMENT_KEY: self.ref(value)}
+        if isinstance(value, (list, tuple)):
+            return [self._to_wire(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._to_wire(item) for key, item in value.items()}
+        return value
+
+    def _from_wire(self, value):
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return self.node(value[ELEMENT_KEY])
+            return {key: self._from_wire(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._from_wire(item) for item in value]
+        return value
+
+    # =======================
+    # SCRIPTS
+    # =======================
+
+    def run_script(self, script, args):
+        handler = self._scripts.get(script)
+        if handler is None:
+            handler = next((handler for fragment, handler in self._script_fragments if fragment in script), None)
+        if handler is None:
+            raise FakeCommandError("javascript error",
+                                   f"No fake script hook for: {script.strip()[:80]!r} (see FakeBrowser.on_script)")
+        return self._to_wire(handler(self, *self._from_wire(list(args))))
+
+    def _install_builtin_scripts(self):
+        self.on_script(HEADER_SCRIPT, lambda browser, selector: browser._column_keys(browser.select_one(selector)))
+        self.on_script(TABLE_DATA_SCRIPT, _table_data)
+        self.on_script(SORT_STATE_SCRIPT, _sort_state)
+        self.on_script(FILTER_VALUES_SCRIPT, _filter_values)
+        self.on_script(CLEAR_FILTERS_SCRIPT, _clear_filters)
+        self.on_script(VIEW_STATE_SCRIPT, _view_state)
+        self.on_script(CLEAR_SELECTION_SCRIPT, _clear_selection)
+        self.on_script(CLOSE_AUTOCOMPLETE_SCRIPT, _close_autocomplete)
+        self.on_script(FIRST_PAGE_SCRIPT, _first_page)
+        self.on_script(WATCH_SCRIPT, _watch_table)
+        self.on_script(SETTLE_SCRIPT, _settle_table)
+        self.on_script(APP_IDLE_SCRIPT, lambda browser, quiet_ms, timeout_ms: {
+            "idle": True, "angular": browser.select_one("nb-layout") is not None, "inflight": 0})
+        self.on_script(APP_SHELL_SCRIPT, lambda browser: {
+            "origin": browser.origin, "hash": browser.hash, "shell": browser.select_one("nb-layout") is not None,
+            "now": browser.now()})
+        self.on_script(HASH_NAVIGATE_SCRIPT, lambda browser, fragment: browser.navigate(
+            fragment if fragment.startswith("#") else "#" + fragment))
+        self.on_script(PAGE_TIMING_SCRIPT, lambda browser, since: {
+            "ttfb": None, "dcl": None, "load": None, "fcp": None, "lcp": None, "resources": 0,
+            "transfer_bytes": 0, "encoded_bytes": 0, "cached_resources": 0})
+        self.on_script(RESTORE_STATE_SCRIPT, _restore_state)
+        self.on_script(CAPTURE_STORAGE_SCRIPT, lambda browser: {
+            "local_storage": dict(browser.local_storage), "session_storage": dict(browser.session_storage)})
+        self.on_script("arguments[0].scrollIntoView();", lambda browser, node: None)
+        self.on_script("arguments[0].click();", lambda browser, node: browser.click(node))
+        self.on_script_containing("/* getAttribute */", lambda browser, node, name: _get_attribute(browser, node, name))
+        self.on_script_containing("/* isDisplayed */", lambda browser, node: browser.is_displayed(node))
+
+    def now(self):
+        """performance.now() of the current document, in ms"""
+        return (time.perf_counter() - self._loaded_at) * 1000
+
+    def _column_keys(self, table):
+        """Column keys like HEADER_SCRIPT_BODY's columnKeys()"""
+        if table is None:
+            return []
+        head_row = table.select_one("thead tr")
+        if head_row is None:
+            return []
+        keys = []
+        for index, th in enumerate(head_row.select("th")):
+            classes = th.classes
+            key = None
+            if "ng2-smart-th" in classes:
+                key = next((name for name in classes if name != "ng2-smart-th" and not name.startswith("ng-")), None)
+            if key is None:
+                actions = "actions" in th.get("class", "") or th.select_one('[class*="actions"]') is not None
+                key = "actions" if actions else f"col{index}"
+            keys.append(key)
+        return keys
+
+    # =======================
+    # COMMAND EXECUTOR
+    # =======================
+
+    def execute(self, command, params):
+        """RemoteConnection.execute: run one W3C command, return its JSON response"""
+        self.commands[command] += 1
+        handler = COMMANDS.get(command)
+        try:
+            if handler is None:
+                raise FakeCommandError("unknown command", f"FakeBrowser does not implement {command}")
+            value = handler(self, params or {})
+        except FakeCommandError as e:
+            payload = {"value": {"error": e.error, "message": e.message, "stacktrace": ""}}
+            return {"status": ERROR_STATUS.get(e.error, 500), "value": json.dumps(payload)}
+        return {"value": value}
+
+    def close(self):
+        """RemoteConnection.close (called by driver.quit)"""
+
+    def _find(self, params, many, root=None):
+        nodes = self.find(params["using"], params["value"], root)
+        if many:
+            return [{ELEMENT_KEY: self.ref(node)} for node in nodes]
+        if not nodes:
+            raise FakeCommandError("no such element",
+                                   f"Unable to locate element: {{\"method\":\"{params['using']}\","
+                                   f"\"selector\":\"{params['value']}\"}}")
+        return {ELEMENT_KEY: self.ref(nodes[0])}
+
+    def _element(self, params):
+        return self.node(params["id"])
+
+    def _screenshot(self, params):
+        self.screenshots += 1
+        return SCREENSHOT_PNG
+
+    def _actions(self, params):
+        """W3C actions: pointer down + up clicks the element the pointer moved to; keys type into the focus"""
+        sources = params.get("actions", [])
+        pointer, pressed = None, False
+        for tick in range(max((len(source.get("actions", [])) for source in sources), default=0)):
+            for source in sources:
+                actions = source.get("actions", [])
+                if tick >= len(actions):
+                    continue
+                action = actions[tick]
+                if action.get("type") == "pointerMove" and isinstance(action.get("origin"), dict):
+                    pointer = self._from_wire(action["origin"])
+                elif action.get("type") == "pointerDown":
+                    pressed = True
+                elif action.get("type") == "pointerUp" and pressed:
+                    pressed = False
+                    if pointer is not None:
+                        self.click(pointer)
+                elif action.get("type") == "keyDown" and self.active is not None:
+                    self.type_text(self.active, action.get("value", ""))
+        return None
+
+
+def _get_attribute(browser, node, name):
+    """WebElement.get_attribute: the property when there is one, else the attribute"""
+    lowered = name.lower()
+    if lowered in ("checked", "selected"):
+        return "true" if node.checked else None
+    if lowered in ("disabled", "readonly", "required", "multiple", "hidden", "autofocus"):
+        return "true" if lowered in node.attrs or (lowered == "disabled" and node.disabled) else None
+    if lowered in ("href", "src") and lowered in node.attrs:
+        return urljoin(browser.url, node.get(lowered))
+    if lowered == "class":
+        return node.get("class")
+    value = _get_property(browser, node, name)
+    if value is not None and not isinstance(value, bool):
+        return str(value)
+    return node.get(lowered)
+
+
+def _get_property(browser, node, name):
+    if name == "value":
+        return node.value
+    if name in ("checked", "selected"):
+        return node.checked
+    if name == "disabled":
+        return node.disabled
+    if name == "innerHTML":
+        return node.inner_html
+    if name == "outerHTML":
+        return node.outer_html
+    if name == "textContent":
+        return node.text_content
+    if name == "innerText":
+        return browser.text(node)
+    if name == "className":
+        return node.get("class", "")
+    if name == "tagName":
+        return node.tag.upper()
+    if name == "id":
+        return node.get("id", "")
+    return None
+
+
+def _css_value(browser, node, name):
+    for declaration in node.get("style", "").split(";"):
+        key, _, value = declaration.partition(":")
+        if key.strip().lower() == name:
+            return value.strip()
+    if name == "display":
+        return "block" if browser.is_displayed(node) else "none"
+    return ""
+
+
+def _add_cookie(browser, params):
+    cookie = dict(params["cookie"])
+    browser.cookies[cookie["name"]] = cookie
+
+
+def _delete_cookie(browser, params):
+    browser.cookies.pop(params["name"], None)
+
+
+def _get_cookie(browser, params):
+    if params["name"] not in browser.cookies:
+        raise FakeCommandError("no such cookie", f"No cookie named {params['name']}")
+    return browser.cookies[params["name"]]
+
+
+COMMANDS = {
+    Command.NEW_SESSION: lambda b, p: {"sessionId": "fake-session",
+                                       "capabilities": {"browserName": "fake", "browserVersion": "1.0",
+                                                        "platformName": "any", "acceptInsecureCerts": True}},
+    Command.QUIT: lambda b, p: None,
+    Command.CLOSE: lambda b, p: [],
+    Command.GET: lambda b, p: b.navigate(p["url"]),
+    Command.GET_CURRENT_URL: lambda b, p: b.url,
+    Command.GET_TITLE: lambda b, p: b.title,
+    Command.GET_PAGE_SOURCE: lambda b, p: b.document.outer_html,
+    Command.REFRESH: lambda b, p: b.refresh(),
+    Command.GO_BACK: lambda b, p: b._go(-1),
+    Command.GO_FORWARD: lambda b, p: b._go(1),
+    Command.FIND_ELEMENT: lambda b, p: b._find(p, many=False),
+    Command.FIND_ELEMENTS: lambda b, p: b._find(p, many=True),
+    Command.FIND_CHILD_ELEMENT: lambda b, p: b._find(p, many=False, root=b._element(p)),
+    Command.FIND_CHILD_ELEMENTS: lambda b, p: b._find(p, many=True, root=b._element(p)),
+    Command.W3C_GET_ACTIVE_ELEMENT: lambda b, p: b._to_wire(b.active if b.active is not None else b.body),
+    Command.CLICK_ELEMENT: lambda b, p: b.click(b._element(p)),
+    Command.SEND_KEYS_TO_ELEMENT: lambda b, p: b.type_text(b._element(p), p.get("text", "")),
+    Command.CLEAR_ELEMENT: lambda b, p: b.clear(b._element(p)),
+    Command.GET_ELEMENT_TEXT: lambda b, p: b.text(b._element(p)),
+    Command.GET_ELEMENT_TAG_NAME: lambda b, p: b._element(p).tag,
+    Command.GET_ELEMENT_ATTRIBUTE: lambda b, p: b._element(p).get(p["name"].lower()),
+    Command.GET_ELEMENT_PROPERTY: lambda b, p: b._to_wire(_get_property(b, b._element(p), p["name"])),
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY: lambda b, p: _css_value(b, b._element(p), p["propertyName"]),
+    Command.IS_ELEMENT_SELECTED: lambda b, p: b._element(p).checked,
+    Command.IS_ELEMENT_ENABLED: lambda b, p: not b._element(p).disabled,
+    Command.GET_ELEMENT_RECT: lambda b, p: dict(x=0, y=0, **({"width": 100, "height": 20}
+                                                            if b.is_displayed(b._element(p))
+                                                            else {"width": 0, "height": 0})),
+    Command.W3C_EXECUTE_SCRIPT: lambda b, p: b.run_script(p["script"], p.get("args", [])),
+    Command.W3C_EXECUTE_SCRIPT_ASYNC: lambda b, p: b.run_script(p["script"], p.get("args", [])),
+    Command.SCREENSHOT: lambda b, p: b._screenshot(p),
+    Command.ELEMENT_SCREENSHOT: lambda b, p: b._element(p) and b._screenshot(p),
+    Command.SET_TIMEOUTS: lambda b, p: b.timeouts.update({key: value for key, value in p.items()
+                                                         if key in b.timeouts}),
+    Command.GET_TIMEOUTS: lambda b, p: dict(b.timeouts),
+    Command.W3C_ACTIONS: lambda b, p: b._actions(p),
+    Command.W3C_CLEAR_ACTIONS: lambda b, p: None,
+    Command.GET_ALL_COOKIES: lambda b, p: list(b.cookies.values()),
+    Command.GET_COOKIE: _get_cookie,
+    Command.ADD_COOKIE: _add_cookie,
+    Command.DELETE_COOKIE: _delete_cookie,
+    Command.DELETE_ALL_COOKIES: lambda b, p: b.cookies.clear(),
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE: lambda b, p: "fake-window",
+    Command.W3C_GET_WINDOW_HANDLES: lambda b, p: ["fake-window"],
+    Command.GET_WINDOW_RECT: lambda b, p: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+    Command.SET_WINDOW_RECT: lambda b, p: {"x": p.get("x") or 0, "y": p.get("y") or 0,
+                                           "width": p.get("width") or 1920, "height": p.get("height") or 1080},
+    Command.W3C_MAXIMIZE_WINDOW: lambda b, p: {"x": 0, "y": 0, "width": 1920, "height": 1080},
+}
+
+
+# =======================
+# BUILT-IN PAGE SCRIPTS
+# =======================
+
+def _table_data(browser, selector, need_header):
+    """TABLE_DATA_SCRIPT; visibility is settled once per table and row rather than per cell,
+    and each cell's subtree is walked once for its checkbox and action icons"""
+    table = browser.select_one(selector)
+    if table is None:
+        return {"columns": [], "rows": [], "no_data": False}
+    no_data = table.select_one(".ng2-smart-no-data-message")
+    shown = browser.is_displayed(table)
+    rows = []
+    for row in table.select("tbody tr"):
+        row_shown = shown and not browser.hidden_below(row, table)
+        cells = []
+        for cell in row.select("td"):
+            checkbox, icons = None, set()
+            for node in cell.iter():
+                if node.tag == "input" and checkbox is None and node.attrs.get("type") == "checkbox":
+                    checkbox = node
+                elif node.tag == "i":
+                    icons.update(node.classes)
+            cells.append({
+                "text": visible_text(cell, browser.hidden).strip()
+                if row_shown and not browser.hidden_below(cell, row) else "",
+                "checked": checkbox.checked if checkbox is not None else None,
+                "has_actions": "nb-edit" in icons and "nb-trash" in icons,
+            })
+        rows.append(cells)
+    return {"columns": browser._column_keys(table) if need_header else None,
+            "no_data": no_data is not None and browser.is_displayed(no_data), "rows": rows}
+
+
+def _sort_key(th):
+    return next((name for name in th.classes if name != "ng2-smart-th" and not name.startswith("ng-")), None)
+
+
+def _link_order(link):
+    link_class = link.get("class", "") if link is not None else ""
+    return "asc" if "asc" in link_class else "desc" if "desc" in link_class else "none"
+
+
+def _sort_state(browser, selector):
+    table = browser.select_one(selector)
+    state = {}
+    if table is None:
+        return state
+    for th in table.select("th.ng2-smart-th"):
+        key = _sort_key(th)
+        if key:
+            state[key] = _link_order(th.select_one("a"))
+    return state
+
+
+def _filter_inputs(table):
+    """(position, input) of every header filter, like FILTER_VALUES_SCRIPT walks them"""
+    inputs = []
+    for row in table.select("thead tr")[1:]:
+        for index, th in enumerate(row.select("th")):
+            field = th.select_one('input:not([type="checkbox"]), select')
+            if field is not None:
+                inputs.append((index, field))
+    return inputs
+
+
+def _filter_values(browser, selector):
+    table = browser.select_one(selector)
+    if table is None:
+        return {}
+    return {str(index): field.value for index, field in _filter_inputs(table)}
+
+
+def _clear_filters(browser, selector):
+    table = browser.select_one(selector)
+    if table is None:
+        return 0
+    cleared = 0
+    for field in table.select('thead input:not([type="checkbox"])'):
+        if field.value:
+            field.value = ""
+            browser._run_hooks("input", field)
+            cleared += 1
+    return cleared
+
+
+def _view_state(browser, selector):
+    table = browser.select_one(selector)
+    state = {"hash": browser.hash, "present": table is not None, "autocomplete": 0, "overlays": 0, "filters": 0,
+             "sorted": [], "selected": 0, "page": 1}
+    watch = browser._watch
+    loaded = watch["autocomplete"] if watch is not None and watch["target"] is table else []
+    state["autocomplete"] = sum(1 for index, field in enumerate(browser.select(AUTOCOMPLETE_INPUTS))
+                                if field.value != (loaded[index] if index < len(loaded) else ""))
+    state["overlays"] = sum(1 for panel in browser.select(".ui-autocomplete-panel") if browser.is_displayed(panel))
+    if table is None:
+        return state
+    state["filters"] = sum(1 for field in table.select('thead input:not([type="checkbox"]), thead select')
+                           if field.value)
+    for th in table.select("th.ng2-smart-th"):
+        key = _sort_key(th)
+        if key and _link_order(th.select_one("a")) != "none":
+            state["sorted"].append(key)
+    state["selected"] = len(table.select('.ng2-smart-actions input[type="checkbox"]:checked'))
+    active = browser.select_one("ng2-smart-table-pager .page-item.active, .ng2-smart-pagination .active")
+    if active is not None:
+        text = browser.text(active).strip() or "1"
+        state["page"] = int(text) if text.isdigit() else 1
+    return state
+
+
+def _close_autocomplete(browser):
+    """CLOSE_AUTOCOMPLETE_SCRIPT; closed option panels are removed like PrimeNG's *ngIf does"""
+    for panel in browser.select(".ui-autocomplete-panel"):
+        panel.remove()
+
+
+def _clear_selection(browser, selector):
+    table = browser.select_one(selector)
+    if table is None:
+        return 0
+    boxes = table.select('.ng2-smart-actions input[type="checkbox"]:checked')
+    for box in boxes:
+        browser.click(box)
+    return len(boxes)
+
+
+def _first_page(browser):
+    link = browser.select_one('ng2-smart-table-pager .page-item:not(.disabled) a.page-link[aria-label="First"], '
+                              '.ng2-smart-pagination .ng2-smart-page-link[aria-label="First"]')
+    if link is None:
+        return False
+    browser.click(link)
+    return True
+
+
+def _watch_table(browser, selector):
+    if not _watch_table_target(browser, selector):
+        return False
+    browser._watch["seen"] = browser._watch["count"]
+    return True
+
+
+def _settle_table(browser, selector, quiet_ms, change_ms, timeout_ms):
+    """Page changes happen synchronously here, so the table is always settled by now"""
+    if not _watch_table_target(browser, selector):
+        return {"settled": False, "mutations": 0, "changed": False}
+    watch = browser._watch
+    mutations = watch["count"] - watch["seen"]
+    watch["seen"] = watch["count"]
+    return {"settled": True, "mutations": mutations, "changed": mutations > 0}
+
+
+def _watch_table_target(browser, selector):
+    table = browser.select_one(selector)
+    if table is None:
+        return False
+    if browser._watch is None or browser._watch["target"] is not table:
+        browser._watch = {"target": table, "count": 0, "seen": 0,
+                          "autocomplete": [field.value for field in browser.select(AUTOCOMPLETE_INPUTS)]}
+    return True
+
+
+def _restore_state(browser, state):
+    browser.local_storage.update(state.get("local_storage") or {})
+    browser.session_storage.update(state.get("session_storage") or {})
+    for cookie in state.get("cookies") or []:
+        if not cookie.get("httpOnly"):
+            browser.cookies[cookie["name"]] = dict(cookie)
+    return True
+
+
+# =======================
+# NG2-SMART-TABLE EMULATION
+# =======================
+
+def _table_rows(browser, table):
+    """Data rows as first seen; sorting and filtering re-render tbody from these"""
+    key = id(table)
+    if key not in browser._tables:
+        tbody = table.select_one("tbody")
+        rows = [row for row in (tbody.elements if tbody is not None else [])
+                if row.select_one(".ng2-smart-no-data-message") is None]
+        browser._tables[key] = {"rows": rows, "sort": None}
+    return browser._tables[key]
+
+
+def _smart_table_sort(browser, link):
+    """Header click: none -> asc -> desc -> none, one sorted column at a time"""
+    table, th = link.closest("table"), link.closest("th")
+    if table is None or th is None:
+        return False
+    order = {"none": "asc", "asc": "desc", "desc": "none"}[_link_order(link)]
+    for other in table.select("th.ng2-smart-th a"):
+        other.remove_class("asc")
+        other.remove_class("desc")
+    if order != "none":
+        link.add_class(order)
+    state = _table_rows(browser, table)
+    state["sort"] = (th.parent.elements.index(th), order) if order != "none" else None
+    _render_table(browser, table)
+    return True
+
+
+def _smart_table_filter(browser, field):
+    table = field.closest("table")
+    if table is not None:
+        _render_table(browser, table)
+    return False
+
+
+def _cell_text(browser, row, index):
+    cells = row.select("td")
+    return visible_text(cells[index], browser.hidden) if index < len(cells) else ""
+
+
+def _number(text):
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def _render_table(browser, table):
+    state = _table_rows(browser, table)
+    rows = state["rows"]
+    for index, field in _filter_inputs(table):
+        if field.value:
+            needle = field.value.lower()
+            rows = [row for row in rows if needle in _cell_text(browser, row, index).lower()]
+    if state["sort"]:
+        index, order = state["sort"]
+        texts = [_cell_text(browser, row, index) for row in rows]
+        numbers = [_number(text) for text in texts]
+        keys = numbers if all(number is not None for number in numbers) else [text.lower() for text in texts]
+        rows = [row for _, row in sorted(zip(keys, rows), key=lambda pair: pair[0], reverse=order == "desc")]
+    if not rows:
+        columns = len(browser._column_keys(table)) or 1
+        rows = parse_fragment(f'<tr><td colspan="{columns}" class="ng2-smart-no-data-message">No data found</td></tr>',
+                              browser)
+    tbody = table.select_one("tbody")
+    if tbody is not None:
+        tbody.replace_children(rows)
+
+
+# =======================
+# DRIVER
+# =======================
+
+class FakeWebDriver(RemoteWebDriver):
+    """selenium's RemoteWebDriver on top of a FakeBrowser - no driver binary, no browser
+
+    Args:
+        browser (FakeBrowser): Session to drive (default: a new one built from browser_options)
+        html (str): Document to load first
+        url (str): Its URL (default: Config.BASE_URL)
+    """
+
+    def __init__(self, browser=None, html=None, url=None, **browser_options):
+        browser = browser or FakeBrowser(**browser_options)
+        if html is not None:
+            browser.load(html, url)
+        super().__init__(command_executor=browser, options=ChromeOptions())
+        self._is_remote = False  # send_keys types text instead of uploading local files
+
+    @property
+    def browser(self):
+        return self.command_executor
+
+
+# =======================
+# VIRTUAL TIME
+# =======================
+
+class VirtualClock:
+    """Drop-in for the time module whose sleep() advances a virtual clock instead of blocking"""
+
+    def __init__(self):
+        self.offset = 0.0
+        self.sleeps = 0
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.offset += max(0.0, seconds)
+
+    def monotonic(self):
+        return time.monotonic() + self.offset
+
+    def perf_counter(self):
+        return time.perf_counter() + self.offset
+
+    def time(self):
+        return time.time() + self.offset
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@contextmanager
+def virtual_time(*modules):
+    """Let WebDriverWait (and time.sleep in the given modules, e.g. pages.home_page) run on a
+    virtual clock: a 10 s wait for a missing element returns at once, timing out as usual
+
+    Yields:
+        VirtualClock: .offset is the virtual time that passed, .sleeps the sleep calls
+    """
+    clock = VirtualClock()
+    targets = [wait_module] + list(modules)
+    saved = [(module, module.time) for module in targets]
+    for module in targets:
+        module.time = clock
+    try:
+        yield clock
+    finally:
+        for module, original in saved:
+            module.time = original
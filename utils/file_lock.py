@@ -0,0 +1,71 @@
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Cross-process exclusive lock backed by a lock file
+
+    Used as a context manager so parallel pytest workers can share on-disk caches:
+
+        with FileLock(".driver_cache/.lock"):
+            ...
+    """
+
+    def __init__(self, path, timeout=120, poll_interval=0.1):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._handle = None
+
+    def acquire(self):
+        """Block until the lock is held or the timeout expires"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._handle = open(self.path, "a+")
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            try:
+                self._try_lock()
+                return self
+            except OSError:
+                if time.monotonic() >= deadline:
+                    self._handle.close()
+                    self._handle = None
+                    raise TimeoutError(f"Could not acquire lock {self.path} within {self.timeout}s")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        """Release the lock if held"""
+        if self._handle is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+            else:
+                self._handle.seek(0)
+                msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._handle.close()
+            self._handle = None
+
+    def _try_lock(self):
+        if fcntl:
+            fcntl.flock(self._handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            self._handle.seek(0)
+            msvcrt.locking(self._handle.fileno(), msvcrt.LK_NBLCK, 1)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
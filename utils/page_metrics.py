@@ -0,0 +1,48 @@
+from contextlib import contextmanager
+
+
+class PageMetrics:
+    """Session-wide counters and listeners shared by every page object
+
+    BasePage and SmartTableComponent record their waits, navigations, resets and page
+    timings here for the end-of-session report; listeners receive page timings (results
+    store) and latencies (performance budgets) as they are measured.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Empty counters and no listeners, as at the start of a session"""
+        # App idle and table settle wait durations
+        self.idle_stats = {"waits": 0, "seconds": 0.0, "max_seconds": 0.0, "timeouts": 0}
+        self.settle_stats = {"waits": 0, "seconds": 0.0, "max_seconds": 0.0, "unchanged": 0, "timeouts": 0}
+
+        # In-place resets of shared list views (see SmartTableComponent.reset_state)
+        self.reset_stats = {"clean": 0, "restored": 0, "failed": 0, "seconds": 0.0}
+
+        # Route navigations by how they were done
+        self.navigation_stats = {mode: {"count": 0, "seconds": 0.0} for mode in ("full", "in_app", "current")}
+
+        # Page load timings; listeners(timing) also store them
+        self.page_timings = []
+        self.timing_listeners = []
+
+        # Last input or click that makes a table reload, as (kind, perf_counter)
+        self.pending_table_action = None
+        # Called with (kind, seconds) for route loads and search/sort-to-settled latencies
+        self.latency_listeners = []
+
+    @contextmanager
+    def isolated(self):
+        """Start from empty metrics and put the session's back afterwards (unit tests)"""
+        saved = dict(vars(self))
+        self.reset()
+        try:
+            yield self
+        finally:
+            vars(self).clear()
+            vars(self).update(saved)
+
+
+page_metrics = PageMetrics()
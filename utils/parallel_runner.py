@@ -0,0 +1,440 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import pytest
+from config.config import Config
+from utils.browser_profile import current_run_id
+from utils.results_store import ResultsStore
+
+# Options that only make sense for the parent run or for a single worker process: flags, and
+# options whose value follows either as --name=value or as the next argument
+COLLECT_SKIP_FLAGS = {"--self-contained-html", "-v", "-vv", "-vvv", "--verbose", "-s"}
+COLLECT_SKIP_VALUE_OPTIONS = {"--html", "--durations", "--junitxml", "--junit-xml", "--capture", "--tb"}
+
+WORKER_TESTS_OPTION = "--worker-tests"
+
+COLLECT_OUTPUT_OPTION = "--collect-into"
+
+SHARD_OPTION = "--shard"
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ScheduleGroup:
+    """Tests that must run on the same worker (they share a loaded page fixture)"""
+
+    def __init__(self, key):
+        self.key = key
+        self.nodeids = []
+        self.estimate = 0.0
+
+    def __repr__(self):
+        return f"ScheduleGroup({self.key!r}, {len(self.nodeids)} tests)"
+
+
+class WorkerPlan:
+    """Groups assigned to one worker process"""
+
+    def __init__(self, index):
+        self.index = index
+        self.groups = []
+        self.load = 0.0
+
+    @property
+    def nodeids(self):
+        return [nodeid for group in self.groups for nodeid in group.nodeids]
+
+
+# =======================
+# COLLECTION AND SCHEDULING
+# =======================
+
+def collect(pytest_args):
+    """Collect the selected tests in a separate --collect-only pytest process
+
+    Collecting in this process would run conftest's pytest_configure here too (sleep
+    profiler, metric listeners, results store) before any worker has started.
+
+    Returns:
+        list: (nodeid, fixture names) tuples in collection order
+    """
+    args = collect_args(pytest_args)
+    handle, output = tempfile.mkstemp(prefix="collect-", suffix=".json")
+    os.close(handle)
+    command = [sys.executable, "-m", "pytest", "-p", "utils.parallel_runner", f"{COLLECT_OUTPUT_OPTION}={output}"]
+    command += args + ["--collect-only", "-qq", "-p", "no:cacheprovider"]
+    try:
+        completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                   cwd=PROJECT_ROOT)
+        if completed.returncode not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+            print(completed.stdout[-4000:])
+            raise RuntimeError(f"Test collection failed with exit code {completed.returncode}")
+        with open(output, encoding="utf-8") as f:
+            content = f.read()
+        return [(nodeid, fixturenames) for nodeid, fixturenames in json.loads(content or "[]")]
+    finally:
+        os.unlink(output)
+
+
+def collect_args(pytest_args):
+    """pytest_args without the options that do not affect collection (and their values)"""
+    args = []
+    skip_value = False
+    for arg in pytest_args:
+        if skip_value:
+            skip_value = False
+            continue
+        if arg in COLLECT_SKIP_FLAGS:
+            continue
+        if arg.split("=", 1)[0] in COLLECT_SKIP_VALUE_OPTIONS:
+            skip_value = "=" not in arg
+            continue
+        args.append(arg)
+    return args
+
+
+def group_key(nodeid, fixturenames):
+    """Page fixture the test needs (e.g. 'brands_page_ready'), else the test itself"""
+    for name in fixturenames:
+        if name.endswith("_page_ready"):
+            return name
+    return nodeid
+
+
+def build_groups(items, durations=None, default_duration=1.0):
+    """Group collected tests by page fixture, keeping collection order inside each group
+
+    Args:
+        items (list): (nodeid, fixture names) tuples from collect()
+        durations (dict): Expected seconds per nodeid; unknown tests count default_duration
+    """
+    durations = durations or {}
+    groups = {}
+    for nodeid, fixturenames in items:
+        key = group_key(nodeid, fixturenames)
+        group = groups.setdefault(key, ScheduleGroup(key))
+        group.nodeids.append(nodeid)
+        group.estimate += durations.get(nodeid, default_duration)
+    return list(groups.values())
+
+
+def schedule(groups, workers, keep_empty=False):
+    """Longest-processing-time-first: whole groups, largest first, onto the least loaded worker
+
+    Ties are broken by test count, group key and worker index, so the same groups always
+    produce the same plan (sharding relies on this).
+    """
+    plans = [WorkerPlan(index) for index in range(max(1, workers))]
+    for group in sorted(groups, key=lambda g: (-g.estimate, g.key)):
+        plan = min(plans, key=lambda p: (p.load, len(p.nodeids), p.index))
+        plan.groups.append(group)
+        plan.load += group.estimate
+    return plans if keep_empty else [plan for plan in plans if plan.groups]
+
+
+# =======================
+# WORKER PROCESSES
+# =======================
+
+def worker_args(pytest_args, index):
+    """Per-worker copy of the pytest arguments with per-worker report paths"""
+    args = []
+    skip_value = False
+    for arg in pytest_args:
+        if skip_value:
+            skip_value = False
+            continue
+        if arg.startswith("--html="):
+            base, ext = os.path.splitext(arg[len("--html="):])
+            arg = f"--html={base}.worker{index}{ext}"
+        elif arg.split("=", 1)[0] in ("--junitxml", "--junit-xml"):
+            skip_value = "=" not in arg
+            continue
+        elif arg.startswith(SHARD_OPTION):
+            # The parent already applied the shard to the node ids it hands out
+            skip_value = arg == SHARD_OPTION
+            continue
+        args.append(arg)
+    return args
+
+
+def shard_args(pytest_args, shard):
+    """Pytest arguments for one shard ("i/N"): the --shard option plus per-shard report paths
+
+    Each shard writes a JUnit report named after it (reports/junit.shard1of4.xml) so the
+    reports of all machines can be combined with `python -m utils.sharding merge`.
+    """
+    index, count = shard.split("/")
+    suffix = f"shard{index}of{count}"
+    args = []
+    for arg in pytest_args:
+        if arg.startswith("--html="):
+            base, ext = os.path.splitext(arg[len("--html="):])
+            arg = f"--html={base}.{suffix}{ext}"
+        args.append(arg)
+    if option_value(args, "--junitxml") is None:
+        args.append(f"--junitxml={os.path.join(Config.REPORTS_DIR, f'junit.{suffix}.xml')}")
+    return args + [f"{SHARD_OPTION}={shard}"]
+
+
+def worker_env(index):
+    """Environment of a worker: its id, the run id plus per-worker metric files"""
+    env = dict(os.environ)
+    env["WORKER_ID"] = str(index)
+    env["TEST_RUN_ID"] = current_run_id()  # Workers share one warmed browser profile
+    env.pop("SHARD", None)  # Workers get node ids already filtered to the shard
+    for name, default in (("DRIVER_METRICS_FILE", Config.DRIVER_METRICS_FILE),
+                          ("SLEEP_PROFILE_FILE", Config.SLEEP_PROFILE_FILE)):
+        base, ext = os.path.splitext(default)
+        env[name] = f"{base}.worker{index}{ext}"
+    return env
+
+
+def _junit_counts(path):
+    counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return counts
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    for suite in suites:
+        for key in ("tests", "failures", "errors", "skipped"):
+            counts[key] += int(suite.get(key, 0))
+        counts["time"] += float(suite.get("time", 0))
+    return counts
+
+
+def merge_junit(paths, output):
+    """Combine JUnit XML files (per worker or per shard) into one <testsuites> report
+
+    Returns:
+        dict: Totals of the merged report plus "duplicates", test cases found in more than one file
+    """
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    seen = set()
+    duplicates = []
+    for path in paths:
+        try:
+            root = ET.parse(path).getroot()
+        except (OSError, ET.ParseError) as e:
+            print(f"⚠ Skipping unreadable JUnit report {path}: {e}")
+            continue
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            if suite.get("name", "pytest") == "pytest":
+                suite.set("name", os.path.splitext(os.path.basename(path))[0])
+            for case in suite.iter("testcase"):
+                key = (case.get("classname"), case.get("name"))
+                if key in seen:
+                    duplicates.append(".".join(filter(None, key)))
+                seen.add(key)
+            for key in ("tests", "failures", "errors", "skipped"):
+                totals[key] += int(suite.get(key, 0))
+            totals["time"] += float(suite.get("time", 0))
+            merged.append(suite)
+
+    for key, value in totals.items():
+        merged.set(key, f"{value:.3f}" if key == "time" else str(value))
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    ET.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+
+    totals["duplicates"] = duplicates
+    return totals
+
+
+def option_value(pytest_args, name):
+    """Value of `--name=value` or `--name value` in a pytest argument list, else None"""
+    for index, arg in enumerate(pytest_args):
+        if arg.startswith(f"{name}="):
+            return arg[len(name) + 1:]
+        if arg == name and index + 1 < len(pytest_args):
+            return pytest_args[index + 1]
+    return None
+
+
+def run_parallel(pytest_args, workers, durations=None, reports_dir=None):
+    """Run the selected tests across worker processes, one pytest session each
+
+    Every worker is a separate pytest process, so each has its own driver pool and its
+    own logged-in session. Tests sharing a page fixture stay on one worker, in order.
+    Group sizes come from the results store history unless `durations` is given.
+
+    Returns:
+        int: 0 if every worker passed, otherwise the first non-zero worker exit code
+
+    A --junitxml path in `pytest_args` receives the merged worker reports.
+    """
+    reports_dir = reports_dir or Config.REPORTS_DIR
+    os.makedirs(reports_dir, exist_ok=True)
+
+    items = collect(pytest_args)
+    if not items:
+        print("⚠ No tests collected")
+        return int(pytest.ExitCode.NO_TESTS_COLLECTED)
+
+    nodeids = [nodeid for nodeid, _ in items]
+    overhead = 0.0
+    if durations is None:
+        durations, overhead = load_history(nodeids)
+    default_duration = statistics.median(durations.values()) if durations else 1.0
+
+    plans = schedule(build_groups(items, durations, default_duration), workers)
+    predicted = max(plan.load for plan in plans) + overhead
+    print(f"⚡ Running {len(items)} tests on {len(plans)} workers")
+    if durations:
+        known = sum(1 for nodeid in nodeids if nodeid in durations)
+        serial = sum(durations.get(nodeid, default_duration) for nodeid in nodeids)
+        print(f"🔮 Predicted wall time {predicted:.1f}s (serial {serial + overhead:.1f}s, "
+              f"{known}/{len(nodeids)} tests with history, {overhead:.1f}s session overhead)")
+    else:
+        predicted = None
+
+    start = time.perf_counter()
+    processes = []
+    for plan in plans:
+        tests_file = tempfile.NamedTemporaryFile("w", suffix=".txt", prefix=f"worker{plan.index}-",
+                                                 delete=False, encoding="utf-8")
+        tests_file.write("\n".join(plan.nodeids))
+        tests_file.close()
+
+        junit = os.path.join(reports_dir, f"worker{plan.index}.xml")
+        log_path = os.path.join(reports_dir, f"worker{plan.index}.log")
+        command = [sys.executable, "-m", "pytest", "-p", "utils.parallel_runner",
+                   f"{WORKER_TESTS_OPTION}={tests_file.name}", f"--junitxml={junit}"]
+        command += worker_args(pytest_args, plan.index)
+
+        log = open(log_path, "w", encoding="utf-8")
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT,
+                                   env=worker_env(plan.index), cwd=PROJECT_ROOT)
+        processes.append({"plan": plan, "process": process, "log": log, "log_path": log_path,
+                          "junit": junit, "tests_file": tests_file.name, "started": time.perf_counter()})
+        estimate = f" ~{plan.load:.0f}s" if predicted is not None else ""
+        print(f"  worker {plan.index}: {len(plan.nodeids)} tests{estimate} in {len(plan.groups)} groups "
+              f"({', '.join(g.key for g in plan.groups if g.key.endswith('_page_ready')) or 'no page fixture'})")
+
+    running = list(processes)
+    while running:
+        for worker in list(running):
+            exit_code = worker["process"].poll()
+            if exit_code is None:
+                continue
+            worker["exit_code"] = exit_code
+            worker["busy"] = time.perf_counter() - worker["started"]
+            worker["log"].close()
+            os.unlink(worker["tests_file"])
+            running.remove(worker)
+            print(f"  worker {worker['plan'].index} finished after {worker['busy']:.1f}s (exit {exit_code})")
+        if running:
+            time.sleep(0.2)
+
+    wall = time.perf_counter() - start
+    print_parallel_report(processes, wall, predicted)
+
+    junit = option_value(pytest_args, "--junitxml")
+    if junit:
+        merge_junit([worker["junit"] for worker in processes], junit)
+        print(f"📁 Combined JUnit report: {junit}")
+
+    failed = [w["exit_code"] for w in processes if w["exit_code"] != 0]
+    return failed[0] if failed else 0
+
+
+def load_history(nodeids):
+    """Expected seconds per test and per-session overhead from the results store
+
+    Returns:
+        tuple: (durations dict, overhead seconds) - ({}, 0.0) when disabled or empty
+    """
+    if not Config.RESULTS_STORE_ENABLED:
+        return {}, 0.0
+    store = ResultsStore(Config.RESULTS_DB)
+    try:
+        return store.expected_durations(nodeids), store.session_overhead()
+    except Exception as e:
+        print(f"⚠ Could not read test history: {e}")
+        return {}, 0.0
+    finally:
+        store.close()
+
+
+def print_parallel_report(processes, wall, predicted=None):
+    """Wall time, per-worker utilisation and outcome counts"""
+    print("\n⚡ PARALLEL RUN")
+    print("=" * 80)
+    print(f"{'worker':<8}{'tests':>6}{'failed':>8}{'busy':>10}{'in tests':>10}{'utilisation':>13}  exit  log")
+    print("-" * 80)
+    busy_total = 0.0
+    for worker in processes:
+        counts = _junit_counts(worker["junit"])
+        busy_total += worker["busy"]
+        utilisation = worker["busy"] / wall * 100 if wall else 0
+        print(f"{worker['plan'].index:<8}{counts['tests']:>6}{counts['failures'] + counts['errors']:>8}"
+              f"{worker['busy']:>9.1f}s{counts['time']:>9.1f}s{utilisation:>12.0f}%  "
+              f"{worker['exit_code']:>4}  {worker['log_path']}")
+    print("-" * 80)
+    average = busy_total / len(processes) / wall * 100 if processes and wall else 0
+    print(f"wall time {wall:.1f}s  |  summed worker time {busy_total:.1f}s  |  "
+          f"speed-up {busy_total / wall if wall else 0:.2f}x  |  average utilisation {average:.0f}%")
+    if predicted is not None:
+        print(f"predicted wall time {predicted:.1f}s  |  actual {wall:.1f}s  |  "
+              f"error {(wall - predicted) / wall * 100 if wall else 0:+.0f}%")
+    print("=" * 80)
+
+
+def run_pytest(pytest_args, workers=None, shard=None):
+    """Run pytest serially, or in parallel when more than one worker is configured
+
+    Args:
+        pytest_args (list): Arguments as for pytest.main
+        workers (int): Worker processes (default: Config.PARALLEL_WORKERS)
+        shard (str): "i/N" to run only this machine's share of the tests (default: Config.SHARD)
+    """
+    workers = Config.PARALLEL_WORKERS if workers is None else workers
+    shard = Config.SHARD if shard is None else shard
+    if shard and option_value(pytest_args, SHARD_OPTION) is None:
+        pytest_args = shard_args(pytest_args, shard)
+    if workers <= 1:
+        return pytest.main(pytest_args)
+    return run_parallel(pytest_args, workers)
+
+
+# =======================
+# WORKER-SIDE PLUGIN (loaded with -p utils.parallel_runner)
+# =======================
+
+def pytest_addoption(parser):
+    parser.addoption(WORKER_TESTS_OPTION, action="store", default=None,
+                     help="File with the node ids this worker runs, in order")
+    parser.addoption(COLLECT_OUTPUT_OPTION, action="store", default=None,
+                     help="Write the collected node ids and their fixture names to this JSON file")
+
+
+def pytest_collection_modifyitems(session, config, items):
+    tests_file = config.getoption(WORKER_TESTS_OPTION)
+    if not tests_file:
+        return
+
+    with open(tests_file, encoding="utf-8") as handle:
+        order = {nodeid: index for index, nodeid in enumerate(line.strip() for line in handle) if nodeid}
+
+    selected = sorted((item for item in items if item.nodeid in order), key=lambda item: order[item.nodeid])
+    deselected = [item for item in items if item.nodeid not in order]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_collection_finish(session):
+    output = session.config.getoption(COLLECT_OUTPUT_OPTION)
+    if not output:
+        return
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump([[item.nodeid, list(getattr(item, "fixturenames", []))] for item in session.items], handle)
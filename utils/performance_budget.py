@@ -0,0 +1,153 @@
+import pytest
+from config.config import Config
+
+# Latencies measured by the page objects (BasePage.record_latency)
+BUDGET_METRICS = ("route_load", "search_settle", "sort_settle")
+
+# Metrics that only count while the test body runs; route loads count from setup on, since
+# the page fixtures open the route there
+CALL_ONLY_METRICS = ("search_settle", "sort_settle")
+
+
+class PerformanceBudgetWarning(UserWarning):
+    """A latency went over its @pytest.mark.budget limit in warn mode"""
+
+
+def budget_limits(marker, env=None, budgets=None):
+    """
+    Limits in seconds for a budget marker in an environment
+
+        @pytest.mark.budget(route_load=3.0, sort_settle=1.0)  explicit, times the env 'scale'
+        @pytest.mark.budget("route_load", "search_settle")    the env defaults
+
+    Raises:
+        ValueError: For unknown metrics or environments
+    """
+    env = env or Config.BUDGET_ENV
+    budgets = Config.PERFORMANCE_BUDGETS if budgets is None else budgets
+    if env not in budgets:
+        raise ValueError(f"Unknown BUDGET_ENV {env!r}; configured: {', '.join(budgets)}")
+    defaults = budgets[env]
+    scale = defaults.get("scale", 1.0)
+
+    limits = {}
+    for metric in marker.args:
+        limits[metric] = defaults.get(metric)
+    for metric, seconds in marker.kwargs.items():
+        if metric != "mode":
+            limits[metric] = seconds * scale
+
+    unknown = set(limits) - set(BUDGET_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown budget metrics {sorted(unknown)}; choose from {', '.join(BUDGET_METRICS)}")
+    return {metric: seconds for metric, seconds in limits.items() if seconds is not None}
+
+
+class PerformanceBudgetPlugin:
+    """Checks the latencies measured during a test against its @pytest.mark.budget
+
+    The page objects report route loads and search/sort-to-settled latencies through
+    page_metrics.latency_listeners; conftest registers record() there. The worst sample of each
+    budgeted metric is compared with its limit once the test body has run. Over budget the
+    test fails (or, in warn mode, gets a PerformanceBudgetWarning).
+    """
+
+    def __init__(self, env=None, mode=None):
+        self.env = env or Config.BUDGET_ENV
+        self.mode = mode or Config.BUDGET_MODE
+        self.samples = None
+        self.phase = None
+        self.results = []
+
+    # =======================
+    # SAMPLES
+    # =======================
+
+    def record(self, kind, seconds):
+        if self.samples is None or kind not in self.samples:
+            return
+        if kind in CALL_ONLY_METRICS and self.phase != "call":
+            return
+        self.samples[kind].append(seconds)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        budgeted = item.get_closest_marker("budget") is not None
+        self.samples = {metric: [] for metric in BUDGET_METRICS} if budgeted else None
+        self.phase = "setup"
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        self.phase = "call"
+        yield
+        self.phase = None
+
+    # =======================
+    # CHECK
+    # =======================
+
+    def check(self, marker):
+        """(metric, worst seconds, limit) for every budgeted metric; worst is None when the test
+        never measured it (e.g. route_load after the first test of a class-scoped page fixture)"""
+        limits = budget_limits(marker, self.env)
+        samples = self.samples or {}
+        return [(metric, max(samples[metric]) if samples.get(metric) else None, limit)
+                for metric, limit in limits.items()]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        marker = item.get_closest_marker("budget")
+        if call.when != "call" or marker is None or self.samples is None:
+            return
+
+        report = outcome.get_result()
+        try:
+            measured = self.check(marker)
+        except ValueError as e:
+            self.samples = None
+            report.outcome = "failed"
+            report.longrepr = f"Invalid budget marker: {e}"
+            return
+        self.samples = None
+
+        over = [(metric, worst, limit) for metric, worst, limit in measured if worst is None or worst > limit]
+        self.results.append((item.nodeid, measured, bool(over)))
+        if not over:
+            return
+
+        exceeded = any(worst is not None for _, worst, _ in over)
+        message = "Performance budget {} ({}): {}".format(
+            "exceeded" if exceeded else "not measured", self.env,
+            "; ".join(_describe(metric, worst, limit, " > ") for metric, worst, limit in over))
+        if marker.kwargs.get("mode", self.mode) == "warn":
+            item.warn(PerformanceBudgetWarning(message))
+        elif report.passed:
+            report.outcome = "failed"
+            report.longrepr = message
+        else:
+            report.sections.append(("performance budget", message))
+
+    # =======================
+    # REPORTING
+    # =======================
+
+    def report(self):
+        """Budgeted tests, their worst latency per metric and the overruns"""
+        if not self.results:
+            return []
+        over = sum(1 for _, _, exceeded in self.results if exceeded)
+        lines = [f"{len(self.results)} budgeted tests ({self.env}), {over} over budget"]
+        for nodeid, measured, exceeded in self.results:
+            if not exceeded:
+                continue
+            details = ", ".join(_describe(metric, worst, limit, "/") for metric, worst, limit in measured)
+            lines.append(f"  ❌ {nodeid}: {details}")
+        return lines
+
+
+def _describe(metric, worst, limit, separator):
+    if worst is None:
+        return f"{metric} not measured (budget {limit:.2f}s)"
+    return f"{metric} {worst:.2f}s{separator}{limit:.2f}s"
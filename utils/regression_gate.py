@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from config.config import Config
+from utils.results_store import ResultsStore
+
+# Exit code of a run whose tests passed but whose timings regressed (pytest uses 0-5)
+REGRESSION_EXIT_CODE = 6
+
+# Culprits listed under each regression
+TOP_CULPRITS = 3
+
+
+def selection_digest(nodeids):
+    """Short fingerprint of a test selection - wall times are only comparable for the same one"""
+    return hashlib.sha1("\n".join(sorted(nodeids)).encode("utf-8")).hexdigest()[:12]
+
+
+def snapshot(tests, methods, wall_seconds=None):
+    """
+    Timings in the baseline file format
+
+    Args:
+        tests (dict): nodeid -> seconds (ResultsStore.expected_durations)
+        methods (dict): nodeid -> {method: {"calls", "seconds"}} (ResultsStore.page_method_durations)
+        wall_seconds (float): Wall time of the whole run, if known
+    """
+    document = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "tests": {nodeid: {"seconds": round(seconds, 4),
+                           "methods": {method: {"calls": stats["calls"], "seconds": round(stats["seconds"], 4)}
+                                       for method, stats in sorted(methods.get(nodeid, {}).items())}}
+                  for nodeid, seconds in sorted(tests.items())},
+    }
+    if wall_seconds is not None:
+        document["wall_time"] = {"seconds": round(wall_seconds, 2), "tests": len(tests),
+                                 "selection": selection_digest(tests)}
+    return document
+
+
+def current_snapshot(store, since, wall_seconds=None):
+    """Timings of the runs started since a time.time() timestamp (all workers of one invocation)"""
+    run_ids = store.runs_since(since)
+    return snapshot(store.expected_durations(run_ids=run_ids), store.page_method_durations(run_ids=run_ids),
+                    wall_seconds)
+
+
+def history_snapshot(store, nodeids, wall_seconds=None):
+    """Median timings of the given tests over their recent runs - what a baseline is made of"""
+    return snapshot(store.expected_durations(nodeids), store.page_method_durations(nodeids), wall_seconds)
+
+
+def save_baseline(document, path=None):
+    path = path or Config.REGRESSION_BASELINE_FILE
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=1, sort_keys=True)
+    return path
+
+
+def load_baseline(path=None):
+    """The saved baseline, or None when there is none yet"""
+    try:
+        with open(path or Config.REGRESSION_BASELINE_FILE, encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+# =======================
+# COMPARISON
+# =======================
+
+class Regression:
+    """One timing that got slower than the baseline allows, and what made it slower"""
+
+    def __init__(self, kind, name, before, after, culprits=(), unit="s"):
+        self.kind = kind  # wall_time | test | page_method
+        self.name = name
+        self.before = before
+        self.after = after
+        self.culprits = list(culprits)  # (name, extra seconds), biggest first
+        self.unit = unit
+
+    @property
+    def change(self):
+        return (self.after - self.before) / self.before if self.before else float("inf")
+
+    def lines(self):
+        label = {"wall_time": "wall time", "test": "test", "page_method": "page method"}[self.kind]
+        lines = [f"❌ {label} {self.name}: {self.before:.2f}{self.unit} -> {self.after:.2f}{self.unit} "
+                 f"({self.change:+.0%})"]
+        if self.culprits:
+            heading = {"wall_time": "slower tests", "test": "slower page methods", "page_method": "in tests"}[self.kind]
+            lines.append(f"     {heading}: " + ", ".join(f"{name} +{extra:.2f}s" for name, extra in self.culprits))
+        return lines
+
+
+def _slower(before, after, threshold, floor):
+    return after - before >= floor and after > before * (1 + threshold)
+
+
+def _top(deltas):
+    return sorted(((name, extra) for name, extra in deltas if extra > 0), key=lambda item: -item[1])[:TOP_CULPRITS]
+
+
+def _method_deltas(before, after):
+    """Extra seconds per page method between two test records"""
+    methods = set(before.get("methods", {})) | set(after.get("methods", {}))
+    return [(method, after.get("methods", {}).get(method, {}).get("seconds", 0.0)
+             - before.get("methods", {}).get(method, {}).get("seconds", 0.0)) for method in methods]
+
+
+def _per_call(document, nodeids):
+    """Calls and seconds per page method summed over some tests"""
+    totals = {}
+    for nodeid in nodeids:
+        for method, stats in document["tests"][nodeid].get("methods", {}).items():
+            total = totals.setdefault(method, [0, 0.0])
+            total[0] += stats["calls"]
+            total[1] += stats["seconds"]
+    return totals
+
+
+def find_regressions(baseline, current, threshold=None, min_seconds=None, min_call_seconds=None):
+    """
+    Compare a run's timings with the baseline
+
+    A timing regresses when it is more than `threshold` (a fraction) slower and at least
+    the absolute floor slower too (min_seconds for tests and wall time, min_call_seconds
+    for one page-method call). Page methods are compared per call over the tests both
+    snapshots have, so a different selection does not skew them; the wall time only when
+    the selection is the same.
+
+    Returns:
+        tuple: (regressions, notes) - notes explain what could not be compared
+    """
+    threshold = Config.REGRESSION_THRESHOLD if threshold is None else threshold
+    min_seconds = Config.REGRESSION_MIN_SECONDS if min_seconds is None else min_seconds
+    min_call_seconds = Config.REGRESSION_MIN_CALL_SECONDS if min_call_seconds is None else min_call_seconds
+    regressions = []
+    notes = []
+    common = sorted(set(baseline["tests"]) & set(current["tests"]))
+
+    test_deltas = [(nodeid, current["tests"][nodeid]["seconds"] - baseline["tests"][nodeid]["seconds"])
+                   for nodeid in common]
+    wall_before, wall_after = baseline.get("wall_time"), current.get("wall_time")
+    if wall_before and wall_after:
+        if wall_before["selection"] != wall_after["selection"]:
+            notes.append(f"wall time not compared: different test selection "
+                         f"({wall_before['tests']} tests in the baseline, {wall_after['tests']} now)")
+        elif _slower(wall_before["seconds"], wall_after["seconds"], threshold, min_seconds):
+            regressions.append(Regression("wall_time", "total", wall_before["seconds"], wall_after["seconds"],
+                                          _top(test_deltas)))
+
+    for nodeid, _ in test_deltas:
+        before, after = baseline["tests"][nodeid], current["tests"][nodeid]
+        if _slower(before["seconds"], after["seconds"], threshold, min_seconds):
+            regressions.append(Regression("test", nodeid, before["seconds"], after["seconds"],
+                                          _top(_method_deltas(before, after))))
+
+    methods_before, methods_after = _per_call(baseline, common), _per_call(current, common)
+    for method in sorted(set(methods_before) & set(methods_after)):
+        (calls_before, seconds_before), (calls_after, seconds_after) = methods_before[method], methods_after[method]
+        if not calls_before or not calls_after:
+            continue
+        before, after = seconds_before / calls_before, seconds_after / calls_after
+        if _slower(before, after, threshold, min_call_seconds):
+            in_tests = [(nodeid, current["tests"][nodeid].get("methods", {}).get(method, {}).get("seconds", 0.0)
+                         - baseline["tests"][nodeid].get("methods", {}).get(method, {}).get("seconds", 0.0))
+                        for nodeid in common]
+            regressions.append(Regression("page_method", method, before, after, _top(in_tests), unit="s/call"))
+
+    missing = len(current["tests"]) - len(common)
+    if missing:
+        notes.append(f"{missing} tests have no baseline yet")
+    return regressions, notes
+
+
+def gate_report(regressions, notes, threshold=None):
+    """Report lines for find_regressions()"""
+    threshold = Config.REGRESSION_THRESHOLD if threshold is None else threshold
+    order = {"wall_time": 0, "page_method": 1, "test": 2}
+    regressions = sorted(regressions, key=lambda r: (order[r.kind], -(r.after - r.before)))
+    lines = [f"{len(regressions)} timings regressed more than {threshold:.0%}" if regressions
+             else f"✅ No timing regressed more than {threshold:.0%}"]
+    for regression in regressions:
+        lines.extend(regression.lines())
+    lines.extend(f"ℹ️ {note}" for note in notes)
+    return lines
+
+
+# =======================
+# RUNNER ENTRY POINT
+# =======================
+
+def run_gate(since, wall_seconds, baseline_path=None, save=False, db_path=None):
+    """
+    Check (or, with save, replace) the baseline after a test run
+
+    Args:
+        since (float): time.time() when the run started; its results store runs are compared
+        wall_seconds (float): Wall time of the run
+        save (bool): Store the tests' recent medians (this run included) as the new baseline
+
+    Returns:
+        bool: False if a timing regressed
+    """
+    baseline_path = baseline_path or Config.REGRESSION_BASELINE_FILE
+    store = ResultsStore(db_path or Config.RESULTS_DB)
+    try:
+        current = current_snapshot(store, since, wall_seconds)
+        if not current["tests"]:
+            print("⚠ Regression gate: no results recorded for this run (is RESULTS_STORE enabled?)")
+            return True
+        if save:
+            document = history_snapshot(store, list(current["tests"]), wall_seconds)
+            print(f"📌 Timing baseline for {len(document['tests'])} tests saved to {save_baseline(document, baseline_path)}")
+            return True
+    finally:
+        store.close()
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print(f"ℹ️ Regression gate: no baseline at {baseline_path} - run with --save-baseline to create one")
+        return True
+
+    regressions, notes = find_regressions(baseline, current)
+    print(f"\n⏱️ Regression gate vs {baseline_path} (saved {baseline.get('created_at', '?')}):")
+    for line in gate_report(regressions, notes):
+        print(f"   {line}")
+    return not regressions
@@ -0,0 +1,249 @@
+import json
+import os
+import threading
+from config.config import Config
+
+
+# URL patterns per resource type for Network.setBlockedURLs ('*' matches any characters).
+# *.ico is left out on purpose: /favicon.ico is the cheap same-origin page used to inject
+# the saved login state (Config.AUTH_STATE_ORIGIN_PATH).
+RESOURCE_TYPE_PATTERNS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "bmp"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "mp3", "wav"),
+    "stylesheet": ("css",),
+    "script": ("js",),
+}
+
+# Third-party hosts the admin pulls in that no test asserts on
+THIRD_PARTY_PATTERNS = (
+    "*://fonts.googleapis.com/*",
+    "*://fonts.gstatic.com/*",
+    "*://www.google-analytics.com/*",
+    "*://www.googletagmanager.com/*",
+    "*://maps.googleapis.com/*",
+    "*://*.gravatar.com/*",
+)
+
+# Chrome's resource types (Network.ResourceType) as used in the blocking profiles
+CDP_RESOURCE_TYPES = {"Image": "image", "Font": "font", "Media": "media", "Stylesheet": "stylesheet",
+                      "Script": "script"}
+
+
+class BlockingProfile:
+    """Resource types and URL patterns to block in a browser
+
+    Declared on page objects (REQUEST_BLOCKING) or tests (@pytest.mark.block_requests) and
+    applied with Network.setBlockedURLs when the browser is leased.
+    """
+
+    def __init__(self, resource_types=(), url_patterns=(), third_party=False, name=None):
+        unknown = set(resource_types) - set(RESOURCE_TYPE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types {sorted(unknown)}; "
+                             f"choose from {', '.join(RESOURCE_TYPE_PATTERNS)}")
+        self.resource_types = tuple(sorted(set(resource_types)))
+        self.url_patterns = tuple(sorted(set(url_patterns)))
+        self.third_party = third_party
+        self.name = name
+
+    def patterns(self):
+        """URL patterns for Network.setBlockedURLs"""
+        patterns = set(self.url_patterns)
+        for resource_type in self.resource_types:
+            for extension in RESOURCE_TYPE_PATTERNS[resource_type]:
+                patterns.add(f"*.{extension}")
+                patterns.add(f"*.{extension}?*")
+        if self.third_party:
+            patterns.update(THIRD_PARTY_PATTERNS)
+        return sorted(patterns)
+
+    def merge(self, other):
+        """Union of two profiles (a browser shared by several page objects)"""
+        return BlockingProfile(self.resource_types + other.resource_types,
+                               self.url_patterns + other.url_patterns,
+                               self.third_party or other.third_party,
+                               name="+".join(sorted({self.label, other.label})))
+
+    @property
+    def label(self):
+        if self.name:
+            return self.name
+        parts = list(self.resource_types) + (["third-party"] if self.third_party else [])
+        if self.url_patterns:
+            parts.append(f"{len(self.url_patterns)} url patterns")
+        return ",".join(parts) or "none"
+
+    @classmethod
+    def resolve(cls, value):
+        """Profile for a declaration: a name in PROFILES, a dict of arguments or a profile
+
+        None means "not declared" and resolves to Config.REQUEST_BLOCKING_PROFILE.
+        """
+        if value is None:
+            value = Config.REQUEST_BLOCKING_PROFILE
+        if isinstance(value, BlockingProfile):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        if value not in PROFILES:
+            raise ValueError(f"Unknown request blocking profile {value!r}; choose from {', '.join(PROFILES)}")
+        return PROFILES[value]
+
+    @classmethod
+    def from_marker(cls, marker):
+        """@pytest.mark.block_requests("image", "font", urls=[...], third_party=True) or (profile="none")"""
+        if "profile" in marker.kwargs:
+            return cls.resolve(marker.kwargs["profile"])
+        return cls(marker.args, marker.kwargs.get("urls", ()), marker.kwargs.get("third_party", False))
+
+    @classmethod
+    def for_pages(cls, page_classes):
+        """Union of the profiles declared by the page objects sharing a browser"""
+        profiles = [cls.resolve(getattr(page_class, "REQUEST_BLOCKING", None)) for page_class in page_classes]
+        if not profiles:
+            return cls.resolve(None)
+        profile = profiles[0]
+        for other in profiles[1:]:
+            if other is not profile:
+                profile = profile.merge(other)
+        return profile
+
+
+PROFILES = {
+    "none": BlockingProfile(name="none"),
+    # Catalogue list pages: tests read tables, never pixels
+    "admin": BlockingProfile(("image", "font", "media"), third_party=True, name="admin"),
+}
+
+
+class RequestBlocker:
+    """Applies blocking profiles over CDP and counts what they saved
+
+    Blocked requests are read from Chrome's performance log (Network.loadingFailed with a
+    blockedReason). Their bytes are estimated from the sizes the same URLs had when they
+    were loaded unblocked - by the profile warm-up browser or pages that block nothing -
+    kept across runs in Config.RESOURCE_SIZES_FILE.
+    """
+
+    def __init__(self, sizes_file=None):
+        self.sizes_file = sizes_file or Config.RESOURCE_SIZES_FILE
+        self.sizes = self._load_sizes()
+        self._new_sizes = False
+        self._lock = threading.Lock()
+        self.stats = {"applied": {}, "blocked": {}, "bytes_saved": 0, "unknown_size": 0,
+                      "loaded": 0, "bytes_loaded": 0}
+
+    # =======================
+    # APPLYING PROFILES
+    # =======================
+
+    def apply(self, driver, profile):
+        """Set the browser's blocked URLs to the profile's (clearing any previous lease's)
+
+        Returns:
+            bool: False for browsers without CDP (Firefox)
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        patterns = profile.patterns()
+        if getattr(driver, "_blocked_patterns", None) != patterns:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            driver._blocked_patterns = patterns
+        with self._lock:
+            applied = self.stats["applied"]
+            applied[profile.label] = applied.get(profile.label, 0) + 1
+        return True
+
+    # =======================
+    # COUNTING
+    # =======================
+
+    def collect(self, driver):
+        """Drain the browser's performance log and count blocked and loaded requests"""
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            return
+        requests = {}
+        with self._lock:
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, TypeError, ValueError):
+                    continue
+                method, params = message.get("method"), message.get("params", {})
+                if method == "Network.requestWillBeSent":
+                    requests[params.get("requestId")] = (params.get("request", {}).get("url", ""),
+                                                         params.get("type"))
+                elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                    url, resource_type = requests.get(params.get("requestId"), ("", params.get("type")))
+                    self._record_blocked(url, resource_type)
+                elif method == "Network.loadingFinished":
+                    url, _ = requests.get(params.get("requestId"), ("", None))
+                    self._record_loaded(url, params.get("encodedDataLength", 0))
+
+    def _record_blocked(self, url, resource_type):
+        kind = CDP_RESOURCE_TYPES.get(resource_type, "other")
+        blocked = self.stats["blocked"]
+        blocked[kind] = blocked.get(kind, 0) + 1
+        size = self.sizes.get(_size_key(url))
+        if size is None:
+            self.stats["unknown_size"] += 1
+        else:
+            self.stats["bytes_saved"] += size
+
+    def _record_loaded(self, url, size):
+        self.stats["loaded"] += 1
+        self.stats["bytes_loaded"] += int(size or 0)
+        if url and size:
+            self.sizes[_size_key(url)] = int(size)
+            self._new_sizes = True
+
+    # =======================
+    # REPORTING
+    # =======================
+
+    def report(self):
+        """Blocked requests by type and the estimated bytes saved"""
+        stats = self.stats
+        if not stats["applied"]:
+            return []
+        applied = ", ".join(f"{label} x{count}" for label, count in sorted(stats["applied"].items()))
+        lines = [f"profiles applied: {applied}"]
+        blocked = sum(stats["blocked"].values())
+        if blocked:
+            by_type = ", ".join(f"{kind} {count}" for kind, count in sorted(stats["blocked"].items()))
+            lines.append(f"requests blocked: {blocked} ({by_type})")
+            estimate = f"~{stats['bytes_saved'] / 1024:.0f} KiB saved"
+            if stats["unknown_size"]:
+                estimate += f" ({stats['unknown_size']} blocked requests of unknown size)"
+            lines.append(estimate)
+        lines.append(f"requests loaded: {stats['loaded']} ({stats['bytes_loaded'] / 1024:.0f} KiB)")
+        return lines
+
+    def save_sizes(self):
+        """Persist sizes learned from unblocked loads for the next run's estimates"""
+        if not self._new_sizes:
+            return
+        directory = os.path.dirname(self.sizes_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        merged = dict(self._load_sizes())
+        merged.update(self.sizes)
+        with open(self.sizes_file, "w", encoding="utf-8") as handle:
+            json.dump(merged, handle, indent=1, sort_keys=True)
+        self._new_sizes = False
+
+    def _load_sizes(self):
+        try:
+            with open(self.sizes_file, encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+
+def _size_key(url):
+    """Sizes are kept per URL without query string (cache-busting parameters vary)"""
+    return url.split("?", 1)[0].split("#", 1)[0]
@@ -0,0 +1,403 @@
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+from config.config import Config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    worker TEXT,
+    exit_status INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS page_loads (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT,
+    route TEXT NOT NULL,
+    navigation TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    duration REAL,
+    ttfb REAL,
+    dcl REAL,
+    load REAL,
+    fcp REAL,
+    lcp REAL,
+    resources INTEGER,
+    transfer_bytes INTEGER,
+    encoded_bytes INTEGER,
+    cached_resources INTEGER
+);
+CREATE INDEX IF NOT EXISTS page_loads_route ON page_loads (route, navigation, run_id);
+CREATE TABLE IF NOT EXISTS page_methods (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    method TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS page_methods_nodeid ON page_methods (nodeid, run_id);
+"""
+
+# Page load metrics kept per route (see BasePage.capture_page_timing), all times in ms
+PAGE_LOAD_METRICS = ("duration", "ttfb", "dcl", "load", "fcp", "lcp", "resources", "transfer_bytes",
+                     "encoded_bytes", "cached_resources")
+
+
+class ResultsStore:
+    """Local SQLite history of per-test setup/call/teardown durations and outcomes, of the
+    wall time per page-object method in each test, and of page load timings per route
+
+    Every pytest session (and every parallel worker) records into the same database;
+    WAL mode plus a busy timeout lets workers write concurrently. The history feeds
+    longest-first scheduling and wall-time predictions.
+    """
+
+    def __init__(self, path, history=5):
+        """
+        Args:
+            path (str): SQLite database file (created on first use)
+            history (int): Most recent runs per test used for expected durations
+        """
+        self.path = path
+        self.history = history
+        self.run_id = None
+        self._connection = None
+        self._lock = threading.Lock()
+
+    # =======================
+    # CONNECTION
+    # =======================
+
+    def connect(self):
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    # =======================
+    # RECORDING
+    # =======================
+
+    def start_run(self, worker=None, started_at=None):
+        """Open a run; conftest does this at session start with started_at=process_started_at()"""
+        with self._lock:
+            connection = self.connect()
+            with connection:
+                cursor = connection.execute("INSERT INTO runs (started_at, worker) VALUES (?, ?)",
+                                            (started_at or time.time(), worker))
+            self.run_id = cursor.lastrowid
+        return self.run_id
+
+    def record(self, nodeid, phase, duration, outcome):
+        """Store one phase (setup, call or teardown) of a test; starts a run on first use"""
+        if self.run_id is None:
+            self.start_run(os.getenv("WORKER_ID"))
+        with self._lock:
+            connection = self.connect()
+            with connection:
+                connection.execute(
+                    "INSERT INTO results (run_id, nodeid, phase, duration, outcome) VALUES (?, ?, ?, ?, ?)",
+                    (self.run_id, nodeid, phase, duration, outcome)
+                )
+
+    def record_page_load(self, timing, nodeid=None):
+        """Store the page load timing of one navigation (BasePage.capture_page_timing)"""
+        if self.run_id is None:
+            self.start_run(os.getenv("WORKER_ID"))
+        columns = ("run_id", "nodeid", "route", "navigation", "recorded_at") + PAGE_LOAD_METRICS
+        values = (self.run_id, nodeid, timing["route"], timing["navigation"],
+                  timing.get("recorded_at", time.time())) + tuple(timing.get(key) for key in PAGE_LOAD_METRICS)
+        with self._lock:
+            connection = self.connect()
+            with connection:
+                connection.execute(f"INSERT INTO page_loads ({', '.join(columns)}) "
+                                   f"VALUES ({', '.join('?' for _ in columns)})", values)
+
+    def record_page_methods(self, nodeid, methods):
+        """Store the page-object method wall times of one test (DriverMetrics page timers)
+
+        Args:
+            methods (dict): method -> {"calls": int, "seconds": float}
+        """
+        if not methods:
+            return
+        if self.run_id is None:
+            self.start_run(os.getenv("WORKER_ID"))
+        with self._lock:
+            connection = self.connect()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO page_methods (run_id, nodeid, method, calls, seconds) VALUES (?, ?, ?, ?, ?)",
+                    [(self.run_id, nodeid, method, stats["calls"], stats["seconds"])
+                     for method, stats in methods.items()]
+                )
+
+    def finish_run(self, exit_status):
+        if self.run_id is None:
+            return
+        with self._lock:
+            connection = self.connect()
+            with connection:
+                connection.execute("UPDATE runs SET finished_at = ?, exit_status = ? WHERE id = ?",
+                                   (time.time(), int(exit_status), self.run_id))
+
+    # =======================
+    # HISTORY
+    # =======================
+
+    def expected_durations(self, nodeids=None, run_ids=None):
+        """Median total duration (setup + call + teardown) of each test over recent runs
+
+        Args:
+            run_ids (list): Only these runs (e.g. the ones of the current invocation)
+
+        Returns:
+            dict: nodeid -> expected seconds, only for tests with history
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        where, params = _run_filter(run_ids)
+        with self._lock:
+            rows = self.connect().execute(
+                f"SELECT nodeid, run_id, SUM(duration) FROM results {where}"
+                f"GROUP BY nodeid, run_id ORDER BY nodeid, run_id DESC", params
+            ).fetchall()
+
+        wanted = set(nodeids) if nodeids is not None else None
+        samples = {}
+        for nodeid, _, total in rows:
+            if wanted is not None and nodeid not in wanted:
+                continue
+            runs = samples.setdefault(nodeid, [])
+            if len(runs) < self.history:
+                runs.append(total)
+        return {nodeid: statistics.median(runs) for nodeid, runs in samples.items()}
+
+    def page_method_durations(self, nodeids=None, run_ids=None):
+        """Median calls and wall time per page-object method of each test over recent runs
+
+        Args:
+            run_ids (list): Only these runs (e.g. the ones of the current invocation)
+
+        Returns:
+            dict: nodeid -> {method: {"calls": median calls, "seconds": median seconds}}
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        where, params = _run_filter(run_ids)
+        with self._lock:
+            rows = self.connect().execute(
+                f"SELECT nodeid, run_id, method, calls, seconds FROM page_methods {where}"
+                f"ORDER BY nodeid, run_id DESC", params
+            ).fetchall()
+
+        wanted = set(nodeids) if nodeids is not None else None
+        samples = {}
+        for nodeid, run_id, method, calls, seconds in rows:
+            if wanted is not None and nodeid not in wanted:
+                continue
+            runs = samples.setdefault(nodeid, {})
+            if run_id not in runs and len(runs) >= self.history:
+                continue
+            runs.setdefault(run_id, {})[method] = (calls, seconds)
+
+        durations = {}
+        for nodeid, runs in samples.items():
+            methods = {method for run in runs.values() for method in run}
+            durations[nodeid] = {
+                method: {"calls": statistics.median(run.get(method, (0, 0.0))[0] for run in runs.values()),
+                         "seconds": statistics.median(run.get(method, (0, 0.0))[1] for run in runs.values())}
+                for method in methods
+            }
+        return durations
+
+    def runs_since(self, started_at):
+        """Ids of the runs started at or after a time.time() timestamp (one invocation's workers)"""
+        if not os.path.exists(self.path):
+            return []
+        with self._lock:
+            return [row[0] for row in self.connect().execute(
+                "SELECT id FROM runs WHERE started_at >= ? ORDER BY id", (started_at,)).fetchall()]
+
+    def predict(self, nodeids, durations=None):
+        """Serial wall-time estimate for a set of tests
+
+        Tests without history count as the median known test duration.
+
+        Returns:
+            tuple: (predicted seconds, tests with history, tests without history)
+        """
+        durations = self.expected_durations(nodeids) if durations is None else durations
+        known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+        unknown = len(nodeids) - len(known)
+        fallback = statistics.median(known) if known else 0.0
+        return sum(known) + unknown * fallback, len(known), unknown
+
+    def session_overhead(self):
+        """Median seconds a finished run spent outside test phases (startup, collection, shutdown)"""
+        if not os.path.exists(self.path):
+            return 0.0
+
+        with self._lock:
+            rows = self.connect().execute(
+                "SELECT runs.finished_at - runs.started_at - COALESCE(SUM(results.duration), 0) "
+                "FROM runs LEFT JOIN results ON results.run_id = runs.id "
+                "WHERE runs.finished_at IS NOT NULL GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?",
+                (self.history,)
+            ).fetchall()
+
+        overheads = [max(0.0, row[0]) for row in rows]
+        return statistics.median(overheads) if overheads else 0.0
+
+    def page_load_baseline(self, runs=None):
+        """Median page load metrics per (route, navigation) over earlier runs
+
+        Args:
+            runs (int): Most recent earlier runs with page loads to use (default: history)
+
+        Returns:
+            dict: (route, navigation) -> {metric: median or None}
+        """
+        if not os.path.exists(self.path):
+            return {}
+
+        with self._lock:
+            rows = self.connect().execute(
+                f"SELECT route, navigation, {', '.join(PAGE_LOAD_METRICS)} FROM page_loads "
+                f"WHERE run_id IN (SELECT DISTINCT run_id FROM page_loads WHERE run_id != ? "
+                f"ORDER BY run_id DESC LIMIT ?)",
+                (self.run_id or -1, runs or self.history)
+            ).fetchall()
+
+        samples = {}
+        for route, navigation, *metrics in rows:
+            samples.setdefault((route, navigation), []).append(metrics)
+        return {key: _metric_medians(loads) for key, loads in samples.items()}
+
+    def page_load_history(self, route, navigation="full", limit=20):
+        """Per-run medians of one route, newest first: (run_id, started_at, loads, {metric: median})"""
+        if not os.path.exists(self.path):
+            return []
+
+        with self._lock:
+            rows = self.connect().execute(
+                f"SELECT page_loads.run_id, runs.started_at, {', '.join(PAGE_LOAD_METRICS)} "
+                f"FROM page_loads JOIN runs ON runs.id = page_loads.run_id "
+                f"WHERE route = ? AND navigation = ? ORDER BY page_loads.run_id DESC",
+                (route, navigation)
+            ).fetchall()
+
+        by_run = {}
+        for run_id, started_at, *metrics in rows:
+            by_run.setdefault((run_id, started_at), []).append(metrics)
+        return [(run_id, started_at, len(loads), _metric_medians(loads))
+                for (run_id, started_at), loads in list(by_run.items())[:limit]]
+
+    def last_runs(self, limit=10):
+        """Most recent runs as (id, started_at, finished_at, worker, exit_status)"""
+        with self._lock:
+            return self.connect().execute(
+                "SELECT id, started_at, finished_at, worker, exit_status FROM runs ORDER BY id DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+
+
+def process_started_at():
+    """Wall-clock time this process started (Linux /proc, 10 ms resolution), else now
+
+    Runs measured from here include interpreter startup and plugin imports in their overhead.
+    """
+    try:
+        with open("/proc/self/stat", encoding="utf-8") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])  # Field 22, starttime
+        with open("/proc/uptime", encoding="utf-8") as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - (uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.time()
+
+
+def _run_filter(run_ids):
+    """WHERE clause (with trailing space) and parameters restricting a query to some runs"""
+    if run_ids is None:
+        return "", ()
+    run_ids = list(run_ids) or [-1]
+    return f"WHERE run_id IN ({', '.join('?' for _ in run_ids)}) ", tuple(run_ids)
+
+
+def _metric_medians(loads):
+    """Median of each page load metric over rows ordered like PAGE_LOAD_METRICS"""
+    medians = {}
+    for index, metric in enumerate(PAGE_LOAD_METRICS):
+        values = [load[index] for load in loads if load[index] is not None]
+        medians[metric] = statistics.median(values) if values else None
+    return medians
+
+
+# =======================
+# COMMAND LINE
+# =======================
+
+def main(argv=None):
+    """Print page load history per route: python -m utils.results_store page-loads [route]"""
+    parser = argparse.ArgumentParser(prog="python -m utils.results_store",
+                                     description="Page load history kept by the test runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    loads = commands.add_parser("page-loads", help="Median page load timings per run")
+    loads.add_argument("route", nargs="?", help="Route path (default: every recorded route)")
+    loads.add_argument("--navigation", default="full", choices=("full", "in_app", "current"))
+    loads.add_argument("--runs", type=int, default=10)
+    loads.add_argument("--db", default=Config.RESULTS_DB)
+    args = parser.parse_args(argv)
+
+    store = ResultsStore(args.db)
+    try:
+        if not os.path.exists(args.db):
+            print(f"No results store at {args.db}")
+            return 1
+        routes = [args.route] if args.route else [row[0] for row in store.connect().execute(
+            "SELECT DISTINCT route FROM page_loads ORDER BY route").fetchall()]
+        for route in routes:
+            history = store.page_load_history(route, args.navigation, args.runs)
+            if not history:
+                continue
+            print(f"\n{route} ({args.navigation})")
+            print(f"  {'run':>5} {'started':<16} {'n':>3} " + " ".join(f"{metric:>8}" for metric in PAGE_LOAD_METRICS[:6])
+                  + f" {'KiB':>7}")
+            for run_id, started_at, count, medians in history:
+                values = " ".join(f"{medians[metric]:8.0f}" if medians[metric] is not None else f"{'-':>8}"
+                                  for metric in PAGE_LOAD_METRICS[:6])
+                kib = (medians["transfer_bytes"] or 0) / 1024
+                print(f"  {run_id:>5} {datetime.fromtimestamp(started_at):%Y-%m-%d %H:%M} {count:>3} {values} {kib:7.0f}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
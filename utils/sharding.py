@@ -0,0 +1,180 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+from config.config import Config
+from utils.parallel_runner import build_groups, merge_junit, schedule
+from utils.results_store import ResultsStore
+
+
+class ShardSelection:
+    """The tests of one shard and how the whole suite was split"""
+
+    def __init__(self, index, count, plans, total, known):
+        self.index = index
+        self.count = count
+        self.plans = plans
+        self.total = total
+        self.known = known
+
+    @property
+    def plan(self):
+        return self.plans[self.index - 1]
+
+    @property
+    def nodeids(self):
+        return self.plan.nodeids
+
+    def summary(self):
+        header = f"🧩 Shard {self.index}/{self.count}: {len(self.nodeids)} of {self.total} tests"
+        if not self.known:
+            sizes = ", ".join(str(len(plan.nodeids)) for plan in self.plans)
+            return f"{header} (no duration snapshot, equal counts: {sizes})"
+        loads = ", ".join(f"{plan.load:.0f}s" for plan in self.plans)
+        return (f"{header}, ~{self.plan.load:.0f}s "
+                f"(durations for {self.known}/{self.total} tests; shard estimates {loads})")
+
+
+def parse_shard(value):
+    """Parse "i/N" (1-based) into (i, N)
+
+    Raises:
+        ValueError: If the value is not of the form i/N with 1 <= i <= N
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N (e.g. 2/4), got {value!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and N, got {value!r}")
+    return index, count
+
+
+# =======================
+# DURATIONS SNAPSHOT
+# =======================
+
+def load_snapshot(path=None):
+    """Expected seconds per node id from the shared snapshot file ({} when there is none)
+
+    Every machine must split the suite the same way, so sharding only uses this committed
+    snapshot and never the machine-local results store.
+    """
+    path = path or Config.SHARD_DURATIONS_FILE
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return {nodeid: float(seconds) for nodeid, seconds in json.load(handle).items()}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, AttributeError) as e:
+        print(f"⚠ Ignoring unreadable duration snapshot {path}: {e}")
+        return {}
+
+
+def export_snapshot(path=None, store_path=None):
+    """Write the results store's expected durations as a snapshot file for sharding
+
+    Returns:
+        int: Number of tests written
+    """
+    path = path or Config.SHARD_DURATIONS_FILE
+    store = ResultsStore(store_path or Config.RESULTS_DB)
+    try:
+        durations = store.expected_durations()
+    finally:
+        store.close()
+
+    snapshot = {nodeid: round(seconds, 2) for nodeid, seconds in sorted(durations.items())}
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(snapshot, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    return len(snapshot)
+
+
+# =======================
+# SPLITTING
+# =======================
+
+def split(items, index, count, durations=None):
+    """Partition collected tests into `count` balanced shards and select shard `index`
+
+    Tests sharing a page fixture stay in one shard. Shards are balanced on the snapshot
+    durations (tests missing from it count as the median) and, without a snapshot, on test
+    counts. The split depends only on the node ids, fixtures and snapshot, so every machine
+    computes the same partition.
+
+    Args:
+        items (list): (nodeid, fixture names) tuples in collection order
+        index (int): 1-based shard number
+        count (int): Number of shards
+        durations (dict): Seconds per node id (default: load_snapshot())
+    """
+    durations = load_snapshot() if durations is None else durations
+    nodeids = {nodeid for nodeid, _ in items}
+    known = {nodeid: seconds for nodeid, seconds in durations.items() if nodeid in nodeids}
+    default_duration = statistics.median(known.values()) if known else 1.0
+
+    # Sort first so the split does not depend on collection order
+    ordered = sorted(items, key=lambda item: item[0])
+    plans = schedule(build_groups(ordered, known, default_duration), count, keep_empty=True)
+    order = {nodeid: position for position, (nodeid, _) in enumerate(items)}
+    for plan in plans:
+        for group in plan.groups:
+            group.nodeids.sort(key=order.get)
+    return ShardSelection(index, count, plans, len(items), len(known))
+
+
+def apply_shard(config, items, value):
+    """Deselect every collected item outside the requested shard (pytest_collection_modifyitems)"""
+    index, count = parse_shard(value)
+    selection = split([(item.nodeid, list(getattr(item, "fixturenames", []))) for item in items],
+                      index, count)
+
+    selected = set(selection.nodeids)
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = [item for item in items if item.nodeid in selected]
+    return selection
+
+
+# =======================
+# COMMAND LINE
+# =======================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.sharding",
+                                     description="Duration snapshots and report merging for sharded runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Write the duration snapshot from the local results store")
+    export.add_argument("--output", default=Config.SHARD_DURATIONS_FILE)
+    export.add_argument("--db", default=Config.RESULTS_DB)
+
+    merge = commands.add_parser("merge", help="Combine the JUnit reports of all shards into one")
+    merge.add_argument("reports", nargs="+")
+    merge.add_argument("--output", default=os.path.join(Config.REPORTS_DIR, "junit.xml"))
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        written = export_snapshot(args.output, args.db)
+        print(f"✓ Wrote durations of {written} tests to {args.output}")
+        return 0 if written else 1
+
+    totals = merge_junit(args.reports, args.output)
+    print(f"✓ Merged {len(args.reports)} reports into {args.output}: {totals['tests']} tests, "
+          f"{totals['failures']} failures, {totals['errors']} errors, {totals['skipped']} skipped")
+    if totals["duplicates"]:
+        print(f"⚠ {len(totals['duplicates'])} tests ran in more than one shard, "
+              f"e.g. {totals['duplicates'][0]}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
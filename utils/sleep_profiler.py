@@ -0,0 +1,169 @@
+import json
+import os
+import sys
+import threading
+import time
+
+NO_TEST = "<outside tests>"
+
+
+class SleepProfiler:
+    """Records every time.sleep by call site and test to find the dead time worth removing
+
+    `time.sleep` is replaced for the session. Each call is attributed to the line that made
+    it (file:line plus Class.method) and to the running test. Sleeps made by Selenium itself
+    (the poll interval of WebDriverWait) are condition waits, not dead time, so they are only
+    counted as a separate total.
+    """
+
+    def __init__(self, path, root=None):
+        """
+        Args:
+            path (str): JSON file receiving the ranked call sites at the end of the session
+            root (str): Directory call-site paths are shown relative to (default: cwd)
+        """
+        self.path = path
+        self.root = os.path.abspath(root or os.getcwd())
+        self.current_test = NO_TEST
+        self.call_sites = {}
+        self.by_test = {}
+        self.poll_seconds = 0.0
+        self.listeners = []
+        self._lock = threading.Lock()
+        self._original_sleep = None
+
+    # =======================
+    # PATCHING
+    # =======================
+
+    def install(self):
+        """Replace time.sleep with the recording version (idempotent)"""
+        if self._original_sleep is not None:
+            return
+
+        self._original_sleep = original_sleep = time.sleep
+        profiler = self
+
+        def profiled_sleep(seconds):
+            caller = sys._getframe(1)
+            while caller.f_back is not None and caller.f_globals.get("__name__") == __name__:
+                caller = caller.f_back  # Another profiler stacked on top of this one
+            start = time.perf_counter()
+            try:
+                original_sleep(seconds)
+            finally:
+                profiler.record(caller, seconds, time.perf_counter() - start)
+
+        time.sleep = profiled_sleep
+
+    def uninstall(self):
+        if self._original_sleep is None:
+            return
+        time.sleep = self._original_sleep
+        self._original_sleep = None
+
+    # =======================
+    # RECORDING
+    # =======================
+
+    def start_test(self, nodeid):
+        self.current_test = nodeid
+
+    def finish_test(self):
+        self.current_test = NO_TEST
+
+    def record(self, frame, requested, slept):
+        """Attribute one finished sleep to its call site and the running test"""
+        if frame.f_globals.get("__name__", "").startswith("selenium"):
+            with self._lock:
+                self.poll_seconds += slept
+            return
+
+        site = self._call_site(frame)
+        main_thread = threading.current_thread() is threading.main_thread()
+        test = self.current_test if main_thread else NO_TEST
+
+        with self._lock:
+            stats = self.call_sites.setdefault(site, {"count": 0, "seconds": 0.0, "requested": 0.0, "tests": {}})
+            stats["count"] += 1
+            stats["seconds"] += slept
+            stats["requested"] += requested
+            stats["tests"][test] = stats["tests"].get(test, 0.0) + slept
+            self.by_test[test] = self.by_test.get(test, 0.0) + slept
+
+        if main_thread:
+            for listener in self.listeners:
+                listener(slept)
+
+    def _call_site(self, frame):
+        filename = frame.f_code.co_filename
+        try:
+            filename = os.path.relpath(filename, self.root)
+        except ValueError:
+            pass  # Different drive on Windows
+
+        owner = frame.f_locals.get("self")
+        function = frame.f_code.co_name
+        if owner is not None:
+            function = f"{type(owner).__name__}.{function}"
+        return f"{filename}:{frame.f_lineno} {function}"
+
+    # =======================
+    # REPORTING
+    # =======================
+
+    @property
+    def total_seconds(self):
+        return sum(stats["seconds"] for stats in self.call_sites.values())
+
+    def ranked_call_sites(self):
+        """Call sites ordered by total seconds slept"""
+        return sorted(self.call_sites.items(), key=lambda item: -item[1]["seconds"])
+
+    def save(self):
+        """Write the ranked profile as JSON"""
+        if not self.call_sites:
+            return
+        profile = {
+            "total_seconds": round(self.total_seconds, 3),
+            "selenium_poll_seconds": round(self.poll_seconds, 3),
+            "call_sites": [
+                {
+                    "site": site,
+                    "count": stats["count"],
+                    "seconds": round(stats["seconds"], 3),
+                    "requested_seconds": round(stats["requested"], 3),
+                    "tests": len(stats["tests"]),
+                }
+                for site, stats in self.ranked_call_sites()
+            ],
+            "tests": {test: round(seconds, 3) for test, seconds in
+                      sorted(self.by_test.items(), key=lambda item: -item[1])},
+        }
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as handle:
+                json.dump(profile, handle, indent=2)
+        except OSError as e:
+            print(f"⚠ Could not write sleep profile: {e}")
+
+    def report(self, top=15):
+        """Suite-wide dead time and the call sites that cost the most"""
+        if not self.call_sites:
+            return []
+
+        total = self.total_seconds
+        tests = [test for test in self.by_test if test != NO_TEST]
+        lines = [
+            f"dead time in time.sleep: {total:.2f}s across {len(tests)} tests "
+            f"({len(self.call_sites)} call sites; WebDriverWait polling {self.poll_seconds:.2f}s not counted)",
+            f"  {'total':>9} {'share':>6} {'calls':>6} {'tests':>6}  call site",
+        ]
+        for site, stats in self.ranked_call_sites()[:top]:
+            share = stats["seconds"] / total * 100 if total else 0
+            lines.append(f"  {stats['seconds']:8.2f}s {share:5.1f}% {stats['count']:>6} "
+                         f"{len(stats['tests']):>6}  {site}")
+        lines.append(f"  full profile: {self.path}")
+        return lines